@@ -1,5 +1,6 @@
 from app import create_app, db
 from app.models import Permission
+from app.auth.permission_matrix import invalidate_permission_matrix
 
 app = create_app()
 with app.app_context():
@@ -16,5 +17,7 @@ with app.app_context():
             p.category = 'contacts'
             db.session.commit()
             print("Updated CONTACT_ADD_GUEST permission.")
+        # Workers keep a compiled role/permission matrix in the shared cache.
+        invalidate_permission_matrix()
     else:
         print("Reference permission not found.")
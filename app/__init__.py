@@ -72,10 +72,9 @@ def create_app(config_class='config.Config'):
     assets.init_app(app)
     cache.init_app(app)
     
-    # Register global translation function
-    from .translations.translations import translate as _, get_locale
-    app.jinja_env.globals['_'] = _
-    app.jinja_env.globals['get_locale'] = get_locale
+    # Register global translation function (catalogs compiled once here)
+    from .translations import translations
+    translations.init_app(app)
 
     import os as _os
     @app.template_filter('static_version')
@@ -131,42 +130,41 @@ def create_app(config_class='config.Config'):
     @app.context_processor
     def inject_global_vars():
         from flask import g
-        from .models import Meeting, Club
+        from types import SimpleNamespace
         from .auth.permissions import Permissions
         from .club_context import get_or_set_default_club, get_current_club_id, is_module_enabled
         from .translations.translations import translate as _
+        from .services.nav_state import get_nav_state
 
         # Ensure club context is initialized
         club_id = get_or_set_default_club()
 
-        # Get current club object
-        club = db.session.get(Club, club_id) if club_id else None
-        
-        # Check for meeting-based navigation visibility
+        # Club row, meeting probe and default meeting come from one cached
+        # per-club snapshot instead of 5+ queries per render
+        club = None
         has_meetings = False
         hide_booking_nav = False
         hide_voting_nav = False
         
         if club_id:
-            has_meetings = db.session.query(Meeting.id).filter(Meeting.club_id == club_id).first() is not None
+            nav = get_nav_state(club_id)
+            club = nav['club']
+            has_meetings = nav['has_meetings']
             
             if has_meetings:
-                from .utils import get_default_meeting_id
-                default_meeting_id = get_default_meeting_id()
-                if default_meeting_id:
-                    default_meeting = db.session.get(Meeting, default_meeting_id)
-                    if default_meeting:
-                        status = default_meeting.status
-                        
-                        # Booking Visibility - Always allow access if user has the page available
-                        # (The page itself handles notice display)
-                        pass
-                        
-                        # Voting Visibility
-                        # (The page itself handles notice display for unpublished/not started)
-                        if status == 'finished':
-                            if not is_authorized(Permissions.VOTING_VIEW_RESULTS, meeting=default_meeting):
-                                hide_voting_nav = True
+                include_unpublished = is_authorized(Permissions.MEETING_VIEW_ALL)
+                default_meeting = nav['default_meeting'][include_unpublished]
+                if default_meeting:
+                    # Booking Visibility - Always allow access if user has the page available
+                    # (The page itself handles notice display)
+
+                    # Voting Visibility
+                    # (The page itself handles notice display for unpublished/not started)
+                    if default_meeting['status'] == 'finished':
+                        # is_authorized only needs the meeting's club and sharing master
+                        meeting = SimpleNamespace(**default_meeting)
+                        if not is_authorized(Permissions.VOTING_VIEW_RESULTS, meeting=meeting):
+                            hide_voting_nav = True
 
         return dict(
             is_authorized=is_authorized,
@@ -228,6 +226,14 @@ def create_app(config_class='config.Config'):
         app.register_blueprint(achievements_bp)
         from .messages_routes import messages_bp
         app.register_blueprint(messages_bp)
+        from .events_routes import events_bp
+        app.register_blueprint(events_bp)
+        from .jobs_routes import jobs_bp
+        app.register_blueprint(jobs_bp)
+        from .services.event_bus import event_bus
+        event_bus.init_app(app)
+        from .services import email_outbox
+        email_outbox.init_app(app)
         app.register_blueprint(planner_bp)
         app.register_blueprint(program_bp)
         app.register_blueprint(uploads_bp)
@@ -249,6 +255,11 @@ def create_app(config_class='config.Config'):
     from app.commands.sync import sync
     from app.commands.translate import translate_scan
     from app.commands.backfill_sharing_master import backfill_sharing_master
+    from app.commands.meeting_pointers import rebuild_pointers
+    from app.commands.search_index import reindex_search
+    from app.commands.pathway_progress import rebuild_progress
+    from app.commands.chat_tool_cache import tool_cache_stats
+    from app.commands.email_outbox import outbox_status, drain_outbox
 
     app.cli.add_command(create_admin)
     app.cli.add_command(import_group)
@@ -262,6 +273,12 @@ def create_app(config_class='config.Config'):
     app.cli.add_command(sync)
     app.cli.add_command(translate_scan)
     app.cli.add_command(backfill_sharing_master)
+    app.cli.add_command(rebuild_pointers)
+    app.cli.add_command(reindex_search)
+    app.cli.add_command(rebuild_progress)
+    app.cli.add_command(tool_cache_stats)
+    app.cli.add_command(outbox_status)
+    app.cli.add_command(drain_outbox)
 
     
 
@@ -1,14 +1,19 @@
 # vpemaster/agenda_routes.py
 
-from flask import Blueprint, render_template, request, redirect, url_for, jsonify, send_file, current_app, flash
+from flask import Blueprint, render_template, request, redirect, url_for, jsonify, current_app, flash
 from flask_login import current_user
 from .auth.utils import login_required, is_authorized, club_permission_required
 from .auth.permissions import Permissions
-from .models import SessionLog, SessionType, Contact, Meeting, Project, Media, Roster, MeetingRole, Vote, Pathway, PathwayProject, OwnerMeetingRoles, Planner, Waitlist, Club, Ticket, ContactClub, ContactPath
+from .models import (
+    SessionLog, SessionType, Contact, Meeting, Project, Media, Roster, MeetingRole, Vote, Pathway,
+    OwnerMeetingRoles, Planner, Waitlist, Club, Ticket, ContactClub, ContactPath,
+)
 from .constants import ProjectID, SPEECH_TYPES_WITH_PROJECT, GLOBAL_CLUB_ID
-from .services.export import MeetingExportService
 from .services.export.context import MeetingExportContext
-from .services.meeting_slide_service import MeetingSlideService
+from .services import artifact_cache, export_jobs
+from .services.club_metadata import get_club_metadata, get_pathway_project_codes
+from .services.agenda_schedule import recalculate_agenda
+from .jobs_routes import cached_artifact_response, job_response
 from . import db
 from sqlalchemy import distinct, orm, func
 from datetime import datetime, timedelta
@@ -200,44 +205,8 @@ def _get_agenda_logs(meeting_id):
     logs = query.order_by(SessionLog.Meeting_Seq.asc()).all()
 
     # Batch-pre-fetch owners for all logs in one query to avoid the N+1 in
-    # SessionLog.owners. The owners property joins Contact with
-    # OwnerMeetingRoles filtered by (meeting_id, role_id, [session_log_id
-    # if has_single_owner]). We load all OMRs for the meeting once with
-    # the Contact relationship joined, then materialize the per-log owner
-    # list and stash it on _cached_owners — which the property checks
-    # before re-querying.
-    if meeting_id and logs:
-        omrs = db.session.query(OwnerMeetingRoles)\
-            .options(orm.joinedload(OwnerMeetingRoles.contact))\
-            .filter(OwnerMeetingRoles.meeting_id == meeting_id)\
-            .all()
-        omr_index = {}
-        for omr in omrs:
-            omr_index.setdefault((omr.session_log_id, omr.role_id), []).append(omr.contact)
-        for log in logs:
-            if not log.meeting:
-                log._cached_owners = []
-                continue
-            target_role_id = None
-            has_single_owner = True
-            if log.session_type and log.session_type.role:
-                target_role_id = log.session_type.role_id
-                has_single_owner = log.session_type.role.has_single_owner
-            if has_single_owner:
-                log._cached_owners = list(omr_index.get((log.id, target_role_id), []))
-            else:
-                # Shared role: no session_log_id filter in the original
-                # property — match OMRs by role_id across any session_log_id.
-                seen = set()
-                result = []
-                for (sid, rid), contacts in omr_index.items():
-                    if rid != target_role_id:
-                        continue
-                    for c in contacts:
-                        if c is not None and c.id not in seen:
-                            seen.add(c.id)
-                            result.append(c)
-                log._cached_owners = result
+    # SessionLog.owners.
+    SessionLog.load_owners(logs)
 
     # Populate users and primary clubs for all owners (SessionLog.owners is a list)
     all_owners = []
@@ -542,43 +511,9 @@ def _create_or_update_session(item, meeting_id, seq, updated_role_groups=None):
 
 
 def _recalculate_start_times(meetings_to_update):
-    for meeting in meetings_to_update:
-        if not meeting or not meeting.Start_Time or not meeting.Meeting_Date:
-            continue
-
-        current_time = meeting.Start_Time
-        # Fetch Is_Hidden along with Is_Section
-        logs_to_update = db.session.query(SessionLog, SessionType.Is_Section, SessionType.Is_Hidden)\
-            .join(SessionType, SessionLog.Type_ID == SessionType.id, isouter=True)\
-            .filter(SessionLog.meeting_id == meeting.id)\
-            .order_by(SessionLog.Meeting_Seq.asc()).all()
-
-        for log, is_section, is_hidden_type in logs_to_update:
-            # Calculate duration first
-            duration_val = int(log.Duration_Max or 0)
-            
-            # Determine if session is hidden (snapshot override or type default)
-            is_hidden = log.hidden if log.hidden is not None else is_hidden_type
+    recalculate_agenda(meetings_to_update, sections=False)
 
-            # If the session is a section header OR hidden OR its duration is 0,
-            # set its time to None and continue (skip time accumulation).
-            if is_section or is_hidden or duration_val == 0:
-                log.Start_Time = None
-                continue
 
-            # The rest of the logic only runs for visible, non-section items.
-            log.Start_Time = current_time
-            duration_to_add = duration_val
-            break_minutes = 1
-            # For "Multiple shots" style (ge_mode=1), add an extra minute break after each evaluation
-            EVAL_ID = SessionType.get_id_by_title('Evaluation', meeting.club_id)
-            if log.Type_ID == EVAL_ID and meeting.ge_mode == 1:
-                break_minutes += 1
-            dt_current_time = datetime.combine(
-                meeting.Meeting_Date, current_time)
-            next_dt = dt_current_time + \
-                timedelta(minutes=duration_to_add + break_minutes)
-            current_time = next_dt.time()
 def recalculate_section_ids(meeting):
     """
     Groups all sessions by sections.
@@ -588,22 +523,7 @@ def recalculate_section_ids(meeting):
     """
     if not meeting:
         return
-    
-    if isinstance(meeting, int):
-        meeting = db.session.get(Meeting, meeting)
-        if not meeting:
-            return
-
-    # Fetch all session logs for the meeting ordered by Meeting_Seq ascending.
-    logs = SessionLog.query.filter_by(meeting_id=meeting.id).order_by(SessionLog.Meeting_Seq.asc()).all()
-    current_section_id = None
-    for log in logs:
-        is_section = log.session_type.Is_Section if log.session_type else False
-        if is_section:
-            current_section_id = log.id
-            log.section_id = log.id
-        else:
-            log.section_id = current_section_id
+    recalculate_agenda([meeting], start_times=False)
 
 
 def _get_processed_logs_data(meeting_id, show_media=False):
@@ -1105,7 +1025,7 @@ def agenda():
             }
 
     # Fetch meeting roles for the club and candidate mapping for JS
-    meeting_roles = [{'id': r.id, 'name': r.name, 'type': r.type} for r in MeetingRole.get_all_for_club(club_id)]
+    meeting_roles = [{'id': r['id'], 'name': r['name'], 'type': r['type']} for r in get_club_metadata(club_id)['roles']]
     role_candidates = {}
     if selected_meeting:
         from .models import OwnerMeetingRoles
@@ -1186,16 +1106,16 @@ A single endpoint to fetch all data needed for the agenda modals.
     """
     # Session Types - Filtered by club
     club_id = get_current_club_id()
-    session_types = SessionType.get_all_for_club(club_id)
+    metadata = get_club_metadata(club_id)
     session_types_data = [
         {
-            "id": s.id, "Title": s.Title, "Is_Section": s.Is_Section,
-            "Valid_for_Project": s.Valid_for_Project,
-            "Role": s.role.name if s.role else '', "Role_Group": s.role.type if s.role else '',
-            "Duration_Min": s.Duration_Min, "Duration_Max": s.Duration_Max,
-            "club_id": s.club_id,
-            "featured": bool(s.Featured)
-        } for s in session_types
+            "id": s['id'], "Title": s['Title'], "Is_Section": s['Is_Section'],
+            "Valid_for_Project": s['Valid_for_Project'],
+            "Role": s['role_name'], "Role_Group": s['role_type'],
+            "Duration_Min": s['Duration_Min'], "Duration_Max": s['Duration_Max'],
+            "club_id": s['club_id'],
+            "featured": bool(s['Featured'])
+        } for s in metadata['session_types']
     ]
     club_id = get_current_club_id()
     contacts = Contact.query \
@@ -1225,12 +1145,7 @@ A single endpoint to fetch all data needed for the agenda modals.
     # Projects
     projects = Project.query.order_by(Project.Project_Name).all()
 
-    all_pp = db.session.query(PathwayProject, Pathway.abbr).join(Pathway).all()
-    project_codes_lookup = {}  # {project_id: {path_abbr: {'code': code, 'level': level}, ...}}
-    for pp, path_abbr in all_pp:
-        if pp.project_id not in project_codes_lookup:
-            project_codes_lookup[pp.project_id] = {}
-        project_codes_lookup[pp.project_id][path_abbr] = {'code': pp.code, 'level': pp.level}
+    project_codes_lookup = get_pathway_project_codes()  # {project_id: {path_abbr: {'code': code, 'level': level}, ...}}
 
     projects_data = [
         {
@@ -1241,16 +1156,15 @@ A single endpoint to fetch all data needed for the agenda modals.
     ]
 
     # Meeting Roles - Filtered by club
-    roles_from_db = MeetingRole.query.filter_by(club_id=club_id).all()
     meeting_roles_data = {}
-    for r in roles_from_db:
-        formatted_key = r.name.upper().replace(' ', '_').replace('-', '_')
+    for r in metadata['local_roles']:
+        formatted_key = r['name'].upper().replace(' ', '_').replace('-', '_')
         meeting_roles_data[formatted_key] = {
-            "name": r.name,
-            "icon": r.icon,
-            "type": r.type,
-            "award": r.award_category,
-            "unique": r.has_single_owner # Map database has_single_owner to legacy 'unique' property
+            "name": r['name'],
+            "icon": r['icon'],
+            "type": r['type'],
+            "award": r['award_category'],
+            "unique": r['has_single_owner']  # Map database has_single_owner to legacy 'unique' property
         }
 
     # Fetch Series Initials from DB
@@ -1298,25 +1212,21 @@ def export_agenda(meeting_id):
     if not is_module_enabled('Data/Slides Export'):
         abort(404)
     """
-    Generates a multi-sheet XLSX export of the agenda using the ExportService.
+    Queues a multi-sheet XLSX export of the agenda (see services/export_jobs.py).
     """
     # Find meeting to get club context
     meeting = Meeting.query.get(meeting_id)
     if not meeting:
         return "Meeting not found", 404
-        
-    output = MeetingExportService.generate_meeting_xlsx(meeting_id)
-    if not output:
-        return "Error generating XLSX", 500
 
     filename = f"Agenda_{meeting.Meeting_Date.strftime('%Y-%m-%d')}.xlsx"
-
-    return send_file(
-        output,
-        as_attachment=True,
-        download_name=filename,
-        mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
-    )
+    digest = artifact_cache.meeting_export_digest('agenda_xlsx', meeting)
+    cached = cached_artifact_response('agenda_xlsx', digest, filename)
+    if cached:
+        return cached
+    job = export_jobs.enqueue('agenda_xlsx', meeting_id, filename,
+                              club_id=get_current_club_id(), user_id=current_user.id, digest=digest)
+    return job_response(job)
 
 
 @agenda_bp.route('/agenda/ppt/<int:meeting_id>')
@@ -1328,27 +1238,21 @@ def download_pptx_agenda(meeting_id):
     if not is_module_enabled('Data/Slides Export'):
         abort(404)
     """
-    Generates a PPTX agenda for the meeting.
+    Queues a PPTX agenda for the meeting (see services/export_jobs.py).
     """
     # Find meeting to get club context
     meeting = Meeting.query.get(meeting_id)
     if not meeting:
         return "Meeting not found", 404
         
-    # v2 Integration: Pre-process agenda data to pass to the layout-based service
-    logs_data, _ = _get_processed_logs_data(meeting_id)
-    output = MeetingSlideService.generate_meeting_pptx(meeting_id, logs_data)
-    if not output:
-        return "Could not generate PPTX. Template might be missing or error occurred.", 500
-
     filename = f"Meeting_{meeting.Meeting_Number}_{meeting.Meeting_Date.strftime('%Y-%m-%d')}.pptx"
-
-    return send_file(
-        output,
-        as_attachment=True,
-        download_name=filename,
-        mimetype='application/vnd.openxmlformats-officedocument.presentationml.presentation'
-    )
+    digest = artifact_cache.meeting_export_digest('agenda_pptx', meeting)
+    cached = cached_artifact_response('agenda_pptx', digest, filename)
+    if cached:
+        return cached
+    job = export_jobs.enqueue('agenda_pptx', meeting_id, filename,
+                              club_id=get_current_club_id(), user_id=current_user.id, digest=digest)
+    return job_response(job)
 
 
 
@@ -1507,6 +1411,9 @@ def _generate_logs_from_template(meeting, template_file):
         OwnerMeetingRoles.query.filter_by(meeting_id=meeting.id).delete(synchronize_session=False)
     if meeting.id:
         SessionLog.query.filter_by(meeting_id=meeting.id).delete()
+        # Bulk deletes bypass the flush hooks that keep search in step
+        from .services.speech_log_search import mark_meetings_stale
+        mark_meetings_stale([meeting.id])
 
     from .services import meeting_template_service as tpl_service
     template_rows = tpl_service.parse_template_rows(meeting.club_id, template_file)
@@ -1877,8 +1784,8 @@ def update_logs():
                 # selected_role_ids is the new payload field; resolve to ints and
                 # validate against the club's actual role list.
                 raw_role_ids = award.get('selected_role_ids') or []
-                club_meeting_roles = MeetingRole.get_all_for_club(meeting.club_id)
-                valid_role_ids = {r.id: {'id': r.id, 'name': r.name} for r in club_meeting_roles}
+                club_meeting_roles = get_club_metadata(meeting.club_id)['roles']
+                valid_role_ids = {r['id']: {'id': r['id'], 'name': r['name']} for r in club_meeting_roles}
                 selected_role_ids = []
                 seen = set()
                 for rid in raw_role_ids:
@@ -2081,8 +1988,7 @@ def update_logs():
         for seq, item in enumerate(agenda_data, 1):
             _create_or_update_session(item, meeting.id, seq, updated_role_groups)
 
-        _recalculate_start_times([meeting])
-        recalculate_section_ids(meeting)
+        recalculate_agenda([meeting])
 
         # Recompute sharing master from the now-updated session logs and
         # owners. Same logic as the backfill CLI / migration, run on every
@@ -2184,6 +2090,10 @@ def _tally_votes_and_set_winners(meeting):
     if not meeting:
         return
 
+    # The live tally is only needed while voting is open; verify and drop it
+    from .services.vote_tally import reconcile_vote_tally
+    reconcile_vote_tally(meeting.id)
+
     # Query to get all vote counts grouped by category and contact
     vote_counts = db.session.query(
         Vote.award_category,
@@ -2216,7 +2126,6 @@ def _tally_votes_and_set_winners(meeting):
         # Compute historical wins per candidate in the same club, excluding
         # the current meeting. This is the tie-breaker when two candidates
         # have the same vote count: the one with fewer historical wins wins.
-        from .models.voting import MeetingAwardWinner
         candidate_ids = [cid for cid, _ in candidate_votes if cid is not None]
         if candidate_ids:
             hist_rows = db.session.query(
@@ -2342,6 +2251,7 @@ def update_meeting_status(meeting_id):
             # 'draft' stays 'draft' - user can move it to another meeting later
 
         # Auto-complete all projects of this meeting
+        SessionLog.load_owners(meeting.session_logs)
         for log in meeting.session_logs:
             is_prepared_speech = log.project and log.project.is_prepared_speech
             is_project = (log.session_type and log.session_type.Valid_for_Project and log.Project_ID and log.Project_ID != ProjectID.GENERIC) or is_prepared_speech
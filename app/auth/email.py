@@ -1,19 +1,10 @@
 from flask import render_template, current_app, url_for
 from flask_mail import Message
-from .. import mail
-import time
+from .. import db
+from ..services import email_outbox
 
-def _send_mail_with_retry(msg, retries=3, delay=2):
-    """Sends email with retry logic to mitigate transient network/SSL EOF issues."""
-    for attempt in range(retries):
-        try:
-            mail.send(msg)
-            return True
-        except Exception as e:
-            print(f"DEBUG: SMTP send attempt {attempt + 1} failed: {e}")
-            if attempt == retries - 1:
-                raise e
-            time.sleep(delay)
+# Messages are queued in the email outbox and sent by a background sender,
+# which retries transient network/SSL EOF failures without holding the request.
 
 def send_reset_email(user):
     token = user.get_reset_token()
@@ -43,11 +34,11 @@ If you did not make this request then simply ignore this email and no changes wi
     print(f"DEBUG: Password Reset Link for {user.username}: {reset_url}")
     
     try:
-        _send_mail_with_retry(msg)
+        email_outbox.enqueue(msg, kind='password_reset')
+        db.session.commit()
     except Exception as e:
-        print(f"Error sending email: {e}")
-        # Make sure to re-raise or handle appropriately if email is critical.
-        # usually we don't want to crash the app, but user needs to know.
+        db.session.rollback()
+        print(f"Error queuing email: {e}")
         raise e
 
 def send_verification_email(user):
@@ -67,8 +58,9 @@ If you did not register for an account, please ignore this email.
 '''
     print(f"DEBUG: Email Verification Link for {user.username}: {verify_url}")
     
+    # Queued in the caller's transaction; it is sent once registration commits
     try:
-        _send_mail_with_retry(msg)
+        email_outbox.enqueue(msg, kind='verification')
     except Exception as e:
-        print(f"Error sending email: {e}")
+        print(f"Error queuing email: {e}")
         raise e
@@ -0,0 +1,91 @@
+"""Compiled per-club permission matrix shared across workers.
+
+``Role.has_permission(name, club_id)`` used to run a ``Permission.id``
+lookup plus one or two ``RolePermission`` existence queries per cache miss,
+and its cache only lived for one request. This module compiles the whole
+``role_permissions`` table into an immutable mapping::
+
+    {(role_id, club_id): frozenset(permission_names)}
+
+where ``club_id=None`` holds the global (default) rows. The compiled matrix
+is stored in the shared Flask-Caching backend (Redis in production) next to
+a version stamp (``app/services/versioned_cache.py``). Each worker keeps
+the last matrix it saw in memory and only re-reads the shared copy when the
+stamp changes, so a steady-state permission check costs no SQL and at most
+one cache read per request.
+
+Any change to roles, permissions or their mappings must call
+``invalidate_permission_matrix()``. Unit-of-work changes are picked up
+automatically by the session hooks (``changes`` registered in
+``app/models/role_permission.py``); bulk ``DELETE`` statements and raw SQL
+scripts should call it explicitly.
+"""
+from flask import g, has_request_context
+
+from app import cache, db
+from app.services.versioned_cache import CACHE_TIMEOUT, VersionStamps
+
+MATRIX_CACHE_KEY = 'permission_matrix'
+VERSION_SCOPE = 'all'
+
+_stamps = VersionStamps('permission_matrix_version')
+
+
+def compile_permission_matrix():
+    """Load every role_permissions row and return the immutable matrix."""
+    from app.models.permission import Permission
+    from app.models.role_permission import RolePermission
+
+    rows = (
+        db.session.query(RolePermission.role_id, RolePermission.club_id, Permission.name)
+        .join(Permission, Permission.id == RolePermission.permission_id)
+        .all()
+    )
+    grouped = {}
+    for role_id, club_id, perm_name in rows:
+        grouped.setdefault((role_id, club_id), set()).add(perm_name)
+    return {key: frozenset(names) for key, names in grouped.items()}
+
+
+def get_permission_matrix():
+    """Return the compiled matrix, rebuilding it only when the stamp moved."""
+    if has_request_context():
+        memo = getattr(g, '_permission_matrix', None)
+        if memo is not None:
+            return memo
+
+    version = _stamps.get(VERSION_SCOPE)
+
+    def load():
+        payload = cache.get(MATRIX_CACHE_KEY)
+        if payload and payload.get('version') == version:
+            return payload['matrix']
+        matrix = compile_permission_matrix()
+        cache.set(MATRIX_CACHE_KEY, {'version': version, 'matrix': matrix}, timeout=CACHE_TIMEOUT)
+        return matrix
+
+    matrix = _stamps.local_copy(VERSION_SCOPE, version, load)
+    if has_request_context():
+        g._permission_matrix = matrix
+    return matrix
+
+
+def role_has_permission(role_id, permission_name, club_id):
+    """True if the role is granted the permission for the club.
+
+    A per-club row grants the permission; otherwise the global (club_id
+    None) row is consulted, matching the previous query-based fallback.
+    """
+    matrix = get_permission_matrix()
+    if permission_name in matrix.get((role_id, club_id), ()):
+        return True
+    return permission_name in matrix.get((role_id, None), ())
+
+
+def invalidate_permission_matrix():
+    """Bump the version stamp so every worker recompiles on next use."""
+    _stamps.bump(VERSION_SCOPE)
+    cache.delete(MATRIX_CACHE_KEY)
+    _stamps.local.clear()
+    if has_request_context():
+        g.pop('_permission_matrix', None)
@@ -11,6 +11,7 @@ from .models import SessionLog, SessionType, Contact, Meeting, Waitlist, Meeting
 from sqlalchemy import func
 
 from .services.role_service import RoleService
+from .services.booking_state import get_booking_version
 from . import db
 
 booking_bp = Blueprint('booking_bp', __name__)
@@ -449,6 +450,10 @@ def _get_booking_page_context(meeting_id, user, current_user_contact_id):
     if not meeting_id:
         return context
 
+    # Read the version before building the tables: a change landing while
+    # the context is built bumps it again, so the page refreshes once more.
+    context['initial_hash'] = str(get_booking_version(meeting_id))
+
     club_id = get_current_club_id()
     selected_meeting = Meeting.query.filter_by(id=meeting_id)
     if club_id:
@@ -567,19 +572,6 @@ def _get_booking_page_context(meeting_id, user, current_user_contact_id):
     context['all_projects'] = all_projects
     context['working_path'] = working_path
 
-    # Calculate state hash of consolidated roles for real-time polling synchronization
-    state_parts = []
-    for r in roles:
-        owner_id = r.get('owner_id') or ''
-        all_owners = r.get('all_owners') or []
-        owners_str = "-".join(str(o['id']) for o in all_owners) if all_owners else str(owner_id)
-        waitlist_str = "-".join(str(w['id']) for w in r.get('waitlist', []))
-        state_parts.append(f"{r['session_id']}:{owners_str}:{waitlist_str}")
-    
-    state_str = "|".join(state_parts)
-    import hashlib
-    context['initial_hash'] = hashlib.md5(state_str.encode('utf-8')).hexdigest()
-
     return context
 
 
@@ -599,10 +591,8 @@ def booking(meeting_id):
 @login_required
 @authorized_club_required
 def booking_hash(meeting_id):
-    """Get the booking state hash of the meeting for polling."""
-    user, current_user_contact_id = get_current_user_info()
-    context = _get_booking_page_context(meeting_id, user, current_user_contact_id)
-    return jsonify(success=True, hash=context.get('initial_hash', ''))
+    """Get the booking state version of the meeting for polling (no SQL)."""
+    return jsonify(success=True, hash=str(get_booking_version(meeting_id)))
 
 
 @booking_bp.route('/booking/<int:meeting_id>/tables_html', methods=['GET'])
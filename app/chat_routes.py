@@ -1,12 +1,14 @@
-from flask import Blueprint, request, jsonify, session, current_app
+from flask import Blueprint, request, jsonify, session, current_app, url_for
 from flask_login import login_required, current_user
 from app import db
 from app.models import ChatMessage, Club
 from app.auth.permissions import Permissions
 from app.auth.utils import is_authorized
 from app.club_context import get_current_club_id, authorized_club_required
+from app.services import chat_runs, chat_summaries
 from app.services.chat_service import ChatService
 from app.services.command_parser import CommandParser
+from app.services.event_bus import chat_topic
 import json
 
 chat_bp = Blueprint('chat_bp', __name__)
@@ -75,6 +77,7 @@ def chat_send():
             )
             db.session.add(assistant_msg)
             db.session.commit()
+            chat_summaries.schedule(current_user.id, club_id)
             
             return jsonify({
                 'success': True,
@@ -111,6 +114,7 @@ def chat_send():
                 )
                 db.session.add(assistant_msg)
                 db.session.commit()
+                chat_summaries.schedule(current_user.id, club_id)
                 return jsonify({
                     'success': True,
                     'role': 'assistant',
@@ -140,6 +144,7 @@ def chat_send():
                 )
                 db.session.add(assistant_msg)
                 db.session.commit()
+                chat_summaries.schedule(current_user.id, club_id)
                 return jsonify({
                     'success': True,
                     'role': 'assistant',
@@ -148,11 +153,20 @@ def chat_send():
                     'executed_tools': [{'id': 'hybrid_route_agenda', 'name': 'get_meeting_agenda', 'arguments': {'meeting_identifier': meeting_ident}}]
                 })
 
-            # Load preceding context
-            history = ChatMessage.query.filter_by(
-                user_id=current_user.id,
-                club_id=club_id
-            ).order_by(ChatMessage.timestamp.asc()).all()
+            if data.get('stream'):
+                # Generate the reply in the background; progress arrives over /api/events
+                chat_runs.start(user_msg, locale)
+                return jsonify({
+                    'success': True,
+                    'pending': True,
+                    'mode': 'ai',
+                    'message_id': user_msg.id,
+                    'topic': chat_topic(user_msg.id),
+                    'status_url': url_for('chat_bp.chat_reply', message_id=user_msg.id)
+                }), 202
+
+            # Load preceding context (messages not yet folded into the summary)
+            history = chat_summaries.recent_messages(current_user.id, club_id)
             
             # Process AI completion (includes tool loop execution)
             reply_text, executed_tools = ChatService.process_chat_completion(
@@ -176,6 +190,7 @@ def chat_send():
             )
             db.session.add(assistant_msg)
             db.session.commit()
+            chat_summaries.schedule(current_user.id, club_id)
             
             return jsonify({
                 'success': True,
@@ -190,6 +205,20 @@ def chat_send():
         current_app.logger.error(f"Error in chat send route: {str(e)}")
         return jsonify({'success': False, 'message': f"Error: {str(e)}"}), 500
 
+
+@chat_bp.route('/chat/replies/<int:message_id>', methods=['GET'])
+@login_required
+@authorized_club_required
+def chat_reply(message_id):
+    """
+    Returns the state of a streamed reply, for clients that missed its events.
+    """
+    message = db.session.get(ChatMessage, message_id)
+    if not message or message.user_id != current_user.id or message.club_id != get_current_club_id():
+        return jsonify({'success': False, 'message': 'Message not found.'}), 404
+
+    return jsonify({'success': True, **chat_runs.reply_status(message)})
+
 @chat_bp.route('/chat/history', methods=['GET'])
 @login_required
 @authorized_club_required
@@ -242,12 +271,10 @@ def chat_clear():
             user_id=current_user.id,
             club_id=club_id
         ).delete()
+        # Clear the stored chat summary
+        chat_summaries.clear(current_user.id, club_id)
         db.session.commit()
         
-        # Clear cached chat summary
-        from app import cache
-        cache.delete(f"chat_summary_{current_user.id}_{club_id}")
-        
         return jsonify({'success': True, 'message': 'Chat history cleared successfully.'})
     except Exception as e:
         db.session.rollback()
@@ -0,0 +1,30 @@
+"""Show how often read-only chat tools were answered from the result cache.
+
+Counters live in the shared cache and add up across workers since the
+last reset (or since the cache was flushed).
+"""
+import click
+from flask.cli import with_appcontext
+
+from app.services import tool_result_cache
+
+
+@click.command('chat:tool-cache-stats')
+@click.option('--reset', is_flag=True, help='Zero the counters after printing them.')
+@with_appcontext
+def tool_cache_stats(reset):
+    """Print hits, misses and hit rate per cached chat tool."""
+    stats = tool_result_cache.stats()
+    total_hits = total_misses = 0
+    for tool_name, counts in stats.items():
+        total_hits += counts['hits']
+        total_misses += counts['misses']
+        click.echo(f"  {tool_name}: {counts['hits']} hit(s), {counts['misses']} miss(es), "
+                   f"{counts['hit_rate']:.0%} hit rate")
+    total = total_hits + total_misses
+    rate = total_hits / total if total else 0.0
+    click.echo(f"Total: {total_hits} hit(s) of {total} call(s), {rate:.0%} hit rate")
+
+    if reset:
+        tool_result_cache.reset_stats()
+        click.echo("Counters reset.")
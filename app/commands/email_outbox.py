@@ -0,0 +1,46 @@
+"""Inspect and send the outgoing email queue.
+
+``email:outbox`` lists queued, in-flight and failed messages;
+``email:drain`` sends what is due from the command line, e.g. after the
+SMTP server was down longer than the retry schedule covers.
+"""
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+
+from app import db
+from app.models import OutboundEmail
+from app.services import email_outbox
+
+STATUSES = [OutboundEmail.STATUS_QUEUED, OutboundEmail.STATUS_SENDING,
+            OutboundEmail.STATUS_SENT, OutboundEmail.STATUS_FAILED]
+
+
+@click.command('email:outbox')
+@click.option('--status', type=click.Choice(STATUSES), help='Only list messages with this status.')
+@click.option('--limit', default=20, show_default=True, help='Number of messages to list.')
+@with_appcontext
+def outbox_status(status, limit):
+    """Print message counts per status and the oldest unsent messages."""
+    counts = email_outbox.status_counts()
+    click.echo(', '.join(f"{name}: {counts.get(name, 0)}" for name in STATUSES))
+    for email in email_outbox.pending(limit=limit, status=status):
+        line = (f"  #{email.id} {email.status} {email.kind or '-'} to {email.recipients} "
+                f"({email.attempts} attempt(s), next {email.next_attempt_at:%Y-%m-%d %H:%M:%S})")
+        if email.last_error:
+            line += f": {email.last_error}"
+        click.echo(line)
+
+
+@click.command('email:drain')
+@click.option('--now', 'include_deferred', is_flag=True, help='Also send messages waiting for a retry.')
+@click.option('--retry-failed', is_flag=True, help='Queue failed messages again before sending.')
+@with_appcontext
+def drain_outbox(include_deferred, retry_failed):
+    """Send the queued messages that are due."""
+    if retry_failed:
+        requeued = email_outbox.requeue_failed()
+        db.session.commit()
+        click.echo(f"Queued {requeued} failed message(s) again.")
+    stats = email_outbox.drain(current_app._get_current_object(), include_deferred=include_deferred)
+    click.echo(f"Sent {stats['sent']}, retrying {stats['retrying']}, failed {stats['failed']}.")
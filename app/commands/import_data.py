@@ -1,6 +1,7 @@
 import click
 from flask.cli import with_appcontext
 from app.services.backup_parser import SQLBackupParser
+from app.services.bulk_data_import_service import BULK_CHUNK_SIZE, BulkDataImportService
 from app.services.data_import_service import DataImportService
 from app.services.member_import_service import process_member_file
 from app.models import Club
@@ -15,77 +16,29 @@ def import_group():
 @import_group.command('data')
 @click.option('--file', required=True, help='Path to SQL backup file')
 @click.option('--club-no', required=True, type=str, help='Club Number to associate data with')
+@click.option('--bulk', is_flag=True, help='Preload lookups and write each table with chunked bulk inserts')
+@click.option('--chunk-size', default=BULK_CHUNK_SIZE, show_default=True, type=int,
+              help='Rows per insert batch in bulk mode')
 @with_appcontext
-def import_data(file, club_no):
-    """Imports data from a SQL backup file."""
+def import_data(file, club_no, bulk, chunk_size):
+    """Imports data from a SQL backup file, one table at a time."""
     print(f"Starting import from {file} for Club Number {club_no}...")
     
     parser = SQLBackupParser()
     try:
-        data = parser.parse(file)
+        tables = parser.table_keys(file)
     except Exception as e:
         print(f"Error parsing file: {e}")
         return
     
-    service = DataImportService(club_no)
-    
-    # 1. Execute DDL if needed
-    if 'ddl' in data:
-        print("Checking for missing tables...")
-        service.create_tables(data['ddl'])
-    
-    # 2. Import Data
-    # Import Clubs first to ensure Club Exists (if present in backup) or resolve existing
-    if 'clubs' in data:
-        service.import_clubs(data['clubs'])
-        
-    # Resolve Club ID after potential import
-    service.resolve_club()
-    
-    if not service.club_id:
-        print("ERROR: Club ID could not be resolved. Import aborted.")
-        return
-    
-    try:
-        if 'media' in data:
-            service.import_media(data['media'])
-
-        if 'contacts' in data:
-            service.import_contacts(data['contacts'])
-            
-        if 'excomm' in data:
-             # Depend on contacts
-             service.import_excomm(data['excomm'])
-
-        if 'meetings' in data:
-            service.import_meetings(data['meetings'])
-
-        if 'users' in data:
-             service.import_users(data['users'])
-        
-        if 'meeting_roles' in data:
-            service.import_meeting_roles(data['meeting_roles'])
-
-        if 'session_types' in data:
-            service.import_session_types(data['session_types'])
-
-        if 'session_logs' in data:
-            service.import_session_logs(data['session_logs'])
-            
-        if 'roster' in data:
-            service.import_roster(data['roster'])
+    if bulk:
+        service = BulkDataImportService(club_no, chunk_size=chunk_size)
+    else:
+        service = DataImportService(club_no)
 
-        if 'achievements' in data:
-            service.import_achievements(data['achievements'])
-            
-        if 'votes' in data:
-            service.import_votes(data['votes'])
-            
-            
-        print("Running post-import fixes...")
-        service.run_fix_home_clubs()
-            
-        print("Import completed successfully.")
+    try:
+        if service.import_backup(file, tables, parser):
+            print("Import completed successfully.")
         
     except Exception as e:
         print(f"Error during import: {e}")
@@ -0,0 +1,34 @@
+"""Rebuild the per-club MeetingPointer rows behind get_default_meeting_id().
+
+The pointers are normally kept in step by session hooks whenever a meeting
+is created, deleted or changes status. Run this after edits that bypass
+the ORM (raw SQL, restores from backup) or if the default meeting looks
+wrong.
+
+Idempotent: safe to run multiple times.
+"""
+import click
+from flask.cli import with_appcontext
+
+from app.models.base import db
+from app.services.meeting_pointer import rebuild_meeting_pointers
+
+
+@click.command('meetings:rebuild-pointers')
+@click.option('--club-id', type=int, multiple=True, help='Only rebuild these clubs (repeatable).')
+@click.option('--dry-run', is_flag=True, help='Print what would change without writing.')
+@with_appcontext
+def rebuild_pointers(club_id, dry_run):
+    """Recompute running/upcoming/finished meeting pointers for every club."""
+    drifted = rebuild_meeting_pointers(list(club_id) or None)
+
+    for cid, before, after in drifted:
+        click.echo(f"  club {cid}: {before} -> {after}")
+
+    if dry_run:
+        db.session.rollback()
+        click.echo(f"[dry-run] {len(drifted)} club pointer(s) would change")
+        return
+
+    db.session.commit()
+    click.echo(f"Done. {len(drifted)} club pointer(s) rebuilt.")
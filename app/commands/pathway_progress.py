@@ -0,0 +1,30 @@
+"""Rebuild the materialized pathway progress (pathway_progress).
+
+Rows are normally dropped by session hooks when a member's logs, roles or
+pathways change and recomputed once that change commits. Run this after the
+migration that adds the table, after a change to the level requirements
+(which drops every member), after edits that bypass the ORM (raw SQL,
+restores from backup), or to warm every member ahead of time.
+
+Idempotent: safe to run multiple times.
+"""
+import click
+from flask.cli import with_appcontext
+
+from app.services.pathway_progress import (
+    REBUILD_BATCH_SIZE, REBUILD_WORKERS, rebuild_pathway_progress,
+)
+
+
+@click.command('speech-logs:rebuild-progress')
+@click.option('--contact-id', 'contact_ids', type=int, multiple=True,
+              help='Only rebuild these contacts (repeatable).')
+@click.option('--workers', type=int, default=REBUILD_WORKERS, show_default=True,
+              help='Parallel worker threads.')
+@click.option('--batch-size', type=int, default=REBUILD_BATCH_SIZE, show_default=True,
+              help='Contacts per worker batch (one commit each).')
+@with_appcontext
+def rebuild_progress(contact_ids, workers, batch_size):
+    """Recompute stored pathway progress for each contact's current pathway."""
+    rebuilt = rebuild_pathway_progress(list(contact_ids) or None, workers=workers, batch_size=batch_size)
+    click.echo(f"Done. {rebuilt} member pathway(s) rebuilt.")
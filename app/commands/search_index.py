@@ -0,0 +1,24 @@
+"""Rebuild the speech log full-text search index (session_log_search).
+
+Documents are normally kept in step by session hooks whenever a log, its
+owners, an owner's name or the meeting number changes. Run this once after
+the migration that adds the table, and after edits that bypass the ORM
+(raw SQL, restores from backup) or pathway code changes.
+
+Idempotent: safe to run multiple times.
+"""
+import click
+from flask.cli import with_appcontext
+
+from app.models.base import db
+from app.services.speech_log_search import rebuild_search_index
+
+
+@click.command('speech-logs:reindex-search')
+@click.option('--club-id', type=int, default=None, help='Only reindex this club.')
+@with_appcontext
+def reindex_search(club_id):
+    """Rebuild search documents for every session log."""
+    written = rebuild_search_index(club_id)
+    db.session.commit()
+    click.echo(f"Done. {written} session log(s) indexed.")
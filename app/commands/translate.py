@@ -97,4 +97,6 @@ def translate_scan():
         click.echo("No translation JSON files found in app/translations/ directory to update.")
         click.echo("Please ensure at least one locale JSON file exists (e.g. app/translations/zh_CN.json).")
     else:
+        from app.translations.translations import reload_translations
+        reload_translations()
         click.echo("Scan and merge complete.")
@@ -576,9 +576,14 @@ def delete_contact(contact_id):
     Contact.query.filter(Contact.Mentor_ID == contact_id).update({"Mentor_ID": None})
     
     # 4. SessionLogs (owners relationship) via OwnerMeetingRoles
+    from .services.speech_log_search import mark_meetings_stale
+    mark_meetings_stale(row[0] for row in db.session.query(OwnerMeetingRoles.meeting_id)
+                        .filter_by(contact_id=contact_id).distinct())
     OwnerMeetingRoles.query.filter_by(contact_id=contact_id).delete(synchronize_session=False)
 
     # 5. Votes (contact_id)
+    from .services.vote_tally import drop_tallies_for_contacts
+    drop_tallies_for_contacts([contact_id])
     Vote.query.filter_by(contact_id=contact_id).update({"contact_id": None})
 
     # 6. ExComm (officer positions via association table)
@@ -0,0 +1,89 @@
+# vpemaster/events_routes.py
+
+import json
+import queue
+
+from flask import Blueprint, Response, jsonify, request
+from flask_login import current_user
+
+from . import db
+from .auth.permissions import Permissions
+from .auth.utils import is_authorized, login_required
+from .club_context import authorized_club_required, get_current_club_id
+from .jobs_routes import can_access_job
+from .models import ChatMessage, Meeting
+from .services.export_jobs import get_job
+from .services.event_bus import event_bus, parse_topic
+
+events_bp = Blueprint('events_bp', __name__)
+
+
+def _can_subscribe(topic, club_id):
+    """Check that the current user may follow ``topic``."""
+    parsed = parse_topic(topic)
+    if not parsed:
+        return False
+    kind, object_id, name = parsed
+
+    if kind == 'user':
+        return object_id == current_user.id
+    if kind == 'job':
+        return can_access_job(get_job(object_id), club_id)
+    if kind == 'chat':
+        message = db.session.get(ChatMessage, object_id)
+        return bool(message and message.role == 'user' and message.user_id == current_user.id
+                    and (not club_id or message.club_id == club_id))
+
+    meeting = db.session.get(Meeting, object_id)
+    if not meeting or (club_id and meeting.club_id != club_id):
+        return False
+    if name == 'votes':
+        return is_authorized(Permissions.VOTING_TRACK_PROGRESS, meeting=meeting)
+    return True
+
+
+@events_bp.route('/api/events', methods=['GET'])
+@login_required
+@authorized_club_required
+def event_stream():
+    """Server-Sent Events stream multiplexing several event-bus topics.
+
+    Topics are passed as repeated ``?topic=`` arguments (or one
+    comma-separated list). Each event is sent as JSON
+    ``{"topic": ..., "data": ...}``; idle connections get a keep-alive
+    comment every 25 seconds.
+    """
+    topics = []
+    for value in request.args.getlist('topic'):
+        topics.extend(t for t in value.split(',') if t)
+    topics = list(dict.fromkeys(topics))
+    if not topics:
+        return jsonify(success=False, message="No topics requested."), 400
+
+    club_id = get_current_club_id()
+    denied = [t for t in topics if not _can_subscribe(t, club_id)]
+    if denied:
+        return jsonify(success=False, message="Access denied.", topics=denied), 403
+
+    # The stream may stay open for hours; give its pooled connection back now.
+    # The generator only touches the event bus, never the request or the DB.
+    db.session.remove()
+
+    def event_generator():
+        q = event_bus.listen_many(topics)
+        try:
+            yield "data: connected\n\n"
+            while True:
+                try:
+                    topic, data = q.get(timeout=25)
+                    yield f"data: {json.dumps({'topic': topic, 'data': data})}\n\n"
+                except queue.Empty:
+                    yield ": ping\n\n"
+        finally:
+            event_bus.remove_listener_many(topics, q)
+
+    response = Response(event_generator(), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache, no-transform'
+    response.headers['Connection'] = 'keep-alive'
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
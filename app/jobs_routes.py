@@ -0,0 +1,124 @@
+# vpemaster/jobs_routes.py
+
+import os
+
+from flask import Blueprint, abort, current_app, jsonify, render_template, request, send_file, url_for
+
+from .auth.permissions import Permissions
+from .auth.utils import is_authorized, login_required
+from .club_context import authorized_club_required, get_current_club_id, is_module_enabled
+from .models import ExportJob
+from .services import artifact_cache
+from .services.event_bus import job_topic
+from .services.export_jobs import JOB_KINDS, get_job
+
+jobs_bp = Blueprint('jobs_bp', __name__)
+
+
+def can_access_job(job, club_id):
+    """Check that the current user may follow and download ``job``."""
+    if not job or (club_id and job.club_id != club_id):
+        return False
+    if job.kind == 'uploads_zip':
+        return is_authorized(Permissions.UPLOAD_MANAGE)
+    return is_module_enabled('Data/Slides Export')
+
+
+def _job_payload(job):
+    data = job.to_dict()
+    data['status_url'] = url_for('jobs_bp.job_status', job_id=job.id)
+    data['topic'] = job_topic(job.id)
+    if job.status == ExportJob.STATUS_FINISHED:
+        data['download_url'] = url_for('jobs_bp.download_job', job_id=job.id)
+    return data
+
+
+def _send_file(path, download_name, kind, digest=None):
+    response = send_file(
+        path,
+        as_attachment=True,
+        download_name=download_name,
+        mimetype=JOB_KINDS[kind].mimetype,
+        etag=digest or True
+    )
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+
+def _send_artifact(job):
+    if job.status != ExportJob.STATUS_FINISHED or not job.file_path or not os.path.exists(job.file_path):
+        abort(404)
+    return _send_file(job.file_path, job.download_name, job.kind, job.digest)
+
+
+def wants_json():
+    """Whether the export request comes from a script following the job."""
+    if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+        return True
+    return request.accept_mimetypes.best_match(['text/html', 'application/json']) == 'application/json'
+
+
+def cached_artifact_response(kind, digest, download_name):
+    """Answer an export request from the artifact cache; None when it has to be built.
+
+    A browser already holding this version gets a 304. Scripts are pointed
+    back at the export URL, which then serves the cached file directly.
+    """
+    is_script = wants_json()
+    if not is_script and digest in request.if_none_match:
+        response = current_app.response_class(status=304)
+        response.set_etag(digest)
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
+
+    path = artifact_cache.lookup(digest, os.path.splitext(download_name)[1])
+    if not path:
+        return None
+    if is_script:
+        return jsonify(success=True, job={
+            'status': ExportJob.STATUS_FINISHED,
+            'progress': 100,
+            'download_name': download_name,
+            'download_url': request.path,
+        })
+    return _send_file(path, download_name, kind, digest)
+
+
+def job_response(job):
+    """Answer an export request with its job.
+
+    Scripts (``X-Requested-With: XMLHttpRequest`` or JSON in ``Accept``)
+    always get the job as JSON to poll or follow over SSE. Plain requests
+    get the file straight away when it is already built, as before the
+    exports moved to jobs, and otherwise a page that follows the job and
+    starts the download when it finishes.
+    """
+    if not wants_json():
+        if job.status == ExportJob.STATUS_FINISHED:
+            return _send_artifact(job)
+        if job.status == ExportJob.STATUS_FAILED:
+            return job.message or "Export failed", 500
+        return render_template('job_progress.html', job=job), 202
+    if job.status == ExportJob.STATUS_FAILED:
+        return jsonify(success=False, message=job.message, job=_job_payload(job)), 500
+    return jsonify(success=True, job=_job_payload(job)), 200 if job.is_done else 202
+
+
+@jobs_bp.route('/jobs/<int:job_id>', methods=['GET'])
+@login_required
+@authorized_club_required
+def job_status(job_id):
+    job = get_job(job_id)
+    if not can_access_job(job, get_current_club_id()):
+        abort(404)
+    return jsonify(success=True, job=_job_payload(job))
+
+
+@jobs_bp.route('/jobs/<int:job_id>/download', methods=['GET'])
+@login_required
+@authorized_club_required
+def download_job(job_id):
+    job = get_job(job_id)
+    if not can_access_job(job, get_current_club_id()):
+        abort(404)
+    return _send_artifact(job)
@@ -1,41 +1,14 @@
-from flask import Blueprint, render_template, request, flash, redirect, url_for, jsonify, Response, stream_with_context
+from flask import Blueprint, render_template, request, flash, redirect, url_for, jsonify, Response
 from flask_login import login_required, current_user
 from app import db
 from app.models.message import Message
 from app.models.user import User
+from app.services.event_bus import event_bus, mail_topic, publish
 from datetime import datetime
 import queue
 
 messages_bp = Blueprint('messages', __name__)
 
-class MessageAnnouncer:
-    def __init__(self):
-        self.listeners = {} # user_id -> list of queues
-
-    def listen(self, user_id):
-        q = queue.Queue(maxsize=5)
-        if user_id not in self.listeners:
-            self.listeners[user_id] = []
-        self.listeners[user_id].append(q)
-        return q
-
-    def announce(self, user_id, message):
-        if user_id in self.listeners:
-            for q in self.listeners[user_id]:
-                try:
-                    q.put_nowait(message)
-                except queue.Full:
-                    pass
-
-    def remove_listener(self, user_id, q):
-        if user_id in self.listeners:
-            if q in self.listeners[user_id]:
-                self.listeners[user_id].remove(q)
-            if not self.listeners[user_id]:
-                del self.listeners[user_id]
-
-announcer = MessageAnnouncer()
-
 @messages_bp.route('/messages')
 @login_required
 def messages():
@@ -211,7 +184,7 @@ def send_message():
 
     # Announce new message event to all active recipient listeners
     for rid in recipient_ids:
-        announcer.announce(rid, 'new_message')
+        publish(mail_topic(rid), 'new_message')
 
     return jsonify({
         'success': True,
@@ -445,9 +418,12 @@ def unread_count():
 @login_required
 def message_events():
     """Server-Sent Events endpoint for message updates."""
+    topic = mail_topic(current_user.id)
+    # Don't hold a pooled DB connection for the life of an idle stream
+    db.session.remove()
+
     def event_generator():
-        user_id = current_user.id
-        q = announcer.listen(user_id)
+        q = event_bus.listen(topic)
         try:
             # Yield initial connect event
             yield "data: connected\n\n"
@@ -460,9 +436,9 @@ def message_events():
                     # Send keep-alive ping to prevent connection timeout
                     yield "data: ping\n\n"
         finally:
-            announcer.remove_listener(user_id, q)
+            event_bus.remove_listener(topic, q)
 
-    response = Response(stream_with_context(event_generator()), mimetype='text/event-stream')
+    response = Response(event_generator(), mimetype='text/event-stream')
     response.headers['Cache-Control'] = 'no-cache, no-transform'
     response.headers['Connection'] = 'keep-alive'
     response.headers['X-Accel-Buffering'] = 'no'
@@ -12,7 +12,10 @@ from .user import User, AnonymousUser
 
 from .project import Project, Pathway, PathwayProject, LevelRole
 from .meeting import Meeting
+from .meeting_pointer import MeetingPointer
 from .session import SessionType, SessionLog, OwnerMeetingRoles
+from .session_log_search import SessionLogSearch
+from .pathway_progress import PathwayProgress
 from .roster import Roster, RosterRole, MeetingRole, Waitlist
 from .voting import Vote
 from .media import Media
@@ -23,7 +26,10 @@ from .planner import Planner
 from .program import Program, ProgramTask, ProgramEnrollment
 
 from .upload_link import UploadLink
+from .export_job import ExportJob
 from .chat_message import ChatMessage
+from .chat_summary import ChatSummary
+from .outbound_email import OutboundEmail
 from .issue import Issue, IssueComment
 
 # Import permission system models
@@ -63,6 +69,7 @@ __all__ = [
     'PathwayProject',
     'LevelRole',
     'Meeting',
+    'MeetingPointer',
     'SessionType',
     'SessionLog',
     'Roster',
@@ -90,13 +97,18 @@ __all__ = [
     'ExcommOfficer',
     'UserClub',
     'OwnerMeetingRoles',
+    'SessionLogSearch',
+    'PathwayProgress',
     'Planner',
     'Program',
     'ProgramTask',
     'ProgramEnrollment',
 
     'UploadLink',
+    'ExportJob',
     'ChatMessage',
+    'ChatSummary',
+    'OutboundEmail',
     'Issue',
     'IssueComment',
 ]
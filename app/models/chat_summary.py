@@ -0,0 +1,32 @@
+"""ChatSummary model: rolling summary of a user's older chat messages in a club."""
+from datetime import datetime
+
+from .base import db
+
+
+class ChatSummary(db.Model):
+    """
+    Summary of the chat messages that have left the active window
+    (see app/services/chat_summaries.py).
+
+    ``last_message_id`` is the watermark: every ChatMessage of this user and
+    club with an id up to it is folded into ``summary``, so only newer
+    messages have to be loaded for a turn. Clearing the chat resets the row
+    and bumps ``generation``, so a refresh that started before the clear
+    cannot write the old history back.
+    """
+    __tablename__ = 'chat_summaries'
+    __table_args__ = (
+        db.UniqueConstraint('user_id', 'club_id', name='uq_chat_summary_user_club'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id', ondelete='CASCADE'), nullable=False)
+    club_id = db.Column(db.Integer, db.ForeignKey('clubs.id', ondelete='CASCADE'), nullable=False)
+    summary = db.Column(db.Text, nullable=False, default='')
+    last_message_id = db.Column(db.Integer, nullable=False, default=0)
+    generation = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    updated_at = db.Column(db.DateTime, default=datetime.now, onupdate=datetime.now)
+
+    def __repr__(self):
+        return f'<ChatSummary user={self.user_id} club={self.club_id} through={self.last_message_id}>'
@@ -575,6 +575,8 @@ class Contact(db.Model):
             {ExcommOfficer.contact_id: primary_id}, synchronize_session='fetch'
         )
         # Vote
+        from ..services.vote_tally import drop_tallies_for_contacts
+        drop_tallies_for_contacts(secondary_ids)
         Vote.query.filter(Vote.contact_id.in_(secondary_ids)).update(
             {Vote.contact_id: primary_id}, synchronize_session='fetch'
         )
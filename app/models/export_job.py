@@ -0,0 +1,54 @@
+"""ExportJob model: queued builds of agenda exports, slide decks and upload archives."""
+from datetime import datetime
+
+from .base import db
+
+
+class ExportJob(db.Model):
+    """
+    One background build of a downloadable file (see app/services/export_jobs.py).
+
+    ``active_key`` identifies the artifact being built (kind, club and target)
+    and is only set while the job is queued or running. Its unique index is
+    what lets concurrent requests for the same export share one job, even
+    across gunicorn workers.
+    """
+    __tablename__ = 'export_jobs'
+
+    STATUS_QUEUED = 'queued'
+    STATUS_RUNNING = 'running'
+    STATUS_FINISHED = 'finished'
+    STATUS_FAILED = 'failed'
+
+    id = db.Column(db.Integer, primary_key=True)
+    club_id = db.Column(db.Integer, db.ForeignKey('clubs.id', ondelete='CASCADE'), nullable=True, index=True)
+    kind = db.Column(db.String(20), nullable=False)
+    target = db.Column(db.String(50), nullable=False)  # meeting id or upload link code
+    active_key = db.Column(db.String(100), nullable=True, unique=True)
+    status = db.Column(db.String(20), nullable=False, default=STATUS_QUEUED)
+    progress = db.Column(db.Integer, nullable=False, default=0)  # percent
+    message = db.Column(db.String(255), nullable=True)
+    download_name = db.Column(db.String(255), nullable=False)
+    file_path = db.Column(db.String(500), nullable=True)
+    digest = db.Column(db.String(64), nullable=True)  # artifact cache key, see app/services/artifact_cache.py
+    requested_by_id = db.Column(db.Integer, db.ForeignKey('users.id', ondelete='SET NULL'), nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.now)
+    started_at = db.Column(db.DateTime, nullable=True)
+    finished_at = db.Column(db.DateTime, nullable=True)
+
+    @property
+    def is_done(self):
+        return self.status in (self.STATUS_FINISHED, self.STATUS_FAILED)
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'kind': self.kind,
+            'status': self.status,
+            'progress': self.progress,
+            'message': self.message,
+            'download_name': self.download_name,
+        }
+
+    def __repr__(self):
+        return f'<ExportJob {self.id} {self.kind}:{self.target} {self.status}>'
@@ -1,7 +1,9 @@
 """Meeting model."""
 from sqlalchemy.dialects import mysql
-from sqlalchemy import event
+from sqlalchemy import event, inspect, select
+from sqlalchemy.orm import Session
 from .base import db
+from ..services.versioned_cache import mark, track
 
 
 class Meeting(db.Model):
@@ -235,3 +237,105 @@ def _apply_pending_best_speaker_id(mapper, connection, target):
             )
         )
         target._pending_best_speaker_id = None
+
+
+# Meeting columns the default-meeting pointer (app/services/meeting_pointer.py)
+# is computed from; the navigation snapshot (app/services/nav_state.py) also
+# reads sharing_master_id.
+_POINTER_COLUMNS = ('status', 'Meeting_Date', 'club_id')
+_NAV_STATE_COLUMNS = _POINTER_COLUMNS + ('sharing_master_id',)
+
+_POINTER_DIRTY_KEY = 'meeting_pointer_dirty'
+
+
+def _meeting_state_changes(session):
+    """Return (pointer_club_ids, nav_club_ids) for the clubs the flush affects."""
+    from .club import Club
+    from .session import SessionLog
+
+    pointer_ids = set()
+    nav_ids = set()
+    log_meeting_ids = set()
+    for obj in session.new:
+        if isinstance(obj, Meeting):
+            pointer_ids.add(obj.club_id)
+        elif isinstance(obj, Club):
+            # Every club gets its pointer row from the start
+            pointer_ids.add(obj.id)
+        elif isinstance(obj, SessionLog):
+            # The upcoming-meeting pick only counts meetings with logs
+            log_meeting_ids.add(obj.meeting_id)
+    for obj in session.deleted:
+        if isinstance(obj, Meeting):
+            pointer_ids.add(obj.club_id)
+        elif isinstance(obj, Club):
+            nav_ids.add(obj.id)
+        elif isinstance(obj, SessionLog):
+            log_meeting_ids.add(obj.meeting_id)
+    for obj in session.dirty:
+        if isinstance(obj, Club):
+            nav_ids.add(obj.id)
+        elif isinstance(obj, SessionLog):
+            # Only moving a log changes which meetings have one
+            history = inspect(obj).attrs.meeting_id.history
+            log_meeting_ids.update(history.added)
+            log_meeting_ids.update(history.deleted)
+        elif isinstance(obj, Meeting):
+            state = inspect(obj)
+            changed = {key for key in _NAV_STATE_COLUMNS if state.attrs[key].history.has_changes()}
+            if changed:
+                target = pointer_ids if changed.intersection(_POINTER_COLUMNS) else nav_ids
+                target.add(obj.club_id)
+                # A meeting moved between clubs affects the old one too
+                target.update(state.attrs.club_id.history.deleted)
+    log_meeting_ids.discard(None)
+    if log_meeting_ids:
+        # Plain connection read: session.query would autoflush mid-flush
+        pointer_ids.update(session.connection().execute(
+            select(Meeting.club_id).where(Meeting.id.in_(log_meeting_ids))
+        ).scalars())
+    pointer_ids.discard(None)
+    nav_ids.discard(None)
+    # Deleted clubs lose their pointer row via ON DELETE CASCADE
+    deleted_clubs = {obj.id for obj in session.deleted if isinstance(obj, Club)}
+    return pointer_ids - deleted_clubs, nav_ids | pointer_ids
+
+
+@event.listens_for(Session, 'after_flush')
+def _sync_meeting_state(session, flush_context):
+    """Keep meeting pointers and the navigation snapshot in step with meetings.
+
+    Clubs whose pointer may have moved are collected across the flushes of
+    the transaction and recomputed once, just before it commits, so the
+    pointer commits or rolls back together with the change. The cached
+    navigation snapshot is dropped here and, as with the club metadata
+    hooks, again on commit so a snapshot rebuilt from pre-commit data in
+    between does not stick.
+    """
+    pointer_ids, nav_ids = _meeting_state_changes(session)
+    if pointer_ids:
+        session.info.setdefault(_POINTER_DIRTY_KEY, set()).update(pointer_ids)
+    mark(session, 'nav_state', nav_ids)
+
+
+@event.listens_for(Session, 'before_commit')
+def _refresh_meeting_pointers(session):
+    # The commit's own flush runs after this hook; do it now so its changes count
+    session.flush()
+    pointer_ids = session.info.pop(_POINTER_DIRTY_KEY, None)
+    if pointer_ids:
+        from ..services.meeting_pointer import refresh_meeting_pointers
+        refresh_meeting_pointers(session.connection(), sorted(pointer_ids))
+
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_meeting_pointer_changes(session):
+    session.info.pop(_POINTER_DIRTY_KEY, None)
+
+
+def _invalidate_nav_state(club_id):
+    from ..services.nav_state import invalidate_nav_state
+    invalidate_nav_state(club_id)
+
+
+track('nav_state', _invalidate_nav_state)
@@ -0,0 +1,30 @@
+"""MeetingPointer model: per-club pointers used to pick the default meeting."""
+from datetime import datetime, timezone
+from .base import db
+
+
+class MeetingPointer(db.Model):
+    """Denormalized answer to "which meeting should a page open on?".
+
+    One row per club, kept in step with its meetings by the session hooks in
+    ``app/models/meeting.py`` (see ``app/services/meeting_pointer.py``), so
+    resolving the default meeting is a single keyed lookup.
+    """
+    __tablename__ = 'meeting_pointers'
+
+    club_id = db.Column(db.Integer, db.ForeignKey('clubs.id', ondelete='CASCADE'), primary_key=True)
+    # Any 'running' meeting
+    running_meeting_id = db.Column(db.Integer, db.ForeignKey('Meetings.id', ondelete='SET NULL'), nullable=True)
+    # Earliest 'not started' / 'cancelled' meeting that has an agenda
+    upcoming_meeting_id = db.Column(db.Integer, db.ForeignKey('Meetings.id', ondelete='SET NULL'), nullable=True)
+    # Same, also counting 'unpublished' (for MEETING_VIEW_ALL users)
+    upcoming_unpublished_meeting_id = db.Column(db.Integer, db.ForeignKey('Meetings.id', ondelete='SET NULL'),
+                                                nullable=True)
+    # Latest 'finished' meeting
+    finished_meeting_id = db.Column(db.Integer, db.ForeignKey('Meetings.id', ondelete='SET NULL'), nullable=True)
+    updated_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc),
+                           onupdate=lambda: datetime.now(timezone.utc))
+
+    def __repr__(self):
+        return (f'<MeetingPointer club={self.club_id} running={self.running_meeting_id} '
+                f'upcoming={self.upcoming_meeting_id}>')
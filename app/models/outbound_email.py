@@ -0,0 +1,47 @@
+"""OutboundEmail model: messages queued in the email outbox."""
+from datetime import datetime
+
+from .base import db
+
+
+class OutboundEmail(db.Model):
+    """
+    One email waiting to be sent, or the delivery record of a sent one
+    (see app/services/email_outbox.py).
+
+    A sender claims a queued row by moving it to ``sending``; failed
+    attempts put it back to ``queued`` with a later ``next_attempt_at``
+    until ``attempts`` reaches the limit and it is marked ``failed``.
+    The body is cleared once the message has been sent.
+    """
+    __tablename__ = 'email_outbox'
+    __table_args__ = (
+        db.Index('ix_email_outbox_status_next_attempt', 'status', 'next_attempt_at'),
+    )
+
+    STATUS_QUEUED = 'queued'
+    STATUS_SENDING = 'sending'
+    STATUS_SENT = 'sent'
+    STATUS_FAILED = 'failed'
+
+    id = db.Column(db.Integer, primary_key=True)
+    kind = db.Column(db.String(30), nullable=True)  # e.g. 'password_reset', 'verification'
+    sender = db.Column(db.String(255), nullable=False)
+    recipients = db.Column(db.Text, nullable=False)  # comma-separated addresses
+    subject = db.Column(db.String(255), nullable=False)
+    body = db.Column(db.Text, nullable=False, default='')
+    html = db.Column(db.Text, nullable=True)
+    status = db.Column(db.String(20), nullable=False, default=STATUS_QUEUED)
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    last_error = db.Column(db.String(255), nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.now)
+    next_attempt_at = db.Column(db.DateTime, default=datetime.now, nullable=False)
+    claimed_at = db.Column(db.DateTime, nullable=True)
+    sent_at = db.Column(db.DateTime, nullable=True)
+
+    @property
+    def recipient_list(self):
+        return [addr for addr in (self.recipients or '').split(',') if addr]
+
+    def __repr__(self):
+        return f'<OutboundEmail {self.id} {self.kind} to={self.recipients} {self.status}>'
@@ -0,0 +1,232 @@
+"""PathwayProgress model: materialized speech-log completion summary per level."""
+import json
+from datetime import datetime, timezone
+
+from sqlalchemy import event, inspect, select
+from sqlalchemy.orm import Session
+
+from .base import db
+
+
+class PathwayProgress(db.Model):
+    """
+    One level of a member's completion summary for a pathway, as built by
+    _calculate_completion_summary (required/elective band results, speech
+    badges and extra roles). Rows are dropped by the session hooks below when
+    anything feeding the summary changes and are recomputed once that change
+    commits (see app/services/pathway_progress.py).
+    """
+    __tablename__ = 'pathway_progress'
+
+    id = db.Column(db.Integer, primary_key=True)
+    contact_id = db.Column(db.Integer, db.ForeignKey('Contacts.id', ondelete='CASCADE'), nullable=False)
+    pathway = db.Column(db.String(100), nullable=False)
+    level = db.Column(db.Integer, nullable=False)
+    summary = db.Column(db.Text, nullable=False)  # JSON level summary
+    computed_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
+
+    __table_args__ = (
+        db.UniqueConstraint('contact_id', 'pathway', 'level', name='uq_pathway_progress'),
+        db.Index('ix_pathway_progress_contact', 'contact_id'),
+    )
+
+    @property
+    def summary_data(self):
+        return json.loads(self.summary) if self.summary else {}
+
+    def __repr__(self):
+        return f'<PathwayProgress contact={self.contact_id} {self.pathway} L{self.level}>'
+
+
+# Meeting columns shown in (or deciding the status of) summary entries
+_PROGRESS_MEETING_COLUMNS = ('status', 'Meeting_Date', 'Meeting_Number')
+
+
+def _history_values(obj, key):
+    """Current and pre-flush values of ``key`` on ``obj``."""
+    history = inspect(obj).attrs[key].history
+    return {v for v in (*history.added, *history.unchanged, *history.deleted) if v is not None}
+
+
+def _pathway_progress_changes(session):
+    """Return the contact ids whose progress the flush invalidates, or None for everyone."""
+    from .achievement import Achievement
+    from .contact import Contact
+    from .contact_path import ContactPath
+    from .meeting import Meeting
+    from .media import Media
+    from .planner import Planner
+    from .project import LevelRole, Pathway, PathwayProject, Project
+    from .roster import MeetingRole, Waitlist
+    from .session import OwnerMeetingRoles, SessionLog, SessionType
+    from .user_club import UserClub
+
+    contact_ids = set()
+    meeting_ids = set()
+    log_ids = set()
+    user_ids = set()
+    role_ids = set()
+    path_ids = set()
+    project_ids = set()
+    pathway_names = set()
+    named_contact_ids = set()
+    column_checked = (LevelRole, Pathway, PathwayProject, Project, SessionType, MeetingRole, SessionLog)
+    for obj in (*session.new, *session.deleted, *session.dirty):
+        if (isinstance(obj, column_checked) and obj in session.dirty
+                and not session.is_modified(obj, include_collections=False)):
+            continue
+        if isinstance(obj, LevelRole):
+            # Level requirements feed every member's summary
+            return None
+        if isinstance(obj, Pathway):
+            path_ids.add(obj.id)
+            pathway_names.update(_history_values(obj, 'name'))
+        elif isinstance(obj, PathwayProject):
+            path_ids.update(_history_values(obj, 'path_id'))
+            project_ids.update(_history_values(obj, 'project_id'))
+        elif isinstance(obj, Project):
+            project_ids.add(obj.id)
+        elif isinstance(obj, SessionType):
+            role_ids.update(_history_values(obj, 'role_id'))
+        elif isinstance(obj, MeetingRole):
+            role_ids.add(obj.id)
+        elif isinstance(obj, SessionLog):
+            meeting_ids.update(_history_values(obj, 'meeting_id'))
+        elif isinstance(obj, OwnerMeetingRoles):
+            contact_ids.update(_history_values(obj, 'contact_id'))
+            meeting_ids.update(_history_values(obj, 'meeting_id'))
+        elif isinstance(obj, Waitlist):
+            contact_ids.update(_history_values(obj, 'contact_id'))
+        elif isinstance(obj, Media):
+            log_ids.update(_history_values(obj, 'log_id'))
+        elif isinstance(obj, Planner):
+            # Planned projects override the project shown for booked roles
+            user_ids.update(_history_values(obj, 'user_id'))
+        elif isinstance(obj, Achievement):
+            user_ids.update(_history_values(obj, 'user_id'))
+            contact_ids.update(int(m) for m in _history_values(obj, 'member_id') if str(m).isdigit())
+        elif isinstance(obj, Meeting):
+            if obj in session.deleted:
+                # Its role rows are gone by now; deleting a meeting is rare
+                return None
+            if obj in session.dirty:
+                state = inspect(obj)
+                if any(state.attrs[key].history.has_changes() for key in _PROGRESS_MEETING_COLUMNS):
+                    meeting_ids.add(obj.id)
+        elif isinstance(obj, Contact) and obj in session.deleted:
+            contact_ids.add(obj.id)
+            named_contact_ids.add(obj.id)
+        elif isinstance(obj, Contact) and obj in session.dirty:
+            state = inspect(obj)
+            if state.attrs.Name.history.has_changes():
+                named_contact_ids.add(obj.id)
+            if state.attrs._Current_Path.history.has_changes():
+                contact_ids.add(obj.id)
+        elif isinstance(obj, ContactPath):
+            # Which pathway is current decides the date range of generic roles
+            contact_ids.update(_history_values(obj, 'contact_id'))
+
+    # Plain connection reads: session.query would autoflush mid-flush
+    connection = session.connection()
+    if named_contact_ids:
+        # Shown as the evaluator on the speeches of their meetings
+        meeting_ids.update(connection.execute(
+            select(OwnerMeetingRoles.meeting_id).where(OwnerMeetingRoles.contact_id.in_(named_contact_ids))
+        ).scalars())
+    if log_ids:
+        meeting_ids.update(connection.execute(
+            select(SessionLog.meeting_id).where(SessionLog.id.in_(log_ids))
+        ).scalars())
+    meeting_ids.discard(None)
+    if meeting_ids:
+        # Evaluators are matched within the speech's own meeting
+        contact_ids.update(connection.execute(
+            select(OwnerMeetingRoles.contact_id).where(OwnerMeetingRoles.meeting_id.in_(meeting_ids))
+        ).scalars())
+    role_ids.discard(None)
+    if role_ids:
+        contact_ids.update(connection.execute(
+            select(OwnerMeetingRoles.contact_id).where(OwnerMeetingRoles.role_id.in_(role_ids))
+        ).scalars())
+    project_ids.discard(None)
+    if project_ids:
+        path_ids.update(connection.execute(
+            select(PathwayProject.path_id).where(PathwayProject.project_id.in_(project_ids))
+        ).scalars())
+    path_ids.discard(None)
+    if path_ids:
+        pathway_names.update(connection.execute(
+            select(Pathway.name).where(Pathway.id.in_(path_ids))
+        ).scalars())
+        contact_ids.update(connection.execute(
+            select(ContactPath.contact_id).where(ContactPath.path_id.in_(path_ids))
+        ).scalars())
+    pathway_names.discard(None)
+    if pathway_names:
+        contact_ids.update(connection.execute(
+            select(PathwayProgress.contact_id).where(PathwayProgress.pathway.in_(pathway_names))
+        ).scalars())
+    if user_ids:
+        contact_ids.update(connection.execute(
+            select(UserClub.contact_id).where(UserClub.user_id.in_(user_ids))
+        ).scalars())
+    contact_ids.discard(None)
+    return contact_ids
+
+
+def _drop_progress(session, contact_ids):
+    from ..services.pathway_progress import drop_pathway_progress
+
+    drop_pathway_progress(session.connection(), contact_ids)
+    pending = session.info.setdefault('pathway_progress_dirty', set())
+    if contact_ids is None:
+        pending.add(None)
+    else:
+        pending.update(contact_ids)
+
+
+@event.listens_for(Session, 'after_flush')
+def _invalidate_pathway_progress(session, flush_context):
+    """Drop stored progress for members whose logs, roles or requirements changed.
+
+    The delete runs on the flush's own connection so it commits or rolls
+    back with the change that caused it.
+    """
+    from ..services.pathway_progress import pop_stale
+
+    stale = pop_stale(session)
+    contact_ids = _pathway_progress_changes(session)
+    if contact_ids is not None:
+        contact_ids |= stale
+        if not contact_ids:
+            return
+    _drop_progress(session, contact_ids)
+
+
+@event.listens_for(Session, 'before_commit')
+def _flush_stale_pathway_progress(session):
+    """Apply contacts queued by bulk deletes that did not go through a flush."""
+    from ..services.pathway_progress import pop_stale
+
+    contact_ids = pop_stale(session)
+    if contact_ids:
+        _drop_progress(session, contact_ids)
+
+
+@event.listens_for(Session, 'after_commit')
+def _publish_pathway_progress_change(session):
+    contact_ids = session.info.pop('pathway_progress_dirty', None)
+    if not contact_ids:
+        return
+    from ..services.pathway_progress import publish_pathway_progress_change, rebuild_after_commit
+    publish_pathway_progress_change(None if None in contact_ids else contact_ids)
+    # After a drop of everyone only the contacts named alongside are rebuilt here
+    contact_ids.discard(None)
+    if contact_ids:
+        rebuild_after_commit(contact_ids)
+
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_pathway_progress_change(session):
+    session.info.pop('pathway_progress_dirty', None)
+    session.info.pop('pathway_progress_stale', None)
@@ -5,6 +5,7 @@ club_id, so different clubs can have different permission matrices for the
 same role. See docs/access_matrix.md.
 """
 from .base import db
+from ..services.versioned_cache import track
 
 
 class RolePermission(db.Model):
@@ -25,3 +26,21 @@ class RolePermission(db.Model):
 
     def __repr__(self):
         return f'<RolePermission role_id={self.role_id} permission_id={self.permission_id} club_id={self.club_id}>'
+
+
+def _permission_matrix_changes(session):
+    from .permission import Permission
+    from .role import Role
+
+    watched = (RolePermission, Role, Permission)
+    if any(isinstance(obj, watched) for obj in (*session.new, *session.dirty, *session.deleted)):
+        return {'matrix'}
+    return ()
+
+
+def _invalidate_permission_matrix(_):
+    from app.auth.permission_matrix import invalidate_permission_matrix
+    invalidate_permission_matrix()
+
+
+track('permission_matrix', _invalidate_permission_matrix, _permission_matrix_changes)
@@ -1,10 +1,13 @@
 """Session models including SessionType and SessionLog."""
 import re
+import sys
+from sqlalchemy import inspect as sa_inspect, or_, select, tuple_
 from sqlalchemy.dialects import mysql
-from sqlalchemy.orm import joinedload, subqueryload
+from sqlalchemy.orm import Session, joinedload, subqueryload
 
 from .base import db
 from ..constants import ProjectID
+from ..services.versioned_cache import track
 
 
 class SessionType(db.Model):
@@ -32,24 +35,16 @@ class SessionType(db.Model):
         """
         Helper to get ID by Title and Club.
         Checks Local club first, then Global (Club 1).
+        Served from the compiled club metadata cache.
         """
-        from ..constants import GLOBAL_CLUB_ID
-        
-        # 1. Local check
-        if club_id:
-            st = cls.query.filter_by(Title=title, club_id=club_id).first()
-            if st:
-                return st.id
-        
-        # 2. Global check
-        st_global = cls.query.filter_by(Title=title, club_id=GLOBAL_CLUB_ID).first()
-        return st_global.id if st_global else None
+        from ..services.club_metadata import get_session_type_id
+        return get_session_type_id(title, club_id)
 
     @classmethod
     def get_ids_for_club(cls, club_id):
         """Returns a dict mapping Title to id for the given club (merging Global + Local)."""
-        types = cls.get_all_for_club(club_id)
-        return {t.Title: t.id for t in types}
+        from ..services.club_metadata import get_club_metadata
+        return dict(get_club_metadata(club_id)['session_type_ids'])
 
     @classmethod
     def get_all_for_club(cls, club_id):
@@ -78,6 +73,30 @@ class SessionType(db.Model):
         return sorted(list(merged.values()), key=lambda x: x.Title)
 
 
+def _guard_unprimed_owners():
+    """
+    Debug aid: warn when SessionLog.owners is resolved one log at a time from
+    the same call site, which means a list is being rendered without
+    SessionLog.load_owners(). Active when the app runs in debug mode or
+    OWNER_LOAD_GUARD is set.
+    """
+    from flask import current_app, g, has_app_context
+
+    if not has_app_context() or not (current_app.debug or current_app.config.get('OWNER_LOAD_GUARD')):
+        return
+    frame = sys._getframe(1)
+    while frame and frame.f_code.co_filename == __file__:
+        frame = frame.f_back
+    if frame is None:
+        return
+    site = f"{frame.f_code.co_filename}:{frame.f_lineno}"
+    hits = g.setdefault('_unprimed_owner_sites', {})
+    hits[site] = hits.get(site, 0) + 1
+    if hits[site] == 2:
+        current_app.logger.warning(
+            f"SessionLog.owners queried per log in a loop at {site}; "
+            f"prime the list with SessionLog.load_owners()")
+
 
 # Association Table for Many-to-Many SessionLog <-> Contact
 # [DEPRECATED] session_log_owners = db.Table('session_log_owners', ... )
@@ -163,7 +182,8 @@ class SessionLog(db.Model):
         """Dynamic Owners Property with caching support."""
         if hasattr(self, '_cached_owners'):
             return self._cached_owners
-            
+        _guard_unprimed_owners()
+
         from .contact import Contact
         
         # Safety checks
@@ -188,6 +208,69 @@ class SessionLog(db.Model):
         # Legacy OMR records may have a non-null session_log_id.
         return query.all()
 
+    @classmethod
+    def load_owners(cls, logs):
+        """
+        Batch-resolve owners for any collection of session logs in one query.
+
+        Mirrors the owners property: single-owner roles match OwnerMeetingRoles
+        on (meeting_id, role_id, session_log_id); shared roles match on
+        (meeting_id, role_id) alone. Results are stashed on _cached_owners, and
+        each owner's target pathway/level on _cached_owner_targets.
+        """
+        from .contact import Contact
+
+        logs = [log for log in logs if log is not None]
+        # Only the OMR rows these logs can match: their own rows for
+        # single-owner roles, the (meeting, role) rows for shared roles
+        meeting_ids = set()
+        single_log_ids = set()
+        shared_keys = set()
+        for log in logs:
+            if not log.meeting_id:
+                continue
+            meeting_ids.add(log.meeting_id)
+            role = log.session_type.role if log.session_type else None
+            if role is None or role.has_single_owner:
+                single_log_ids.add(log.id)
+            else:
+                shared_keys.add((log.meeting_id, role.id))
+        by_log = {}
+        by_role = {}
+        if meeting_ids:
+            conditions = []
+            if single_log_ids:
+                conditions.append(OwnerMeetingRoles.session_log_id.in_(single_log_ids))
+            if shared_keys:
+                conditions.append(tuple_(OwnerMeetingRoles.meeting_id, OwnerMeetingRoles.role_id).in_(shared_keys))
+            rows = db.session.query(OwnerMeetingRoles, Contact)\
+                .join(Contact, OwnerMeetingRoles.contact_id == Contact.id)\
+                .filter(OwnerMeetingRoles.meeting_id.in_(meeting_ids), or_(*conditions))\
+                .order_by(OwnerMeetingRoles.id).all()
+            for omr, contact in rows:
+                by_log.setdefault((omr.meeting_id, omr.role_id, omr.session_log_id), []).append((omr, contact))
+                by_role.setdefault((omr.meeting_id, omr.role_id), []).append((omr, contact))
+
+        for log in logs:
+            matches = []
+            if log.meeting_id:
+                role = log.session_type.role if log.session_type else None
+                if role is None or role.has_single_owner:
+                    matches = by_log.get((log.meeting_id, role.id if role else None, log.id), [])
+                else:
+                    # Shared role: legacy OMR records may carry any session_log_id
+                    seen = set()
+                    for omr, contact in by_role.get((log.meeting_id, role.id), []):
+                        if contact.id not in seen:
+                            seen.add(contact.id)
+                            matches.append((omr, contact))
+            log._cached_owners = [contact for _, contact in matches]
+            log._cached_owner_targets = {
+                contact.id: {'pathway': omr.target_pathway, 'level': omr.target_level}
+                for omr, contact in matches
+            }
+        return logs
+
     @owners.setter
     def owners(self, value):
         from .contact import Contact
@@ -687,6 +770,11 @@ class SessionLog(db.Model):
             if target_log not in sessions_to_update:
                 sessions_to_update.append(target_log)
 
+        # Owners primed by load_owners are about to go stale
+        for stale_log in sessions_to_update:
+            stale_log.__dict__.pop('_cached_owners', None)
+            stale_log.__dict__.pop('_cached_owner_targets', None)
+
         # 2. Update OwnerMeetingRoles (The Source of Truth)
         # Identify scope - handle case where meeting relationship might not be loaded
         meeting_id = None
@@ -717,7 +805,13 @@ class SessionLog(db.Model):
             if is_single_owner:
                 delete_query = delete_query.filter(OwnerMeetingRoles.session_log_id == target_log.id)
             
+            # Bulk delete bypasses the flush hooks that keep search and
+            # pathway progress in step
+            from ..services.pathway_progress import mark_contacts_stale
+            from ..services.speech_log_search import mark_meetings_stale
+            mark_contacts_stale(row[0] for row in delete_query.with_entities(OwnerMeetingRoles.contact_id))
             delete_query.delete(synchronize_session=False)
+            mark_meetings_stale([meeting_id])
             
             # Insertion
         # 3. Insertion & Data Preparation
@@ -878,7 +972,7 @@ class SessionLog(db.Model):
         if not is_authorized(Permissions.MEETING_MANAGE, meeting=meeting_obj):
             query = query.filter(MeetingRole.type != 'officer')
 
-        return query.all()
+        return cls.load_owners(query.all())
 
     @classmethod
     def delete_for_meeting(cls, meeting_id):
@@ -894,3 +988,120 @@ class SessionLog(db.Model):
             if log.media:
                 db.session.delete(log.media)
             db.session.delete(log)
+
+
+def _club_metadata_changes(session):
+    """Return the metadata scopes (club ids, ``PATHWAY_SCOPE``) the flush affects."""
+    from .project import Pathway, PathwayProject
+    from .roster import MeetingRole
+    from ..services.club_metadata import PATHWAY_SCOPE
+
+    scopes = set()
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, (SessionType, MeetingRole)):
+            scopes.add(obj.club_id)
+        elif isinstance(obj, (Pathway, PathwayProject)):
+            scopes.add(PATHWAY_SCOPE)
+    return scopes
+
+
+def _invalidate_club_metadata(scope):
+    from ..services.club_metadata import invalidate_scope
+    invalidate_scope(scope)
+
+
+track('club_metadata', _invalidate_club_metadata, _club_metadata_changes)
+
+
+# Columns that feed the speech log search document
+# (app/services/speech_log_search.py).
+_SEARCH_LOG_COLUMNS = ('Session_Title', 'Type_ID', 'project_code', 'Project_ID', 'meeting_id')
+_SEARCH_CONTACT_COLUMNS = ('Name', 'first_name', 'last_name')
+
+
+def _changed(obj, columns):
+    state = sa_inspect(obj)
+    return any(state.attrs[key].history.has_changes() for key in columns)
+
+
+def _speech_log_search_changes(session):
+    """Return (log_ids, meeting_ids) whose search documents the flush affects."""
+    from .contact import Contact
+    from .meeting import Meeting
+    from .roster import MeetingRole
+
+    log_ids = set()
+    meeting_ids = set()
+    contact_ids = set()
+    role_ids = set()
+    type_ids = set()
+    for obj in (*session.new, *session.deleted):
+        if isinstance(obj, SessionLog):
+            log_ids.add(obj.id)
+        elif isinstance(obj, OwnerMeetingRoles):
+            # Shared-role owners apply to every log of the role in the meeting
+            meeting_ids.add(obj.meeting_id)
+    for obj in session.deleted:
+        if isinstance(obj, Meeting):
+            meeting_ids.add(obj.id)
+    for obj in session.dirty:
+        if isinstance(obj, SessionLog):
+            if _changed(obj, _SEARCH_LOG_COLUMNS):
+                log_ids.add(obj.id)
+        elif isinstance(obj, OwnerMeetingRoles):
+            meeting_ids.add(obj.meeting_id)
+            meeting_ids.update(sa_inspect(obj).attrs.meeting_id.history.deleted)
+        elif isinstance(obj, Meeting):
+            if _changed(obj, ('Meeting_Number',)):
+                meeting_ids.add(obj.id)
+        elif isinstance(obj, Contact):
+            if _changed(obj, _SEARCH_CONTACT_COLUMNS):
+                contact_ids.add(obj.id)
+        elif isinstance(obj, SessionType):
+            if _changed(obj, ('Title', 'role_id')):
+                type_ids.add(obj.id)
+        elif isinstance(obj, MeetingRole):
+            if _changed(obj, ('name', 'has_single_owner')):
+                role_ids.add(obj.id)
+
+    # Plain connection reads: session.query would autoflush mid-flush
+    if contact_ids:
+        meeting_ids.update(session.connection().execute(
+            select(OwnerMeetingRoles.meeting_id).where(OwnerMeetingRoles.contact_id.in_(contact_ids))
+        ).scalars())
+    if role_ids:
+        type_ids.update(session.connection().execute(
+            select(SessionType.id).where(SessionType.role_id.in_(role_ids))
+        ).scalars())
+    if type_ids:
+        log_ids.update(session.connection().execute(
+            select(SessionLog.id).where(SessionLog.Type_ID.in_(type_ids))
+        ).scalars())
+    log_ids.discard(None)
+    meeting_ids.discard(None)
+    return log_ids, meeting_ids
+
+
+@db.event.listens_for(Session, 'after_flush')
+def _queue_speech_log_search(session, flush_context):
+    """Queue the search documents of logs touched by the flush."""
+    from ..services.speech_log_search import queue_reindex
+
+    log_ids, meeting_ids = _speech_log_search_changes(session)
+    if log_ids or meeting_ids:
+        queue_reindex(session, log_ids, meeting_ids)
+
+
+@db.event.listens_for(Session, 'after_commit')
+def _reindex_speech_log_search(session):
+    """Rebuild the queued documents now that the changes are visible."""
+    from ..services.speech_log_search import pop_stale, reindex_committed
+
+    log_ids, meeting_ids = pop_stale(session)
+    if log_ids or meeting_ids:
+        reindex_committed(log_ids, meeting_ids)
+
+
+@db.event.listens_for(Session, 'after_rollback')
+def _discard_stale_speech_log_search(session):
+    session.info.pop('speech_log_search_stale', None)
@@ -0,0 +1,30 @@
+"""SessionLogSearch model: denormalized full-text search document per session log."""
+from datetime import datetime, timezone
+
+from .base import db
+
+
+class SessionLogSearch(db.Model):
+    """One searchable text document per SessionLog.
+
+    ``document`` holds the owners' names, session title, role, session type,
+    project codes and meeting number, so speech log search reads a single
+    indexed column instead of LIKE-scanning a five-way join. On MySQL it
+    carries a FULLTEXT index; SQLite (dev/tests) scans the one column. Rows
+    are maintained by ``app/services/speech_log_search.py``.
+    """
+    __tablename__ = 'session_log_search'
+
+    session_log_id = db.Column(db.Integer, db.ForeignKey('Session_Logs.id', ondelete='CASCADE'), primary_key=True)
+    club_id = db.Column(db.Integer, db.ForeignKey('clubs.id', ondelete='CASCADE'), nullable=False, index=True)
+    meeting_id = db.Column(db.Integer, db.ForeignKey('Meetings.id', ondelete='CASCADE'), nullable=False, index=True)
+    document = db.Column(db.Text, nullable=False, default='')
+    updated_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc),
+                           onupdate=lambda: datetime.now(timezone.utc))
+
+    __table_args__ = (
+        db.Index('ft_session_log_search_document', 'document', mysql_prefix='FULLTEXT').ddl_if(dialect='mysql'),
+    )
+
+    def __repr__(self):
+        return f'<SessionLogSearch log={self.session_log_id} club={self.club_id}>'
@@ -536,6 +536,7 @@ class User(UserMixin, db.Model):
         - UserClub rows  (via cascade on club_memberships)
         - Message rows   where this user is sender or recipient
         - ChatMessage    rows for this user
+        - ChatSummary    rows for this user
         - Planner        rows for this user
         - Achievement    rows where this user is recipient or requestor
 
@@ -555,6 +556,7 @@ class User(UserMixin, db.Model):
         from sqlalchemy import or_
         from .message import Message
         from .chat_message import ChatMessage
+        from .chat_summary import ChatSummary
         from .planner import Planner
         from .achievement import Achievement
 
@@ -563,6 +565,7 @@ class User(UserMixin, db.Model):
                 or_(Message.sender_id == self.id, Message.recipient_id == self.id)
             ).delete(synchronize_session=False),
             'chat_messages': ChatMessage.query.filter_by(user_id=self.id).delete(synchronize_session=False),
+            'chat_summaries': ChatSummary.query.filter_by(user_id=self.id).delete(synchronize_session=False),
             'planner': Planner.query.filter_by(user_id=self.id).delete(synchronize_session=False),
             'achievement': Achievement.query.filter(
                 or_(Achievement.user_id == self.id, Achievement.requestor_id == self.id)
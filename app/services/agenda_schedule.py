@@ -0,0 +1,128 @@
+"""Single-pass agenda recomputation (start times and section ids).
+
+Saving an agenda used to walk the logs twice: once for start times, looking
+up the ``Evaluation`` session type id for every visible row, and once more
+for section ids, lazy-loading ``log.session_type`` per row. Here one query
+reads the scheduling columns for every requested meeting, both values are
+computed in the same pass, and only rows whose value actually changed are
+written back with a single executemany ``UPDATE``. The evaluation type id
+comes from the club metadata cache, so the cost no longer depends on the
+number of rows or meetings.
+"""
+from datetime import datetime, timedelta
+
+from sqlalchemy import update
+from sqlalchemy.orm import attributes
+
+from app import db
+from app.models import Meeting, SessionLog, SessionType
+from app.services.club_metadata import get_session_type_id
+
+
+def _load_meetings(meetings):
+    loaded = {}
+    missing = []
+    for meeting in meetings:
+        if isinstance(meeting, int):
+            missing.append(meeting)
+        elif meeting is not None:
+            loaded[meeting.id] = meeting
+    missing = [mid for mid in missing if mid not in loaded]
+    if missing:
+        for meeting in Meeting.query.filter(Meeting.id.in_(missing)).all():
+            loaded[meeting.id] = meeting
+    return loaded
+
+
+def _schedule_meeting(meeting, rows, start_times, sections):
+    """Yield ``(log_id, changes)`` for one meeting's rows, in Meeting_Seq order."""
+    eval_id = None
+    current_time = None
+    if start_times and meeting.Start_Time and meeting.Meeting_Date:
+        current_time = meeting.Start_Time
+        if meeting.ge_mode == 1:
+            eval_id = get_session_type_id('Evaluation', meeting.club_id)
+
+    current_section_id = None
+    for row in rows:
+        changes = {}
+
+        if sections:
+            if row.Is_Section:
+                current_section_id = row.id
+            if row.section_id != current_section_id:
+                changes['section_id'] = current_section_id
+
+        if current_time is not None:
+            duration_val = int(row.Duration_Max or 0)
+            # Snapshot override wins over the type default
+            is_hidden = row.hidden if row.hidden is not None else row.Is_Hidden
+
+            # Sections, hidden and zero-length items take no time slot
+            if row.Is_Section or is_hidden or duration_val == 0:
+                start_time = None
+            else:
+                start_time = current_time
+                break_minutes = 1
+                # For "Multiple shots" style (ge_mode=1), add an extra minute break after each evaluation
+                if eval_id is not None and row.Type_ID == eval_id:
+                    break_minutes += 1
+                next_dt = datetime.combine(meeting.Meeting_Date, current_time) + \
+                    timedelta(minutes=duration_val + break_minutes)
+                current_time = next_dt.time()
+            if row.Start_Time != start_time:
+                changes['Start_Time'] = start_time
+
+        if changes:
+            yield row.id, changes
+
+
+def recalculate_agenda(meetings, start_times=True, sections=True):
+    """Recompute start times and/or section ids for one or more meetings.
+
+    ``meetings`` may mix Meeting objects and ids. Start times are only
+    recomputed for meetings with a start time and date, matching the old
+    behaviour. Returns the number of session logs updated; the caller
+    commits.
+    """
+    meetings_by_id = _load_meetings(meetings)
+    if not meetings_by_id:
+        return 0
+
+    rows = db.session.query(
+        SessionLog.id, SessionLog.meeting_id, SessionLog.Type_ID,
+        SessionLog.Duration_Max, SessionLog.hidden,
+        SessionLog.Start_Time, SessionLog.section_id,
+        SessionType.Is_Section, SessionType.Is_Hidden,
+    ).outerjoin(SessionType, SessionLog.Type_ID == SessionType.id)\
+     .filter(SessionLog.meeting_id.in_(list(meetings_by_id)))\
+     .order_by(SessionLog.meeting_id, SessionLog.Meeting_Seq.asc())\
+     .all()
+
+    rows_by_meeting = {}
+    for row in rows:
+        rows_by_meeting.setdefault(row.meeting_id, []).append(row)
+
+    updates = {}
+    for meeting_id, meeting_rows in rows_by_meeting.items():
+        for log_id, changes in _schedule_meeting(meetings_by_id[meeting_id], meeting_rows,
+                                                 start_times, sections):
+            updates[log_id] = changes
+
+    if not updates:
+        return 0
+
+    # Executemany needs one parameter shape per batch
+    by_shape = {}
+    for log_id, changes in updates.items():
+        by_shape.setdefault(tuple(sorted(changes)), []).append(dict(changes, id=log_id))
+    for params in by_shape.values():
+        db.session.execute(update(SessionLog), params)
+
+    # Keep already-loaded logs in step without marking them dirty
+    for log_id, changes in updates.items():
+        log = db.session.identity_map.get(db.session.identity_key(SessionLog, log_id))
+        if log is not None:
+            for key, value in changes.items():
+                attributes.set_committed_value(log, key, value)
+    return len(updates)
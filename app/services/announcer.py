@@ -0,0 +1,179 @@
+"""Cross-process announcer for Server-Sent Events streams.
+
+``MessageAnnouncer`` used to keep its listener queues in a process-local
+dict, so under gunicorn with several workers ``announce()`` only reached
+streams that happened to be served by the same worker. The announcer now
+keeps only the *local* queues and hands every event to a pluggable backend:
+
+* ``MemoryBackend`` delivers synchronously inside the process. It is the
+  default for development and tests and matches the old behaviour.
+* ``RedisBackend`` publishes over Redis pub/sub. Each worker runs a single
+  subscriber thread (started lazily on the first ``listen()``, i.e. after
+  gunicorn has forked) that multiplexes incoming events onto the local
+  queues, so fan-out costs one Redis connection per worker regardless of
+  how many streams are open.
+
+Only stdlib ``threading``/``queue`` primitives and blocking socket reads are
+used, so the same code runs unchanged under gevent workers
+(``make run-prod-gevent``), where each idle SSE stream costs a greenlet
+instead of an OS thread. See docs/MAILBOX_REALTIME_DESIGN.md.
+"""
+import logging
+import queue
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class MemoryBackend:
+    """In-process backend: publishing delivers straight to local listeners."""
+
+    def __init__(self):
+        self._dispatch = None
+
+    def start(self, dispatch):
+        self._dispatch = dispatch
+
+    def publish(self, channel, message):
+        if self._dispatch is not None:
+            self._dispatch(channel, message)
+
+    def stop(self):
+        self._dispatch = None
+
+
+class RedisBackend:
+    """Redis pub/sub backend with one subscriber thread per process."""
+
+    def __init__(self, url, prefix='vpemaster:announce:'):
+        import redis
+
+        self._redis = redis
+        self._client = redis.Redis.from_url(url)
+        self._prefix = prefix
+        self._dispatch = None
+        self._thread = None
+        self._stopped = threading.Event()
+
+    def start(self, dispatch):
+        self._dispatch = dispatch
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run, name='announcer-subscriber', daemon=True)
+        self._thread.start()
+
+    def publish(self, channel, message):
+        try:
+            self._client.publish(self._prefix + channel, message)
+        except self._redis.RedisError as e:
+            logger.warning(f"Announcer publish to {channel} failed: {e}")
+
+    def stop(self):
+        self._stopped.set()
+
+    def _run(self):
+        while not self._stopped.is_set():
+            pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+            try:
+                pubsub.psubscribe(self._prefix + '*')
+                while not self._stopped.is_set():
+                    item = pubsub.get_message(timeout=1.0)
+                    if not item or item.get('type') != 'pmessage':
+                        continue
+                    channel = item['channel'].decode('utf-8')[len(self._prefix):]
+                    data = item['data']
+                    if isinstance(data, bytes):
+                        data = data.decode('utf-8')
+                    self._dispatch(channel, data)
+            except self._redis.RedisError as e:
+                logger.warning(f"Announcer subscriber lost Redis connection: {e}")
+                self._stopped.wait(1.0)
+            finally:
+                pubsub.close()
+
+
+class MessageAnnouncer:
+    """Fans events out to the SSE listener queues of this process.
+
+    Listeners are keyed by channel (an event-bus topic); ``announce``
+    goes through the backend so that every worker's listeners receive it.
+    """
+
+    def __init__(self, backend=None):
+        self.listeners = {}  # channel -> list of queues
+        self._lock = threading.Lock()
+        self.backend = backend or MemoryBackend()
+        self.backend.start(self._deliver)
+
+    def init_app(self, app):
+        """Select the backend from ``ANNOUNCER_BACKEND`` ('memory' or 'redis')."""
+        kind = app.config.get('ANNOUNCER_BACKEND', 'memory')
+        if kind == 'redis':
+            backend = RedisBackend(app.config.get('ANNOUNCER_REDIS_URL')
+                                   or app.config.get('CACHE_REDIS_URL'))
+        else:
+            backend = MemoryBackend()
+        self.set_backend(backend)
+
+    def set_backend(self, backend):
+        self.backend.stop()
+        self.backend = backend
+        # The Redis subscriber thread is started by the first listen() so it
+        # is created in the forked worker, not in the gunicorn master.
+        if isinstance(backend, MemoryBackend):
+            backend.start(self._deliver)
+
+    def listen(self, channel):
+        q = queue.Queue(maxsize=5)
+        with self._lock:
+            self.listeners.setdefault(str(channel), []).append(q)
+        self.backend.start(self._deliver)
+        return q
+
+    def listen_many(self, channels):
+        """Listen on several channels with one queue.
+
+        Items arrive as ``(channel, message)`` tuples so a single stream can
+        tell the channels apart.
+        """
+        q = _TaggedQueue(maxsize=20)
+        with self._lock:
+            for channel in channels:
+                self.listeners.setdefault(str(channel), []).append(q)
+        self.backend.start(self._deliver)
+        return q
+
+    def remove_listener_many(self, channels, q):
+        for channel in channels:
+            self.remove_listener(channel, q)
+
+    def announce(self, channel, message):
+        self.backend.publish(str(channel), message)
+
+    def remove_listener(self, channel, q):
+        channel = str(channel)
+        with self._lock:
+            queues = self.listeners.get(channel)
+            if queues is None:
+                return
+            if q in queues:
+                queues.remove(q)
+            if not queues:
+                del self.listeners[channel]
+
+    def _deliver(self, channel, message):
+        channel = str(channel)
+        with self._lock:
+            queues = list(self.listeners.get(channel, ()))
+        for q in queues:
+            item = (channel, message) if isinstance(q, _TaggedQueue) else message
+            try:
+                q.put_nowait(item)
+            except queue.Full:
+                pass
+
+
+class _TaggedQueue(queue.Queue):
+    """Listener queue registered on several channels via ``listen_many``."""
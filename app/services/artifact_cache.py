@@ -0,0 +1,164 @@
+"""Content-addressed cache for generated meeting workbooks, slide decks and upload archives.
+
+Around meeting time the VPE, Toastmaster and SAA download the same agenda
+again and again, and each download rebuilt the file with openpyxl or
+python-pptx. ``meeting_export_digest()`` hashes everything the generators
+read for a meeting (its row, session logs, owners, votes, roster, awards,
+the contacts involved, shared role/project/pathway tables and, for slides,
+the layout template and avatar file mtimes). A finished export is stored
+under that digest; while the digest is unchanged, downloads are served
+straight from the file and the digest doubles as the ETag.
+``upload_archive_digest()`` does the same for an upload link's ZIP, from
+the names, sizes and mtimes of its files.
+
+Files live in ``ARTIFACT_CACHE_DIR`` (default: instance/artifact_cache).
+Hits refresh a file's mtime, and ``store()`` deletes the least recently
+used files once the directory grows past ``ARTIFACT_CACHE_MAX_BYTES``.
+"""
+import hashlib
+import logging
+import os
+
+from flask import current_app
+from sqlalchemy import or_, select
+
+from app import db
+from app.constants import GLOBAL_CLUB_ID
+from app.models import (
+    Club, Contact, ContactClub, ContactPath, ExComm, ExcommOfficer, Media, Meeting, MeetingRole,
+    OwnerMeetingRoles, Pathway, PathwayProject, Project, Roster, RosterRole, SessionLog, SessionType,
+    Ticket, Vote, Waitlist,
+)
+from app.models.voting import Award, MeetingAwardConfig, MeetingAwardWinner
+from app.services import avatar_renditions
+
+logger = logging.getLogger(__name__)
+
+# Bump when the generators change, so artifacts built by older code are not served
+ARTIFACT_VERSION = 1
+
+
+def cache_dir():
+    return current_app.config.get('ARTIFACT_CACHE_DIR') or os.path.join(current_app.instance_path, 'artifact_cache')
+
+
+def _hash_rows(hasher, model, *criteria):
+    """Feed every column of the matching rows into ``hasher`` and return the rows."""
+    table = model.__table__
+    rows = db.session.execute(
+        select(table).where(*criteria).order_by(*table.primary_key.columns)
+    ).all()
+    hasher.update(f"{table.name}:{len(rows)}".encode())
+    for row in rows:
+        hasher.update(repr(tuple(row)).encode())
+    return rows
+
+
+def _hash_mtime(hasher, path):
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        mtime = None
+    hasher.update(f"{path}:{mtime}".encode())
+
+
+def meeting_export_digest(kind, meeting):
+    """Digest of every input the ``kind`` export of ``meeting`` is built from."""
+    from app.services.meeting_slide_service import MeetingSlideService
+
+    hasher = hashlib.sha256(f"{ARTIFACT_VERSION}:{kind}".encode())
+    _hash_rows(hasher, Meeting, Meeting.id == meeting.id)
+    logs = _hash_rows(hasher, SessionLog, SessionLog.meeting_id == meeting.id)
+    owners = _hash_rows(hasher, OwnerMeetingRoles, OwnerMeetingRoles.meeting_id == meeting.id)
+    votes = _hash_rows(hasher, Vote, Vote.meeting_id == meeting.id)
+    winners = _hash_rows(hasher, MeetingAwardWinner, MeetingAwardWinner.meeting_id == meeting.id)
+    _hash_rows(hasher, MeetingAwardConfig, MeetingAwardConfig.meeting_id == meeting.id)
+    roster = _hash_rows(hasher, Roster, Roster.meeting_id == meeting.id)
+
+    log_ids = [row.id for row in logs]
+    roster_ids = [row.id for row in roster]
+    project_ids = {row.Project_ID for row in logs if row.Project_ID}
+    _hash_rows(hasher, RosterRole, RosterRole.roster_id.in_(roster_ids))
+    _hash_rows(hasher, Ticket, Ticket.id.in_({row.ticket_id for row in roster if row.ticket_id}))
+    waitlist = _hash_rows(hasher, Waitlist, Waitlist.session_log_id.in_(log_ids))
+    _hash_rows(hasher, Media, or_(Media.log_id.in_(log_ids), Media.id == meeting.media_id))
+    _hash_rows(hasher, SessionType, SessionType.id.in_({row.Type_ID for row in logs}))
+    _hash_rows(hasher, MeetingRole, MeetingRole.club_id.in_({GLOBAL_CLUB_ID, meeting.club_id}))
+    _hash_rows(hasher, Project, Project.id.in_(project_ids))
+    _hash_rows(hasher, PathwayProject, PathwayProject.project_id.in_(project_ids))
+    _hash_rows(hasher, Pathway)
+    _hash_rows(hasher, Club, Club.id == meeting.club_id)
+    _hash_rows(hasher, Award, Award.club_id == meeting.club_id)
+    excomms = _hash_rows(hasher, ExComm, ExComm.club_id == meeting.club_id)
+    officers = _hash_rows(hasher, ExcommOfficer, ExcommOfficer.excomm_id.in_([row.id for row in excomms]))
+
+    contact_ids = {row.contact_id for rows in (owners, votes, winners, roster, waitlist, officers)
+                   for row in rows if row.contact_id}
+    contacts = _hash_rows(hasher, Contact, Contact.id.in_(contact_ids))
+    _hash_rows(hasher, ContactClub, ContactClub.contact_id.in_(contact_ids))
+    _hash_rows(hasher, ContactPath, ContactPath.contact_id.in_(contact_ids))
+
+    if kind == 'agenda_pptx':
+        template_path = MeetingSlideService.layout_template_path(meeting.club_id)
+        if template_path:
+            _hash_mtime(hasher, template_path)
+        for row in contacts:
+            avatar_path = avatar_renditions.avatar_source_path(row.Avatar_URL)
+            if avatar_path:
+                _hash_mtime(hasher, avatar_path)
+    return hasher.hexdigest()
+
+
+def upload_archive_digest(code, entries):
+    """Digest of an upload link's files, from their names, sizes and mtimes."""
+    hasher = hashlib.sha256(f"{ARTIFACT_VERSION}:uploads_zip:{code}".encode())
+    for path, name in entries:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        hasher.update(f"{name}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+    return hasher.hexdigest()
+
+
+def lookup(digest, suffix):
+    """Return the cached file for ``digest``, marking it recently used, or None."""
+    path = os.path.join(cache_dir(), f"{digest}{suffix}")
+    try:
+        os.utime(path)
+    except OSError:
+        return None
+    return path
+
+
+def store(digest, suffix, source_path):
+    """Move a freshly built file into the cache and return its cached path."""
+    directory = cache_dir()
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{digest}{suffix}")
+    os.replace(source_path, path)
+    _evict(directory, keep=path)
+    return path
+
+
+def _evict(directory, keep):
+    max_bytes = current_app.config.get('ARTIFACT_CACHE_MAX_BYTES', 200 * 1024 * 1024)
+    entries = []
+    for entry in os.scandir(directory):
+        try:
+            stat = entry.stat()
+        except OSError:
+            continue
+        entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        if path == keep:
+            continue
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+        logger.info("Evicted cached artifact %s", os.path.basename(path))
@@ -0,0 +1,132 @@
+"""Pre-processed avatar images for slide generation.
+
+Each deck build used to open every avatar with PIL, flatten transparency
+onto white, crop it to the picture shape and re-encode it. A rendition is
+that result saved once as PNG under ``AVATAR_RENDITION_DIR`` (default:
+instance/avatar_renditions). It is keyed by the source file, its mtime,
+the target aspect ratio and the pixel size, so a replaced avatar gets new
+renditions and later builds only read bytes from disk.
+
+Renditions are made on first use. Older renditions of the same source are
+deleted when a newer one is written.
+"""
+import glob
+import hashlib
+import io
+import logging
+import os
+
+from flask import current_app
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+EMU_PER_INCH = 914400
+# Resolution renditions are sized for when the target shape is known
+RENDITION_DPI = 200
+
+
+def rendition_dir():
+    return (current_app.config.get('AVATAR_RENDITION_DIR')
+            or os.path.join(current_app.instance_path, 'avatar_renditions'))
+
+
+def avatar_source_path(avatar_url):
+    """Resolve a contact's ``Avatar_URL`` to a file under the static folder, or None."""
+    if not avatar_url:
+        return None
+    url = avatar_url
+    if url.startswith('/static/'):
+        url = url[8:]
+    elif url.startswith('static/'):
+        url = url[7:]
+    if '/' not in url and '\\' not in url:
+        url = os.path.join(current_app.config.get('AVATAR_ROOT_DIR', 'avatars'), url)
+    path = os.path.join(current_app.static_folder, url.lstrip('/'))
+    return path if os.path.exists(path) else None
+
+
+def shape_box(width_emu, height_emu):
+    """Pixel size matching a slide shape at ``RENDITION_DPI``."""
+    return (max(1, int(width_emu * RENDITION_DPI / EMU_PER_INCH)),
+            max(1, int(height_emu * RENDITION_DPI / EMU_PER_INCH)))
+
+
+def _flatten(img):
+    """Fill transparency with white and return an RGB image."""
+    if img.mode in ('RGBA', 'LA') or (img.mode == 'P' and 'transparency' in img.info):
+        img = img.convert('RGBA')
+        background = Image.new('RGB', img.size, (255, 255, 255))
+        background.paste(img, mask=img.split()[-1])
+        return background
+    return img if img.mode == 'RGB' else img.convert('RGB')
+
+
+def _crop_to_aspect(img, aspect):
+    iw, ih = img.size
+    if iw / ih > aspect:
+        nw = int(ih * aspect)
+        left = (iw - nw) // 2
+        return img.crop((left, 0, left + nw, ih))
+    nh = int(iw / aspect)
+    top = (ih - nh) // 2
+    return img.crop((0, top, iw, top + nh))
+
+
+def _render(source_path, box):
+    with Image.open(source_path) as img:
+        img = _flatten(img)
+        if box:
+            img = _crop_to_aspect(img, box[0] / box[1])
+            if img.width > box[0]:
+                # Shrink only; a small avatar is not scaled up
+                img = img.resize(box, Image.LANCZOS)
+        output = io.BytesIO()
+        img.save(output, format='PNG')
+        return output.getvalue()
+
+
+def rendition_path(source_path, box=None):
+    """Return the PNG rendition of ``source_path`` for a ``(width, height)`` pixel box.
+
+    Without a box the image is only flattened. Returns None when the source
+    is missing or cannot be read.
+    """
+    try:
+        mtime = os.stat(source_path).st_mtime_ns
+    except OSError:
+        return None
+    source_key = hashlib.sha1(os.path.abspath(source_path).encode()).hexdigest()[:16]
+    box_key = f"{box[0]}x{box[1]}" if box else 'full'
+    directory = rendition_dir()
+    path = os.path.join(directory, f"{source_key}_{mtime}_{box_key}.png")
+    if os.path.exists(path):
+        return path
+
+    try:
+        data = _render(source_path, box)
+    except Exception as e:
+        logger.error(f"Error rendering avatar {source_path}: {e}")
+        return None
+    os.makedirs(directory, exist_ok=True)
+    partial = f"{path}.{os.getpid()}.part"
+    with open(partial, 'wb') as f:
+        f.write(data)
+    os.replace(partial, path)
+
+    for stale in glob.glob(os.path.join(directory, f"{source_key}_*.png")):
+        if not os.path.basename(stale).startswith(f"{source_key}_{mtime}_"):
+            try:
+                os.remove(stale)
+            except OSError:
+                pass
+    return path
+
+
+def rendition_bytes(source_path, box=None):
+    """Like ``rendition_path`` but return the PNG bytes, or None."""
+    path = rendition_path(source_path, box)
+    if not path:
+        return None
+    with open(path, 'rb') as f:
+        return f.read()
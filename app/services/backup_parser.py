@@ -1,6 +1,24 @@
 
 import re
 
+# Bytes of text read per step while streaming a dump.
+CHUNK_SIZE = 1 << 20
+
+# Tokens the statement splitter must look at; everything between them is
+# skipped by the regex engine instead of a Python loop.
+_STATEMENT_TOKEN = re.compile(r"--|/\*|[;'\"`#]")
+_QUOTE_END = {
+    "'": re.compile(r"[^'\\]*(?:\\.[^'\\]*)*'", re.S),
+    '"': re.compile(r'[^"\\]*(?:\\.[^"\\]*)*"', re.S),
+    '`': re.compile(r"[^`]*`"),
+}
+_INSERT_HEAD = re.compile(r"INSERT\s+INTO\s+`([^`]+)`\s+VALUES", re.I)
+_CREATE_HEAD = re.compile(r"CREATE\s+TABLE\s+`([^`]+)`", re.I)
+# One token of a VALUES list: a quoted string, a delimiter, or bare text.
+_VALUE_TOKEN = re.compile(
+    r"""'[^'\\]*(?:\\.[^'\\]*)*'|"[^"\\]*(?:\\.[^"\\]*)*"|[(),]|[^(),'"]+""", re.S)
+
+
 class SQLBackupParser:
     """Parses SQL backup files to extract specific table data."""
     
@@ -25,6 +43,22 @@ class SQLBackupParser:
         'all': r"(CREATE TABLE `.*?` \(.*?\).*?;)"
     }
 
+    # Source table name (lower-cased; matching is case-insensitive) -> key
+    TABLE_KEYS = {
+        'contacts': 'contacts',
+        'users': 'users',
+        'meetings': 'meetings',
+        'session_types': 'session_types',
+        'session_logs': 'session_logs',
+        'roster': 'roster',
+        'media': 'media',
+        'achievements': 'achievements',
+        'votes': 'votes',
+        'clubs': 'clubs',
+        'excomm': 'excomm',
+        'meeting_roles': 'meeting_roles',
+    }
+
     
     # Define mapping of positions based on Source Schema (from backup analysis)
     # Positions are 0-indexed matches from the parsed values list
@@ -114,53 +148,123 @@ class SQLBackupParser:
             return val
 
     def parse(self, file_path):
-        """Reads SQL file and returns dict of list of rows per table."""
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
+        """Reads SQL file and returns dict of list of rows per table.
 
-        parsed_data = {}
+        Kept for callers that want every table at once; it holds all rows
+        in memory. The importer reads one table at a time (read_table).
+        """
+        parsed_data = {'ddl': {}}
+        for key, item in self.iter_rows(file_path):
+            if key == 'ddl':
+                table_name, statement = item
+                parsed_data['ddl'].setdefault(table_name, statement)
+            else:
+                parsed_data.setdefault(key, []).append(item)
+        return parsed_data
 
-        # Parse tables using robust extraction
-        for key, table_name in [
-            ('contacts', 'Contacts'), 
-            ('users', 'Users'), # Check casing if needed, usually Users or users
-            ('meetings', 'Meetings'),
-            ('session_types', 'Session_Types'),
-            ('session_logs', 'Session_Logs'),
-            ('roster', 'roster'),
-            ('media', 'Media'),
-            ('achievements', 'achievements'),
-            ('votes', 'votes'),
-            ('clubs', 'clubs'),
-            ('excomm', 'excomm'),
-            ('meeting_roles', 'meeting_roles')
-        ]:
-            # Regex to find START of insert
-            # Case insensitive table name match might be safer?
-            # Using specific known casing for now.
-            # Handle potential backticks or not? definition has backticks.
-            start_pattern = re.compile(rf"INSERT INTO `{table_name}` VALUES", re.IGNORECASE)
-            
-            # Find all start indices
-            for match in start_pattern.finditer(content):
-                start_idx = match.end()
-                # Extract robustly until ;
-                values_str = self._extract_values_str(content, start_idx)
-                if values_str:
-                    rows = self.parse_simple(values_str)
-                    if key not in parsed_data: parsed_data[key] = []
-                    parsed_data[key].extend(rows)
+    def read_table(self, file_path, key, chunk_size=CHUNK_SIZE):
+        """Returns the rows of one table; the dump is read once per call."""
+        return [row for _, row in self.iter_rows(file_path, chunk_size, tables=(key,))]
 
-        # Parse DDL (Keep naive regex for DDL as it's less prone to data content issues)
-        parsed_data['ddl'] = {}
-        ddl_matches = re.findall(r"CREATE TABLE `(.*?)`.*?;", content, re.DOTALL)
-        for table_name in ddl_matches:
-             pattern = rf"(CREATE TABLE `{re.escape(table_name)}` .*?;)"
-             match = re.search(pattern, content, re.DOTALL)
-             if match:
-                 parsed_data['ddl'][table_name] = match.group(1)
+    def read_ddl(self, file_path, chunk_size=CHUNK_SIZE):
+        """Returns {table_name: CREATE TABLE statement}, first one per table."""
+        ddl = {}
+        for _, (table_name, statement) in self.iter_rows(file_path, chunk_size, tables=('ddl',)):
+            ddl.setdefault(table_name, statement)
+        return ddl
 
-        return parsed_data
+    def table_keys(self, file_path, chunk_size=CHUNK_SIZE):
+        """Returns the keys present in the dump ('ddl' for CREATE TABLE) without parsing any values."""
+        keys = set()
+        for statement in self.iter_statements(file_path, chunk_size):
+            match = _INSERT_HEAD.match(statement)
+            if match:
+                key = self.TABLE_KEYS.get(match.group(1).lower())
+                if key:
+                    keys.add(key)
+            elif _CREATE_HEAD.match(statement):
+                keys.add('ddl')
+        return keys
+
+    def iter_rows(self, file_path, chunk_size=CHUNK_SIZE, tables=None):
+        """
+        Lazily yields (key, row) for every row of a known table, in dump
+        order, and ('ddl', (table_name, statement)) for each CREATE TABLE.
+        With tables, only those keys are parsed and yielded. Memory is
+        bounded by the largest single statement.
+        """
+        for statement in self.iter_statements(file_path, chunk_size):
+            match = _INSERT_HEAD.match(statement)
+            if match:
+                key = self.TABLE_KEYS.get(match.group(1).lower())
+                if key and (tables is None or key in tables):
+                    for row in self.parse_simple(statement[match.end():]):
+                        yield key, row
+                continue
+            if tables is not None and 'ddl' not in tables:
+                continue
+            match = _CREATE_HEAD.match(statement)
+            if match:
+                yield 'ddl', (match.group(1), statement)
+
+    def iter_statements(self, file_path, chunk_size=CHUNK_SIZE):
+        """
+        Yields each SQL statement of the dump (terminating ';' included),
+        reading chunk_size characters at a time. Semicolons inside quotes
+        and comments do not split; comments before a statement are dropped.
+        """
+        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+            buf = ''
+            start = 0  # start of the current statement in buf
+            pos = 0    # where scanning resumes
+            eof = False
+            while True:
+                match = _STATEMENT_TOKEN.search(buf, pos)
+                need_more = match is None
+                if match:
+                    token = match.group()
+                    if token == ';':
+                        statement = buf[start:match.end()].strip()
+                        if statement != ';':
+                            yield statement
+                        start = pos = match.end()
+                        continue
+                    if token in _QUOTE_END:
+                        closing = _QUOTE_END[token].match(buf, match.end())
+                        if closing:
+                            pos = closing.end()
+                            continue
+                        need_more = True
+                    elif token == '--' and match.end() < len(buf) and not buf[match.end()].isspace():
+                        # MySQL only treats '-- ' as a comment
+                        pos = match.start() + 1
+                        continue
+                    else:
+                        closer = '*/' if token == '/*' else '\n'
+                        comment_end = buf.find(closer, match.end())
+                        if comment_end != -1:
+                            comment_end += len(closer)
+                            if not buf[start:match.start()].strip():
+                                # Leading comment (dump headers, /*!40101 ... */)
+                                start = comment_end
+                            pos = comment_end
+                            continue
+                        need_more = True
+
+                if need_more:
+                    if eof:
+                        tail = buf[start:].strip()
+                        if tail:
+                            yield tail
+                        return
+                    # Rescan the unfinished token (or the last character,
+                    # which may open a two-character one) once more text is in
+                    pos = match.start() if match else max(pos, len(buf) - 1)
+                    chunk = f.read(chunk_size)
+                    eof = not chunk
+                    buf = buf[start:] + chunk
+                    pos = max(pos - start, 0)
+                    start = 0
 
     def _extract_values_str(self, content, start_idx):
         """Walks content from start_idx to find the terminating semicolon, respecting quotes."""
@@ -193,76 +297,30 @@ class SQLBackupParser:
         """
         Parses MySQL INSERT values. 
         text: (1, 'A'), (2, 'B')
+
+        Quoted strings and runs of bare text are matched as whole tokens by
+        _VALUE_TOKEN, so only delimiters are handled in Python.
         """
-        # A simple regex approach that assumes standard mysqldump format
-        # This regex matches: ( ... )
-        # But we need to be careful about nested parens or quotes.
-        # Given complexity, we will implement a character walker.
-        
         rows = []
-        row = []
+        row = None
         val_buffer = []
-        in_quote = False
-        quote_char = ''
-        in_paren = False
-        
-        i = 0
-        n = len(text)
-        
-        while i < n:
-            c = text[i]
-            
-            if in_quote:
-                if c == '\\':
-                    val_buffer.append(c)
-                    if i + 1 < n:
-                        val_buffer.append(text[i+1])
-                        i += 1
-                elif c == quote_char:
-                    in_quote = False
-                    val_buffer.append(c)
-                else:
-                    val_buffer.append(c)
-            
-            else:
-                if c == '(':
-                    if not in_paren:
-                        in_paren = True
-                        row = []
-                        val_buffer = []
-                    else:
-                        val_buffer.append(c)
-                
-                elif c == ')':
-                    if in_paren:
-                        # End of row? Check if next char is comma or EOF
-                        # But wait, we separate values by commas inside parens
-                        # We need to know if this ) closes the row
-                         val_str = "".join(val_buffer).strip()
-                         if val_str:
-                             row.append(self._clean_val(val_str))
-                         rows.append(row)
-                         in_paren = False
-                         val_buffer = []
 
-                elif c == ',':
-                    if in_paren:
-                        val_str = "".join(val_buffer).strip()
-                        row.append(self._clean_val(val_str))
-                        val_buffer = []
-                
-                elif c in ["'", '"']:
-                    in_quote = True
-                    quote_char = c
-                    val_buffer.append(c)
-                
-                elif c in [' ', '\n', '\t']:
-                    if val_buffer: # If checking strict valid sql, spaces outside quotes matter? 
-                       # Inside a value (123) spaces ok?
-                       val_buffer.append(c)
-                else:
-                    val_buffer.append(c)
+        for match in _VALUE_TOKEN.finditer(text):
+            token = match.group()
+            if row is None:
+                if token == '(':
+                    row = []
+                    val_buffer = []
+            elif token == ',':
+                row.append(self._clean_val("".join(val_buffer).strip()))
+                val_buffer = []
+            elif token == ')':
+                val_str = "".join(val_buffer).strip()
+                if val_str:
+                    row.append(self._clean_val(val_str))
+                rows.append(row)
+                row = None
+            else:
+                val_buffer.append(token)
 
-            i += 1
-            
         return rows
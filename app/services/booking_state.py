@@ -0,0 +1,74 @@
+"""Per-meeting booking version counter used by the booking page poller.
+
+The booking page used to poll ``/booking/<id>/hash``, which rebuilt the
+whole booking context (every role, waitlist and recommendation query) just
+to MD5 a state string. Instead, each meeting now has a monotonically
+increasing version number in the shared cache. Every write that changes the
+booking tables goes through ``RoleService._clear_meeting_cache``, which
+calls ``bump_booking_version``; readers only compare numbers, so polling
+costs one cache read and no SQL. Each bump is also published on the
+``meeting:<id>:booking`` event-bus topic so open pages are pushed the new
+version instead of polling.
+
+Versions are seeded from the wall clock (in milliseconds) when the cache
+entry is missing, so a counter evicted from the cache restarts above any
+value a client could already hold.
+"""
+import time
+
+from sqlalchemy.orm import Session
+
+from app import cache, db
+from app.services.event_bus import booking_topic, publish
+
+# Counters never expire on their own; the seed keeps restarts monotonic.
+VERSION_TIMEOUT = 0
+
+
+def _version_key(meeting_id):
+    return f"booking_version_{meeting_id}"
+
+
+def get_booking_version(meeting_id):
+    """Return the current booking version for a meeting (no SQL)."""
+    key = _version_key(meeting_id)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, int(time.time() * 1000), timeout=VERSION_TIMEOUT)
+        version = cache.get(key)
+    return int(version) if version is not None else 0
+
+
+def bump_booking_version(meeting_id):
+    """Advance the booking version after the booking state of a meeting changed.
+
+    The counter is bumped immediately and again once the surrounding
+    transaction commits: a poller that woke on the first bump may have read
+    the tables before the commit, and the second bump makes it refresh again.
+    """
+    if not meeting_id:
+        return None
+    version = _increment(meeting_id)
+
+    session = db.session()
+    if session.in_transaction():
+        session.info.setdefault('booking_versions_dirty', set()).add(meeting_id)
+    return version
+
+
+def _increment(meeting_id):
+    get_booking_version(meeting_id)
+    version = cache.cache.inc(_version_key(meeting_id))
+    publish(booking_topic(meeting_id), version)
+    return version
+
+
+@db.event.listens_for(Session, 'after_commit')
+def _publish_booking_versions(session):
+    for meeting_id in session.info.pop('booking_versions_dirty', ()):
+        _increment(meeting_id)
+
+
+@db.event.listens_for(Session, 'after_rollback')
+def _discard_booking_versions(session):
+    session.info.pop('booking_versions_dirty', None)
@@ -0,0 +1,626 @@
+"""Bulk mode for ``DataImportService``.
+
+The row-by-row importer resolves every reference (officer roles, session
+types, contacts, meetings, existing logs and owners) with a query per row
+and adds objects one at a time, so a full club history takes minutes.
+``BulkDataImportService`` loads each lookup table into dictionaries once per
+imported table, resolves the rows in memory and writes them with chunked
+``insert()`` executemany calls:
+
+* a table is one transaction, committed once at the end;
+* every chunk runs in a savepoint, and a chunk that fails is retried row
+  by row so a bad row only skips itself;
+* tables whose new ids other rows point at (media, meetings, excomm,
+  session logs) use a batched ``INSERT ... RETURNING`` where the dialect
+  returns ids in parameter order; MySQL and SQLite cannot, so those rows
+  are inserted one at a time, still without any per-row lookup.
+
+Bulk inserts bypass the unit of work, so the search index, stored pathway
+progress, meeting pointers, navigation snapshot, chat name index, vote
+tallies and cached chat tool answers that the session hooks normally maintain are refreshed
+explicitly per table.
+
+Meeting roles, session types and users are small reference tables and keep
+the row-by-row logic inherited from ``DataImportService``. Here
+``meeting_map`` holds meeting ids rather than Meeting objects.
+"""
+import time
+from contextlib import contextmanager
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.constants import GLOBAL_CLUB_ID
+from app.models.achievement import Achievement
+from app.models.base import db
+from app.models.contact import Contact
+from app.models.contact_club import ContactClub
+from app.models.excomm import ExComm
+from app.models.excomm_officer import ExcommOfficer
+from app.models.media import Media
+from app.models.meeting import Meeting
+from app.models.roster import MeetingRole, Roster
+from app.models.session import OwnerMeetingRoles, SessionLog, SessionType
+from app.models.ticket import Ticket
+from app.models.voting import MeetingAwardWinner, Vote
+from app.services.data_import_service import DataImportService
+
+BULK_CHUNK_SIZE = 1000
+
+# IN (...) lists are split so MySQL packets and SQLite variables stay small
+_LOOKUP_BATCH_SIZE = 500
+
+# Cached chat tool domains (``tool_result_cache``) each written table feeds
+_TOOL_CACHE_DOMAINS = {
+    Meeting: 'meetings', SessionLog: 'meetings', OwnerMeetingRoles: 'meetings',
+    MeetingAwardWinner: 'meetings', Vote: 'meetings',
+    ContactClub: 'contacts', Achievement: 'pathways',
+}
+
+
+def _first_ids(rows):
+    """``{key: id}`` keeping the first row per key, like ``Query.first()``."""
+    result = {}
+    for key, id_ in rows:
+        result.setdefault(key, id_)
+    return result
+
+
+def _batches(values):
+    values = list(values)
+    for start in range(0, len(values), _LOOKUP_BATCH_SIZE):
+        yield values[start:start + _LOOKUP_BATCH_SIZE]
+
+
+def _select_in(query, column, values):
+    """Run ``query`` once per batch of ``column IN values`` and chain the rows."""
+    for batch in _batches(values):
+        yield from db.session.execute(query.where(column.in_(batch)))
+
+
+class BulkDataImportService(DataImportService):
+
+    def __init__(self, club_no, chunk_size=BULK_CHUNK_SIZE):
+        super().__init__(club_no)
+        self.chunk_size = max(1, int(chunk_size))
+        self.role_map = {}  # Source Role ID -> Target Role ID
+        self.timings = {}   # Table -> (rows written, seconds)
+        self._log_types = {}  # Source Type ID -> resolved target Type ID (or None)
+
+    # ------------------------------------------------------------------
+    # Chunked writes
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def _timed(self, table):
+        started = time.perf_counter()
+        stats = {'rows': 0}
+        yield stats
+        elapsed = time.perf_counter() - started
+        self.timings[table] = (stats['rows'], elapsed)
+        # import_backup reports the time of the whole table
+        print(f"{table}: {stats['rows']} row(s) written")
+
+    @staticmethod
+    def _insert(model, rows, returning):
+        if not returning:
+            db.session.execute(insert(model), rows)
+            return [True] * len(rows)
+        if db.session.get_bind().dialect.insert_executemany_returning_sort_by_parameter_order:
+            result = db.session.execute(insert(model).returning(model.id, sort_by_parameter_order=True), rows)
+            return list(result.scalars())
+        return [db.session.execute(insert(model).values(**row)).inserted_primary_key[0] for row in rows]
+
+    def _write(self, table, model, rows, returning=False):
+        """Insert ``rows`` (attribute dicts) in chunks, one savepoint per chunk.
+
+        Returns the new ids in row order (None for skipped rows) when
+        ``returning`` is set, else the number of rows written.
+        """
+        results = []
+        self._mark_tool_cache(model, rows)
+        for start in range(0, len(rows), self.chunk_size):
+            chunk = rows[start:start + self.chunk_size]
+            try:
+                with db.session.begin_nested():
+                    results.extend(self._insert(model, chunk, returning))
+            except SQLAlchemyError as e:
+                print(f"WARNING: {table} chunk at row {start} failed ({e.__class__.__name__}). Retrying row by row.")
+                for row in chunk:
+                    try:
+                        with db.session.begin_nested():
+                            results.extend(self._insert(model, [row], returning))
+                    except SQLAlchemyError as e:
+                        print(f"WARNING: Skipping {table} row {row}: {e.__class__.__name__}")
+                        results.append(None)
+            print(f"  {table}: {min(start + self.chunk_size, len(rows))}/{len(rows)}")
+        if returning:
+            return results
+        return sum(1 for r in results if r is not None)
+
+    def _update(self, model, rows):
+        """Bulk UPDATE by primary key; ``rows`` carry ``id`` plus the new values."""
+        self._mark_tool_cache(model, rows)
+        for start in range(0, len(rows), self.chunk_size):
+            db.session.execute(update(model), rows[start:start + self.chunk_size])
+
+    def _mark_tool_cache(self, model, rows):
+        from app.services import tool_result_cache
+
+        domain = _TOOL_CACHE_DOMAINS.get(model)
+        if rows and domain:
+            tool_result_cache.mark_changed(self.club_id, (domain,))
+
+    # ------------------------------------------------------------------
+    # Reference lookups
+    # ------------------------------------------------------------------
+
+    def _load_roles(self):
+        """``({(name, club_id): role_id}, {role_id: has_single_owner})``."""
+        rows = db.session.execute(
+            select(MeetingRole.id, MeetingRole.name, MeetingRole.club_id, MeetingRole.has_single_owner)
+            .order_by(MeetingRole.id)
+        ).all()
+        by_name = _first_ids(((name, club_id), role_id) for role_id, name, club_id, _ in rows)
+        return by_name, {role_id: single for role_id, _, _, single in rows}
+
+    def _load_contact_keys(self):
+        by_name, by_email, by_phone, by_member_id = {}, {}, {}, {}
+        rows = db.session.execute(
+            select(Contact.id, Contact.Name, Contact.Email, Contact.Phone_Number, Contact.Member_ID)
+            .order_by(Contact.id))
+        for contact_id, name, email, phone, member_id in rows:
+            by_name.setdefault(name, contact_id)
+            if email:
+                by_email.setdefault(email, contact_id)
+            if phone:
+                by_phone.setdefault(phone, contact_id)
+            if member_id:
+                by_member_id.setdefault(member_id, contact_id)
+        return by_name, by_email, by_phone, by_member_id
+
+    def _mark_changed(self, meeting_ids=(), contact_ids=()):
+        """Queue the derived data the session hooks would have refreshed."""
+        from app.services.pathway_progress import mark_contacts_stale
+        from app.services.speech_log_search import mark_meetings_stale
+
+        if meeting_ids:
+            mark_meetings_stale(meeting_ids)
+        if contact_ids:
+            mark_contacts_stale(contact_ids)
+
+    def _refresh_meeting_state(self):
+        from app.services.meeting_pointer import refresh_meeting_pointers
+
+        if self.club_id:
+            refresh_meeting_pointers(db.session.connection(), [self.club_id])
+
+    def _publish_meeting_state(self):
+        from app.services.name_resolver import invalidate_name_index
+        from app.services.nav_state import invalidate_nav_state
+
+        if self.club_id:
+            invalidate_nav_state(self.club_id)
+            invalidate_name_index(self.club_id)
+
+    # ------------------------------------------------------------------
+    # Tables
+    # ------------------------------------------------------------------
+
+    def import_media(self, media_data):
+        print(f"Importing {len(media_data)} media (bulk)...")
+        with self._timed('media') as stats:
+            by_url = _first_ids(db.session.execute(select(Media.url, Media.id).order_by(Media.id)))
+            pending = {}  # url -> source ids sharing the new row
+            new_rows = []
+            for row in media_data:
+                source_id, url = row[0], row[2]
+                if url in by_url:
+                    self.media_map[source_id] = by_url[url]
+                    continue
+                if url not in pending:
+                    pending[url] = []
+                    new_rows.append({'url': url, 'notes': row[3]})
+                pending[url].append(source_id)
+
+            ids = self._write('media', Media, new_rows, returning=True)
+            for values, media_id in zip(new_rows, ids):
+                if media_id is None:
+                    continue
+                for source_id in pending[values['url']]:
+                    self.media_map[source_id] = media_id
+                stats['rows'] += 1
+            db.session.commit()
+
+    def import_contacts(self, contacts_data):
+        print(f"Importing {len(contacts_data)} contacts (bulk)...")
+        with self._timed('contacts') as stats:
+            by_name, by_email, by_phone, by_member_id = self._load_contact_keys()
+
+            # 1. Deduplicate every row against the preloaded keys and the
+            #    contacts created earlier in this import.
+            resolved = []  # (row, target id or new Contact, created by this row)
+            for row in contacts_data:
+                def get_idx(i): return row[i] if len(row) > i else None
+                name, phone, email = row[1], get_idx(7), get_idx(9)
+                target = by_name.get(name)
+                if target is None and email:
+                    target = by_email.get(email)
+                if target is None and phone:
+                    target = by_phone.get(phone)
+
+                created = target is None
+                if created:
+                    target = self._new_contact(row)
+                    db.session.add(target)
+                    stats['rows'] += 1
+                    by_name.setdefault(name, target)
+                    if phone:
+                        by_phone.setdefault(phone, target)
+                if email:
+                    by_email.setdefault(email, target)
+                if get_idx(10):
+                    by_member_id.setdefault(get_idx(10), target)
+                resolved.append((row, target, created))
+
+            existing_ids = {target for _, target, _ in resolved if isinstance(target, int)}
+            loaded = {c.id: c for batch in _batches(existing_ids)
+                      for c in Contact.query.filter(Contact.id.in_(batch))}
+
+            # 2. Apply updates in row order and map source ids.
+            mentor_updates = []
+            for row, target, created in resolved:
+                contact = loaded[target] if isinstance(target, int) else target
+                if not created:
+                    self._update_contact(contact, row)
+                self._split_contact_name(contact)
+                self.contact_map[row[0]] = contact
+                m_ref = row[11] if len(row) > 11 else None
+                if m_ref and m_ref != 'NULL':
+                    mentor_updates.append((contact, m_ref))
+            db.session.flush()
+
+            # 3. Club membership for every imported contact.
+            if self.club_id:
+                linked = set(db.session.execute(
+                    select(ContactClub.contact_id).where(ContactClub.club_id == self.club_id)).scalars())
+                contact_ids = dict.fromkeys(c.id for c in self.contact_map.values() if c.id not in linked)
+                self._write('contact_clubs', ContactClub,
+                            [{'contact_id': cid, 'club_id': self.club_id} for cid in contact_ids])
+
+            # 4. Mentors, by source id or legacy Member_ID string.
+            for contact, m_ref in mentor_updates:
+                mentor = self.contact_map.get(m_ref)
+                if not mentor and isinstance(m_ref, str):
+                    mentor = by_member_id.get(m_ref)
+                if mentor is not None:
+                    contact.Mentor_ID = mentor if isinstance(mentor, int) else mentor.id
+            db.session.commit()
+        if self.club_id:
+            from app.services.name_resolver import invalidate_name_index
+            invalidate_name_index(self.club_id)
+
+    def import_excomm(self, excomm_data):
+        print(f"Importing {len(excomm_data)} excomm entries (bulk)...")
+        if not self.club_id:
+            print("Skipping excomm import: Club ID not resolved.")
+            return
+        with self._timed('excomm') as stats:
+            roles, _ = self._load_roles()
+            terms = _first_ids(db.session.execute(
+                select(ExComm.excomm_term, ExComm.id).where(ExComm.club_id == self.club_id)))
+            # Row indices: 6=Pres, 7=VPE, 8=VPM, 9=VPPR, 10=Sec, 11=Treas, 12=SAA, 13=IPP
+            officer_columns = {
+                'President': 6, 'VPE': 7, 'VPM': 8, 'VPPR': 9, 'Secretary': 10,
+                'Treasurer': 11, 'SAA': 12, 'Immediate Past President': 13,
+            }
+
+            new_rows, officers = [], []
+            for row in excomm_data:
+                term = row[2]
+                if term in terms:
+                    continue
+                terms[term] = None
+                new_rows.append({
+                    'club_id': self.club_id, 'excomm_term': term,
+                    'start_date': self._parse_date(row[3]), 'end_date': self._parse_date(row[4]),
+                    'excomm_name': row[5],
+                })
+                for role_name, index in officer_columns.items():
+                    contact_id = self._map_contact(row[index])
+                    role_id = roles.get((role_name, GLOBAL_CLUB_ID)) or roles.get((role_name, self.club_id))
+                    if contact_id and role_id:
+                        officers.append((len(new_rows) - 1, contact_id, role_id))
+
+            ids = self._write('excomm', ExComm, new_rows, returning=True)
+            stats['rows'] = sum(1 for i in ids if i is not None)
+            self._write('excomm_officers', ExcommOfficer, [
+                {'excomm_id': ids[index], 'contact_id': contact_id, 'meeting_role_id': role_id}
+                for index, contact_id, role_id in officers if ids[index] is not None])
+            db.session.commit()
+
+    def import_meetings(self, meetings_data):
+        print(f"Importing {len(meetings_data)} meetings (bulk)...")
+        with self._timed('meetings') as stats:
+            # Meeting numbers are per club
+            existing = _first_ids(db.session.execute(
+                select(Meeting.Meeting_Number, Meeting.id)
+                .where(Meeting.club_id == self.club_id).order_by(Meeting.id)))
+            excomms = []
+            if self.club_id:
+                excomms = db.session.execute(
+                    select(ExComm.id, ExComm.start_date, ExComm.end_date)
+                    .where(ExComm.club_id == self.club_id).order_by(ExComm.id)).all()
+            # Meeting.get_excomm falls back to the most recent term
+            latest = max(excomms, key=lambda e: (e.start_date is not None, e.start_date), default=None)
+
+            new_rows, awards = [], []
+            for row in meetings_data:
+                meeting_no = row[1]
+                if meeting_no in existing:
+                    if existing[meeting_no] is not None:
+                        self.meeting_map[meeting_no] = existing[meeting_no]
+                    continue
+                existing[meeting_no] = None
+
+                meeting_date = self._parse_date(row[2])
+                excomm_id = row[18] if len(row) > 18 and row[18] and row[18] != 'NULL' else None
+                if not excomm_id and meeting_date:
+                    excomm_id = next((e.id for e in excomms
+                                      if e.start_date and e.end_date
+                                      and e.start_date <= meeting_date <= e.end_date), None)
+                if not excomm_id and latest is not None:
+                    excomm_id = latest.id
+
+                new_rows.append(self._meeting_values(row, excomm_id))
+                awards.append(self._meeting_awards(row))
+
+            ids = self._write('meetings', Meeting, new_rows, returning=True)
+            award_rows = []
+            for values, meeting_id, meeting_awards in zip(new_rows, ids, awards):
+                if meeting_id is None:
+                    continue
+                self.meeting_map[values['Meeting_Number']] = meeting_id
+                stats['rows'] += 1
+                award_rows.extend({'meeting_id': meeting_id, 'award_category': cat, 'contact_id': cid}
+                                  for cat, cid in meeting_awards)
+            self._write('meeting_award_winners', MeetingAwardWinner, award_rows)
+            self._refresh_meeting_state()
+            db.session.commit()
+        self._publish_meeting_state()
+
+    def _resolve_log_type(self, source_type_id, by_title, by_role):
+        """Target Type_ID for a source session type, following the row-by-row fallbacks.
+
+        ``by_title`` and ``by_role`` map ``(Title, club_id)`` and
+        ``(role_id, club_id)`` to target type ids. Returns None when the log
+        should be skipped. Memoized per source id.
+        """
+        if source_type_id in self._log_types:
+            return self._log_types[source_type_id]
+
+        type_id = self.session_type_map.get(source_type_id)
+        if not type_id:
+            skipped_title = self.skipped_types_map.get(source_type_id)
+            if skipped_title:
+                type_id = by_title.get((skipped_title, GLOBAL_CLUB_ID))
+        if not type_id:
+            target_role_id = self.role_map.get(self.source_type_role_map.get(source_type_id))
+            if target_role_id:
+                type_id = by_role.get((target_role_id, self.club_id)) or by_role.get((target_role_id, GLOBAL_CLUB_ID))
+        if not type_id:
+            if not self.generic_type_id:
+                self.generic_type_id = (by_title.get(('Generic', self.club_id))
+                                        or by_title.get(('Generic', GLOBAL_CLUB_ID)))
+            type_id = self.generic_type_id
+        if not type_id:
+            # Assume the source id exists in the target, unless types were mapped
+            type_id = None if self.session_type_map else source_type_id
+            if type_id is None:
+                print(f"WARNING: Type ID {source_type_id} not found in map and fallback failed. Skipping its logs.")
+
+        self._log_types[source_type_id] = type_id
+        return type_id
+
+    def import_session_logs(self, logs_data):
+        print(f"Importing {len(logs_data)} session logs (bulk)...")
+        with self._timed('session_logs') as stats:
+            _, single_owner = self._load_roles()
+            types = {type_id: (title, role_id, club_id) for type_id, title, role_id, club_id in db.session.execute(
+                select(SessionType.id, SessionType.Title, SessionType.role_id, SessionType.club_id)
+                .order_by(SessionType.id))}
+            by_title = _first_ids(((title, club_id), type_id) for type_id, (title, _, club_id) in types.items())
+            by_role = _first_ids(((role_id, club_id), type_id) for type_id, (_, role_id, club_id) in types.items())
+            meeting_ids = set(self.meeting_map.values())
+
+            # Existing logs and owners of the imported meetings. Logs are
+            # keyed by reference: positive ids exist, negative ones are new.
+            shared_logs = {}  # (meeting_id, title, type_id) -> log ref
+            log_keys = {}     # log ref -> (meeting_id, title, type_id)
+            for log_id, meeting_id, title, type_id in _select_in(
+                    select(SessionLog.id, SessionLog.meeting_id, SessionLog.Session_Title, SessionLog.Type_ID)
+                    .order_by(SessionLog.id), SessionLog.meeting_id, meeting_ids):
+                shared_logs.setdefault((meeting_id, title, type_id), log_id)
+                log_keys[log_id] = (meeting_id, title, type_id)
+            owned_logs = {}   # (meeting_id, title, type_id, contact_id) -> log ref
+            owners = {}       # (meeting_id, role_id, log ref, contact_id) -> OMR id or staged row
+            for omr_id, meeting_id, role_id, log_id, contact_id in _select_in(
+                    select(OwnerMeetingRoles.id, OwnerMeetingRoles.meeting_id, OwnerMeetingRoles.role_id,
+                           OwnerMeetingRoles.session_log_id, OwnerMeetingRoles.contact_id)
+                    .order_by(OwnerMeetingRoles.id), OwnerMeetingRoles.meeting_id, meeting_ids):
+                owners.setdefault((meeting_id, role_id, log_id, contact_id), omr_id)
+                if log_id in log_keys:
+                    owned_logs.setdefault((*log_keys[log_id], contact_id), log_id)
+
+            new_logs, new_owners, credentials = [], [], {}
+            touched_meetings, touched_contacts, synced_contacts = set(), set(), set()
+            for row in logs_data:
+                meet_no = row[1]
+                if meet_no not in self.meeting_map:
+                    continue
+                meeting_id = self.meeting_map[meet_no]
+                type_id = self._resolve_log_type(row[2], by_title, by_role)
+                if type_id is None:
+                    continue
+
+                target_contact = self.contact_map.get(row[3])
+                type_title, role_id, _ = types.get(type_id, (None, None, None))
+                is_single_owner = single_owner.get(role_id, True) if role_id is not None else True
+                title = row[9] if row[9] else ""
+
+                log_ref = None
+                if is_single_owner and target_contact:
+                    log_ref = owned_logs.get((meeting_id, title, type_id, target_contact.id))
+                if log_ref is None and not is_single_owner:
+                    log_ref = shared_logs.get((meeting_id, title, type_id))
+
+                if log_ref is None:
+                    is_prepared_speech = type_title in ('Prepared Speech', 'Presentation')
+                    should_import_metadata = (row[10] is not None) or is_prepared_speech
+                    values = self._session_log_values(row, meeting_id, type_id, should_import_metadata)
+                    new_logs.append(values)
+                    log_ref = -len(new_logs)
+                    log_keys[log_ref] = (meeting_id, values['Session_Title'], type_id)
+                    shared_logs.setdefault(log_keys[log_ref], log_ref)
+                    touched_meetings.add(meeting_id)
+
+                if not target_contact:
+                    continue
+                if target_contact.id not in synced_contacts:
+                    synced_contacts.add(target_contact.id)
+                    for uc in target_contact.user_club_records:
+                        if uc.user and target_contact.Member_ID and not uc.user.member_no:
+                            uc.user.member_no = target_contact.Member_ID
+
+                owner_log = log_ref if is_single_owner else None
+                key = (meeting_id, role_id, owner_log, target_contact.id)
+                omr = owners.get(key)
+                if omr is None:
+                    omr = {'meeting_id': meeting_id, 'role_id': role_id, 'contact_id': target_contact.id,
+                           'log_ref': owner_log, 'credential': None}
+                    owners[key] = omr
+                    new_owners.append(omr)
+                    touched_meetings.add(meeting_id)
+                    touched_contacts.add(target_contact.id)
+                    if owner_log is not None:
+                        owned_logs.setdefault((*log_keys[owner_log], target_contact.id), owner_log)
+                source_credential = row[12] if len(row) > 12 else None
+                if source_credential:
+                    if isinstance(omr, dict):
+                        omr['credential'] = source_credential
+                    else:
+                        credentials[omr] = source_credential
+                        touched_contacts.add(target_contact.id)
+
+            # Write logs first; staged owners then pick up the new log ids.
+            ids = self._write('session_logs', SessionLog, new_logs, returning=True)
+            log_ids = {-(index + 1): log_id for index, log_id in enumerate(ids)}
+            stats['rows'] = sum(1 for log_id in ids if log_id is not None)
+
+            owner_rows = []
+            for omr in new_owners:
+                log_ref = omr.pop('log_ref')
+                log_id = log_ids.get(log_ref, log_ref) if log_ref is not None else None
+                if log_ref is not None and log_id is None:
+                    continue  # its log was skipped
+                owner_rows.append(dict(omr, session_log_id=log_id))
+            self._write('owner_meeting_roles', OwnerMeetingRoles, owner_rows)
+            self._update(OwnerMeetingRoles, [{'id': omr_id, 'credential': credential}
+                                             for omr_id, credential in credentials.items()])
+
+            # Recalculate section IDs for all imported/modified meetings
+            from app.services.agenda_schedule import recalculate_agenda
+            recalculate_agenda(sorted(meeting_ids), start_times=False)
+            self._mark_changed(touched_meetings, touched_contacts)
+            self._refresh_meeting_state()
+            db.session.commit()
+        self._publish_meeting_state()
+
+    def import_roster(self, roster_data):
+        print(f"Importing {len(roster_data)} roster entries (bulk)...")
+        with self._timed('roster') as stats:
+            rows = [row for row in roster_data if row[1] in self.meeting_map]
+            tickets = _first_ids(db.session.execute(select(Ticket.name, Ticket.id).order_by(Ticket.id)))
+            prices = dict(db.session.execute(select(Ticket.id, Ticket.price)).all())
+            missing = list(dict.fromkeys(row[3] for row in rows if row[3] and row[3] not in tickets))
+            for name, ticket_id in zip(missing, self._write('tickets', Ticket, [{'name': n} for n in missing],
+                                                            returning=True)):
+                tickets[name] = ticket_id
+
+            existing = set(_select_in(select(Roster.meeting_id, Roster.order_number), Roster.meeting_id,
+                                      set(self.meeting_map.values())))
+            new_rows = []
+            for row in rows:
+                meeting_id = self.meeting_map[row[1]]
+                key = (meeting_id, row[2])
+                if key in existing:
+                    continue
+                existing.add(key)
+                ticket_id = tickets.get(row[3]) if row[3] else None
+                new_rows.append({
+                    'meeting_id': meeting_id,
+                    'order_number': row[2],
+                    'contact_id': self._map_contact(row[4]),
+                    'contact_type': row[5] if len(row) > 5 else None,
+                    'ticket_id': ticket_id,
+                    # update_roster_amount does not run for bulk inserts
+                    'amount': (prices.get(ticket_id) or 0.0) if ticket_id else 0.0,
+                })
+            stats['rows'] = self._write('roster', Roster, new_rows)
+            db.session.commit()
+
+    def import_achievements(self, achievements_data):
+        print(f"Importing {len(achievements_data)} achievements (bulk)...")
+        with self._timed('achievements') as stats:
+            user_ids = {}  # target contact id -> user id (Contact.user_id, once per contact)
+            staged = []
+            for row in achievements_data:
+                target_contact = self.contact_map.get(row[1])
+                if not target_contact:
+                    continue
+                if target_contact.id not in user_ids:
+                    user_ids[target_contact.id] = target_contact.user_id or 0
+                staged.append((target_contact.id, user_ids[target_contact.id], row))
+
+            existing = set(_select_in(
+                select(Achievement.user_id, Achievement.award_date, Achievement.achievement_type, Achievement.level),
+                Achievement.user_id, {uid for _, uid, _ in staged}))
+            new_rows, contact_ids = [], set()
+            for contact_id, uid, row in staged:
+                key = (uid, self._parse_date(row[3]), row[4], row[6])
+                if key in existing:
+                    continue
+                existing.add(key)
+                contact_ids.add(contact_id)
+                new_rows.append({
+                    'user_id': uid, 'member_id': row[2], 'award_date': key[1],
+                    'achievement_type': row[4], 'path_name': row[5], 'level': row[6], 'notes': row[7],
+                })
+            stats['rows'] = self._write('achievements', Achievement, new_rows)
+            self._mark_changed(contact_ids=contact_ids)
+            db.session.commit()
+
+    def import_votes(self, votes_data):
+        from app.services.vote_tally import invalidate_tally
+
+        print(f"Importing {len(votes_data)} votes (bulk)...")
+        with self._timed('votes') as stats:
+            existing = set(_select_in(
+                select(Vote.meeting_id, Vote.voter_identifier, Vote.award_category, Vote.contact_id),
+                Vote.meeting_id, set(self.meeting_map.values())))
+            new_rows = []
+            for row in votes_data:
+                if row[1] not in self.meeting_map:
+                    continue
+                key = (self.meeting_map[row[1]], row[2], row[3], self._map_contact(row[4]))
+                if key in existing:
+                    continue
+                existing.add(key)
+                new_rows.append({
+                    'meeting_id': key[0], 'voter_identifier': row[2], 'award_category': row[3],
+                    'contact_id': key[3], 'question': row[5], 'score': row[6], 'comments': row[7],
+                })
+            stats['rows'] = self._write('votes', Vote, new_rows)
+            db.session.commit()
+        for meeting_id in {values['meeting_id'] for values in new_rows}:
+            invalidate_tally(meeting_id)
@@ -1,14 +1,50 @@
 import json
 from flask import current_app
-from app import db, cache
-from app.models import ChatMessage
+from app.services import chat_summaries
+
+
+def filter_failed_turns(messages):
+    """
+    Drop user/assistant turns where a database request was answered without
+    calling any tool; such replies are untrustworthy (e.g. hallucinated).
+    """
+    from app.services.chat_service import ChatService
+
+    filtered_messages = []
+    i = 0
+    n = len(messages)
+    while i < n:
+        msg = messages[i]
+
+        # Check if this is a user message followed by an assistant message
+        if msg.role == 'user' and i + 1 < n and messages[i + 1].role == 'assistant':
+            user_msg = msg
+            assistant_msg = messages[i + 1]
+
+            # Check if this was a database query/action request
+            was_db_req = ChatService.should_enforce_tools(user_msg.content)
+            # Check if it executed any database tools
+            executed_any = bool(assistant_msg.tool_calls)
+
+            if was_db_req and not executed_any:
+                # This was a database request that failed to execute tools (e.g. hallucinated text/error).
+                # We exclude this untrustworthy turn from the active history.
+                i += 2
+                continue
+
+        filtered_messages.append(msg)
+        i += 1
+
+    return filtered_messages
+
 
 class ChatHistoryContext:
     """
     Context manager that manages chat history dynamically.
     Partitions the chat history into active messages and older messages,
-    generates/maintains a running summary for older messages,
-    and dynamically injects database context and summary into the system prompt.
+    loads the stored running summary (kept up to date in the background by
+    app/services/chat_summaries.py), and dynamically injects database
+    context and summary into the system prompt.
     """
     def __init__(self, user, club_id, chat_history_list=None, user_message=None, locale='en'):
         self.user = user
@@ -29,63 +65,26 @@ class ChatHistoryContext:
         # 1. Determine active messages limit from config
         self.active_limit = current_app.config.get('CHAT_HISTORY_ACTIVE_LIMIT', 20)
         
-        # 2. Fetch all user/assistant chat messages in chronological order
+        # 2. Fetch the user/assistant chat messages not yet summarized, in chronological order
         if self.chat_history_list is not None:
             all_messages = [
                 msg for msg in self.chat_history_list
                 if msg.role in ['user', 'assistant']
             ]
         else:
-            all_messages = ChatMessage.query.filter_by(
-                user_id=self.user.id,
-                club_id=self.club_id
-            ).filter(
-                ChatMessage.role.in_(['user', 'assistant'])
-            ).order_by(ChatMessage.timestamp.asc()).all()
+            all_messages = chat_summaries.recent_messages(self.user.id, self.club_id)
 
         # Filter out failed/hallucinated database turns to avoid biasing the model
-        filtered_messages = []
-        i = 0
-        n = len(all_messages)
-        while i < n:
-            msg = all_messages[i]
-            
-            # Check if this is a user message followed by an assistant message
-            if msg.role == 'user' and i + 1 < n and all_messages[i + 1].role == 'assistant':
-                user_msg = msg
-                assistant_msg = all_messages[i + 1]
-                
-                # Check if this was a database query/action request
-                was_db_req = ChatService.should_enforce_tools(user_msg.content)
-                # Check if it executed any database tools
-                executed_any = bool(assistant_msg.tool_calls)
-                
-                if was_db_req and not executed_any:
-                    # This was a database request that failed to execute tools (e.g. hallucinated text/error).
-                    # We exclude this untrustworthy turn from the active history.
-                    i += 2
-                    continue
-            
-            filtered_messages.append(msg)
-            i += 1
-            
-        all_messages = filtered_messages
+        all_messages = filter_failed_turns(all_messages)
 
-        # 3. Partition into active messages and older messages
-        older_messages = []
-        active_messages_objs = []
-        
+        # 3. Keep the active window; older messages are covered by the stored summary
         active_limit = self.active_limit
         if ChatService.should_enforce_tools(self.user_message):
             # For database actions/queries, restrict active history to prevent the model
             # from being biased by historical plain-text assistant responses.
             active_limit = min(5, active_limit)
             
-        if len(all_messages) > active_limit:
-            older_messages = all_messages[:-active_limit]
-            active_messages_objs = all_messages[-active_limit:]
-        else:
-            active_messages_objs = all_messages
+        active_messages_objs = all_messages[-active_limit:] if active_limit else []
 
         # Convert active message objects to Anthropic messages payload
         self.messages = []
@@ -147,39 +146,9 @@ class ChatHistoryContext:
                         "content": msg.content
                     })
 
-        # 4. Handle summary of older messages
-        if older_messages:
-            cache_key = f"chat_summary_{self.user.id}_{self.club_id}"
-            cached_data = cache.get(cache_key)
-            
-            # Determine which older messages need summarizing (ignore messages without IDs in test/edge cases)
-            last_msg_id = cached_data.get('last_msg_id', 0) if cached_data else 0
-            messages_to_add = [
-                msg for msg in older_messages
-                if msg.id is not None and msg.id > last_msg_id
-            ]
-            
-            if messages_to_add:
-                # Need to update/generate the summary
-                previous_summary = cached_data.get('summary', '') if cached_data else ''
-                
-                # Convert new messages to simple text format for summarizer
-                new_msgs_text = ""
-                for msg in messages_to_add:
-                    new_msgs_text += f"{msg.role}: {msg.content}\n"
-                
-                # Generate updated summary via LLM
-                updated_summary = ChatService.generate_summary(previous_summary, new_msgs_text)
-                
-                # Cache the updated summary
-                cache_data = {
-                    'summary': updated_summary,
-                    'last_msg_id': messages_to_add[-1].id
-                }
-                cache.set(cache_key, cache_data, timeout=86400) # cache for 1 day
-                self.summary = updated_summary
-            else:
-                self.summary = cached_data.get('summary', '') if cached_data else ''
+        # 4. Load the running summary of older messages
+        stored_summary = chat_summaries.get_summary(self.user.id, self.club_id)
+        self.summary = stored_summary.summary if stored_summary else ""
 
         # 5. Get dynamic database context and apply ceiling limits
         db_context = ChatService.get_query_context(self.user_message, self.club_id)
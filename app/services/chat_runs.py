@@ -0,0 +1,161 @@
+"""AI chat replies generated off the request thread.
+
+``/chat/send`` used to run ``ChatService.process_chat_completion`` inside
+the request: up to five model round trips plus tool calls and rate-limit
+backoff, all while holding a gunicorn thread. With ``"stream": true`` the
+route now saves the user's message, calls ``start()`` and returns at once;
+the tool loop runs on a small per-process thread pool (``CHAT_RUN_WORKERS``)
+inside a copy of the request context, so tools still see the user, club
+and permissions of the original request.
+
+Progress is published on the ``chat:<message id>:reply`` event-bus topic as
+JSON events, which the chat widget follows over ``/api/events``:
+
+* ``{"type": "token", "delta": ..., "text": ...}`` -- model output so far
+  for the current turn.
+* ``{"type": "tool", "status": "running"|"finished", "name": ..., ...}``
+* ``{"type": "done", "content": ..., "executed_tools": [...], "message_id": ...}``
+  -- the reply has been saved as a ``ChatMessage``.
+* ``{"type": "error", "message": ...}``
+
+Events published before the browser subscribed are lost, so each run also
+keeps its state in the cache under the user message's id (pending, then the
+id of the saved reply or the error). ``reply_status()`` backs
+``/chat/replies/<id>`` for polling from that state, so a later message or
+command reply in the same chat is never mistaken for this run's reply.
+
+Under ``TESTING`` (or with ``CHAT_RUN_INLINE``) replies are generated
+synchronously in the sending request instead of on the pool.
+"""
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from flask import copy_current_request_context, current_app
+from flask_login import current_user
+
+from app import cache, db
+from app.models import ChatMessage
+from app.services.event_bus import chat_topic, publish
+
+logger = logging.getLogger(__name__)
+
+# How long a run's state stays available to pollers
+RUN_STATE_TIMEOUT = 3600
+
+_executor = None
+_executor_pid = None
+_executor_lock = threading.Lock()
+
+
+def _state_key(message_id):
+    return f"chat_run_state_{message_id}"
+
+
+def _set_state(message_id, **state):
+    cache.set(_state_key(message_id), state, timeout=RUN_STATE_TIMEOUT)
+
+
+def start(message, locale):
+    """Generate the AI reply to the saved user ``message`` in the background."""
+    message_id = message.id
+    _set_state(message_id, status='pending')
+
+    @copy_current_request_context
+    def run():
+        _run(message_id, locale)
+
+    submit(run)
+
+
+def submit(fn):
+    """Call ``fn`` on the chat pool, or right away under TESTING / ``CHAT_RUN_INLINE``."""
+    app = current_app._get_current_object()
+    inline = app.config.get('CHAT_RUN_INLINE')
+    if inline is None:
+        inline = app.testing
+    if inline:
+        fn()
+    else:
+        _get_executor(app).submit(fn)
+
+
+def _get_executor(app):
+    """Per-process pool; a forked gunicorn worker must not reuse its parent's threads."""
+    global _executor, _executor_pid
+    with _executor_lock:
+        if _executor is None or _executor_pid != os.getpid():
+            _executor = ThreadPoolExecutor(max_workers=app.config.get('CHAT_RUN_WORKERS', 4),
+                                           thread_name_prefix='chat-run')
+            _executor_pid = os.getpid()
+        return _executor
+
+
+def _run(message_id, locale):
+    from app.services import chat_summaries
+    from app.services.chat_service import ChatService
+
+    topic = chat_topic(message_id)
+
+    def emit(event):
+        publish(topic, json.dumps(event))
+
+    message = db.session.get(ChatMessage, message_id)
+    if not message:
+        return
+    user_id, club_id = message.user_id, message.club_id
+    try:
+        history = chat_summaries.recent_messages(user_id, club_id)
+
+        reply_text, executed_tools = ChatService.process_chat_completion(
+            chat_history_list=history,
+            user=current_user,
+            club_id=club_id,
+            locale=locale,
+            on_event=emit
+        )
+
+        assistant_msg = ChatMessage(
+            user_id=user_id,
+            club_id=club_id,
+            role='assistant',
+            content=reply_text,
+            tool_calls=json.dumps(executed_tools) if executed_tools else None,
+            mode='ai'
+        )
+        db.session.add(assistant_msg)
+        db.session.commit()
+        _set_state(message_id, status='done', reply_id=assistant_msg.id)
+    except Exception as e:
+        db.session.rollback()
+        logger.exception("Chat reply to message %s failed", message_id)
+        error = f"Error: {str(e)}"
+        _set_state(message_id, status='error', message=error)
+        emit({'type': 'error', 'message': error})
+        return
+
+    emit({
+        'type': 'done',
+        'content': reply_text,
+        'executed_tools': executed_tools,
+        'message_id': assistant_msg.id
+    })
+    chat_summaries.schedule(user_id, club_id)
+
+
+def reply_status(message):
+    """Return the state of the reply to user ``message`` as a dict for polling."""
+    state = cache.get(_state_key(message.id)) or {'status': 'pending'}
+    if state['status'] == 'done':
+        reply = db.session.get(ChatMessage, state['reply_id'])
+        if not reply:
+            return {'status': 'error', 'message': 'The reply was deleted.'}
+        return {
+            'status': 'done',
+            'content': reply.content,
+            'executed_tools': json.loads(reply.tool_calls) if reply.tool_calls else [],
+            'message_id': reply.id
+        }
+    return dict(state)
@@ -478,38 +478,70 @@ class ChatService:
         return anthropic.Anthropic(api_key=api_key, base_url=base_url)
 
     @classmethod
-    def _messages_create_with_retry(cls, client, **kwargs):
+    def _with_retry(cls, call, kwargs):
+        """Run ``call()``, retrying rate limits and transient API errors with backoff.
+
+        ``kwargs`` are the request parameters, logged when retries run out.
+        """
         import time
         import anthropic
-        
+
         api_retries = 0
         max_api_retries = 5
         backoff = 1.0
-        
+
         while True:
             try:
-                return client.messages.create(**kwargs)
+                return call()
             except anthropic.RateLimitError as e:
                 api_retries += 1
                 if api_retries > max_api_retries:
                     current_app.logger.error(f"RateLimitError: Max retries exceeded. Request parameters: {kwargs}")
                     raise e
-                current_app.logger.warning(f"RateLimitError encountered. Retrying in {backoff} seconds... (Attempt {api_retries}/{max_api_retries})")
+                current_app.logger.warning(f"RateLimitError encountered. Retrying in {backoff} seconds... "
+                                           f"(Attempt {api_retries}/{max_api_retries})")
                 time.sleep(backoff)
                 backoff *= 2.0
             except (anthropic.APIConnectionError, anthropic.APITimeoutError) as e:
                 api_retries += 1
                 if api_retries > max_api_retries:
-                    current_app.logger.error(f"Connection/Timeout Error: Max retries exceeded. Request parameters: {kwargs}")
+                    current_app.logger.error(
+                        f"Connection/Timeout Error: Max retries exceeded. Request parameters: {kwargs}")
                     raise e
-                current_app.logger.warning(f"Transient API error: {str(e)}. Retrying in {backoff} seconds... (Attempt {api_retries}/{max_api_retries})")
+                current_app.logger.warning(f"Transient API error: {str(e)}. Retrying in {backoff} seconds... "
+                                           f"(Attempt {api_retries}/{max_api_retries})")
                 time.sleep(backoff)
                 backoff *= 1.5
 
     @classmethod
-    def generate_summary(cls, previous_summary, new_messages_text):
+    def _messages_create_with_retry(cls, client, **kwargs):
+        return cls._with_retry(lambda: client.messages.create(**kwargs), kwargs)
+
+    @classmethod
+    def _messages_stream_with_retry(cls, client, on_event, **kwargs):
+        """Streaming counterpart of ``_messages_create_with_retry``.
+
+        Each text delta is passed to ``on_event`` as a ``token`` event that
+        also carries the turn's text so far, so a retried attempt (or a late
+        subscriber) simply replaces what was shown. Returns the final message.
+        """
+        def stream_once():
+            text = ""
+            with client.messages.stream(**kwargs) as stream:
+                for delta in stream.text_stream:
+                    text += delta
+                    on_event({'type': 'token', 'delta': delta, 'text': text})
+                return stream.get_final_message()
+
+        return cls._with_retry(stream_once, kwargs)
+
+    @classmethod
+    def generate_summary(cls, previous_summary, new_messages_text, raise_errors=False):
         """
         Uses the LLM to update or create a running summary of the chat history.
+
+        With ``raise_errors`` a failed call raises instead of returning a
+        placeholder, so the caller can keep the previous summary.
         """
         client = cls.get_client()
         model_name = current_app.config.get('ANTHROPIC_MODEL', 'MiniMax-M3')
@@ -539,6 +571,8 @@ class ChatService:
             return text_block.strip()
         except Exception as e:
             current_app.logger.error(f"Error generating chat summary: {str(e)}")
+            if raise_errors:
+                raise
             if previous_summary:
                 return previous_summary + "\n[Error updating summary context]"
             return "[Error generating summary context]"
@@ -577,8 +611,8 @@ class ChatService:
     @staticmethod
     def get_query_context(message_text, club_id):
         """
-        Queries the database for relevant meetings or contacts matching keywords 
-        in the user's query and returns a structured context string to guide the LLM.
+        Looks up meetings and contacts matching keywords in the user's query in
+        the club's name index and returns a structured context string to guide the LLM.
         """
         if not message_text:
             return ""
@@ -587,32 +621,24 @@ class ChatService:
         message_lower = message_text.lower()
         import re
         
+        from app.services.name_resolver import get_name_index
+        index = get_name_index(club_id)
+        
         # 1. Look for meeting numbers (e.g. #973, 973)
-        meeting_nums = re.findall(r'#?(\d+)', message_text)
-        if meeting_nums:
-            from app.models import Meeting
-            for num_str in meeting_nums:
-                try:
-                    num = int(num_str)
-                    meeting = Meeting.query.filter_by(club_id=club_id, Meeting_Number=num).first()
-                    if meeting:
-                        context_parts.append(
-                            f"- Meeting #{meeting.Meeting_Number} exists (Date: {meeting.Meeting_Date}, Status: {meeting.status}, Title: '{meeting.Meeting_Title or 'N/A'}')"
-                        )
-                except ValueError:
-                    continue
+        for num_str in re.findall(r'#?(\d+)', message_text):
+            meeting = index.meetings_by_number.get(int(num_str))
+            if meeting:
+                context_parts.append(
+                    f"- Meeting #{meeting.number} exists (Date: {meeting.date}, Status: {meeting.status}, "
+                    f"Title: '{meeting.title or 'N/A'}')"
+                )
                     
         # 2. Look for "upcoming" or "next" meeting query
         if any(w in message_lower for w in {'upcoming', 'next', '下一次', '下次', '后面', '新', '创建'}):
-            from app.models import Meeting
-            upcoming = Meeting.query.filter(
-                Meeting.club_id == club_id,
-                Meeting.status != 'finished',
-                Meeting.status != 'cancelled'
-            ).order_by(Meeting.Meeting_Date.asc()).limit(3).all()
-            for m in upcoming:
+            for m in index.upcoming_meetings(3):
                 context_parts.append(
-                    f"- Upcoming/Active Meeting #{m.Meeting_Number}: Date={m.Meeting_Date}, Status='{m.status}', Title='{m.Meeting_Title or 'N/A'}'"
+                    f"- Upcoming/Active Meeting #{m.number}: Date={m.date}, Status='{m.status}', "
+                    f"Title='{m.title or 'N/A'}'"
                 )
 
         # 3. Look for potential contact names (capitalized words or specific name substrings)
@@ -631,17 +657,22 @@ class ChatService:
             if len(w) >= 2 or re.match(r'[\u4e00-\u9fa5]', w):
                 potential_names.append(w)
                 
-        if potential_names:
-            from app.models import Contact
-            from app.models.contact_club import ContactClub
-            for name in potential_names:
-                contacts = Contact.query.join(ContactClub).filter(
-                    ContactClub.club_id == club_id,
-                    Contact.Name.like(f"%{name}%")
-                ).limit(5).all()
-                for c in contacts:
+        for name in potential_names:
+            contacts = index.search(name, limit=5)
+            if not contacts and re.match(r'[\u4e00-\u9fa5]', name):
+                # Chinese text has no spaces: look for names inside the run
+                contacts = index.names_in(name)[:5]
+            for c in contacts:
+                context_parts.append(
+                    f"- Contact in directory: Name='{c.name}' (ID: {c.id}, Type: '{c.type}', "
+                    f"Email: '{c.email or 'N/A'}')"
+                )
+            if not contacts and name[:1].isupper() and len(name) >= 3:
+                # Probably a misspelled name: offer the closest ones
+                for c in index.search(name, limit=3, fuzzy=True):
                     context_parts.append(
-                        f"- Contact in directory: Name='{c.Name}' (ID: {c.id}, Type: '{c.Type}', Email: '{c.Email or 'N/A'}')"
+                        f"- Closest contact to '{name}': Name='{c.name}' (ID: {c.id}, Type: '{c.type}', "
+                        f"Email: '{c.email or 'N/A'}')"
                     )
                     
         if context_parts:
@@ -723,9 +754,13 @@ class ChatService:
         return False
 
     @classmethod
-    def process_chat_completion(cls, chat_history_list, user, club_id, locale):
+    def process_chat_completion(cls, chat_history_list, user, club_id, locale, on_event=None):
         """
         Processes a full conversation cycle using Anthropic protocol.
+
+        With ``on_event`` the model's replies are streamed: text deltas and
+        tool start/finish notices are passed to it as they happen (see
+        ``app/services/chat_runs.py``).
         """
         client = cls.get_client()
         model_name = current_app.config.get('ANTHROPIC_MODEL', 'MiniMax-M3')
@@ -814,8 +849,7 @@ class ChatService:
             while turn < max_turns:
                 turn += 1
                 
-                response = cls._messages_create_with_retry(
-                    client,
+                request_args = dict(
                     model=model_name,
                     system=system_prompt,
                     messages=messages_run,
@@ -824,6 +858,10 @@ class ChatService:
                     max_tokens=2000,
                     temperature=0.0
                 )
+                if on_event:
+                    response = cls._messages_stream_with_retry(client, on_event, **request_args)
+                else:
+                    response = cls._messages_create_with_retry(client, **request_args)
                 # Downgrade tool_choice to auto for subsequent turns
                 tool_choice = {"type": "auto"}
 
@@ -845,7 +883,13 @@ class ChatService:
                         params = tu.input # Anthropic parses arguments into dict automatically
 
                         # Execute tool locally
+                        if on_event:
+                            on_event({'type': 'tool', 'status': 'running', 'id': tu.id, 'name': tool_name,
+                                      'arguments': params})
                         tool_result = ChatToolExecutor.execute(tool_name, params, user, club_id)
+                        if on_event:
+                            on_event({'type': 'tool', 'status': 'finished', 'id': tu.id, 'name': tool_name,
+                                      'success': tool_result.get('success') is not False})
 
                         # Audit tool execution (including result)
                         executed_tools.append({
@@ -914,7 +958,7 @@ class ChatService:
                     "content": f"System Note: {guidance_msg}{lang_suffix}"
                 })
                 # Give LLM one more turn to respond constructively
-                response = client.messages.create(
+                request_args = dict(
                     model=model_name,
                     system=system_prompt,
                     messages=messages_run,
@@ -923,6 +967,10 @@ class ChatService:
                     max_tokens=2000,
                     temperature=0.0
                 )
+                if on_event:
+                    response = cls._messages_stream_with_retry(client, on_event, **request_args)
+                else:
+                    response = client.messages.create(**request_args)
                 text_block = next((block.text for block in response.content if block.type == "text"), "")
                 if text_block:
                     return text_block, executed_tools
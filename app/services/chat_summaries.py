@@ -0,0 +1,170 @@
+"""Rolling summaries of older chat history, kept up to date in the background.
+
+Every chat turn used to load the user's whole ``ChatMessage`` history for the
+club, and when messages had fallen out of the active window
+(``CHAT_HISTORY_ACTIVE_LIMIT``) it asked the model to fold them into a
+summary before it could answer, with the result only kept in a one-day
+cache entry.
+
+The summary now lives in a ``ChatSummary`` row whose ``last_message_id`` is a
+watermark. A turn reads that row and ``recent_messages()``: a keyset query
+for the newest messages above the watermark, so its cost no longer grows
+with the history. After a reply has been saved, ``schedule()`` runs
+``refresh()`` on the chat pool (see ``app/services/chat_runs.py``), which
+folds the messages that have left the active window into the summary and
+moves the watermark past them. A turn never waits for it; until it
+finishes, the previous summary is used. ``clear()`` keeps the row but
+resets it under a new ``generation``; a refresh writes only if the row
+still has the generation and watermark it started from.
+"""
+import logging
+import threading
+from datetime import datetime
+
+from flask import current_app
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
+
+from app import db
+from app.models import ChatMessage, ChatSummary
+
+logger = logging.getLogger(__name__)
+
+# (user_id, club_id) pairs with a refresh queued or running in this process
+_pending = set()
+_pending_lock = threading.Lock()
+
+
+def active_limit():
+    return current_app.config.get('CHAT_HISTORY_ACTIVE_LIMIT', 20)
+
+
+def get_summary(user_id, club_id):
+    """Return the stored ``ChatSummary`` of a user's chat in a club, or None."""
+    return ChatSummary.query.filter_by(user_id=user_id, club_id=club_id).first()
+
+
+def _messages_after(user_id, club_id, watermark):
+    return ChatMessage.query.filter(
+        ChatMessage.user_id == user_id,
+        ChatMessage.club_id == club_id,
+        ChatMessage.role.in_(['user', 'assistant']),
+        ChatMessage.id > watermark
+    )
+
+
+def recent_messages(user_id, club_id, limit=None):
+    """Newest user/assistant messages not yet summarized, oldest first.
+
+    Loads at most ``limit`` messages (default: twice the active window, which
+    leaves room for the failed turns ``ChatHistoryContext`` drops).
+    """
+    summary = get_summary(user_id, club_id)
+    watermark = summary.last_message_id if summary else 0
+    messages = _messages_after(user_id, club_id, watermark).order_by(
+        ChatMessage.id.desc()
+    ).limit(limit or 2 * active_limit()).all()
+    messages.reverse()
+    return messages
+
+
+def refresh(user_id, club_id):
+    """Fold messages that left the active window into the stored summary.
+
+    Returns True when the summary was updated. If another worker moved the
+    watermark in the meantime, its result is kept and this one dropped.
+    """
+    from app.services.chat_history_context import filter_failed_turns
+    from app.services.chat_service import ChatService
+
+    summary = get_summary(user_id, club_id)
+    watermark = summary.last_message_id if summary else 0
+    generation = summary.generation if summary else 0
+    messages = filter_failed_turns(
+        _messages_after(user_id, club_id, watermark).order_by(ChatMessage.id.asc()).all()
+    )
+    limit = active_limit()
+    if len(messages) <= limit:
+        return False
+    older = messages[:-limit]
+
+    new_msgs_text = ""
+    for msg in older:
+        new_msgs_text += f"{msg.role}: {msg.content}\n"
+    previous_summary = summary.summary if summary else ''
+    updated_summary = ChatService.generate_summary(previous_summary, new_msgs_text, raise_errors=True)
+
+    if summary:
+        result = db.session.execute(
+            update(ChatSummary)
+            .where(ChatSummary.id == summary.id, ChatSummary.last_message_id == watermark,
+                   ChatSummary.generation == generation)
+            .values(summary=updated_summary, last_message_id=older[-1].id, updated_at=datetime.now())
+        )
+        if result.rowcount == 0:
+            db.session.rollback()
+            return False
+    else:
+        db.session.add(ChatSummary(user_id=user_id, club_id=club_id,
+                                   summary=updated_summary, last_message_id=older[-1].id))
+    try:
+        db.session.commit()
+    except IntegrityError:
+        # Another worker created the summary first, or the chat was cleared
+        db.session.rollback()
+        return False
+    return True
+
+
+def schedule(user_id, club_id):
+    """Refresh the summary in the background unless a refresh is already pending."""
+    from app.services.chat_runs import submit
+
+    key = (user_id, club_id)
+    with _pending_lock:
+        if key in _pending:
+            return
+        _pending.add(key)
+
+    app = current_app._get_current_object()
+
+    def run():
+        try:
+            with app.app_context():
+                try:
+                    refresh(user_id, club_id)
+                except Exception:
+                    db.session.rollback()
+                    logger.exception("Chat summary refresh for user %s in club %s failed", user_id, club_id)
+        finally:
+            with _pending_lock:
+                _pending.discard(key)
+
+    submit(run)
+
+
+def _reset(user_id, club_id):
+    return db.session.execute(
+        update(ChatSummary)
+        .where(ChatSummary.user_id == user_id, ChatSummary.club_id == club_id)
+        .values(summary='', last_message_id=0, generation=ChatSummary.generation + 1,
+                updated_at=datetime.now())
+    ).rowcount
+
+
+def clear(user_id, club_id):
+    """Reset the stored summary under a new generation; the caller commits.
+
+    The row is kept (or created) so that a refresh already running cannot
+    store the cleared history: its conditional update no longer matches and
+    its insert hits the unique constraint.
+    """
+    if _reset(user_id, club_id):
+        return
+    try:
+        with db.session.begin_nested():
+            db.session.add(ChatSummary(user_id=user_id, club_id=club_id, summary='',
+                                       last_message_id=0, generation=1))
+    except IntegrityError:
+        # A refresh created the summary in the meantime
+        _reset(user_id, club_id)
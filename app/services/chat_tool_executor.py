@@ -11,6 +11,8 @@ from app.auth.permissions import Permissions
 from app.auth.utils import is_authorized
 from app.services.role_service import RoleService
 from app.services.achievement_service import AchievementService
+from app.services.name_resolver import get_name_index
+from app.services import tool_result_cache
 from app.utils import derive_credentials
 from app.constants import GLOBAL_CLUB_ID
 from flask import current_app, url_for
@@ -41,28 +43,33 @@ class ChatToolExecutor:
             return None
             
         ident = str(meeting_identifier).strip().lstrip('#')
+        index = get_name_index(club_id) if club_id else None
         
         # Try meeting number (integer)
         try:
             mtg_num = int(ident)
-            query = Meeting.query.filter_by(Meeting_Number=mtg_num)
-            if club_id:
-                query = query.filter_by(club_id=club_id)
-            meeting = query.first()
-            if meeting:
-                return meeting
+            if index is not None:
+                entry = index.meetings_by_number.get(mtg_num)
+                if entry:
+                    return db.session.get(Meeting, entry.id)
+            else:
+                meeting = Meeting.query.filter_by(Meeting_Number=mtg_num).first()
+                if meeting:
+                    return meeting
         except ValueError:
             pass
             
         # Try date format YYYY-MM-DD
         try:
             mtg_date = datetime.strptime(ident, '%Y-%m-%d').date()
-            query = Meeting.query.filter_by(Meeting_Date=mtg_date)
-            if club_id:
-                query = query.filter_by(club_id=club_id)
-            meeting = query.first()
-            if meeting:
-                return meeting
+            if index is not None:
+                entry = index.meetings_by_date.get(mtg_date)
+                if entry:
+                    return db.session.get(Meeting, entry.id)
+            else:
+                meeting = Meeting.query.filter_by(Meeting_Date=mtg_date).first()
+                if meeting:
+                    return meeting
         except ValueError:
             pass
             
@@ -71,44 +78,15 @@ class ChatToolExecutor:
     @staticmethod
     def resolve_contact(contact_name, club_id):
         """
-        Resolves a contact by name.
+        Resolves a contact by name within the club: exact name, then the only
+        partial match, then first/last name.
         """
-        if not contact_name:
+        if not contact_name or not club_id:
             return None
             
-        name = str(contact_name).strip()
-        
-        # Search exact match
-        query = Contact.query.join(ContactClub).filter(
-            ContactClub.club_id == club_id,
-            Contact.Name == name
-        )
-        contact = query.first()
-        if contact:
-            return contact
-            
-        # Search partial match case insensitive
-        query = Contact.query.join(ContactClub).filter(
-            ContactClub.club_id == club_id,
-            Contact.Name.ilike(f"%{name}%")
-        )
-        contacts = query.all()
-        if len(contacts) == 1:
-            return contacts[0]
-            
-        # Try splitting parts
-        parts = name.split()
-        if len(parts) >= 2:
-            first_name, last_name = parts[0], parts[-1]
-            query = Contact.query.join(ContactClub).filter(
-                ContactClub.club_id == club_id,
-                Contact.first_name.ilike(first_name),
-                Contact.last_name.ilike(last_name)
-            )
-            contact = query.first()
-            if contact:
-                return contact
-                
+        entry = get_name_index(club_id).find_contact(contact_name)
+        if entry:
+            return db.session.get(Contact, entry.id)
         return None
 
     @staticmethod
@@ -131,9 +109,9 @@ class ChatToolExecutor:
                 role_name = re.sub(r'\s*\(?for\s+[^)]+\)?', '', str(role_name), flags=re.I).strip()
                 norm_name = role_name.strip().lower().replace('-', '').replace(' ', '')
 
-        logs = SessionLog.query.join(SessionType).join(MeetingRole).filter(
+        logs = SessionLog.load_owners(SessionLog.query.join(SessionType).join(MeetingRole).filter(
             SessionLog.meeting_id == meeting_id
-        ).all()
+        ).all())
         
         # Sort logs by Meeting_Seq to ensure correct ordering of slots
         logs.sort(key=lambda l: l.Meeting_Seq)
@@ -247,7 +225,10 @@ class ChatToolExecutor:
         if not method:
             return {'success': False, 'message': f"Unknown tool '{tool_name}'."}
         try:
-            return method(params, user, club_id)
+            result = method(params, user, club_id)
+            if tool_name not in tool_result_cache.READ_ONLY_TOOLS:
+                tool_result_cache.invalidate(club_id)
+            return result
         except Exception as e:
             current_app.logger.error(f"Error executing chat tool {tool_name}: {str(e)}")
             return {'success': False, 'message': f"Internal error during execution: {str(e)}"}
@@ -690,7 +671,12 @@ class ChatToolExecutor:
         contact = cls.resolve_contact(contact_name, club_id)
         if not contact:
             return {'success': False, 'message': f"Contact '{contact_name}' not found."}
-            
+
+        return tool_result_cache.cached('get_pathway_status', {'contact_id': contact.id}, club_id,
+                                        lambda: cls._pathway_status(contact, club_id))
+
+    @staticmethod
+    def _pathway_status(contact, club_id):
         registered_paths = ContactPath.query.filter_by(contact_id=contact.id).all()
         
         # Locate user achievements
@@ -784,7 +770,12 @@ class ChatToolExecutor:
         
         if not meeting:
             return {'success': False, 'message': f"Meeting '{meeting_ident}' not found."}
-            
+
+        return tool_result_cache.cached('get_meeting_agenda', {'meeting_id': meeting.id}, club_id,
+                                        lambda: cls._meeting_agenda(meeting))
+
+    @staticmethod
+    def _meeting_agenda(meeting):
         logs = SessionLog.query.filter(
             SessionLog.meeting_id == meeting.id,
             SessionLog.state != 'cancelled'
@@ -843,7 +834,12 @@ class ChatToolExecutor:
             limit = int(limit)
         except ValueError:
             limit = 5
-            
+
+        return tool_result_cache.cached('list_meetings', {'status': status, 'limit': limit}, club_id,
+                                        lambda: cls._list_meetings(status, limit, club_id))
+
+    @staticmethod
+    def _list_meetings(status, limit, club_id):
         query = Meeting.query.filter_by(club_id=club_id)
         if status:
             query = query.filter_by(status=status)
@@ -934,6 +930,7 @@ class ChatToolExecutor:
                     elif plan.status == 'waitlist':
                         plan.status = 'obsolete'
                         
+                SessionLog.load_owners(meeting.session_logs)
                 for log in meeting.session_logs:
                     is_prepared_speech = log.project and log.project.is_prepared_speech
                     is_project = (log.session_type and log.session_type.Valid_for_Project and log.Project_ID and log.Project_ID != 1) or is_prepared_speech
@@ -969,6 +966,11 @@ class ChatToolExecutor:
             if not is_authorized(Permissions.VOTING_VIEW_RESULTS, meeting=meeting):
                 return {'success': False, 'message': "You do not have permission to view voting results (VOTING_VIEW_RESULTS)."}
 
+        return tool_result_cache.cached('get_voting_results', {'meeting_id': meeting.id}, club_id,
+                                        lambda: cls._voting_results(meeting))
+
+    @staticmethod
+    def _voting_results(meeting):
         # Query votes
         vote_counts = db.session.query(
             Vote.award_category,
@@ -1340,6 +1342,12 @@ class ChatToolExecutor:
 
     @classmethod
     def tool_query_pathways_library(cls, params, user, club_id):
+        params = tool_result_cache.normalize_params(params)
+        return tool_result_cache.cached('query_pathways_library', params, club_id,
+                                        lambda: cls._pathways_library(params))
+
+    @staticmethod
+    def _pathways_library(params):
         pathway_name = params.get('pathway_name')
         level_val = params.get('level')
         project_name = params.get('project_name')
@@ -1861,6 +1869,7 @@ class ChatToolExecutor:
             .order_by(SessionLog.Meeting_Seq.asc()).all()
         if not candidates:
             return None
+        SessionLog.load_owners(candidates)
 
         slot_index = _safe_int(params.get('slot_index'))
         if slot_index is not None and 1 <= slot_index <= len(candidates):
@@ -1868,7 +1877,7 @@ class ChatToolExecutor:
 
         owner_name = (params.get('owner_name') or '').strip()
         if owner_name:
-            owner = cls.resolve_contact(owner_name, None)
+            owner = cls.resolve_contact(owner_name, meeting.club_id)
             for log in candidates:
                 if any(o.id == owner.id for o in (log.owners or [])) if owner else False:
                     return log
@@ -1945,9 +1954,10 @@ class ChatToolExecutor:
         st_filter = (params.get('session_type') or '').strip()
         owner_filter = (params.get('owner_name') or '').strip().lower()
 
-        logs = db.session.query(SessionLog).join(SessionType)\
-            .filter(SessionLog.meeting_id == meeting.id)\
-            .order_by(SessionLog.Meeting_Seq.asc()).all()
+        logs = SessionLog.load_owners(
+            db.session.query(SessionLog).join(SessionType)
+            .filter(SessionLog.meeting_id == meeting.id)
+            .order_by(SessionLog.Meeting_Seq.asc()).all())
 
         if st_filter:
             norm = st_filter.lower()
@@ -2103,9 +2113,8 @@ class ChatToolExecutor:
                 RoleService.assign_meeting_role(new_log, [owner_contact.id], is_admin=True)
                 db.session.flush()
 
-            from app.agenda_routes import _recalculate_start_times, recalculate_section_ids
-            _recalculate_start_times([meeting])
-            recalculate_section_ids(meeting)
+            from app.services.agenda_schedule import recalculate_agenda
+            recalculate_agenda([meeting])
             db.session.commit()
             RoleService._clear_meeting_cache(meeting.id)
 
@@ -2170,9 +2179,8 @@ class ChatToolExecutor:
                     db.session.flush()
                     log.project_code = log.derive_project_code(new_owner)
 
-            from app.agenda_routes import _recalculate_start_times, recalculate_section_ids
-            _recalculate_start_times([meeting])
-            recalculate_section_ids(meeting)
+            from app.services.agenda_schedule import recalculate_agenda
+            recalculate_agenda([meeting])
             db.session.commit()
             RoleService._clear_meeting_cache(meeting.id)
 
@@ -2240,9 +2248,8 @@ class ChatToolExecutor:
                 db.session.flush()
                 log.Meeting_Seq = target_seq
 
-            from app.agenda_routes import _recalculate_start_times, recalculate_section_ids
-            _recalculate_start_times([meeting])
-            recalculate_section_ids(meeting)
+            from app.services.agenda_schedule import recalculate_agenda
+            recalculate_agenda([meeting])
             db.session.commit()
             RoleService._clear_meeting_cache(meeting.id)
 
@@ -2286,9 +2293,8 @@ class ChatToolExecutor:
                     l.Meeting_Seq = i
             db.session.flush()
 
-            from app.agenda_routes import _recalculate_start_times, recalculate_section_ids
-            _recalculate_start_times([meeting])
-            recalculate_section_ids(meeting)
+            from app.services.agenda_schedule import recalculate_agenda
+            recalculate_agenda([meeting])
             db.session.commit()
             RoleService._clear_meeting_cache(meeting.id)
 
@@ -2492,9 +2498,8 @@ class ChatToolExecutor:
 
         try:
             if updated_agenda:
-                from app.agenda_routes import _recalculate_start_times, recalculate_section_ids
-                _recalculate_start_times([meeting])
-                recalculate_section_ids(meeting)
+                from app.services.agenda_schedule import recalculate_agenda
+                recalculate_agenda([meeting])
                 RoleService._clear_meeting_cache(meeting.id)
 
             db.session.commit()
@@ -0,0 +1,210 @@
+"""Per-club role/session-type metadata cache.
+
+Session types, meeting roles and the ``PathwayProject`` code map are read on
+almost every agenda, booking and voting request, but only change when an
+admin edits settings. This module compiles them into plain dicts:
+
+``get_club_metadata(club_id)``::
+
+    {
+        'session_types': [...],          # merged Global + Local, by Title
+        'session_type_ids': {Title: id},
+        'session_types_by_id': {id: {...}},
+        'roles': [...],                  # merged Global + Local, by name
+        'roles_by_id': {id: {...}},
+        'local_roles': [...],            # rows owned by the club itself
+        'award_categories': {category: [role_id, ...]},
+    }
+
+``get_pathway_project_codes()``::
+
+    {project_id: {path_abbr: {'code': code, 'level': level}}}
+
+Compiled data lives in the shared Flask-Caching backend next to version
+stamps, one per club (plus one for the Global club, which every club merges
+in, and one for the pathway map). Each worker keeps the last copy it saw in
+memory and only re-reads the shared copy when a stamp moves, so a steady
+state lookup costs no SQL.
+
+Stamps, process copies and the session hooks come from
+``app/services/versioned_cache.py``. Unit-of-work changes to
+``SessionType``, ``MeetingRole``, ``Pathway`` and ``PathwayProject``
+invalidate automatically (``changes`` is registered in
+``app/models/session.py``); the settings routes also call
+``invalidate_club_metadata`` explicitly after they commit.
+"""
+from flask import g, has_request_context
+
+from app import cache, db
+from app.constants import GLOBAL_CLUB_ID
+from app.services.versioned_cache import CACHE_TIMEOUT, VersionStamps
+
+PATHWAY_SCOPE = 'pathways'
+
+_stamps = VersionStamps('club_metadata_version')
+
+
+def _data_key(scope):
+    return f"club_metadata_{scope}"
+
+
+def _normalize(club_id):
+    # get_all_for_club(None) has always meant "Global items only".
+    return club_id or GLOBAL_CLUB_ID
+
+
+def _role_dict(role):
+    return {
+        'id': role.id,
+        'name': role.name,
+        'icon': role.icon,
+        'type': role.type,
+        'award_category': role.award_category,
+        'needs_approval': role.needs_approval,
+        'has_single_owner': role.has_single_owner,
+        'is_member_only': role.is_member_only,
+        'ticket_type': role.ticket_type,
+        'club_id': role.club_id,
+    }
+
+
+def compile_club_metadata(club_id):
+    """Load the club's session types and roles (two queries) into dicts."""
+    from app.models import MeetingRole, SessionType
+
+    club_id = _normalize(club_id)
+    club_ids = {GLOBAL_CLUB_ID, club_id}
+
+    role_rows = MeetingRole.query.filter(MeetingRole.club_id.in_(club_ids)).all()
+    type_rows = (
+        db.session.query(SessionType, MeetingRole.name, MeetingRole.type)
+        .outerjoin(MeetingRole, SessionType.role_id == MeetingRole.id)
+        .filter(SessionType.club_id.in_(club_ids))
+        .all()
+    )
+
+    # Merge: Local overwrites Global by name / Title
+    merged_roles = {}
+    local_roles = []
+    for role in sorted(role_rows, key=lambda r: r.club_id != GLOBAL_CLUB_ID):
+        data = _role_dict(role)
+        merged_roles[role.name] = data
+        if role.club_id == club_id:
+            local_roles.append(data)
+    roles = sorted(merged_roles.values(), key=lambda r: r['name'])
+
+    merged_types = {}
+    for st, role_name, role_type in sorted(type_rows, key=lambda row: row[0].club_id != GLOBAL_CLUB_ID):
+        merged_types[st.Title] = {
+            'id': st.id,
+            'Title': st.Title,
+            'Is_Section': st.Is_Section,
+            'Is_Hidden': st.Is_Hidden,
+            'Valid_for_Project': st.Valid_for_Project,
+            'Featured': st.Featured,
+            'Duration_Min': st.Duration_Min,
+            'Duration_Max': st.Duration_Max,
+            'role_id': st.role_id,
+            'role_name': role_name or '',
+            'role_type': role_type or '',
+            'club_id': st.club_id,
+        }
+    session_types = sorted(merged_types.values(), key=lambda t: t['Title'])
+
+    award_categories = {}
+    for role in roles:
+        if role['award_category']:
+            award_categories.setdefault(role['award_category'], []).append(role['id'])
+
+    return {
+        'session_types': session_types,
+        'session_type_ids': {t['Title']: t['id'] for t in session_types},
+        'session_types_by_id': {t['id']: t for t in session_types},
+        'roles': roles,
+        'roles_by_id': {r['id']: r for r in roles},
+        'local_roles': local_roles,
+        'award_categories': award_categories,
+    }
+
+
+def compile_pathway_project_codes():
+    """``{project_id: {path_abbr: {'code', 'level'}}}`` from one join."""
+    from app.models import Pathway, PathwayProject
+
+    rows = (
+        db.session.query(PathwayProject.project_id, PathwayProject.code,
+                         PathwayProject.level, Pathway.abbr)
+        .join(Pathway, PathwayProject.path_id == Pathway.id)
+        .all()
+    )
+    codes = {}
+    for project_id, code, level, path_abbr in rows:
+        codes.setdefault(project_id, {})[path_abbr] = {'code': code, 'level': level}
+    return codes
+
+
+def _get(scope, version_scopes, compile_fn):
+    memo = g.setdefault('_club_metadata', {}) if has_request_context() else {}
+    if scope in memo:
+        return memo[scope]
+
+    versions = _stamps.get(*version_scopes)
+
+    def load():
+        payload = cache.get(_data_key(scope))
+        if payload and payload.get('version') == versions:
+            return payload['data']
+        data = compile_fn()
+        cache.set(_data_key(scope), {'version': versions, 'data': data}, timeout=CACHE_TIMEOUT)
+        return data
+
+    data = _stamps.local_copy(scope, versions, load)
+    memo[scope] = data
+    return data
+
+
+def get_club_metadata(club_id):
+    """Return the compiled metadata dict for ``club_id`` (see module doc)."""
+    club_id = _normalize(club_id)
+    return _get(club_id, (GLOBAL_CLUB_ID, club_id),
+                lambda: compile_club_metadata(club_id))
+
+
+def get_pathway_project_codes():
+    """Return the shared ``PathwayProject`` code map (see module doc)."""
+    return _get(PATHWAY_SCOPE, (PATHWAY_SCOPE,), compile_pathway_project_codes)
+
+
+def get_session_type_id(title, club_id):
+    """Session type id by Title; Local wins over Global."""
+    return get_club_metadata(club_id)['session_type_ids'].get(title)
+
+
+def _bump(scope):
+    _stamps.bump(scope)
+    cache.delete(_data_key(scope))
+    _stamps.local.pop(scope, None)
+    if has_request_context():
+        # Global changes reach every club, so drop the whole request memo.
+        g.pop('_club_metadata', None)
+
+
+def invalidate_club_metadata(club_id=None):
+    """Bump the club's version stamp so every worker recompiles on next use.
+
+    ``club_id`` of None or the Global club invalidates every club, since
+    they all merge in the Global rows.
+    """
+    _bump(_normalize(club_id))
+
+
+def invalidate_pathway_project_codes():
+    _bump(PATHWAY_SCOPE)
+
+
+def invalidate_scope(scope):
+    """Invalidate a club id or ``PATHWAY_SCOPE`` (for the session hooks)."""
+    if scope == PATHWAY_SCOPE:
+        invalidate_pathway_project_codes()
+    else:
+        invalidate_club_metadata(scope)
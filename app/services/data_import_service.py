@@ -11,11 +11,22 @@ from app.models.ticket import Ticket
 from app.models.media import Media
 from app.models.achievement import Achievement
 from app.models.voting import Vote
+from app.services.backup_parser import SQLBackupParser
 from datetime import datetime
 from sqlalchemy import func
 import os
+import time
 
 class DataImportService:
+
+    # Backup tables in import order; later tables map their references
+    # through the ids recorded by earlier ones.
+    IMPORT_ORDER = (
+        'media', 'contacts',
+        'excomm', 'meetings',  # depend on contacts
+        'users', 'meeting_roles', 'session_types', 'session_logs',
+        'roster', 'achievements', 'votes',
+    )
     
     def __init__(self, club_no):
         self.club_no = club_no
@@ -42,6 +53,43 @@ class DataImportService:
         else:
             print(f"Club No {self.club_no} not found. Will be created if imported.")
 
+    def import_backup(self, file_path, tables=None, parser=None):
+        """Imports a SQL backup table by table, in IMPORT_ORDER.
+
+        Each table is read by its own pass over the dump and released once
+        imported, so memory holds one table's rows rather than the whole
+        backup. ``tables`` is the set of keys present in the dump
+        (SQLBackupParser.table_keys); it is scanned when omitted. Returns
+        False if the club could not be resolved.
+        """
+        parser = parser or SQLBackupParser()
+        if tables is None:
+            tables = parser.table_keys(file_path)
+
+        # 1. Execute DDL if needed
+        if 'ddl' in tables:
+            print("Checking for missing tables...")
+            self.create_tables(parser.read_ddl(file_path))
+
+        # 2. Import Clubs first to ensure Club Exists (if present in backup) or resolve existing
+        if 'clubs' in tables:
+            self.import_clubs(parser.read_table(file_path, 'clubs'))
+        self.resolve_club()
+        if not self.club_id:
+            print("ERROR: Club ID could not be resolved. Import aborted.")
+            return False
+
+        # 3. Import Data
+        for table in self.IMPORT_ORDER:
+            if table in tables:
+                started = time.perf_counter()
+                getattr(self, f'import_{table}')(parser.read_table(file_path, table))
+                print(f"[{table}] done in {time.perf_counter() - started:.2f}s")
+
+        print("Running post-import fixes...")
+        self.run_fix_home_clubs()
+        return True
+
     def create_tables(self, ddl_map):
         """Creates tables if they do not exist."""
         print("Ensuring target schema exists... (SKIPPED by request)")
@@ -384,14 +432,8 @@ class DataImportService:
             def get_idx(i): return row[i] if len(row) > i else None
             
             phone = get_idx(7)
-            bio = get_idx(8)
             email = get_idx(9)
-            member_id = get_idx(10)
-            
-            # Email heuristics removed as index is now explicitly correct
-            final_member_id = member_id
 
-            
             # 1. Deduplication
             target_contact = None
             
@@ -405,37 +447,13 @@ class DataImportService:
                 target_contact = Contact.query.filter_by(Phone_Number=phone).first()
                 
             if not target_contact:
-                target_contact = Contact(
-                    Name=name,
-                    Email=email,
-                    Phone_Number=phone,
-                    Type=get_idx(4) or 'Guest',
-                    Date_Created=self._parse_date(get_idx(3)),
-                    DTM=bool(get_idx(5)),
-                    Completed_Paths=get_idx(6),
-                    Bio=bio,
-                    Member_ID=final_member_id,
-                    Current_Path=get_idx(12),
-                    Next_Project=get_idx(13),
-                    credentials=get_idx(14),
-                    Avatar_URL=os.path.basename(get_idx(15)) if get_idx(15) and get_idx(15) != 'NULL' else None,
-                    is_connected=bool(get_idx(16)) if len(row) > 16 else True
-                )
+                target_contact = self._new_contact(row)
                 db.session.add(target_contact)
                 db.session.flush()
                 count += 1
             else:
-                if email: target_contact.Email = email
-                if final_member_id: target_contact.Member_ID = final_member_id
-                if get_idx(12): target_contact.Current_Path = get_idx(12)
-                if get_idx(13): target_contact.Next_Project = get_idx(13)
-                if get_idx(14): target_contact.credentials = get_idx(14)
-            if target_contact.Name and not (target_contact.first_name or target_contact.last_name):
-                 parts = target_contact.Name.strip().split(' ', 1)
-                 target_contact.first_name = parts[0]
-                 if len(parts) > 1:
-                     target_contact.last_name = parts[1]
-                 # print(f"DEBUG: Split name '{target_contact.Name}' -> '{target_contact.first_name}' '{target_contact.last_name}'")
+                self._update_contact(target_contact, row)
+            self._split_contact_name(target_contact)
 
             # Map Source ID -> Target Contact
             self.contact_map[source_id] = target_contact
@@ -578,36 +596,15 @@ class DataImportService:
                 if excomm:
                     excomm_id = excomm.id
 
-            new_meeting = Meeting(
-                Meeting_Number=meeting_no,
-                club_id=self.club_id,
-                Meeting_Date=meeting_date,
-                Meeting_Template=row[3],
-                WOD=row[4],
-                Start_Time=self._parse_time(row[9]),
-                media_id=self.media_map.get(row[10]) if row[10] else None,
-                Meeting_Title=row[11],
-                type=row[12],
-                Subtitle=row[13],
-                status=row[14] or 'unpublished',
-                sharing_master_id=self._map_contact(row[15]),
-                excomm_id=excomm_id
-                # ge_mode=row[16], nps=row[17]
-            )
+            new_meeting = Meeting(**self._meeting_values(row, excomm_id))
             db.session.add(new_meeting)
             new_meeting.sync_excomm()
             db.session.flush()
             
             # Add Awards
             from app.models.voting import MeetingAwardWinner
-            def add_award(cat, cid):
-                if cid:
-                    db.session.add(MeetingAwardWinner(meeting_id=new_meeting.id, award_category=cat, contact_id=cid))
-            
-            add_award('table-topic', self._map_contact(row[5]))
-            add_award('evaluator', self._map_contact(row[6]))
-            add_award('speaker', self._map_contact(row[7]))
-            add_award('role-taker', self._map_contact(row[8]))
+            for cat, cid in self._meeting_awards(row):
+                db.session.add(MeetingAwardWinner(meeting_id=new_meeting.id, award_category=cat, contact_id=cid))
 
             self.meeting_map[meeting_no] = new_meeting
             count += 1
@@ -746,21 +743,8 @@ class DataImportService:
             
             if not target_log:
                 new_log = SessionLog(
-                    meeting_id=meeting_obj.id,
-                    Meeting_Number=meet_no,
-                    Type_ID=type_id,
-                    Start_Time=self._parse_time(row[4]),
-                    Duration_Min=row[5],
-                    Duration_Max=row[6],
-                    Meeting_Seq=row[7],
-                    Notes=row[8],
-                    Session_Title=session_title,
-                    Project_ID=project_id,
-                    Status=row[11],
-                    # credentials=row[12], Removed in SessionLog but used in OwnerMeetingRoles
-                    project_code=row[13] if should_import_metadata else None,
-                    state=row[14],
-                    pathway=row[15] if should_import_metadata else None
+                    **self._session_log_values(row, meeting_obj.id, type_id, should_import_metadata),
+                    Meeting_Number=meet_no
                 )
                 db.session.add(new_log)
                 db.session.flush()
@@ -814,9 +798,8 @@ class DataImportService:
                      db.session.add(omr)
 
         # Recalculate section IDs for all imported/modified meetings
-        from app.agenda_routes import recalculate_section_ids
-        for meeting_obj in self.meeting_map.values():
-            recalculate_section_ids(meeting_obj)
+        from app.services.agenda_schedule import recalculate_agenda
+        recalculate_agenda(list(self.meeting_map.values()), start_times=False)
         db.session.commit()
         print(f"Imported {count} session logs.")
 
@@ -883,6 +866,99 @@ class DataImportService:
         
         db.session.commit()
 
+    def _new_contact(self, row):
+        """Builds a Contact from a backup row (see ``import_contacts`` for the schema)."""
+        def get_idx(i): return row[i] if len(row) > i else None
+        return Contact(
+            Name=row[1],
+            Email=get_idx(9),
+            Phone_Number=get_idx(7),
+            Type=get_idx(4) or 'Guest',
+            Date_Created=self._parse_date(get_idx(3)),
+            DTM=bool(get_idx(5)),
+            Completed_Paths=get_idx(6),
+            Bio=get_idx(8),
+            Member_ID=get_idx(10),
+            Current_Path=get_idx(12),
+            Next_Project=get_idx(13),
+            credentials=get_idx(14),
+            Avatar_URL=os.path.basename(get_idx(15)) if get_idx(15) and get_idx(15) != 'NULL' else None,
+            is_connected=bool(get_idx(16)) if len(row) > 16 else True
+        )
+
+    @staticmethod
+    def _update_contact(contact, row):
+        """Refreshes a matched Contact with the non-empty fields of a backup row."""
+        def get_idx(i):
+            return row[i] if len(row) > i else None
+
+        if get_idx(9):
+            contact.Email = get_idx(9)
+        if get_idx(10):
+            contact.Member_ID = get_idx(10)
+        if get_idx(12):
+            contact.Current_Path = get_idx(12)
+        if get_idx(13):
+            contact.Next_Project = get_idx(13)
+        if get_idx(14):
+            contact.credentials = get_idx(14)
+
+    @staticmethod
+    def _split_contact_name(contact):
+        if contact.Name and not (contact.first_name or contact.last_name):
+            parts = contact.Name.strip().split(' ', 1)
+            contact.first_name = parts[0]
+            if len(parts) > 1:
+                contact.last_name = parts[1]
+
+    def _meeting_values(self, row, excomm_id):
+        """Column values for a new Meeting from a backup row."""
+        return dict(
+            Meeting_Number=row[1],
+            club_id=self.club_id,
+            Meeting_Date=self._parse_date(row[2]),
+            Meeting_Template=row[3],
+            WOD=row[4],
+            Start_Time=self._parse_time(row[9]),
+            media_id=self.media_map.get(row[10]) if row[10] else None,
+            Meeting_Title=row[11],
+            type=row[12],
+            Subtitle=row[13],
+            status=row[14] or 'unpublished',
+            sharing_master_id=self._map_contact(row[15]),
+            excomm_id=excomm_id
+            # ge_mode=row[16], nps=row[17]
+        )
+
+    def _meeting_awards(self, row):
+        """(award_category, target contact id) pairs of a meeting backup row."""
+        awards = [
+            ('table-topic', self._map_contact(row[5])),
+            ('evaluator', self._map_contact(row[6])),
+            ('speaker', self._map_contact(row[7])),
+            ('role-taker', self._map_contact(row[8])),
+        ]
+        return [(cat, cid) for cat, cid in awards if cid]
+
+    def _session_log_values(self, row, meeting_id, type_id, should_import_metadata):
+        """Column values for a new SessionLog from a backup row."""
+        return dict(
+            meeting_id=meeting_id,
+            Type_ID=type_id,
+            Start_Time=self._parse_time(row[4]),
+            Duration_Min=row[5],
+            Duration_Max=row[6],
+            Meeting_Seq=row[7],
+            Notes=row[8],
+            Session_Title=row[9],
+            Project_ID=row[10],
+            Status=row[11],
+            # credentials=row[12], Removed in SessionLog but used in OwnerMeetingRoles
+            project_code=row[13] if should_import_metadata else None,
+            state=row[14],
+            pathway=row[15] if should_import_metadata else None
+        )
+
     def _map_contact(self, source_id):
         if not source_id: return None
         contact = self.contact_map.get(source_id)
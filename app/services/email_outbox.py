@@ -0,0 +1,369 @@
+"""Outbound email queue with a background sender.
+
+Password reset and verification mails used to be sent inside the request
+through ``_send_mail_with_retry``: a new SSL connection to the SMTP server
+per message and ``time.sleep()`` between attempts, so a flaky server held a
+gunicorn thread for seconds.
+
+``enqueue()`` now stores the message as an ``OutboundEmail`` row in the
+caller's transaction. Once that transaction commits, the sender is woken:
+a single background thread per process (``drain()``) claims due rows in
+batches of ``EMAIL_OUTBOX_BATCH_SIZE`` and sends them over one SMTP
+connection, kept open across batches and reopened only after an error.
+
+A failed attempt does not wait in place. The row goes back to ``queued``
+with ``next_attempt_at`` pushed out by ``EMAIL_OUTBOX_RETRY_DELAY`` seconds,
+doubled per attempt, and a timer wakes the sender when it is due. After
+``EMAIL_OUTBOX_MAX_ATTEMPTS`` attempts, or on a permanent SMTP rejection
+(5xx), the row is marked ``failed`` with the error kept in ``last_error``.
+Sent rows keep their delivery record but lose their body, which may hold
+reset tokens.
+
+Claims are conditional updates, so several gunicorn workers can drain the
+same table; a claim left behind by a dead worker is released after
+``CLAIM_TIMEOUT``. Retry timers live in the worker process, so each worker
+also drains once when it serves its first request (``init_app``): mail
+deferred or claimed by a worker that restarted or died is picked up again,
+and the drain arms a timer for the earliest retry or stale claim. ``flask
+email:outbox`` shows the queue and ``flask email:drain`` sends it from the
+command line; a periodic ``email:drain`` (cron) also covers quiet sites
+where no request arrives for hours.
+
+Under ``TESTING`` (or with ``EMAIL_OUTBOX_INLINE``) the queue is drained
+synchronously right after the queuing transaction commits.
+"""
+import logging
+import os
+import smtplib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from email.utils import formataddr
+
+from flask import current_app
+from flask_mail import BadHeaderError, Message
+from sqlalchemy import func, update
+from sqlalchemy.orm import Session
+
+from app import db, mail
+from app.models import OutboundEmail
+
+logger = logging.getLogger(__name__)
+
+# A claim older than this belongs to a sender that died mid-batch
+CLAIM_TIMEOUT = 600
+
+_executor = None
+_executor_pid = None
+_executor_lock = threading.Lock()
+
+_retry_timer = None
+_retry_due = None
+_retry_lock = threading.Lock()
+
+_started_pid = None
+_started_lock = threading.Lock()
+
+
+class _ConnectError(Exception):
+    """The SMTP server could not be reached; the rest of the batch waits too."""
+
+
+def enqueue(msg, kind=None):
+    """Queue a ``flask_mail.Message``; it is sent after the current transaction commits.
+
+    The caller commits.
+    """
+    sender = msg.sender or current_app.config.get('MAIL_DEFAULT_SENDER')
+    if isinstance(sender, tuple):
+        sender = formataddr(sender)
+    email = OutboundEmail(
+        kind=kind,
+        sender=sender,
+        recipients=','.join(msg.recipients),
+        subject=msg.subject,
+        body=msg.body or '',
+        html=msg.html,
+        status=OutboundEmail.STATUS_QUEUED,
+        attempts=0,
+        next_attempt_at=datetime.now(),
+    )
+    db.session.add(email)
+    db.session.flush()
+    db.session.info['email_outbox_wake'] = True
+    return email
+
+
+def _inline(app):
+    inline = app.config.get('EMAIL_OUTBOX_INLINE')
+    return app.testing if inline is None else inline
+
+
+def wake():
+    """Have the sender go through the queue."""
+    _submit(current_app._get_current_object())
+
+
+def _submit(app):
+    if _inline(app):
+        drain(app)
+    else:
+        _get_executor().submit(drain, app)
+
+
+def init_app(app):
+    """Drain once per worker process, on its first request."""
+    @app.before_request
+    def _drain_on_first_request():
+        global _started_pid
+        if _started_pid == os.getpid():
+            return
+        with _started_lock:
+            if _started_pid == os.getpid():
+                return
+            _started_pid = os.getpid()
+        if not _inline(app):
+            _get_executor().submit(_startup_drain, app)
+
+
+def _startup_drain(app):
+    try:
+        drain(app)
+    except Exception:
+        logger.exception("Email outbox drain at startup failed")
+
+
+def _get_executor():
+    """Per-process single sender thread; a forked gunicorn worker must not reuse its parent's."""
+    global _executor, _executor_pid
+    with _executor_lock:
+        if _executor is None or _executor_pid != os.getpid():
+            _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='email-outbox')
+            _executor_pid = os.getpid()
+        return _executor
+
+
+class _SMTPSession:
+    """One SMTP connection reused for every message of a drain, reopened after an error."""
+
+    def __init__(self):
+        self._connection = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.close()
+
+    def send(self, message):
+        if self._connection is None:
+            connection = mail.connect()
+            try:
+                connection.__enter__()
+            except Exception as e:
+                raise _ConnectError(str(e)) from e
+            self._connection = connection
+        try:
+            self._connection.send(message)
+        except Exception:
+            self.close()
+            raise
+
+    def close(self):
+        connection, self._connection = self._connection, None
+        if connection is not None:
+            try:
+                connection.__exit__(None, None, None)
+            except Exception:
+                # The server already dropped the connection
+                pass
+
+
+def drain(app, include_deferred=False):
+    """Send every due message; returns counts of ``sent``, ``retrying`` and ``failed``.
+
+    With ``include_deferred``, messages waiting for a retry are sent now.
+    Runs in its own app context.
+    """
+    with app.app_context():
+        try:
+            stats = _drain(include_deferred)
+            if not _inline(app):
+                _schedule_retry(app)
+            return stats
+        finally:
+            db.session.remove()
+
+
+def _drain(include_deferred):
+    stats = {'sent': 0, 'retrying': 0, 'failed': 0}
+    _release_stale_claims()
+    _purge_old()
+    batch_size = current_app.config.get('EMAIL_OUTBOX_BATCH_SIZE', 20)
+    with _SMTPSession() as smtp:
+        while True:
+            batch = _claim(batch_size, include_deferred)
+            if not batch:
+                break
+            for i, email in enumerate(batch):
+                try:
+                    _send(smtp, email)
+                except _ConnectError as e:
+                    logger.warning("SMTP server unreachable: %s", e)
+                    for waiting in batch[i:]:
+                        stats[_record_failure(waiting, e)] += 1
+                    return stats
+                except Exception as e:
+                    logger.warning("Sending email %s to %s failed: %s", email.id, email.recipients, e)
+                    stats[_record_failure(email, e)] += 1
+                else:
+                    stats['sent'] += 1
+    return stats
+
+
+def _claim(limit, include_deferred):
+    """Move up to ``limit`` due rows to ``sending`` and return the ones this sender won."""
+    now = datetime.now()
+    query = db.session.query(OutboundEmail.id).filter(OutboundEmail.status == OutboundEmail.STATUS_QUEUED)
+    if not include_deferred:
+        query = query.filter(OutboundEmail.next_attempt_at <= now)
+    ids = [row.id for row in query.order_by(OutboundEmail.id).limit(limit)]
+    claimed = []
+    for email_id in ids:
+        result = db.session.execute(
+            update(OutboundEmail)
+            .where(OutboundEmail.id == email_id, OutboundEmail.status == OutboundEmail.STATUS_QUEUED)
+            .values(status=OutboundEmail.STATUS_SENDING, claimed_at=now)
+        )
+        if result.rowcount:
+            claimed.append(email_id)
+    db.session.commit()
+    if not claimed:
+        return []
+    return OutboundEmail.query.filter(OutboundEmail.id.in_(claimed)).order_by(OutboundEmail.id).all()
+
+
+def _send(smtp, email):
+    message = Message(subject=email.subject, sender=email.sender, recipients=email.recipient_list,
+                      body=email.body, html=email.html)
+    smtp.send(message)
+    email.status = OutboundEmail.STATUS_SENT
+    email.attempts += 1
+    email.sent_at = datetime.now()
+    email.claimed_at = None
+    email.last_error = None
+    email.body = ''
+    email.html = None
+    db.session.commit()
+
+
+def _is_permanent(error):
+    if isinstance(error, (smtplib.SMTPRecipientsRefused, BadHeaderError, AssertionError)):
+        return True
+    return isinstance(error, smtplib.SMTPResponseException) and error.smtp_code >= 500
+
+
+def _record_failure(email, error):
+    """Reschedule ``email`` with backoff or mark it failed; returns the stats bucket."""
+    max_attempts = current_app.config.get('EMAIL_OUTBOX_MAX_ATTEMPTS', 5)
+    delay = current_app.config.get('EMAIL_OUTBOX_RETRY_DELAY', 30)
+    email.attempts += 1
+    email.claimed_at = None
+    email.last_error = str(error)[:255]
+    if _is_permanent(error) or email.attempts >= max_attempts:
+        email.status = OutboundEmail.STATUS_FAILED
+        bucket = 'failed'
+    else:
+        email.status = OutboundEmail.STATUS_QUEUED
+        email.next_attempt_at = datetime.now() + timedelta(seconds=delay * 2 ** (email.attempts - 1))
+        bucket = 'retrying'
+    db.session.commit()
+    return bucket
+
+
+def _release_stale_claims():
+    db.session.execute(
+        update(OutboundEmail)
+        .where(OutboundEmail.status == OutboundEmail.STATUS_SENDING,
+               OutboundEmail.claimed_at < datetime.now() - timedelta(seconds=CLAIM_TIMEOUT))
+        .values(status=OutboundEmail.STATUS_QUEUED, claimed_at=None)
+    )
+    db.session.commit()
+
+
+def _purge_old():
+    """Delete delivery records past ``EMAIL_OUTBOX_RETENTION_DAYS``."""
+    days = current_app.config.get('EMAIL_OUTBOX_RETENTION_DAYS', 30)
+    OutboundEmail.query.filter(
+        OutboundEmail.status.in_([OutboundEmail.STATUS_SENT, OutboundEmail.STATUS_FAILED]),
+        OutboundEmail.created_at < datetime.now() - timedelta(days=days)
+    ).delete(synchronize_session=False)
+    db.session.commit()
+
+
+def _schedule_retry(app):
+    """Wake the sender again when the earliest deferred message or stale claim is due."""
+    global _retry_timer, _retry_due
+    next_retry = db.session.query(func.min(OutboundEmail.next_attempt_at)).filter(
+        OutboundEmail.status == OutboundEmail.STATUS_QUEUED
+    ).scalar()
+    # Rows another sender is working on; released if it dies holding them
+    oldest_claim = db.session.query(func.min(OutboundEmail.claimed_at)).filter(
+        OutboundEmail.status == OutboundEmail.STATUS_SENDING
+    ).scalar()
+    candidates = [next_retry]
+    if oldest_claim is not None:
+        candidates.append(oldest_claim + timedelta(seconds=CLAIM_TIMEOUT + 1))
+    candidates = [c for c in candidates if c is not None]
+    if not candidates:
+        return
+    due = min(candidates)
+    with _retry_lock:
+        if _retry_timer is not None and _retry_timer.is_alive() and _retry_due <= due:
+            return
+        if _retry_timer is not None:
+            _retry_timer.cancel()
+        delay = max(0.0, (due - datetime.now()).total_seconds())
+        _retry_timer = threading.Timer(delay, _submit, args=(app,))
+        _retry_timer.daemon = True
+        _retry_due = due
+        _retry_timer.start()
+
+
+def requeue_failed():
+    """Give failed messages a fresh set of attempts; the caller commits."""
+    return OutboundEmail.query.filter_by(status=OutboundEmail.STATUS_FAILED).update(
+        {'status': OutboundEmail.STATUS_QUEUED, 'attempts': 0, 'next_attempt_at': datetime.now()},
+        synchronize_session=False
+    )
+
+
+def status_counts():
+    """``{status: number of rows}`` for the whole outbox."""
+    rows = db.session.query(OutboundEmail.status, func.count(OutboundEmail.id)).group_by(OutboundEmail.status)
+    return dict(rows.all())
+
+
+def pending(limit=20, status=None):
+    """Queued, in-flight and failed rows (or those of ``status``), oldest first."""
+    query = OutboundEmail.query
+    if status:
+        query = query.filter(OutboundEmail.status == status)
+    else:
+        query = query.filter(OutboundEmail.status != OutboundEmail.STATUS_SENT)
+    return query.order_by(OutboundEmail.id).limit(limit).all()
+
+
+@db.event.listens_for(Session, 'after_commit')
+def _wake_sender(session):
+    if session.info.pop('email_outbox_wake', False):
+        try:
+            wake()
+        except Exception:
+            # The rows are committed; a later drain sends them
+            logger.exception("Could not wake the email outbox sender")
+
+
+@db.event.listens_for(Session, 'after_rollback')
+def _discard_wake(session):
+    session.info.pop('email_outbox_wake', None)
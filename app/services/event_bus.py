@@ -0,0 +1,68 @@
+"""Topic-based real-time event bus shared by every SSE consumer.
+
+Generalises the mailbox SSE design (docs/MAILBOX_REALTIME_DESIGN.md) so one
+browser connection to ``/api/events`` can follow several topics instead of
+each page running its own polling loop:
+
+* ``meeting:<id>:booking`` -- booking tables changed; data is the booking
+  version (see ``app/services/booking_state.py``).
+* ``meeting:<id>:votes`` -- a ballot was cast or withdrawn.
+* ``user:<id>:mail`` -- a new message arrived in the user's mailbox.
+* ``job:<id>:progress`` -- an export job moved on; data is a JSON object
+  with its new status/progress (see ``app/services/export_jobs.py``).
+* ``chat:<id>:reply`` -- progress of the AI reply to chat message ``<id>``;
+  data is a JSON token/tool/done/error event (see
+  ``app/services/chat_runs.py``).
+
+Writers call ``publish()``; delivery goes through the announcer backend
+(``ANNOUNCER_BACKEND``), so events reach streams on every worker.
+"""
+from app.services.announcer import MessageAnnouncer
+
+event_bus = MessageAnnouncer()
+
+TOPIC_KINDS = {
+    'meeting': ('booking', 'votes'),
+    'user': ('mail',),
+    'job': ('progress',),
+    'chat': ('reply',),
+}
+
+
+def booking_topic(meeting_id):
+    return f"meeting:{meeting_id}:booking"
+
+
+def votes_topic(meeting_id):
+    return f"meeting:{meeting_id}:votes"
+
+
+def mail_topic(user_id):
+    return f"user:{user_id}:mail"
+
+
+def job_topic(job_id):
+    return f"job:{job_id}:progress"
+
+
+def chat_topic(message_id):
+    return f"chat:{message_id}:reply"
+
+
+def parse_topic(topic):
+    """Split ``'<kind>:<id>:<name>'`` into ``(kind, id, name)``.
+
+    Returns None for anything that is not a known topic.
+    """
+    parts = (topic or '').split(':')
+    if len(parts) != 3 or not parts[1].isdigit():
+        return None
+    kind, object_id, name = parts
+    if name not in TOPIC_KINDS.get(kind, ()):
+        return None
+    return kind, int(object_id), name
+
+
+def publish(topic, data='changed'):
+    """Publish an event to every subscriber of ``topic`` on any worker."""
+    event_bus.announce(topic, str(data))
@@ -31,6 +31,7 @@ class MeetingExportContext:
             self._logs = db.session.query(SessionLog, SessionType).join(SessionType)\
                 .filter(SessionLog.meeting_id == self.meeting_id)\
                 .order_by(SessionLog.Meeting_Seq).all()
+            SessionLog.load_owners([log for log, _ in self._logs])
         return self._logs
 
     @property
@@ -12,7 +12,8 @@ from ...models import ExComm
 class MeetingExportService:
     """Primary service to generate meeting Excel exports."""
     @staticmethod
-    def generate_meeting_xlsx(meeting_id):
+    def generate_meeting_xlsx(meeting_id, progress=None):
+        """Build the agenda workbook; ``progress(percent, message)`` is called per sheet."""
         context = MeetingExportContext(meeting_id)
         if not context.meeting:
             return None
@@ -29,6 +30,8 @@ class MeetingExportService:
             else:
                 ws = wb.create_sheet()
             board.render(ws, context)
+            if progress:
+                progress(90 * (i + 1) // len(boards), ws.title)
             
         output = io.BytesIO()
         wb.save(output)
@@ -0,0 +1,265 @@
+"""Background builds for agenda exports, slide decks and upload archives.
+
+``/agenda/export``, ``/agenda/ppt`` and ``/uploads/<code>/zip`` used to build
+their file inside the request, so a few officers exporting at once could tie
+up every gunicorn worker. They now call ``enqueue()``, which records an
+``ExportJob`` row and hands the build to a small per-process thread pool
+(``EXPORT_JOB_WORKERS``). The artifact is written under ``EXPORT_JOB_DIR``
+and served from disk by ``/jobs/<id>/download``.
+
+Progress is kept on the job row (for polling ``/jobs/<id>``) and published on
+the ``job:<id>:progress`` event-bus topic (for ``/api/events``). A request
+for an export that is already queued or running gets the existing job back:
+``ExportJob.active_key`` is unique, so this holds across workers too.
+
+Under ``TESTING`` (or with ``EXPORT_JOB_INLINE``) jobs run synchronously in
+the enqueueing request instead of on the pool.
+"""
+import json
+import logging
+import os
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from flask import current_app
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
+
+from app import db
+from app.models import ExportJob
+from app.services import artifact_cache, zip_stream
+from app.services.event_bus import job_topic, publish
+
+logger = logging.getLogger(__name__)
+
+XLSX_MIMETYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+PPTX_MIMETYPE = 'application/vnd.openxmlformats-officedocument.presentationml.presentation'
+ZIP_MIMETYPE = 'application/zip'
+
+# Smallest progress change worth a row update and an event
+PROGRESS_STEP = 5
+
+JobKind = namedtuple('JobKind', 'builder mimetype failure_message')
+
+_executor = None
+_executor_pid = None
+_executor_lock = threading.Lock()
+
+
+def _build_agenda_xlsx(job, path, report):
+    from app.services.export import MeetingExportService
+
+    output = MeetingExportService.generate_meeting_xlsx(int(job.target), progress=report)
+    if not output:
+        return False
+    with open(path, 'wb') as f:
+        f.write(output.getbuffer())
+    return True
+
+
+def _build_agenda_pptx(job, path, report):
+    from app.agenda_routes import _get_processed_logs_data
+    from app.services.meeting_slide_service import MeetingSlideService
+
+    meeting_id = int(job.target)
+    logs_data, _ = _get_processed_logs_data(meeting_id)
+    report(30, 'Building slides')
+    output = MeetingSlideService.generate_meeting_pptx(meeting_id, logs_data)
+    if not output:
+        return False
+    with open(path, 'wb') as f:
+        f.write(output.getbuffer())
+    return True
+
+
+def upload_link_folder(code):
+    """Folder holding an upload link's files (under ``UPLOAD_LINK_DIR``, default static/uploads)."""
+    root = current_app.config.get('UPLOAD_LINK_DIR') or os.path.join(current_app.root_path, 'static', 'uploads')
+    return os.path.join(root, code)
+
+
+def upload_archive_entries(code):
+    """Return ``(path, archive name)`` for every file of an upload link, or None if its folder is missing."""
+    folder_path = upload_link_folder(code)
+    if not os.path.isdir(folder_path):
+        return None
+    # Keep direct name as archive name (do not nest folders)
+    return sorted(
+        (entry.path, entry.name) for entry in os.scandir(folder_path)
+        if entry.is_file() and not entry.name.startswith('.')
+    )
+
+
+def _build_uploads_zip(job, path, report):
+    entries = upload_archive_entries(job.target)
+    if not entries:
+        return False
+    zip_stream.write_zip(path, entries, lambda done, total: report(100 * done // total, f"{done}/{total} files"))
+    return True
+
+
+JOB_KINDS = {
+    'agenda_xlsx': JobKind(_build_agenda_xlsx, XLSX_MIMETYPE, "Error generating XLSX"),
+    'agenda_pptx': JobKind(_build_agenda_pptx, PPTX_MIMETYPE,
+                           "Could not generate PPTX. Template might be missing or error occurred."),
+    'uploads_zip': JobKind(_build_uploads_zip, ZIP_MIMETYPE, "No files to package for download."),
+}
+
+
+def artifact_dir():
+    return current_app.config.get('EXPORT_JOB_DIR') or os.path.join(current_app.instance_path, 'export_jobs')
+
+
+def get_job(job_id):
+    """Load a job with its latest state (workers update it on other connections)."""
+    return db.session.get(ExportJob, job_id, populate_existing=True)
+
+
+def enqueue(kind, target, download_name, club_id=None, user_id=None, digest=None):
+    """Start building an artifact, or join the identical build already in progress.
+
+    With a ``digest`` the finished file is kept in the artifact cache.
+    Returns the ``ExportJob``; when jobs run inline it is already finished.
+    """
+    if kind not in JOB_KINDS:
+        raise ValueError(f"Unknown export job kind: {kind}")
+    target = str(target)
+    active_key = f"{kind}:{club_id or 0}:{target}"
+
+    _expire_jobs()
+    job = ExportJob.query.filter_by(active_key=active_key).first()
+    if job:
+        db.session.commit()
+        return get_job(job.id)
+
+    job = ExportJob(kind=kind, target=target, active_key=active_key, club_id=club_id,
+                    download_name=download_name, requested_by_id=user_id, digest=digest,
+                    status=ExportJob.STATUS_QUEUED, progress=0)
+    db.session.add(job)
+    try:
+        db.session.commit()
+    except IntegrityError:
+        # Another worker queued the same build between our lookup and insert
+        db.session.rollback()
+        job = ExportJob.query.filter_by(active_key=active_key).first()
+        if not job:
+            raise
+        return get_job(job.id)
+
+    _submit(job.id)
+    return get_job(job.id)
+
+
+def _submit(job_id):
+    app = current_app._get_current_object()
+    inline = app.config.get('EXPORT_JOB_INLINE')
+    if inline is None:
+        inline = app.testing
+    if inline:
+        run_job(app, job_id)
+    else:
+        _get_executor(app).submit(run_job, app, job_id)
+
+
+def _get_executor(app):
+    """Per-process pool; a forked gunicorn worker must not reuse its parent's threads."""
+    global _executor, _executor_pid
+    with _executor_lock:
+        if _executor is None or _executor_pid != os.getpid():
+            _executor = ThreadPoolExecutor(max_workers=app.config.get('EXPORT_JOB_WORKERS', 2),
+                                           thread_name_prefix='export-job')
+            _executor_pid = os.getpid()
+        return _executor
+
+
+def _expire_jobs():
+    """Release builds lost to a worker restart and delete artifacts past retention.
+
+    Runs in the caller's transaction.
+    """
+    now = datetime.now()
+    timeout = timedelta(seconds=current_app.config.get('EXPORT_JOB_TIMEOUT', 600))
+    retention = timedelta(seconds=current_app.config.get('EXPORT_JOB_RETENTION', 3600))
+
+    db.session.execute(
+        update(ExportJob)
+        .where(ExportJob.active_key.isnot(None), ExportJob.created_at < now - timeout)
+        .values(active_key=None, status=ExportJob.STATUS_FAILED, message='Interrupted', finished_at=now)
+    )
+    expired = ExportJob.query.filter(
+        ExportJob.active_key.is_(None), ExportJob.finished_at < now - retention
+    ).all()
+    for job in expired:
+        # Cached artifacts outlive their job; the cache evicts them itself
+        if job.file_path and not job.digest:
+            try:
+                os.remove(job.file_path)
+            except OSError:
+                pass
+        db.session.delete(job)
+
+
+def _update(job_id, **values):
+    """Write job state on its own connection, so the build's session is left alone."""
+    with db.engine.begin() as connection:
+        connection.execute(update(ExportJob).where(ExportJob.id == job_id).values(**values))
+    event = {key: values[key] for key in ('status', 'progress', 'message') if key in values}
+    publish(job_topic(job_id), json.dumps(event))
+
+
+def _progress_reporter(job_id):
+    last = {'progress': 0}
+
+    def report(percent, message=None):
+        percent = max(0, min(99, int(percent)))
+        if percent < last['progress'] + PROGRESS_STEP:
+            return
+        last['progress'] = percent
+        _update(job_id, status=ExportJob.STATUS_RUNNING, progress=percent, message=message)
+
+    return report
+
+
+def run_job(app, job_id):
+    """Build one queued job; runs on a pool thread (or inline) with its own app context."""
+    with app.app_context():
+        try:
+            _run(job_id)
+        finally:
+            db.session.remove()
+
+
+def _run(job_id):
+    job = db.session.get(ExportJob, job_id)
+    if not job or job.status != ExportJob.STATUS_QUEUED:
+        return
+    kind = JOB_KINDS[job.kind]
+    _update(job_id, status=ExportJob.STATUS_RUNNING, started_at=datetime.now())
+
+    directory = artifact_dir()
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{job.id}{os.path.splitext(job.download_name)[1]}")
+    partial = f"{path}.part"
+    message = kind.failure_message
+    try:
+        built = kind.builder(job, partial, _progress_reporter(job_id))
+    except Exception:
+        logger.exception("Export job %s (%s:%s) failed", job.id, job.kind, job.target)
+        built = False
+    finally:
+        db.session.rollback()
+
+    if built:
+        if job.digest:
+            path = artifact_cache.store(job.digest, os.path.splitext(path)[1], partial)
+        else:
+            os.replace(partial, path)
+        _update(job_id, status=ExportJob.STATUS_FINISHED, progress=100, message=None,
+                file_path=path, active_key=None, finished_at=datetime.now())
+        return
+    if os.path.exists(partial):
+        os.remove(partial)
+    _update(job_id, status=ExportJob.STATUS_FAILED, message=message,
+            active_key=None, finished_at=datetime.now())
@@ -13,6 +13,9 @@ from app.models.role import Role
 # Import other necessary models as we need them
 
 class LegacyMigrationService:
+    # Characters of sanitized SQL handed to executescript at a time
+    SCRIPT_BATCH_SIZE = 4 << 20
+
     def __init__(self, sql_path, target_club_id):
         self.sql_path = sql_path
         self.target_club_id = target_club_id
@@ -32,10 +35,31 @@ class LegacyMigrationService:
         self.cursor = self.conn.cursor()
 
         print("Sanitizing and executing SQL dump...")
-        with open(self.sql_path, 'r', encoding='utf-8') as f:
-            sql_content = f.read()
+        # Statements are streamed from the dump and executed in batches, so
+        # memory stays bounded by the batch rather than the whole file.
+        from app.services.backup_parser import SQLBackupParser
+
+        batch = []
+        batch_size = 0
+        try:
+            for statement in SQLBackupParser().iter_statements(self.sql_path):
+                statement = self._sanitize_statement(statement)
+                batch.append(statement)
+                batch_size += len(statement)
+                if batch_size >= self.SCRIPT_BATCH_SIZE:
+                    self.cursor.executescript("\n".join(batch))
+                    batch, batch_size = [], 0
+            if batch:
+                self.cursor.executescript("\n".join(batch))
+            self.conn.commit()
+            print("Legacy data loaded into memory successfully.")
+        except Exception as e:
+            print(f"Error executing SQL script: {e}")
+            raise
 
-        # Sanitize SQL for SQLite compatibility
+    @staticmethod
+    def _sanitize_statement(sql_content):
+        """Rewrites one MySQL statement for SQLite."""
         # 1. Remove LOCK TABLES / UNLOCK TABLES
         sql_content = re.sub(r'LOCK TABLES `\w+` WRITE;', '', sql_content)
         sql_content = re.sub(r'UNLOCK TABLES;', '', sql_content)
@@ -57,19 +81,8 @@ class LegacyMigrationService:
         sql_content = re.sub(r'ON UPDATE CURRENT_TIMESTAMP', '', sql_content, flags=re.IGNORECASE)
 
         # 7. Replace MySQL escape slashes if necessary (SQLite can handle standard SQL, but mysqldump often uses \')
-        # This might be tricky, let's hope standard execute script handles it or minimal escaping is used.
         # SQLite uses '' for escaping single quotes, MySQL uses \' often. 
-        # Using a simplistic replace for now:
-        sql_content = sql_content.replace("\\'", "''")
-        
-        # Split into statements, cautiously, or just use executescript
-        try:
-            self.cursor.executescript(sql_content)
-            self.conn.commit()
-            print("Legacy data loaded into memory successfully.")
-        except Exception as e:
-            print(f"Error executing SQL script: {e}")
-            raise
+        return sql_content.replace("\\'", "''")
 
     def migrate_all(self):
         """Orchestrates the migration process."""
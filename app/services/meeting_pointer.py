@@ -0,0 +1,114 @@
+"""Per-club meeting pointers behind ``get_default_meeting_id``.
+
+Picking the default meeting used to take up to three ordered queries
+(running, next unfinished with an agenda, latest finished) every time it
+was asked, often several times per request. The answer only moves when a
+meeting is created, deleted, re-dated or changes status, or when a meeting
+gains or loses its agenda, so it is precomputed into one
+``MeetingPointer`` row per club::
+
+    running_meeting_id               # 'running'
+    upcoming_meeting_id              # 'not started' / 'cancelled' with logs
+    upcoming_unpublished_meeting_id  # same, also counting 'unpublished'
+    finished_meeting_id              # latest 'finished'
+
+The session hooks in ``app/models/meeting.py`` recompute the affected
+clubs' rows inside the flush that changed them, so the pointer commits or
+rolls back with the meeting edit itself. ``flask meetings:rebuild-pointers``
+recomputes every row to repair drift (e.g. after raw SQL restores).
+"""
+from datetime import datetime, timezone
+
+from sqlalchemy import insert, select, update
+
+from app import db
+from app.models import Meeting, MeetingPointer, SessionLog
+
+POINTER_FIELDS = (
+    'running_meeting_id',
+    'upcoming_meeting_id',
+    'upcoming_unpublished_meeting_id',
+    'finished_meeting_id',
+)
+
+UPCOMING_STATUSES = ('not started', 'cancelled')
+
+
+def _first_id(executor, query, club_id):
+    if club_id:
+        query = query.where(Meeting.club_id == club_id)
+    return executor.execute(query.limit(1)).scalar()
+
+
+def compute_meeting_pointer(executor, club_id):
+    """Compute the pointer fields for ``club_id`` (None means every club).
+
+    ``executor`` is a Session or Connection; the flush hook passes the
+    session's connection so no autoflush happens mid-flush.
+    """
+    upcoming = select(Meeting.id) \
+        .join(SessionLog, Meeting.id == SessionLog.meeting_id) \
+        .order_by(Meeting.Meeting_Date.asc(), Meeting.id.asc())
+    return {
+        'running_meeting_id': _first_id(
+            executor,
+            select(Meeting.id).where(Meeting.status == 'running').order_by(Meeting.id.asc()),
+            club_id),
+        'upcoming_meeting_id': _first_id(
+            executor, upcoming.where(Meeting.status.in_(UPCOMING_STATUSES)), club_id),
+        'upcoming_unpublished_meeting_id': _first_id(
+            executor, upcoming.where(Meeting.status.in_(UPCOMING_STATUSES + ('unpublished',))), club_id),
+        'finished_meeting_id': _first_id(
+            executor,
+            select(Meeting.id).where(Meeting.status == 'finished')
+            .order_by(Meeting.Meeting_Date.desc(), Meeting.id.desc()),
+            club_id),
+    }
+
+
+def write_meeting_pointer(connection, club_id, values):
+    """Upsert the pointer row for ``club_id`` on ``connection``."""
+    values = dict(values, updated_at=datetime.now(timezone.utc))
+    table = MeetingPointer.__table__
+    result = connection.execute(update(table).where(table.c.club_id == club_id).values(**values))
+    if result.rowcount == 0:
+        connection.execute(insert(table).values(club_id=club_id, **values))
+
+
+def refresh_meeting_pointers(connection, club_ids):
+    """Recompute and store the pointer rows of ``club_ids``."""
+    for club_id in club_ids:
+        write_meeting_pointer(connection, club_id, compute_meeting_pointer(connection, club_id))
+
+
+def get_meeting_pointer(club_id):
+    """Return the stored pointer fields for ``club_id``, or None if missing."""
+    row = db.session.query(*(getattr(MeetingPointer, f) for f in POINTER_FIELDS)) \
+        .filter(MeetingPointer.club_id == club_id).first()
+    return dict(row._mapping) if row else None
+
+
+def pick_default_meeting_id(pointer, include_unpublished):
+    """Apply the running > upcoming > finished priority to a pointer dict."""
+    upcoming = pointer['upcoming_unpublished_meeting_id' if include_unpublished else 'upcoming_meeting_id']
+    return pointer['running_meeting_id'] or upcoming or pointer['finished_meeting_id']
+
+
+def rebuild_meeting_pointers(club_ids=None):
+    """Recompute pointer rows; returns ``[(club_id, before, after)]`` for drifted rows.
+
+    The caller commits.
+    """
+    from app.models import Club
+
+    if club_ids is None:
+        club_ids = [cid for (cid,) in db.session.query(Club.id).order_by(Club.id)]
+    connection = db.session.connection()
+    drifted = []
+    for club_id in club_ids:
+        before = get_meeting_pointer(club_id)
+        after = compute_meeting_pointer(connection, club_id)
+        if before != after:
+            write_meeting_pointer(connection, club_id, after)
+            drifted.append((club_id, before, after))
+    return drifted
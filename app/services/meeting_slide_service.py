@@ -10,8 +10,8 @@ from pptx.oxml.xmlchemy import OxmlElement
 from pptx.util import Inches, Pt, Cm
 from pptx.enum.text import PP_ALIGN
 from pptx.dml.color import RGBColor
-from PIL import Image
 
+from . import avatar_renditions
 from .export.context import MeetingExportContext
 from ..utils import derive_credentials
 from ..models.meeting import Meeting
@@ -26,6 +26,23 @@ class MeetingSlideService:
         """Main entry point for generating meeting slides. Uses v2 by default."""
         return MeetingSlideService.generate_meeting_pptx_v2(meeting_id, logs_data)
 
+    @staticmethod
+    def layout_template_path(club_id):
+        """Return the layout deck used by v2 generation, or None if there is none."""
+        # Template Path: app/static/club_resources/<club_id>/slides_layouts.pptx
+        template_path = os.path.join(current_app.static_folder, 'club_resources', str(club_id), 'slides_layouts.pptx')
+
+        # Fallback to generic template if club-specific one doesn't exist
+        if not os.path.exists(template_path):
+            current_app.logger.warning(f"Club-specific layout template not found at {template_path}. "
+                                       "Falling back to instance/layouts.pptx")
+            template_path = os.path.join(current_app.root_path, '..', 'instance', 'layouts.pptx')
+
+        if not os.path.exists(template_path):
+            current_app.logger.error(f"Template not found at {template_path}")
+            return None
+        return template_path
+
     @staticmethod
     def generate_meeting_pptx_v2(meeting_id, logs_data=None):
         """
@@ -42,16 +59,8 @@ class MeetingSlideService:
             from ..agenda_routes import _get_processed_logs_data
             logs_data, _ = _get_processed_logs_data(meeting_id)
 
-        # Template Path: app/static/club_resources/<club_id>/slides_layouts.pptx
-        template_path = os.path.join(current_app.static_folder, 'club_resources', str(meeting.club_id), 'slides_layouts.pptx')
-        
-        # Fallback to generic template if club-specific one doesn't exist
-        if not os.path.exists(template_path):
-             current_app.logger.warning(f"Club-specific layout template not found at {template_path}. Falling back to instance/layouts.pptx")
-             template_path = os.path.join(current_app.root_path, '..', 'instance', 'layouts.pptx')
-        
-        if not os.path.exists(template_path):
-            current_app.logger.error(f"Template not found at {template_path}")
+        template_path = MeetingSlideService.layout_template_path(meeting.club_id)
+        if not template_path:
             return None
 
         try:
@@ -78,7 +87,12 @@ class MeetingSlideService:
             if action_layout:
                 prs.slides.add_slide(action_layout)
 
-            avatar_base_path = os.path.join(current_app.static_folder, 'avatars')
+            # One query for every owner's avatar; images come from the rendition cache
+            owner_ids = {log.get('Owner_ID') for log in logs_data if log.get('Owner_ID')}
+            avatar_urls = {}
+            if owner_ids:
+                avatar_urls = dict(db.session.query(Contact.id, Contact.Avatar_URL)
+                                   .filter(Contact.id.in_(owner_ids)).all())
 
             from ..models.roster import MeetingRole
             from ..constants import GLOBAL_CLUB_ID
@@ -185,31 +199,16 @@ class MeetingSlideService:
                         elif idx == 10: shape.text = duration_text
                         elif idx == 12: shape.text = project_info_text
                         elif idx == 11:
-                            # Avatar insertion with WEBP conversion
-                            primary_owner_id = log.get('Owner_ID')
-                            if primary_owner_id:
-                                contact = Contact.query.get(primary_owner_id)
-                                if contact and contact.Avatar_URL:
-                                    avatar_path = os.path.join(avatar_base_path, contact.Avatar_URL)
-                                    if os.path.exists(avatar_path):
-                                        try:
-                                            # Process all images to ensure transparency is filled with white
-                                            img = Image.open(avatar_path)
-                                            if img.mode in ('RGBA', 'LA') or (img.mode == 'P' and 'transparency' in img.info):
-                                                background = Image.new('RGB', img.size, (255, 255, 255))
-                                                if img.mode == 'P':
-                                                    img = img.convert('RGBA')
-                                                background.paste(img, mask=img.split()[-1])
-                                                img = background
-                                            elif img.mode != 'RGB':
-                                                img = img.convert('RGB')
-                                            
-                                            img_io = io.BytesIO()
-                                            img.save(img_io, format='PNG')
-                                            img_io.seek(0)
-                                            shape.insert_picture(img_io)
-                                        except Exception as e:
-                                            current_app.logger.error(f"Error inserting picture {avatar_path}: {e}")
+                            # Avatar, flattened and cropped to the placeholder once per source file
+                            avatar_path = avatar_renditions.avatar_source_path(avatar_urls.get(log.get('Owner_ID')))
+                            if avatar_path:
+                                box = avatar_renditions.shape_box(shape.width, shape.height)
+                                data = avatar_renditions.rendition_bytes(avatar_path, box)
+                                if data:
+                                    try:
+                                        shape.insert_picture(io.BytesIO(data))
+                                    except Exception as e:
+                                        current_app.logger.error(f"Error inserting picture {avatar_path}: {e}")
                 
                 # Defer adding section layouts until after the current role-taker/session slides are generated
                 if pending_section_layouts:
@@ -562,32 +561,10 @@ class MeetingSlideService:
 
     @staticmethod
     def _crop_image_to_aspect_ratio(image_path, target_width, target_height):
-        """Internal v1 helper."""
-        try:
-            im = Image.open(image_path)
-            iw, ih = im.size
-            tr, ir = target_width / target_height, iw / ih
-            if ir > tr:
-                nw = int(ih * tr)
-                l = (iw - nw) // 2
-                box = (l, 0, l + nw, ih)
-            else:
-                nh = int(iw / tr)
-                t = (ih - nh) // 2
-                box = (0, t, iw, t + nh)
-            ci = im.crop(box)
-            if ci.mode in ('RGBA', 'LA'):
-                bg = Image.new(ci.mode[:-1], ci.size, (255, 255, 255))
-                bg.paste(ci, mask=ci.split()[-1])
-                ci = bg.convert('RGB')
-            elif ci.mode != 'RGB': ci = ci.convert('RGB')
-            bp, ex = os.path.splitext(image_path)
-            cp = f"{bp}_cropped.jpg"
-            ci.save(cp, 'JPEG', quality=95)
-            return cp
-        except Exception as e:
-            current_app.logger.error(f"Error cropping image: {e}")
+        """Internal v1 helper. Returns the cached rendition; callers must not delete it."""
+        if not image_path:
             return None
+        return avatar_renditions.rendition_path(image_path, avatar_renditions.shape_box(target_width, target_height))
 
     @staticmethod
     def _fill_shape_with_image(slide, shape, image_path):
@@ -622,14 +599,7 @@ class MeetingSlideService:
                 if nc in nm:
                     d = nm[nc]
                     url = d.Avatar_URL if d and hasattr(d, 'Avatar_URL') else None
-                    ip = None
-                    if url:
-                        if url.startswith('/static/'): url = url[8:]
-                        elif url.startswith('static/'): url = url[7:]
-                        if '/' not in url and '\\' not in url:
-                            url = os.path.join(current_app.config.get('AVATAR_ROOT_DIR', 'avatars'), url)
-                        ip = os.path.join(current_app.static_folder, url.lstrip('/'))
-                        if not os.path.exists(ip): ip = None
+                    ip = avatar_renditions.avatar_source_path(url)
                     if not ip:
                         for dn in ["default_avatar.jpg", "default_avatar.png", "avatar_default.jpg"]:
                             tp = os.path.join(current_app.static_folder, dn)
@@ -641,6 +611,4 @@ class MeetingSlideService:
                         cp = MeetingSlideService._crop_image_to_aspect_ratio(ip, sh.width, sh.height)
                         if cp:
                             MeetingSlideService._fill_shape_with_image(s, sh, cp)
-                            try: os.remove(cp)
-                            except: pass
                     except Exception as e: current_app.logger.error(f"Error processing avatar for {sh.name}: {e}")
@@ -0,0 +1,277 @@
+"""Per-club index of contact names and meetings for chat lookups.
+
+A chat turn used to hit the database for every name it looked at:
+``ChatService.get_query_context`` ran a ``Contact.Name LIKE '%word%'``
+query per word of the message, and every tool call resolved its contact
+with up to three scans (exact, ``ilike``, first/last name) and its meeting
+with separate number and date queries.
+
+``get_name_index(club_id)`` loads the club's contacts and meetings with two
+queries into a ``NameIndex``: normalized names (NFKC, case-folded) with
+posting sets of their characters and trigrams, plus meeting number and
+date maps. Lookups then run in memory. Chinese names have no word breaks,
+so they are found through their characters, including inside a longer run
+of text such as "分配张伟为计时员".
+
+The index is built lazily and kept per process, like the compiled club
+metadata (``app/services/club_metadata.py``): a version stamp per club in
+the shared cache tells a worker when its copy is stale
+(``app/services/versioned_cache.py``). Unit-of-work changes to
+``Contact``, ``ContactClub`` and ``Meeting`` bump the stamps through the
+session hooks registered at the end of this module; the bulk importer,
+which writes memberships and meetings with Core inserts, bumps its club
+after each table.
+"""
+import unicodedata
+from collections import namedtuple
+
+from flask import g, has_request_context
+from sqlalchemy import inspect as sa_inspect, select
+
+from app import db
+from app.services.versioned_cache import VersionStamps, track
+
+# Stamp every club's index depends on, for changes whose clubs are unknown
+ALL_CLUBS_SCOPE = 'all'
+
+# Minimum trigram similarity for a fuzzy match
+FUZZY_THRESHOLD = 0.3
+
+# Columns copied into the index; changes to others leave it valid
+_CONTACT_COLUMNS = ('Name', 'first_name', 'last_name', 'Type', 'Email')
+_MEETING_COLUMNS = ('club_id', 'Meeting_Number', 'Meeting_Date', 'status', 'Meeting_Title')
+
+ContactEntry = namedtuple('ContactEntry', 'id name first_name last_name type email')
+MeetingEntry = namedtuple('MeetingEntry', 'id number date status title')
+
+_stamps = VersionStamps('name_index_version')
+
+
+def normalize(text):
+    """Case-folded NFKC form of ``text`` with runs of whitespace collapsed."""
+    if not text:
+        return ''
+    return ' '.join(unicodedata.normalize('NFKC', str(text)).casefold().split())
+
+
+def _trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _padded_trigrams(text):
+    return _trigrams(f"  {text} ")
+
+
+def _similarity(a, b):
+    ga, gb = _padded_trigrams(a), _padded_trigrams(b)
+    return len(ga & gb) / len(ga | gb)
+
+
+class NameIndex:
+    """Contacts and meetings of one club, searchable without SQL."""
+
+    def __init__(self, contacts, meetings):
+        self.contacts = {}
+        self._names = {}
+        self._by_name = {}
+        self._by_parts = {}
+        self._chars = {}
+        self._grams = {}
+        for entry in sorted(contacts, key=lambda c: c.id):
+            name = normalize(entry.name)
+            self.contacts[entry.id] = entry
+            self._names[entry.id] = name
+            self._by_name.setdefault(name, []).append(entry.id)
+            if entry.first_name and entry.last_name:
+                key = (normalize(entry.first_name), normalize(entry.last_name))
+                self._by_parts.setdefault(key, []).append(entry.id)
+            for ch in set(name):
+                self._chars.setdefault(ch, set()).add(entry.id)
+            for gram in _trigrams(name):
+                self._grams.setdefault(gram, set()).add(entry.id)
+
+        self.meetings_by_number = {}
+        self.meetings_by_date = {}
+        for entry in sorted(meetings, key=lambda m: m.id):
+            if entry.number is not None:
+                self.meetings_by_number.setdefault(entry.number, entry)
+            if entry.date is not None:
+                self.meetings_by_date.setdefault(entry.date, entry)
+        self._meetings = sorted(meetings, key=lambda m: (m.date is not None, m.date or 0, m.id))
+
+    def _containing(self, text):
+        """Ids of contacts whose normalized name contains ``text``."""
+        grams = _trigrams(text) if len(text) >= 3 else set(text)
+        postings = self._grams if len(text) >= 3 else self._chars
+        candidates = None
+        for gram in grams:
+            ids = postings.get(gram)
+            if not ids:
+                return set()
+            candidates = set(ids) if candidates is None else candidates & ids
+        return {cid for cid in candidates or () if text in self._names[cid]}
+
+    def _rank(self, cid, query):
+        name = self._names[cid]
+        if name == query:
+            return 0
+        if name.startswith(query) or query in name.split():
+            return 1
+        if any(token.startswith(query) for token in name.split()):
+            return 2
+        return 3
+
+    def search(self, query, limit=5, fuzzy=False):
+        """Contacts whose name contains ``query``, best matches first.
+
+        Exact names rank first, then names starting with the query or
+        having it as a word, then other substrings. With ``fuzzy``, a query
+        that matches nothing falls back to names with a word, or the whole
+        name without spaces, similar to it (trigram similarity, for misspellings).
+        """
+        query = normalize(query)
+        if not query:
+            return []
+        ids = self._containing(query)
+        if ids:
+            ranked = sorted(ids, key=lambda cid: (self._rank(cid, query), len(self._names[cid]), cid))
+        elif fuzzy:
+            ranked = self._fuzzy(query)
+        else:
+            ranked = []
+        return [self.contacts[cid] for cid in ranked[:limit]]
+
+    def _fuzzy(self, query):
+        postings = self._grams if len(query) >= 3 else self._chars
+        candidates = set()
+        for gram in _trigrams(query) or set(query):
+            candidates |= postings.get(gram, set())
+        scored = []
+        for cid in candidates:
+            tokens = self._names[cid].split()
+            score = max(_similarity(query, t) for t in (*tokens, ''.join(tokens)))
+            if score >= FUZZY_THRESHOLD:
+                scored.append((-score, len(self._names[cid]), cid))
+        return [cid for _, _, cid in sorted(scored)]
+
+    def names_in(self, text, min_length=2):
+        """Contacts whose whole name occurs inside ``text`` (for unsegmented CJK)."""
+        text = normalize(text)
+        candidates = set()
+        for ch in set(text):
+            candidates |= self._chars.get(ch, set())
+        found = [cid for cid in candidates
+                 if len(self._names[cid]) >= min_length and self._names[cid] in text]
+        return [self.contacts[cid] for cid in sorted(found, key=lambda cid: (-len(self._names[cid]), cid))]
+
+    def find_contact(self, name):
+        """Resolve a name the way tools always have; returns an entry or None.
+
+        An exact name wins, then the only name containing it, then a
+        first/last name pair. An ambiguous partial name resolves to nothing.
+        """
+        raw = str(name).strip()
+        query = normalize(raw)
+        if not query:
+            return None
+        exact = [cid for cid in self._by_name.get(query, ()) if self.contacts[cid].name == raw]
+        exact = exact or self._by_name.get(query)
+        if exact:
+            return self.contacts[exact[0]]
+        ids = self._containing(query)
+        if len(ids) == 1:
+            return self.contacts[ids.pop()]
+        parts = query.split()
+        if len(parts) >= 2:
+            ids = self._by_parts.get((parts[0], parts[-1]))
+            if ids:
+                return self.contacts[ids[0]]
+        return None
+
+    def upcoming_meetings(self, limit=3):
+        """Meetings neither finished nor cancelled, earliest first."""
+        upcoming = [m for m in self._meetings if m.status not in ('finished', 'cancelled')]
+        return upcoming[:limit]
+
+
+def build_name_index(club_id):
+    """Load the club's contacts and meetings (two queries) into a ``NameIndex``."""
+    from app.models import Contact, ContactClub, Meeting
+
+    contacts = [
+        ContactEntry(*row) for row in db.session.query(
+            Contact.id, Contact.Name, Contact.first_name, Contact.last_name, Contact.Type, Contact.Email
+        ).join(ContactClub, ContactClub.contact_id == Contact.id).filter(ContactClub.club_id == club_id)
+    ]
+    meetings = [
+        MeetingEntry(*row) for row in db.session.query(
+            Meeting.id, Meeting.Meeting_Number, Meeting.Meeting_Date, Meeting.status, Meeting.Meeting_Title
+        ).filter(Meeting.club_id == club_id)
+    ]
+    return NameIndex(contacts, meetings)
+
+
+def get_name_index(club_id):
+    """Return the ``NameIndex`` of ``club_id``, building it if stale."""
+    memo = g.setdefault('_name_index', {}) if has_request_context() else {}
+    if club_id in memo:
+        return memo[club_id]
+
+    versions = _stamps.get(ALL_CLUBS_SCOPE, club_id)
+    index = _stamps.local_copy(club_id, versions, lambda: build_name_index(club_id))
+    memo[club_id] = index
+    return index
+
+
+def invalidate_name_index(club_id=None):
+    """Bump the club's version stamp (every club's for None) so indexes rebuild."""
+    _stamps.bump(club_id or ALL_CLUBS_SCOPE)
+    if club_id:
+        _stamps.local.pop(club_id, None)
+    else:
+        _stamps.local.clear()
+    if has_request_context():
+        g.pop('_name_index', None)
+
+
+def _changed(obj, columns):
+    state = sa_inspect(obj)
+    return any(state.attrs[key].history.has_changes() for key in columns)
+
+
+def _name_index_changes(session):
+    """Return the ids of clubs whose index the flush affects."""
+    from app.models import Contact, ContactClub, Meeting
+
+    club_ids = set()
+    contact_ids = set()
+    for obj in (*session.new, *session.deleted):
+        if isinstance(obj, (ContactClub, Meeting)):
+            club_ids.add(obj.club_id)
+    for obj in session.new:
+        # Memberships may already exist, e.g. written by the bulk importer
+        if isinstance(obj, Contact):
+            contact_ids.add(obj.id)
+    for obj in session.dirty:
+        if isinstance(obj, ContactClub):
+            if _changed(obj, ('contact_id', 'club_id')):
+                club_ids.add(obj.club_id)
+                club_ids.update(sa_inspect(obj).attrs.club_id.history.deleted)
+        elif isinstance(obj, Meeting):
+            if _changed(obj, _MEETING_COLUMNS):
+                club_ids.add(obj.club_id)
+                club_ids.update(sa_inspect(obj).attrs.club_id.history.deleted)
+        elif isinstance(obj, Contact):
+            if _changed(obj, _CONTACT_COLUMNS):
+                contact_ids.add(obj.id)
+
+    # Plain connection read: session.query would autoflush mid-flush
+    if contact_ids:
+        club_ids.update(session.connection().execute(
+            select(ContactClub.club_id).where(ContactClub.contact_id.in_(contact_ids))
+        ).scalars())
+    club_ids.discard(None)
+    return club_ids
+
+
+track('name_index', invalidate_name_index, _name_index_changes)
@@ -0,0 +1,110 @@
+"""Per-club navigation snapshot for the global template context.
+
+``inject_global_vars`` runs on every template render, modal partials
+included, and used to load the club row, probe for meetings, resolve the
+default meeting (up to three queries) and load it again just to read its
+status. All of that only changes when a club is edited or a meeting is
+created, deleted or moved between statuses, so it is compiled once per club
+into::
+
+    {
+        'club': {column: value},        # Club row, rehydrated on read
+        'has_meetings': bool,
+        'default_meeting': {            # keyed by include_unpublished
+            False: {'id', 'status', 'club_id', 'sharing_master_id'} | None,
+            True:  {...} | None,
+        },
+    }
+
+and kept in the shared cache. A render costs one cache read per request;
+the hooks at the end of ``app/models/meeting.py`` drop the snapshot when the
+underlying rows change, at flush and again at commit
+(``app/services/versioned_cache.py``).
+"""
+from flask import g, has_request_context
+from sqlalchemy import inspect
+from sqlalchemy.orm import make_transient_to_detached
+
+from app import cache, db
+from app.services.versioned_cache import CACHE_TIMEOUT
+
+
+def _key(club_id):
+    return f"nav_state_{club_id}"
+
+
+def _meeting_dict(meeting_id):
+    from app.models import Meeting
+
+    if not meeting_id:
+        return None
+    row = db.session.query(
+        Meeting.id, Meeting.status, Meeting.club_id, Meeting.sharing_master_id
+    ).filter(Meeting.id == meeting_id).first()
+    return dict(row._mapping) if row else None
+
+
+def compile_nav_state(club_id):
+    """Build the snapshot for ``club_id`` straight from the database."""
+    from app.models import Club, Meeting
+    from app.services.meeting_pointer import (
+        compute_meeting_pointer, get_meeting_pointer, pick_default_meeting_id)
+
+    club = db.session.get(Club, club_id)
+    club_data = None
+    if club is not None:
+        club_data = {attr.key: getattr(club, attr.key)
+                     for attr in inspect(Club).column_attrs}
+
+    has_meetings = db.session.query(Meeting.id).filter(Meeting.club_id == club_id).first() is not None
+    default_meeting = {False: None, True: None}
+    if has_meetings:
+        pointer = get_meeting_pointer(club_id) or compute_meeting_pointer(db.session, club_id)
+        for include_unpublished in (False, True):
+            default_meeting[include_unpublished] = _meeting_dict(
+                pick_default_meeting_id(pointer, include_unpublished))
+
+    return {
+        'club': club_data,
+        'has_meetings': has_meetings,
+        'default_meeting': default_meeting,
+    }
+
+
+def _club_instance(club_data):
+    """Return a session-bound Club for the cached columns without a SELECT."""
+    from app.models import Club
+
+    if club_data is None:
+        return None
+    existing = db.session.identity_map.get(db.session.identity_key(Club, club_data['id']))
+    if existing is not None:
+        return existing
+    club = Club(**club_data)
+    make_transient_to_detached(club)
+    return db.session.merge(club, load=False)
+
+
+def get_nav_state(club_id):
+    """Return ``{'club', 'has_meetings', 'default_meeting'}`` for ``club_id``.
+
+    ``club`` is a Club instance attached to the current session.
+    """
+    memo = g.setdefault('_nav_state', {}) if has_request_context() else {}
+    if club_id in memo:
+        return memo[club_id]
+
+    data = cache.get(_key(club_id))
+    if data is None:
+        data = compile_nav_state(club_id)
+        cache.set(_key(club_id), data, timeout=CACHE_TIMEOUT)
+
+    state = dict(data, club=_club_instance(data['club']))
+    memo[club_id] = state
+    return state
+
+
+def invalidate_nav_state(club_id):
+    cache.delete(_key(club_id))
+    if has_request_context():
+        g.pop('_nav_state', None)
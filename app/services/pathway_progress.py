@@ -0,0 +1,239 @@
+"""Materialized pathway progress for the speech log completion summary.
+
+``_calculate_completion_summary`` reloads every ``LevelRole`` requirement,
+rebuilds role aliases, re-fetches evaluator maps and recomputes every band
+for a member on each ``/speech_logs`` view and on every level-progress
+refresh after a speech log edit. The result only changes when one of the
+member's logs is completed, suspended, reassigned or re-projected (or the
+requirements themselves change), so it is stored per
+``(contact, pathway, level)`` in ``PathwayProgress``.
+
+Bands are kept together inside their level row: they draw from one pool of
+logs (a log counted for one band is not reused by the next), so a level is
+the smallest unit that can be recomputed on its own.
+
+The session hooks in ``app/models/pathway_progress.py`` delete the affected
+contacts' rows inside the flush that changes their logs. Once that
+transaction commits, those contacts are recomputed on a background thread
+(``rebuild_after_commit``); under ``TESTING`` (or with
+``PATHWAY_PROGRESS_INLINE``) right away. Reads never write: a read that
+finds no rows computes the summary and returns it. A per-contact generation
+stamp in the shared cache stops a rebuild that started before a change from
+storing its now-stale result. Changes to the level requirements drop every
+row and leave the recompute to ``flask speech-logs:rebuild-progress``,
+which rebuilds everyone in parallel batches.
+"""
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from flask import current_app
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import selectinload
+
+from app import cache, db
+from app.models import Contact, ContactPath, PathwayProgress
+
+logger = logging.getLogger(__name__)
+
+REBUILD_BATCH_SIZE = 50
+REBUILD_WORKERS = 4
+
+_STALE_KEY = 'pathway_progress_stale'
+_ALL = 'all'
+
+_executor = None
+_executor_pid = None
+_executor_lock = threading.Lock()
+
+
+def _generation_key(scope):
+    return f"pathway_progress_gen_{scope}"
+
+
+def _generation(contact_id):
+    values = cache.get_many(_generation_key(_ALL), _generation_key(contact_id))
+    return tuple(v or 0 for v in values)
+
+
+def _bump_generation(scope):
+    key = _generation_key(scope)
+    if not cache.cache.inc(key):
+        cache.set(key, 1, timeout=0)
+
+
+def compute_pathway_progress(contact_id, pathway):
+    """Run the speech-log completion summary for one member and pathway.
+
+    Mirrors the unfiltered member view of ``/speech_logs``:
+    ``{level_str: level_summary}``.
+    """
+    from app.speech_logs_routes import (
+        _attach_owners, _calculate_completion_summary, _fetch_logs_with_filters,
+        _get_pathway_project_mapping, _process_logs, _sort_and_consolidate,
+    )
+    from app.utils import build_pathway_project_cache
+
+    filters = {
+        'meeting_id': None,
+        'pathway': pathway,
+        'level': None,
+        'speaker_id': contact_id,
+        'status': None,
+        'role': None,
+    }
+    all_logs = _fetch_logs_with_filters(filters)
+    _attach_owners(all_logs)
+    project_ids = [log.Project_ID for log in all_logs if log.Project_ID]
+    pathway_cache = build_pathway_project_cache(project_ids=project_ids)
+    grouped_logs = _process_logs(all_logs, filters, pathway_cache)
+    _sort_and_consolidate(grouped_logs)
+    pp_mapping = _get_pathway_project_mapping(None, pathway)
+    return _calculate_completion_summary(grouped_logs, pp_mapping, selected_pathway_name=pathway)
+
+
+def load_pathway_progress(contact_id, pathway):
+    """Return the stored ``{level_str: level_summary}``, or None if not built."""
+    rows = db.session.execute(
+        select(PathwayProgress.level, PathwayProgress.summary)
+        .where(PathwayProgress.contact_id == contact_id, PathwayProgress.pathway == pathway)
+    ).all()
+    if not rows:
+        return None
+    return {str(level): json.loads(summary) for level, summary in sorted(rows)}
+
+
+def store_pathway_progress(contact_id, pathway, summary):
+    """Replace the stored rows for ``(contact_id, pathway)``. The caller commits."""
+    db.session.execute(delete(PathwayProgress).where(
+        PathwayProgress.contact_id == contact_id, PathwayProgress.pathway == pathway))
+    if summary:
+        db.session.execute(insert(PathwayProgress), [
+            {'contact_id': contact_id, 'pathway': pathway, 'level': int(level),
+             'summary': json.dumps(level_summary)}
+            for level, level_summary in summary.items()
+        ])
+
+
+def get_pathway_progress(contact_id, pathway, compute=None):
+    """Stored progress for ``(contact_id, pathway)``, computing it on a miss.
+
+    ``compute`` lets a caller that already has the member's processed logs
+    supply the summary; by default it is built from scratch. A miss is not
+    stored: rows are only written by rebuilds.
+    """
+    summary = load_pathway_progress(contact_id, pathway)
+    if summary is not None:
+        return summary
+    if compute is not None:
+        return compute()
+    return compute_pathway_progress(contact_id, pathway)
+
+
+def mark_contacts_stale(contact_ids):
+    """Queue contacts whose progress must be dropped at the next flush or commit."""
+    db.session.info.setdefault(_STALE_KEY, set()).update(contact_ids)
+
+
+def pop_stale(session):
+    return session.info.pop(_STALE_KEY, set())
+
+
+def drop_pathway_progress(connection, contact_ids=None):
+    """Delete stored rows for ``contact_ids`` (None means everyone) on ``connection``."""
+    query = delete(PathwayProgress)
+    if contact_ids is not None:
+        if not contact_ids:
+            return
+        query = query.where(PathwayProgress.contact_id.in_(contact_ids))
+    connection.execute(query)
+
+
+def publish_pathway_progress_change(contact_ids=None):
+    """Bump generation stamps after commit so in-flight reads do not store."""
+    if contact_ids is None:
+        _bump_generation(_ALL)
+        return
+    for contact_id in contact_ids:
+        _bump_generation(contact_id)
+
+
+def _rebuild_batch(app, batch):
+    """Store progress for ``(contact_id, pathway)`` pairs; returns how many were stored."""
+    stored = 0
+    with app.app_context():
+        try:
+            for contact_id, pathway in batch:
+                generation = _generation(contact_id)
+                with db.session.no_autoflush:
+                    summary = compute_pathway_progress(contact_id, pathway)
+                # Building the summary annotates logs in place; none of it is to be saved
+                db.session.expunge_all()
+                # Logs changed while computing: the commit that changed them rebuilds
+                if _generation(contact_id) != generation:
+                    continue
+                store_pathway_progress(contact_id, pathway, summary)
+                stored += 1
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        finally:
+            db.session.remove()
+    return stored
+
+
+def rebuild_pathway_progress(contact_ids=None, workers=REBUILD_WORKERS, batch_size=REBUILD_BATCH_SIZE):
+    """Recompute progress for every contact's current pathway.
+
+    Contacts are split into batches computed on ``workers`` threads, each
+    with its own app context and session. Returns the number of
+    (contact, pathway) pairs rebuilt.
+    """
+    query = Contact.query.options(selectinload(Contact.registered_paths).joinedload(ContactPath.pathway))
+    if contact_ids:
+        query = query.filter(Contact.id.in_(contact_ids))
+    # Current_Path is derived from the contact's registered paths
+    targets = [(contact.id, contact.Current_Path) for contact in query.order_by(Contact.id)]
+    targets = [(contact_id, pathway) for contact_id, pathway in targets if pathway]
+    if not targets:
+        return 0
+
+    app = current_app._get_current_object()
+    batches = [targets[i:i + batch_size] for i in range(0, len(targets), batch_size)]
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        return sum(executor.map(lambda batch: _rebuild_batch(app, batch), batches))
+
+
+def _inline(app):
+    inline = app.config.get('PATHWAY_PROGRESS_INLINE')
+    return app.testing if inline is None else inline
+
+
+def _get_executor():
+    """Per-process rebuild thread; a forked gunicorn worker must not reuse its parent's."""
+    global _executor, _executor_pid
+    with _executor_lock:
+        if _executor is None or _executor_pid != os.getpid():
+            _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='pathway-progress')
+            _executor_pid = os.getpid()
+        return _executor
+
+
+def _rebuild_contacts(app, contact_ids):
+    with app.app_context():
+        try:
+            rebuild_pathway_progress(contact_ids, workers=1)
+        except Exception:
+            logger.exception("Pathway progress rebuild failed for contacts %s", sorted(contact_ids))
+
+
+def rebuild_after_commit(contact_ids):
+    """Recompute the progress a committed change dropped for ``contact_ids``."""
+    app = current_app._get_current_object()
+    if _inline(app):
+        _rebuild_contacts(app, contact_ids)
+    else:
+        _get_executor().submit(_rebuild_contacts, app, contact_ids)
@@ -1,5 +1,7 @@
 from app import db
 from app.models import SessionLog, SessionType, Waitlist, Roster, MeetingRole, Contact, Meeting, OwnerMeetingRoles, Planner
+from app.services import tool_result_cache
+from app.services.booking_state import bump_booking_version
 from datetime import datetime, timezone
 from sqlalchemy import or_
 
@@ -135,6 +137,11 @@ class RoleService:
         cache.delete(f"role_takers_{club_id}_{meeting_id}")
         cache.delete(f"role_takers_None_{meeting_id}")
 
+        # Wake booking pages polling this meeting
+        bump_booking_version(meeting_id)
+        # Role edits may have bypassed the flush hooks (bulk deletes)
+        tool_result_cache.invalidate(club_id, ('meetings',))
+
     @staticmethod
     def is_role_approval_required(role_obj, club_id):
         """True iff a role still requires VPE approval for this club.
@@ -563,7 +570,7 @@ class RoleService:
         if club_id:
             query = query.filter(Meeting.club_id == club_id)
             
-        session_logs = query.all()
+        session_logs = SessionLog.load_owners(query.all())
         
         # Fetch Planner details for this meeting
         plans = Planner.query.filter(
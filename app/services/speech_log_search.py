@@ -0,0 +1,244 @@
+"""Full-text search index for speech logs.
+
+Speech log search used to OR nine ``LIKE '%kw%'`` predicates per keyword
+over a five-way join (owners, role, session type, meeting, pathway codes),
+which no index can serve. Instead every SessionLog gets one denormalized
+``SessionLogSearch.document``::
+
+    Samantha Adams Samantha Adams    <- owners (Name, first_name, last_name)
+    The Power of AI                  <- Session_Title
+    Prepared Speaker                 <- role name
+    Prepared Speech                  <- session type Title
+    PM1.1 DL1.1                      <- project_code + pathway codes
+    975                              <- Meeting_Number
+
+On MySQL each plain keyword is a whole word (``+adams``) in one boolean-mode
+``MATCH`` over the ``FULLTEXT`` index, so a keyword finds the word it names
+and no longer any word that merely contains it. Every keyword is then
+confirmed with ``LIKE '%kw%'`` on the one document column, so punctuation
+(``PM1.1``) still has to match exactly. Words InnoDB does not index (short
+tokens, stopwords, text with apostrophes, underscores or non-ASCII letters)
+only get the ``LIKE``. SQLite (dev and tests) only runs the ``LIKE``.
+
+Flushes that change a log, its owners, the meeting number or an owner's
+name queue the affected logs (hooks at the end of ``app/models/session.py``);
+ORM bulk deletes that bypass the unit of work queue theirs with
+``mark_logs_stale`` / ``mark_meetings_stale``. Once the transaction commits
+the queued documents are rebuilt in batches, each in its own short
+transaction, so a flush never waits on the index. A rollback drops the
+queue. ``flask speech-logs:reindex-search`` rebuilds everything, including
+documents a failed rebuild left behind.
+"""
+import logging
+import re
+
+from sqlalchemy import delete, insert, or_, select
+
+from app import db
+from app.models import (
+    Contact, Meeting, MeetingRole, OwnerMeetingRoles, SessionLog, SessionLogSearch, SessionType,
+)
+
+logger = logging.getLogger(__name__)
+
+# InnoDB's default innodb_ft_min_token_size; shorter words are not indexed
+# and are left to the LIKE check.
+MYSQL_MIN_TOKEN = 3
+
+# INFORMATION_SCHEMA.INNODB_FT_DEFAULT_STOPWORD; these are not indexed either
+MYSQL_STOPWORDS = frozenset('''
+    a about an are as at be by com de en for from how i in is it la of on or
+    that the this to was what when where who will with und www
+'''.split())
+
+REINDEX_BATCH_SIZE = 500
+
+_STALE_KEY = 'speech_log_search_stale'
+
+
+def fulltext_terms(keyword):
+    """Boolean-mode terms for ``keyword``: each indexed word, matched whole."""
+    terms = []
+    # InnoDB keeps apostrophes and underscores inside a word
+    for token in re.findall(r"[\w']+", keyword.lower()):
+        if (re.fullmatch(r'[a-z0-9]+', token) and len(token) >= MYSQL_MIN_TOKEN
+                and token not in MYSQL_STOPWORDS):
+            terms.append(f'+{token}')
+    return terms
+
+
+def _load_owner_names(connection, meeting_ids):
+    """Owners per log, mirroring ``SessionLog.load_owners``."""
+    by_log = {}
+    by_role = {}
+    if not meeting_ids:
+        return by_log, by_role
+    rows = connection.execute(
+        select(OwnerMeetingRoles.meeting_id, OwnerMeetingRoles.role_id,
+               OwnerMeetingRoles.session_log_id, Contact.id,
+               Contact.Name, Contact.first_name, Contact.last_name)
+        .join(Contact, OwnerMeetingRoles.contact_id == Contact.id)
+        .where(OwnerMeetingRoles.meeting_id.in_(meeting_ids))
+        .order_by(OwnerMeetingRoles.id)
+    )
+    for meeting_id, role_id, log_id, contact_id, *names in rows:
+        owner = (contact_id, names)
+        by_log.setdefault((meeting_id, role_id, log_id), []).append(owner)
+        by_role.setdefault((meeting_id, role_id), []).append(owner)
+    return by_log, by_role
+
+
+def build_documents(connection, log_ids):
+    """Return ``{log_id: (club_id, meeting_id, document)}`` for existing logs."""
+    from app.services.club_metadata import get_pathway_project_codes
+
+    rows = connection.execute(
+        select(SessionLog.id, SessionLog.meeting_id, Meeting.club_id, Meeting.Meeting_Number,
+               SessionLog.Session_Title, SessionLog.project_code, SessionLog.Project_ID,
+               SessionType.Title, MeetingRole.id, MeetingRole.name, MeetingRole.has_single_owner)
+        .join(Meeting, SessionLog.meeting_id == Meeting.id)
+        .outerjoin(SessionType, SessionLog.Type_ID == SessionType.id)
+        .outerjoin(MeetingRole, SessionType.role_id == MeetingRole.id)
+        .where(SessionLog.id.in_(log_ids))
+    ).all()
+    by_log, by_role = _load_owner_names(connection, {row[1] for row in rows})
+    pathway_codes = get_pathway_project_codes() if any(row.Project_ID for row in rows) else {}
+
+    documents = {}
+    for (log_id, meeting_id, club_id, meeting_number, title, project_code, project_id,
+         type_title, role_id, role_name, single_owner) in rows:
+        if role_id is None or single_owner is None or single_owner:
+            owners = by_log.get((meeting_id, role_id, log_id), [])
+        else:
+            # Shared role: every owner of the role in the meeting, once
+            seen = set()
+            owners = []
+            for contact_id, names in by_role.get((meeting_id, role_id), []):
+                if contact_id not in seen:
+                    seen.add(contact_id)
+                    owners.append((contact_id, names))
+
+        parts = [name for _, names in owners for name in names]
+        parts += [title, role_name, type_title, project_code]
+        parts += [f"{abbr}{info['code']}" for abbr, info in pathway_codes.get(project_id, {}).items()
+                  if info.get('code')]
+        parts.append(str(meeting_number) if meeting_number is not None else None)
+        documents[log_id] = (club_id, meeting_id, '\n'.join(p for p in parts if p))
+    return documents
+
+
+def _expand_log_ids(connection, log_ids, meeting_ids):
+    """``log_ids`` plus every log indexed or present in ``meeting_ids``, sorted."""
+    log_ids = set(log_ids)
+    if meeting_ids:
+        log_ids.update(connection.execute(
+            select(SessionLog.id).where(SessionLog.meeting_id.in_(set(meeting_ids)))
+        ).scalars())
+        # Rows of logs already gone from these meetings
+        log_ids.update(connection.execute(
+            select(SessionLogSearch.session_log_id)
+            .where(SessionLogSearch.meeting_id.in_(set(meeting_ids)))
+        ).scalars())
+    log_ids.discard(None)
+    return sorted(log_ids)
+
+
+def reindex_session_logs(connection, log_ids=(), meeting_ids=()):
+    """Rebuild search documents for the given logs and/or whole meetings.
+
+    Logs that no longer exist lose their row. Writes on ``connection`` and
+    leaves the transaction to the caller; returns the number of documents
+    written.
+    """
+    log_ids = _expand_log_ids(connection, log_ids, meeting_ids)
+    written = 0
+    for start in range(0, len(log_ids), REINDEX_BATCH_SIZE):
+        batch = log_ids[start:start + REINDEX_BATCH_SIZE]
+        documents = build_documents(connection, batch)
+        connection.execute(delete(SessionLogSearch).where(SessionLogSearch.session_log_id.in_(batch)))
+        if not documents:
+            continue
+        connection.execute(insert(SessionLogSearch), [
+            {'session_log_id': log_id, 'club_id': club_id, 'meeting_id': meeting_id, 'document': document}
+            for log_id, (club_id, meeting_id, document) in documents.items()
+        ])
+        written += len(documents)
+    return written
+
+
+def reindex_committed(log_ids=(), meeting_ids=()):
+    """Rebuild documents after their changes committed, one transaction per batch.
+
+    Returns the number of documents written. A failure is logged rather than
+    raised: the change itself is already committed.
+    """
+    written = 0
+    try:
+        with db.engine.connect() as connection:
+            log_ids = _expand_log_ids(connection, log_ids, meeting_ids)
+        for start in range(0, len(log_ids), REINDEX_BATCH_SIZE):
+            with db.engine.begin() as connection:
+                written += reindex_session_logs(connection, log_ids[start:start + REINDEX_BATCH_SIZE])
+    except Exception:
+        logger.exception("Speech log search reindex failed; run flask speech-logs:reindex-search")
+    return written
+
+
+def matching_log_ids(club_id, keywords):
+    """Select of ``session_log_id`` whose document matches every keyword."""
+    query = select(SessionLogSearch.session_log_id).where(SessionLogSearch.club_id == club_id)
+
+    if db.session.get_bind().dialect.name == 'mysql':
+        terms = [term for kw in keywords for term in fulltext_terms(kw)]
+        if terms:
+            query = query.where(SessionLogSearch.document.match(' '.join(terms)))
+
+    for kw in keywords:
+        query = query.where(SessionLogSearch.document.like(f'%{kw}%'))
+    return query
+
+
+def queue_reindex(session, log_ids=(), meeting_ids=()):
+    """Queue documents to rebuild once ``session`` commits."""
+    queue = session.info.setdefault(_STALE_KEY, {'logs': set(), 'meetings': set()})
+    queue['logs'].update(log_ids)
+    queue['meetings'].update(meeting_ids)
+
+
+def mark_logs_stale(log_ids):
+    """Queue logs for reindexing after the commit."""
+    queue_reindex(db.session, log_ids=log_ids)
+
+
+def mark_meetings_stale(meeting_ids):
+    """Queue every log of the given meetings for reindexing."""
+    queue_reindex(db.session, meeting_ids=meeting_ids)
+
+
+def pop_stale(session):
+    stale = session.info.pop(_STALE_KEY, None)
+    if not stale:
+        return set(), set()
+    return stale['logs'], stale['meetings']
+
+
+def rebuild_search_index(club_id=None):
+    """Reindex every log (or one club's); returns the number of documents.
+
+    The caller commits.
+    """
+    connection = db.session.connection()
+    meeting_query = select(Meeting.id)
+    stale_query = select(SessionLogSearch.session_log_id).where(
+        or_(SessionLogSearch.meeting_id.not_in(select(Meeting.id)),
+            SessionLogSearch.session_log_id.not_in(select(SessionLog.id))))
+    if club_id:
+        meeting_query = meeting_query.where(Meeting.club_id == club_id)
+        stale_query = stale_query.where(SessionLogSearch.club_id == club_id)
+
+    written = reindex_session_logs(connection, log_ids=connection.execute(stale_query).scalars().all())
+    meeting_ids = connection.execute(meeting_query.order_by(Meeting.id)).scalars().all()
+    for start in range(0, len(meeting_ids), REINDEX_BATCH_SIZE // 10):
+        written += reindex_session_logs(
+            connection, meeting_ids=meeting_ids[start:start + REINDEX_BATCH_SIZE // 10])
+    return written
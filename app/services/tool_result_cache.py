@@ -0,0 +1,230 @@
+"""Cached answers of read-only chat tools.
+
+Agenda, voting-result, meeting-list and pathway lookups are asked again
+and again in chat (the ``/chat/send`` pre-router answers "voting results of
+meeting 350" with ``get_voting_results`` directly), and each call rebuilt
+the same markdown from the same rows.
+
+A read-only tool checks permissions and resolves its meeting or contact
+first, then hands the expensive part to ``cached()``. The result is stored
+in the shared cache under a key made of the tool name, the normalized
+parameters (resolved ids rather than the text the user typed), the club,
+the locale and host the text is rendered for, and the version stamps of
+the data domains the tool reads:
+
+* ``meetings`` -- meetings, session logs, owners, votes and award winners
+  of one club (plus session types);
+* ``contacts`` -- names and club memberships of one club;
+* ``pathways`` -- the pathway library, registrations and level achievements.
+
+Each domain has a stamp per club where the rows belong to one club and a
+stamp for all clubs (``app/services/versioned_cache.py``). Unit-of-work
+changes bump them through the session hooks registered at the end of this
+module, ``RoleService._clear_meeting_cache`` bumps a meeting's club after
+bulk role edits, ``ChatToolExecutor.execute`` bumps the club after any
+tool that is not read-only, and writers that go through Core statements
+(ballots, the bulk importer) call ``mark_changed``.
+
+Hits and misses are counted per tool in the shared cache; ``stats()``
+returns them and ``flask chat:tool-cache-stats`` prints them.
+"""
+import hashlib
+import json
+
+from flask import has_request_context, request
+from sqlalchemy import select
+
+from app import cache, db
+from app.constants import GLOBAL_CLUB_ID
+from app.services.versioned_cache import CACHE_TIMEOUT, VersionStamps, mark, track
+
+ALL_CLUBS = 'all'
+
+# Domains with a stamp per club; the others only have the all-clubs stamp
+CLUB_DOMAINS = ('meetings', 'contacts')
+DOMAINS = ('meetings', 'contacts', 'pathways')
+
+# Data domains each cached tool reads
+CACHED_TOOLS = {
+    'get_meeting_agenda': ('meetings', 'contacts'),
+    'get_voting_results': ('meetings', 'contacts'),
+    'list_meetings': ('meetings',),
+    'get_pathway_status': ('pathways', 'contacts'),
+    'query_pathways_library': ('pathways',),
+}
+
+# Tools that never write; any other tool bumps its club's stamps
+READ_ONLY_TOOLS = frozenset(CACHED_TOOLS) | {
+    'search_contacts', 'get_meeting_info', 'get_role_assignments', 'get_available_roles',
+}
+
+_stamps = VersionStamps('chat_tool_version')
+
+
+def _counter_key(kind, tool_name):
+    return f"chat_tool_cache_{kind}_{tool_name}"
+
+
+def _scopes(domains, club_id):
+    scopes = []
+    for domain in domains:
+        scopes.append((domain, ALL_CLUBS))
+        if domain in CLUB_DOMAINS:
+            scopes.append((domain, club_id))
+    return scopes
+
+
+def _versions(domains, club_id):
+    return list(_stamps.get(*(f"{domain}_{scope}" for domain, scope in _scopes(domains, club_id))))
+
+
+def normalize_params(params):
+    """Params with blank values dropped and strings stripped, in key order."""
+    normalized = {}
+    for key in sorted(params or {}):
+        value = params[key]
+        if isinstance(value, str):
+            value = ' '.join(value.split())
+        if value in (None, ''):
+            continue
+        normalized[key] = value
+    return normalized
+
+
+def _render_context():
+    from app.translations.translations import get_locale
+
+    host = request.host_url if has_request_context() else None
+    return [str(get_locale()), host]
+
+
+def _result_key(tool_name, params, club_id, versions):
+    payload = json.dumps([tool_name, params, club_id, _render_context(), versions],
+                         sort_keys=True, default=str)
+    return f"chat_tool_result_{hashlib.sha1(payload.encode()).hexdigest()}"
+
+
+def _count(kind, tool_name):
+    try:
+        cache.cache.inc(_counter_key(kind, tool_name))
+    except Exception:
+        # Counters are best effort; a backend without inc must not break tools
+        pass
+
+
+def cached(tool_name, params, club_id, build):
+    """Return the result of ``build()`` for these params, reusing a stored one.
+
+    ``params`` should already identify the answer (e.g. a resolved meeting
+    id); it is normalized before use. Only call this after the tool's
+    permission checks passed.
+    """
+    versions = _versions(CACHED_TOOLS[tool_name], club_id)
+    key = _result_key(tool_name, normalize_params(params), club_id, versions)
+    result = cache.get(key)
+    if result is not None:
+        _count('hits', tool_name)
+        return dict(result)
+    _count('misses', tool_name)
+    result = build()
+    cache.set(key, result, timeout=CACHE_TIMEOUT)
+    return dict(result)
+
+
+def invalidate(club_id=None, domains=DOMAINS):
+    """Bump the stamps of ``domains`` for a club (every club for None)."""
+    for domain in domains:
+        scope = club_id if club_id and domain in CLUB_DOMAINS else ALL_CLUBS
+        if scope == GLOBAL_CLUB_ID:
+            # Global rows (session types) are merged into every club
+            scope = ALL_CLUBS
+        _stamps.bump(f"{domain}_{scope}")
+
+
+def mark_changed(club_id, domains=DOMAINS):
+    """Bump the stamps now and again when the current transaction ends.
+
+    For Core ``insert()``/``delete()`` statements, which the session hooks
+    do not see.
+    """
+    mark(db.session, 'tool_cache', ((domain, club_id) for domain in domains))
+
+
+def stats():
+    """``{tool: {'hits', 'misses', 'hit_rate'}}`` counted across workers."""
+    result = {}
+    for tool_name in CACHED_TOOLS:
+        hits = int(cache.get(_counter_key('hits', tool_name)) or 0)
+        misses = int(cache.get(_counter_key('misses', tool_name)) or 0)
+        total = hits + misses
+        result[tool_name] = {
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': hits / total if total else 0.0,
+        }
+    return result
+
+
+def reset_stats():
+    # One delete per key: delete_many stops at the first missing key
+    for tool_name in CACHED_TOOLS:
+        for kind in ('hits', 'misses'):
+            cache.delete(_counter_key(kind, tool_name))
+
+
+def _tool_cache_changes(session):
+    """Return the (domain, club_id) stamps the flush affects."""
+    from app.models import (
+        Achievement, Contact, ContactClub, ContactPath, Meeting, OwnerMeetingRoles, Pathway,
+        PathwayProject, Project, SessionLog, SessionType, UserClub, Vote,
+    )
+    from app.models.voting import MeetingAwardWinner
+
+    changes = set()
+    meeting_ids = set()
+    contact_ids = set()
+    deleted = set(session.deleted)
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if obj in session.dirty and not session.is_modified(obj):
+            continue
+        if isinstance(obj, Meeting):
+            changes.add(('meetings', obj.club_id))
+        elif isinstance(obj, SessionType):
+            changes.add(('meetings', obj.club_id))
+        elif isinstance(obj, (SessionLog, OwnerMeetingRoles, Vote, MeetingAwardWinner)):
+            meeting_ids.add(obj.meeting_id)
+        elif isinstance(obj, (ContactClub, UserClub)):
+            changes.add(('contacts', obj.club_id))
+        elif isinstance(obj, Contact):
+            if obj in deleted:
+                # Its memberships may already be gone
+                changes.add(('contacts', None))
+            else:
+                contact_ids.add(obj.id)
+        elif isinstance(obj, (Pathway, PathwayProject, Project, ContactPath, Achievement)):
+            changes.add(('pathways', None))
+
+    # Plain connection reads: session.query would autoflush mid-flush
+    meeting_ids.discard(None)
+    if meeting_ids:
+        changes.update(('meetings', club_id) for club_id in session.connection().execute(
+            select(Meeting.club_id).where(Meeting.id.in_(meeting_ids))
+        ).scalars())
+    contact_ids.discard(None)
+    if contact_ids:
+        memberships = session.connection().execute(
+            select(ContactClub.contact_id, ContactClub.club_id).where(ContactClub.contact_id.in_(contact_ids))
+        ).all()
+        changes.update(('contacts', club_id) for _, club_id in memberships)
+        if contact_ids - {contact_id for contact_id, _ in memberships}:
+            # Not in any club (yet): its name can still show up anywhere
+            changes.add(('contacts', None))
+    return changes
+
+
+def _invalidate_change(change):
+    domain, club_id = change
+    invalidate(club_id, (domain,))
+
+
+track('tool_cache', _invalidate_change, _tool_cache_changes)
@@ -0,0 +1,102 @@
+"""Version stamps and invalidation hooks shared by the compiled caches.
+
+Caches that turn rows into data kept in the shared cache, often with the
+last copy in each worker's memory as well, register here instead of each
+carrying its own stamps and session hooks.
+
+``VersionStamps`` holds one random token per scope in the shared cache. A
+worker reuses its copy while the tokens it was built under are unchanged;
+bumping a token makes every worker rebuild. Tokens are random, so two apps
+sharing a process (tests) never collide.
+
+``track()`` registers what a cache loses when rows change: after every
+flush, ``changes(session)`` names the affected items and ``invalidate(item)``
+drops each one right away, so reads later in the same transaction see the
+change, and again when the transaction commits or rolls back, so a worker
+that rebuilt from pre-commit rows in between does not keep them. Writers
+the flush never sees (Core statements, hooks with their own bookkeeping)
+report their items with ``mark()``.
+"""
+import uuid
+
+from sqlalchemy.orm import Session
+
+from app import cache, db
+
+# Safety net for rows edited behind the app's back (raw SQL restores):
+# stamps and compiled data expire after this many seconds.
+CACHE_TIMEOUT = 3600
+
+# name -> (changes, invalidate)
+_trackers = {}
+
+
+class VersionStamps:
+    """Version tokens of one cache, and the copies this process built under them."""
+
+    def __init__(self, prefix):
+        self.prefix = prefix
+        # Last copy built by this process: {key: (versions, data)}
+        self.local = {}
+
+    def _key(self, scope):
+        return f"{self.prefix}_{scope}"
+
+    def get(self, *scopes):
+        """Current tokens of ``scopes``, creating missing ones."""
+        keys = [self._key(s) for s in scopes]
+        values = list(cache.get_many(*keys))
+        for i, value in enumerate(values):
+            if value is None:
+                values[i] = uuid.uuid4().hex
+                cache.set(keys[i], values[i], timeout=CACHE_TIMEOUT)
+        return tuple(values)
+
+    def bump(self, scope):
+        cache.set(self._key(scope), uuid.uuid4().hex, timeout=CACHE_TIMEOUT)
+
+    def local_copy(self, key, versions, build):
+        """This process's copy for ``key`` if built under ``versions``, else ``build()``."""
+        local_versions, data = self.local.get(key, (None, None))
+        if local_versions != versions:
+            data = build()
+            self.local[key] = (versions, data)
+        return data
+
+
+def track(name, invalidate, changes=None):
+    """Register cache ``name``; see the module docstring.
+
+    Without ``changes`` only ``mark()`` reports items.
+    """
+    _trackers[name] = (changes, invalidate)
+
+
+def mark(session, name, items):
+    """Invalidate ``items`` of cache ``name`` now and again when the transaction ends."""
+    items = set(items)
+    if not items:
+        return
+    _, invalidate = _trackers[name]
+    session.info.setdefault(_dirty_key(name), set()).update(items)
+    for item in items:
+        invalidate(item)
+
+
+def _dirty_key(name):
+    return f"{name}_dirty"
+
+
+@db.event.listens_for(Session, 'after_flush')
+def _flag_changes(session, flush_context):
+    for name, (changes, _) in list(_trackers.items()):
+        if changes is not None:
+            mark(session, name, changes(session))
+
+
+@db.event.listens_for(Session, 'after_commit')
+@db.event.listens_for(Session, 'after_rollback')
+def _publish_changes(session):
+    for name, (_, invalidate) in list(_trackers.items()):
+        for item in session.info.pop(_dirty_key(name), ()):
+            invalidate(item)
@@ -0,0 +1,223 @@
+"""Incremental live vote tally kept in the shared cache.
+
+Officer live-results polls and the voting page used to re-run
+``COUNT(DISTINCT voter_identifier)`` and a ``GROUP BY contact_id,
+award_category`` over ``votes`` on every request. The tally for a meeting
+is now seeded once from SQL and then updated by applying the delta between
+a voter's old and new ballot inside ``batch_vote`` / ``vote_for_award``, so
+reads cost one cache lookup.
+
+Each seeded tally carries a random epoch. ``ballot_update`` notes the epoch
+before the ballot is written and applies its delta only after the commit,
+so no lock is held across the database transaction. The delta goes in only
+if the tally still has the noted epoch: a tally seeded while the ballot was
+being written may already count it, so it is dropped instead and the next
+read reseeds it. The read-modify-write of the cached value itself runs
+under a short per-meeting lock (``cache.add`` is atomic on Redis), released
+only by the holder of its token. A ballot change that fails half-way drops
+the tally too. ``reconcile_vote_tally`` checks the tally against SQL when
+the meeting is finished. Bulk rewrites of ``Vote.contact_id`` (contact
+merge and delete) drop the tallies of the meetings they touch with
+``drop_tallies_for_contacts``.
+"""
+import logging
+import time
+import uuid
+from contextlib import contextmanager
+
+from sqlalchemy import distinct, func
+
+from app import cache, db
+from app.models import Vote
+from app.services import versioned_cache
+from app.services.voting_aggregation import aggregate_votes_for_meeting
+
+logger = logging.getLogger(__name__)
+
+TALLY_TIMEOUT = 6 * 3600
+LOCK_TIMEOUT = 10
+LOCK_WAIT = 2.0
+
+
+def _tally_key(meeting_id):
+    return f"vote_tally_{meeting_id}"
+
+
+def _lock_key(meeting_id):
+    return f"vote_tally_lock_{meeting_id}"
+
+
+# Deletes the lock only if it still holds our token (atomic on Redis)
+_RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+def _acquire(meeting_id):
+    """Take the tally lock; returns its token, or None after ``LOCK_WAIT``."""
+    token = uuid.uuid4().hex
+    deadline = time.monotonic() + LOCK_WAIT
+    while True:
+        if cache.add(_lock_key(meeting_id), token, timeout=LOCK_TIMEOUT):
+            return token
+        if time.monotonic() >= deadline:
+            return None
+        time.sleep(0.01)
+
+
+def _release(meeting_id, token):
+    """Drop the lock unless it expired and another writer took it since."""
+    backend = cache.cache
+    client = getattr(backend, '_write_client', None)
+    if client is not None:
+        client.eval(_RELEASE_SCRIPT, 1, backend._get_prefix() + _lock_key(meeting_id),
+                    backend.serializer.dumps(token))
+    elif cache.get(_lock_key(meeting_id)) == token:
+        cache.delete(_lock_key(meeting_id))
+
+
+def _load(meeting_id):
+    """Return ``(epoch, tally)`` from the cache, or ``(None, None)``."""
+    return cache.get(_tally_key(meeting_id)) or (None, None)
+
+
+def compute_tally(meeting_id):
+    """Build the tally from SQL: ``{'voters': n, 'counts': {(cid, cat): n}}``."""
+    voters = db.session.query(func.count(distinct(Vote.voter_identifier)))\
+        .filter(Vote.meeting_id == meeting_id)\
+        .scalar() or 0
+    return {
+        'voters': voters,
+        'counts': aggregate_votes_for_meeting(meeting_id),
+    }
+
+
+def get_tally(meeting_id):
+    """Return the live tally for a meeting, seeding it from SQL on a miss."""
+    _, tally = _load(meeting_id)
+    if tally is not None:
+        return tally
+
+    token = _acquire(meeting_id)
+    try:
+        _, tally = _load(meeting_id) if token else (None, None)
+        if tally is None:
+            tally = compute_tally(meeting_id)
+            if token:
+                cache.set(_tally_key(meeting_id), (uuid.uuid4().hex, tally), timeout=TALLY_TIMEOUT)
+    finally:
+        if token:
+            _release(meeting_id, token)
+    return tally
+
+
+def get_vote_counts(meeting_id):
+    """``{(contact_id, award_category): count}`` from the live tally."""
+    return get_tally(meeting_id)['counts']
+
+
+def invalidate_tally(meeting_id):
+    cache.delete(_tally_key(meeting_id))
+
+
+versioned_cache.track('vote_tally', invalidate_tally)
+
+
+def drop_tallies_for_contacts(contact_ids):
+    """Drop the tallies of meetings with votes for ``contact_ids``.
+
+    Call before rewriting their ``Vote.contact_id``; the tallies are dropped
+    now and again when the transaction ends.
+    """
+    meeting_ids = db.session.query(Vote.meeting_id).filter(
+        Vote.contact_id.in_(list(contact_ids))).distinct()
+    versioned_cache.mark(db.session, 'vote_tally', {row[0] for row in meeting_ids} - {None})
+
+
+def _load_ballot(meeting_id, voter_identifier):
+    """Return ``(has_any_vote, [(contact_id, award_category), ...])``."""
+    rows = db.session.query(Vote.contact_id, Vote.award_category).filter(
+        Vote.meeting_id == meeting_id,
+        Vote.voter_identifier == voter_identifier,
+    ).all()
+    pairs = [(cid, cat) for cid, cat in rows if cid and cat]
+    return bool(rows), pairs
+
+
+def _apply_delta(tally, old_ballot, new_ballot):
+    had_votes, old_pairs = old_ballot
+    has_votes, new_pairs = new_ballot
+    counts = dict(tally['counts'])
+    for pair in old_pairs:
+        counts[pair] = counts.get(pair, 0) - 1
+        if counts[pair] <= 0:
+            del counts[pair]
+    for pair in new_pairs:
+        counts[pair] = counts.get(pair, 0) + 1
+    return {
+        'voters': tally['voters'] + int(has_votes) - int(had_votes),
+        'counts': counts,
+    }
+
+
+@contextmanager
+def ballot_update(meeting_id, voter_identifier):
+    """Keep the live tally in step with one voter's ballot change.
+
+    Wrap the code that rewrites the voter's ``Vote`` rows *and commits*::
+
+        with ballot_update(meeting.id, voter_identifier):
+            ...delete/add Vote rows...
+            db.session.commit()
+
+    The old ballot is read before the block and the new one after it; the
+    difference is applied to the cached tally once the block has committed.
+    """
+    epoch, _ = _load(meeting_id)
+    old_ballot = _load_ballot(meeting_id, voter_identifier)
+    try:
+        yield
+    except Exception:
+        invalidate_tally(meeting_id)
+        raise
+    if epoch is None:
+        return
+
+    new_ballot = _load_ballot(meeting_id, voter_identifier)
+    token = _acquire(meeting_id)
+    if not token:
+        invalidate_tally(meeting_id)
+        return
+    try:
+        current_epoch, tally = _load(meeting_id)
+        if current_epoch == epoch:
+            cache.set(_tally_key(meeting_id), (epoch, _apply_delta(tally, old_ballot, new_ballot)),
+                      timeout=TALLY_TIMEOUT)
+        elif tally is not None:
+            # Reseeded while the ballot was written; it may already count it
+            invalidate_tally(meeting_id)
+    finally:
+        _release(meeting_id, token)
+
+
+def reconcile_vote_tally(meeting_id):
+    """Verify the cached tally against SQL and drop it.
+
+    Called once a meeting is finished. Returns True when the cached tally
+    matched (or there was none); a mismatch is logged.
+    """
+    _, tally = _load(meeting_id)
+    invalidate_tally(meeting_id)
+    if tally is None:
+        return True
+    expected = compute_tally(meeting_id)
+    if tally != expected:
+        logger.warning(
+            f"Live vote tally for meeting {meeting_id} drifted from SQL: "
+            f"cached voters={tally['voters']} counts={len(tally['counts'])}, "
+            f"sql voters={expected['voters']} counts={len(expected['counts'])}")
+        return False
+    return True
@@ -0,0 +1,104 @@
+"""Ballot ingestion for ``batch_vote``.
+
+At the end of a meeting every voter submits at once, and the old path
+deleted all of a voter's ``Vote`` rows, then re-added them one ORM object
+at a time while scanning the award configs linearly per ballot entry.
+
+Here the configs are indexed by category once, the submitted ballot is
+normalised into plain row tuples, and it is diffed against what the voter
+already has stored (one lookup on ``idx_meeting_voter``). Only rows that
+actually changed are deleted, and new rows go in with a single executemany
+``INSERT``. An unchanged resubmission therefore writes nothing. The index is
+not unique (a voter has one row per category and question), so the diff
+plays the role of an upsert without a schema change.
+
+These Core statements bypass the session hooks, so ``write_ballot`` bumps
+the cached chat tool answers (``get_voting_results``) of the meeting's club
+itself.
+"""
+from app import db
+from app.models import Meeting, Vote
+from app.services import tool_result_cache
+
+
+def _row_key(row):
+    return (row['award_category'], row['contact_id'], row['question'], row['score'], row['comments'])
+
+
+def build_ballot_rows(meeting_id, voter_identifier, votes, configs):
+    """Turn a submitted ballot into ``votes`` rows, enforcing award limits.
+
+    Disabled categories are skipped and each category is capped at
+    ``min(max_votes_per_user, max_winners)`` (1 when unconfigured).
+    """
+    configs_by_category = {c.award_category: c for c in configs}
+    disabled_cats = {c.award_category for c in configs if c.max_votes_per_user == 0 or c.max_winners == 0}
+
+    rows = []
+    category_votes_count = {}
+    base = {'meeting_id': meeting_id, 'voter_identifier': voter_identifier}
+    for v in votes:
+        contact_id = v.get('contact_id')
+        award_category = v.get('award_category')
+        if isinstance(contact_id, str) and contact_id.isdigit():
+            contact_id = int(contact_id)
+        if contact_id and award_category:
+            if award_category in disabled_cats:
+                continue
+
+            config_item = configs_by_category.get(award_category)
+            max_votes_allowed = 1
+            if config_item:
+                max_votes_allowed = min(config_item.max_votes_per_user, config_item.max_winners)
+
+            category_votes_count[award_category] = category_votes_count.get(award_category, 0) + 1
+            if category_votes_count[award_category] > max_votes_allowed:
+                continue
+
+            rows.append(dict(base, award_category=award_category, contact_id=contact_id,
+                             question=None, score=None, comments=None))
+
+        question = v.get('question')
+        score = v.get('score')
+        comments = v.get('comments')
+        if question is not None and (score is not None or comments is not None):
+            rows.append(dict(base, award_category=None, contact_id=None,
+                             question=question, score=score, comments=comments))
+    return rows
+
+
+def write_ballot(meeting_id, voter_identifier, rows):
+    """Replace the voter's stored ballot with ``rows`` (not committed).
+
+    Returns ``(inserted, deleted)`` row counts.
+    """
+    table = Vote.__table__
+    existing = db.session.execute(
+        db.select(table.c.id, table.c.award_category, table.c.contact_id,
+                  table.c.question, table.c.score, table.c.comments)
+        .where(table.c.meeting_id == meeting_id,
+               table.c.voter_identifier == voter_identifier)
+    ).mappings().all()
+
+    # Match new rows against stored ones; leftovers on either side change.
+    stored = {}
+    for row in existing:
+        stored.setdefault(_row_key(row), []).append(row['id'])
+    to_insert = []
+    for row in rows:
+        ids = stored.get(_row_key(row))
+        if ids:
+            ids.pop()
+        else:
+            to_insert.append(row)
+    to_delete = [vote_id for ids in stored.values() for vote_id in ids]
+
+    if to_delete:
+        db.session.execute(table.delete().where(table.c.id.in_(to_delete)))
+    if to_insert:
+        db.session.execute(table.insert(), to_insert)
+    if to_insert or to_delete:
+        # Usually already in the identity map (batch_vote loaded it)
+        meeting = db.session.get(Meeting, meeting_id)
+        tool_result_cache.mark_changed(meeting.club_id if meeting else None, ('meetings',))
+    return len(to_insert), len(to_delete)
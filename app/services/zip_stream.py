@@ -0,0 +1,97 @@
+"""ZIP archives written entry by entry, for upload-link downloads.
+
+``/uploads/<code>/zip`` used to build the whole archive in an
+``io.BytesIO`` and then copy it out again, so one download of a club's
+speech videos held twice the folder size in a worker. Files are now copied
+into the archive ``CHUNK_SIZE`` bytes at a time: ``iter_zip()`` yields the
+archive as it is written (for a chunked response) and never buffers much
+more than one chunk, and ``write_zip()`` writes it to a file (for the
+``uploads_zip`` export job, whose result is kept in the artifact cache).
+
+Media and archives are already compressed, so they are stored as-is;
+deflate is only spent on documents and other files that shrink.
+"""
+import os
+import zipfile
+
+CHUNK_SIZE = 64 * 1024
+
+# Already-compressed formats; deflating them costs CPU and saves nothing
+STORED_EXTENSIONS = frozenset({
+    '.jpg', '.jpeg', '.png', '.gif', '.webp', '.heic', '.heif',
+    '.mp4', '.m4v', '.mov', '.webm', '.avi', '.mkv', '.3gp',
+    '.mp3', '.m4a', '.aac', '.ogg', '.opus', '.flac',
+    '.zip', '.gz', '.7z', '.rar',
+    '.docx', '.xlsx', '.pptx',
+})
+
+
+def compression_for(name):
+    """ZIP compression method for an archive member called ``name``."""
+    if os.path.splitext(name)[1].lower() in STORED_EXTENSIONS:
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+
+class _ChunkSink:
+    """Write-only, unseekable target that collects archive bytes until drained."""
+
+    def __init__(self):
+        self._buffer = bytearray()
+
+    def __len__(self):
+        return len(self._buffer)
+
+    def write(self, data):
+        self._buffer += data
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        return data
+
+
+def _write_entries(zipf, entries, chunk_size):
+    """Copy ``(path, archive name)`` entries into ``zipf``, yielding after every chunk."""
+    for file_path, name in entries:
+        info = zipfile.ZipInfo.from_file(file_path, name)
+        info.compress_type = compression_for(name)
+        with open(file_path, 'rb') as src, zipf.open(info, 'w') as dest:
+            while True:
+                chunk = src.read(chunk_size)
+                if not chunk:
+                    break
+                dest.write(chunk)
+                yield file_path
+
+
+def iter_zip(entries, chunk_size=CHUNK_SIZE):
+    """Yield a ZIP archive of ``entries`` in pieces of roughly ``chunk_size`` bytes."""
+    sink = _ChunkSink()
+    # An unseekable target makes zipfile write sizes in data descriptors
+    # after each member instead of seeking back to its header.
+    with zipfile.ZipFile(sink, 'w') as zipf:
+        for _ in _write_entries(zipf, entries, chunk_size):
+            if len(sink) >= chunk_size:
+                yield sink.drain()
+    data = sink.drain()
+    if data:
+        yield data
+
+
+def write_zip(path, entries, progress=None, chunk_size=CHUNK_SIZE):
+    """Write a ZIP archive of ``entries`` to ``path``.
+
+    ``progress(done, total)`` is called after each file.
+    """
+    entries = list(entries)
+    with zipfile.ZipFile(path, 'w') as zipf:
+        for i, (file_path, name) in enumerate(entries, 1):
+            for _ in _write_entries(zipf, [(file_path, name)], chunk_size):
+                pass
+            if progress:
+                progress(i, len(entries))
@@ -3,6 +3,8 @@
 from flask import Blueprint, render_template, session, redirect, url_for, request, jsonify, current_app, flash
 from .auth.utils import login_required, is_authorized
 from .auth.permissions import Permissions
+from .auth.permission_matrix import invalidate_permission_matrix
+from .services.club_metadata import invalidate_club_metadata
 from flask_login import current_user
 from .club_context import get_current_club_id, authorized_club_required
 from .models import SessionType, User, MeetingRole, Achievement, Contact, Permission, AuthRole, RolePermission, PermissionAudit, ContactClub, Club, ExComm, UserClub, ExcommOfficer, Pathway, ContactPath
@@ -380,6 +382,7 @@ def add_session_type():
             msg = "Session type added successfully"
 
         db.session.commit()
+        invalidate_club_metadata(club_id)
 
         # Return the session object so the frontend can add/update it in the table
         session_data = {
@@ -435,6 +438,7 @@ def update_session_types():
                     duration_max) if duration_max else None
 
         db.session.commit()
+        invalidate_club_metadata(club_id)
         return jsonify(success=True, message="Session types updated successfully.")
     except Exception as e:
         db.session.rollback()
@@ -478,6 +482,7 @@ def delete_session_type(id):
             
             db.session.delete(session_type)
             db.session.commit()
+            invalidate_club_metadata(club_id)
             return jsonify(success=True, message="Session type deleted successfully.")
         else:
             return jsonify(success=False, message="Session type not found or permission denied"), 404
@@ -647,6 +652,7 @@ def add_role():
             msg = "Role added successfully"
         
         db.session.commit()
+        invalidate_club_metadata(club_id)
 
         # Return the role object so the frontend can add/update it in the table
         role_data = {
@@ -687,6 +693,7 @@ def update_roles():
                 role.is_member_only = item.get('is_member_only', False)
 
         db.session.commit()
+        invalidate_club_metadata(club_id)
         return jsonify(success=True, message="Roles updated successfully.")
     except Exception as e:
         db.session.rollback()
@@ -746,6 +753,7 @@ def delete_role(id):
 
             db.session.delete(role)
             db.session.commit()
+            invalidate_club_metadata(club_id)
             return jsonify(success=True, message="Role deleted successfully.")
         else:
             return jsonify(success=False, message="Permission denied"), 403
@@ -821,6 +829,7 @@ def import_roles():
         service.import_meeting_roles(roles_data)
         
         db.session.commit()
+        invalidate_club_metadata(club_id)
         return jsonify(success=True, message=f"Imported {len(roles_data)} roles successfully (duplicates skipped).")
 
     except Exception as e:
@@ -1234,6 +1243,7 @@ def update_permission_matrix():
             db.session.add(audit)
 
         db.session.commit()
+        invalidate_permission_matrix()
         return jsonify(success=True, message="Permissions updated successfully")
     except Exception as e:
         db.session.rollback()
@@ -1401,6 +1411,7 @@ def reset_permissions_to_default():
                     f"missing roles={counts['roles_missing']}, missing perms={counts['perms_missing']}"
         ))
         db.session.commit()
+        invalidate_permission_matrix()
 
         # Return the new matrix so the UI can re-render without a second fetch
         new_role_perms = _build_role_perms_map_from_db(club_id)
@@ -1565,6 +1576,7 @@ def add_auth_role():
         db.session.commit()
 
         AuthRole.clear_role_cache()
+        invalidate_permission_matrix()
 
         return jsonify(success=True, message="Security group added successfully")
     except Exception as e:
@@ -1634,6 +1646,7 @@ def delete_auth_role(id):
         db.session.commit()
 
         AuthRole.clear_role_cache()
+        invalidate_permission_matrix()
 
         return jsonify(success=True, message=f"Deleted security group '{role_name}' and reassigned {count} user(s) to 'Member'")
     except Exception as e:
@@ -47,97 +47,16 @@ def _attach_owners(logs):
     Performance optimization: Pre-fetch all owners for a list of session logs 
     to avoid N+1 queries via log.owners property.
     """
-    if not logs:
-        return
-        
-    log_ids = [l.id for l in logs]
-    
-    # 1. Fetch owners for single-owner roles (linked via session_log_id)
-    omr_entries = db.session.query(OwnerMeetingRoles, Contact).join(Contact).filter(
-        OwnerMeetingRoles.session_log_id.in_(log_ids)
-    ).all()
-    
-    owners_by_log = {}
-    for omr, contact in omr_entries:
-        if omr.session_log_id not in owners_by_log:
-            owners_by_log[omr.session_log_id] = []
-        owners_by_log[omr.session_log_id].append(contact)
-        
-    # 2. Fetch owners for shared roles (linked via meeting_id and role_id)
-    # Identify shared logs
-    shared_logs = [l for l in logs if l.session_type and l.session_type.role and not l.session_type.role.has_single_owner]
-    if shared_logs:
-        # Get unique (meeting_id, role_id) pairs
-        shared_keys = set()
-        for l in shared_logs:
-            if l.meeting:
-                shared_keys.add((l.meeting.id, l.session_type.role_id))
-        
-        if shared_keys:
-            from sqlalchemy import or_
-            filter_conds = [
-                db.and_(OwnerMeetingRoles.meeting_id == m_id, OwnerMeetingRoles.role_id == r_id)
-                for m_id, r_id in shared_keys
-            ]
-            
-            omr_shared = db.session.query(OwnerMeetingRoles, Contact).join(Contact).filter(
-                OwnerMeetingRoles.session_log_id.is_(None),
-                or_(*filter_conds)
-            ).all()
-            
-            shared_owners_lookup = {}
-            for omr, contact in omr_shared:
-                key = (omr.meeting_id, omr.role_id)
-                if key not in shared_owners_lookup:
-                    shared_owners_lookup[key] = []
-                shared_owners_lookup[key].append(contact)
-            
-            # Map back to logs
-            for l in shared_logs:
-                key = (l.meeting.id, l.session_type.role_id)
-                if key in shared_owners_lookup:
-                    if l.id not in owners_by_log:
-                        owners_by_log[l.id] = []
-                    # Avoid duplicates if any
-                    owners_by_log[l.id].extend(shared_owners_lookup[key])
-
-    # 3. Attach to logs via the new _cached_owners attribute
-    # Improved: Also attach historical credentials found in OwnerMeetingRoles
-    
-    # helper to map targets: {session_log_id: {contact_id: {pathway, level}}}
-    targets_map = {}
-    for omr, contact in omr_entries:
-        if omr.session_log_id not in targets_map:
-            targets_map[omr.session_log_id] = {}
-        targets_map[omr.session_log_id][contact.id] = {
-            'pathway': omr.target_pathway,
-            'level': omr.target_level
-        }
-
-    # Shared roles targets
-    if 'omr_shared' in locals():
-        for omr, contact in omr_shared:
-            # For shared roles, we can't key by log ID easily until we map back
-            # But we can update the map for each log that matches
-            key = (omr.meeting_id, omr.role_id)
-            for l in shared_logs:
-                if (l.meeting.id, l.session_type.role_id) == key:
-                    if l.id not in targets_map:
-                        targets_map[l.id] = {}
-                    targets_map[l.id][contact.id] = {
-                        'pathway': omr.target_pathway,
-                        'level': omr.target_level
-                    }
-
-    for l in logs:
-        l._cached_owners = owners_by_log.get(l.id, [])
-        l._cached_owner_targets = targets_map.get(l.id, {})
+    SessionLog.load_owners(logs)
 
 
 def _search_logs(query_str, can_view_all, current_club_id):
     """
     Search session logs matching the given query string.
-    Supports multiple keywords (AND combination of OR clauses for each keyword).
+    Supports multiple keywords (AND combination; each keyword may match the
+    speaker, title, role, session type, project code or meeting number).
+    Matching runs against the full-text search index (see
+    app/services/speech_log_search.py).
     """
     if not query_str:
         return []
@@ -145,8 +64,10 @@ def _search_logs(query_str, can_view_all, current_club_id):
     keywords = query_str.strip().split()
     if not keywords:
         return []
+
+    from .services.speech_log_search import matching_log_ids
         
-    # Start with base query for the current club
+    # Start with base query for the current club, restricted to indexed matches
     query = db.session.query(SessionLog).options(
         joinedload(SessionLog.media),
         joinedload(SessionLog.session_type).joinedload(SessionType.role),
@@ -156,29 +77,10 @@ def _search_logs(query_str, can_view_all, current_club_id):
         MeetingRole.name.isnot(None),
         MeetingRole.name != '',
         MeetingRole.type.in_(['standard', 'club-specific', 'leading', 'functional']),
-        Meeting.club_id == current_club_id
-    )
-    
-    # Outer join to retrieve owners
-    query = query.outerjoin(
-        OwnerMeetingRoles,
-        or_(
-            SessionLog.id == OwnerMeetingRoles.session_log_id,
-            db.and_(
-                OwnerMeetingRoles.session_log_id.is_(None),
-                SessionLog.meeting_id == OwnerMeetingRoles.meeting_id,
-                SessionType.role_id == OwnerMeetingRoles.role_id
-            )
-        )
-    ).outerjoin(
-        Contact,
-        OwnerMeetingRoles.contact_id == Contact.id
+        Meeting.club_id == current_club_id,
+        SessionLog.id.in_(matching_log_ids(current_club_id, keywords))
     )
     
-    # Outer join to retrieve Pathway and PathwayProject for dynamically constructed project codes
-    query = query.outerjoin(PathwayProject, SessionLog.Project_ID == PathwayProject.project_id) \
-                 .outerjoin(Pathway, PathwayProject.path_id == Pathway.id)
-    
     # Add guest check (if user is guest of the active club, restrict finished meetings)
     try:
         if current_user.is_guest_of_club(current_club_id):
@@ -187,25 +89,6 @@ def _search_logs(query_str, can_view_all, current_club_id):
         # No request context (helper called from tests) — skip the gate.
         pass
         
-    # Build the filters for each keyword
-    for kw in keywords:
-        kw_like = f"%{kw}%"
-        
-        # Build conditions for this keyword
-        conds = [
-            Contact.Name.like(kw_like),
-            Contact.first_name.like(kw_like),
-            Contact.last_name.like(kw_like),
-            SessionLog.Session_Title.like(kw_like),
-            MeetingRole.name.like(kw_like),
-            SessionType.Title.like(kw_like),
-            SessionLog.project_code.like(kw_like),
-            db.cast(Meeting.Meeting_Number, db.String).like(kw_like),
-            db.func.concat(db.func.coalesce(Pathway.abbr, ''), db.func.coalesce(PathwayProject.code, '')).like(kw_like)
-        ]
-        
-        query = query.filter(or_(*conds))
-        
     # Retrieve all matched logs, order by meeting number desc
     results = query.order_by(Meeting.Meeting_Number.desc()).all()
     
@@ -1063,13 +946,14 @@ def _get_project_groups_for_level(level_int, path_id):
     return badge_groups
 
 def _build_evaluator_map(logs_for_level):
-    """Build a map of (meeting_number, speaker_suffix) -> evaluator_name."""
-    relevant_meetings = set(log.Meeting_Number for entry in logs_for_level 
+    """Build a map of (meeting_id, speaker_suffix) -> evaluator_name."""
+    relevant_meetings = set(log.meeting_id for entry in logs_for_level 
                           for log in (entry['logs'] if isinstance(entry, dict) and entry.get('log_type') == 'grouped_role' else [entry]))
     evaluator_map = {}
     if relevant_meetings:
-        eval_logs = db.session.query(SessionLog).join(SessionType).join(MeetingRole).join(Meeting, SessionLog.meeting_id == Meeting.id).filter(
-            Meeting.Meeting_Number.in_(relevant_meetings),
+        # By meeting id: meeting numbers repeat across clubs
+        eval_logs = db.session.query(SessionLog).join(SessionType).join(MeetingRole).filter(
+            SessionLog.meeting_id.in_(relevant_meetings),
             MeetingRole.name.like('%Evaluator%')
         ).options(joinedload(SessionLog.session_type).joinedload(SessionType.role)).all()
         _attach_owners(eval_logs)
@@ -1078,7 +962,7 @@ def _build_evaluator_map(logs_for_level):
             match = re.search(r'Evaluator\s*(\d+)', role_name, re.IGNORECASE)
             suffix = match.group(1) if match else "1"
             owner_name = el.owner.Name if el.owner else "TBA"
-            evaluator_map[(el.Meeting_Number, suffix)] = owner_name
+            evaluator_map[(el.meeting_id, suffix)] = owner_name
     return evaluator_map
 
 def _process_badge_group(major_code, p_type, rps, logs_for_level, evaluator_map, used_log_ids):
@@ -1136,7 +1020,7 @@ def _process_badge_group(major_code, p_type, rps, logs_for_level, evaluator_map,
                     role_name = log.session_type.role.name if log.session_type and log.session_type.role else ""
                     match_speaker = re.search(r'Speaker\s*(\d+)', role_name, re.IGNORECASE)
                     speaker_suffix = match_speaker.group(1) if match_speaker else "1"
-                    evaluator_name = evaluator_map.get((log.Meeting_Number, speaker_suffix))
+                    evaluator_name = evaluator_map.get((log.meeting_id, speaker_suffix))
                     
                     is_waitlist = getattr(log, 'is_waitlist', False)
                     meeting_finished = log.meeting and log.meeting.status == 'finished'
@@ -1537,44 +1421,50 @@ def _get_role_metadata():
     return role_icons
 
 
+def _can_use_stored_progress():
+    """Stored pathway progress is built without the guest-only meeting filter."""
+    from .club_context import get_current_club_id
+    try:
+        return not current_user.is_guest_of_club(get_current_club_id())
+    except (RuntimeError, AttributeError):
+        return True
+
+
+def _stored_progress_contact_id(filters, view_mode):
+    """
+    Contact whose stored pathway progress can stand in for this view's
+    completion summary, or None. Only the unfiltered member view of one
+    speaker on one pathway matches what the store holds.
+    """
+    if view_mode != 'member' or not filters['pathway']:
+        return None
+    if any(filters[key] for key in ('meeting_id', 'level', 'status', 'role')):
+        return None
+    try:
+        speaker_id = int(filters['speaker_id'])
+    except (ValueError, TypeError):
+        return None
+    if speaker_id == -1 or not _can_use_stored_progress():
+        return None
+    return speaker_id
+
+
 def _get_level_progress_html(user_id, level, pathway_id=None):
     """
     Generate the HTML for the level progress summary.
     """
-    # Create minimal filter set for this user
-    filters = {
-        'meeting_id': None,
-        'pathway': pathway_id, # This might need to be the name or ID depending on usage
-        'level': None,
-        'speaker_id': user_id,
-        'status': None,
-        'role': None
-    }
-    
-    # Needs to be able to get the contact for the user_id
+    from .services.pathway_progress import compute_pathway_progress, get_pathway_progress
+
     contact = db.session.get(Contact, user_id)
     if not contact:
         return ""
 
-    if not filters['pathway'] and contact.Current_Path:
-        filters['pathway'] = contact.Current_Path
-        
-    # We need to fetch logs again to calculate progress
-    # This might be expensive but necessary for accurate update
-    all_logs = _fetch_logs_with_filters(filters)
-    _attach_owners(all_logs)
-    
-    project_ids = [log.Project_ID for log in all_logs if log.Project_ID]
-    pathway_cache = build_pathway_project_cache(project_ids=project_ids)
-    
-    grouped_logs = _process_logs(all_logs, filters, pathway_cache)
-    sorted_grouped_logs = _sort_and_consolidate(grouped_logs)
-    
-    speaker_user = contact.user
-    pp_mapping = _get_pathway_project_mapping(speaker_user)
-    
-    completion_summary = _calculate_completion_summary(grouped_logs, pp_mapping)
-    
+    pathway = pathway_id or contact.Current_Path
+    if pathway and _can_use_stored_progress():
+        completion_summary = get_pathway_progress(contact.id, pathway)
+    else:
+        completion_summary = compute_pathway_progress(contact.id, pathway)
+
     summary = completion_summary.get(str(level))
     
     return render_template('partials/_level_progress.html', summary=summary)
@@ -1679,7 +1569,16 @@ def show_speech_logs():
     # 8. Calculate completion summary
     speaker_user = _get_speaker_user(viewed_contact, is_member_view)
     pp_mapping = _get_pathway_project_mapping(speaker_user, filters['pathway'])
-    completion_summary = _calculate_completion_summary(grouped_logs, pp_mapping, selected_pathway_name=filters['pathway'])
+    progress_contact_id = _stored_progress_contact_id(filters, view_mode)
+    if progress_contact_id:
+        from .services.pathway_progress import get_pathway_progress
+        completion_summary = get_pathway_progress(
+            progress_contact_id, filters['pathway'],
+            compute=lambda: _calculate_completion_summary(
+                grouped_logs, pp_mapping, selected_pathway_name=filters['pathway']))
+    else:
+        completion_summary = _calculate_completion_summary(
+            grouped_logs, pp_mapping, selected_pathway_name=filters['pathway'])
     
     # 9. Get achievement status
     completed_levels, active_level, achievement_dates = _get_achievement_status(
@@ -2223,10 +2223,21 @@ document.addEventListener("DOMContentLoaded", () => {
     });
   }
 
+  function downloadExport(url) {
+    ExportJob.run(url)
+      .then((job) => {
+        window.location.href = job.download_url;
+      })
+      .catch((err) => {
+        console.error("Export error:", err);
+        showCustomAlert("Export Error", err.message);
+      });
+  }
+
   function exportAgenda() {
     const meetingNumber = meetingFilter.value;
     if (meetingNumber) {
-      window.location.href = `/agenda/export/${meetingNumber}`;
+      downloadExport(`/agenda/export/${meetingNumber}`);
     } else {
       showCustomAlert("Select Meeting", "Please select a meeting to export.");
     }
@@ -2235,7 +2246,7 @@ document.addEventListener("DOMContentLoaded", () => {
   function downloadPPT() {
     const meetingNumber = meetingFilter.value;
     if (meetingNumber) {
-      window.location.href = `/agenda/ppt/${meetingNumber}`;
+      downloadExport(`/agenda/ppt/${meetingNumber}`);
     } else {
       showCustomAlert("Select Meeting", "Please select a meeting to download PPT.");
     }
@@ -73,9 +73,9 @@ document.addEventListener("DOMContentLoaded", function () {
     });
   });
 
-  // Setup state polling if a valid meeting is selected and hash is present
+  // Subscribe to booking version changes if a valid meeting is selected and hash is present
   if (typeof selectedMeetingId !== "undefined" && selectedMeetingId && typeof currentBookingHash !== "undefined") {
-    setInterval(pollBookingState, 10000);
+    subscribeBookingState();
   }
 });
 
@@ -265,105 +265,131 @@ function shouldSkipRefresh() {
   return false;
 }
 
-function pollBookingState() {
-  if (document.hidden || shouldSkipRefresh()) {
-    return;
+function subscribeBookingState() {
+  if (typeof AppEvents !== "undefined") {
+    AppEvents.subscribe(`meeting:${selectedMeetingId}:booking`, (version) => {
+      refreshBookingTables(String(version));
+    });
+    // Slow safety net in case an event was missed while reconnecting
+    setInterval(pollBookingState, 60000);
+  } else {
+    setInterval(pollBookingState, 10000);
   }
+}
 
+function pollBookingState() {
   fetch(`/booking/${selectedMeetingId}/hash`)
     .then((response) => response.json())
     .then((data) => {
-      if (data.success && data.hash && data.hash !== currentBookingHash) {
-        // State has changed! Fetch updated HTML fragment
-        fetch(`/booking/${selectedMeetingId}/tables_html`)
-          .then((res) => res.text())
-          .then((html) => {
-            // Double check protection before swapping
-            if (shouldSkipRefresh()) return;
-
-            const container = document.getElementById("booking-tables-container");
-            if (container) {
-              // Map of new owner/waitlist state per session_id
-              const newStates = {};
-              const tempDiv = document.createElement("div");
-              tempDiv.innerHTML = html;
-
-              tempDiv.querySelectorAll("tr[data-session-id]").forEach((row) => {
-                const sid = row.dataset.sessionId;
-                if (!sid) return;
-
-                let stateStr = "";
-                const adminInput = row.querySelector(".admin-assign-input");
-                if (adminInput) {
-                  stateStr += adminInput.value + "|" + adminInput.dataset.currentId;
-                } else {
-                  const ownerDisplay = row.querySelector(".owner-display");
-                  if (ownerDisplay) {
-                    stateStr += ownerDisplay.textContent.trim();
-                  }
-                }
-
-                row.querySelectorAll(".waitlist-avatar").forEach((w) => {
-                  stateStr += "|" + (w.dataset.name || "") + "|" + (w.dataset.userId || "");
-                });
-
-                newStates[sid] = stateStr;
-              });
-
-              // Collect session_ids whose state changed
-              const changedSessionIds = [];
-              container.querySelectorAll("tr[data-session-id]").forEach((row) => {
-                const sid = row.dataset.sessionId;
-                if (!sid) return;
-
-                let oldStateStr = "";
-                const adminInput = row.querySelector(".admin-assign-input");
-                if (adminInput) {
-                  oldStateStr += adminInput.value + "|" + adminInput.dataset.currentId;
-                } else {
-                  const ownerDisplay = row.querySelector(".owner-display");
-                  if (ownerDisplay) {
-                    oldStateStr += ownerDisplay.textContent.trim();
-                  }
-                }
-
-                row.querySelectorAll(".waitlist-avatar").forEach((w) => {
-                  oldStateStr += "|" + (w.dataset.name || "") + "|" + (w.dataset.userId || "");
-                });
-
-                if (newStates[sid] && newStates[sid] !== oldStateStr) {
-                  changedSessionIds.push(sid);
-                }
-              });
-
-              // Perform DOM Swap
-              container.innerHTML = html;
-              currentBookingHash = data.hash;
-
-              // Rebind listeners
-              if (isAdminView) {
-                initializeAdminAutocomplete();
-              }
-              initializeAccordions();
-
-              // Trigger pulse glow animation on changed rows
-              changedSessionIds.forEach((sid) => {
-                const row = container.querySelector(`tr[data-session-id="${sid}"]:not(.recommendation-row)`);
-                if (row) {
-                  row.classList.add("row-pulse-glow");
-                  row.addEventListener("animationend", () => {
-                    row.classList.remove("row-pulse-glow");
-                  }, { once: true });
-                }
-              });
-            }
-          })
-          .catch((err) => console.error("Error fetching tables HTML:", err));
+      if (data.success && data.hash) {
+        refreshBookingTables(data.hash);
       }
     })
     .catch((err) => console.error("Error polling booking hash:", err));
 }
 
+let latestBookingHash = null;
+
+function refreshBookingTables(newHash) {
+  if (!newHash || newHash === currentBookingHash) {
+    return;
+  }
+  latestBookingHash = newHash;
+  if (document.hidden || shouldSkipRefresh()) {
+    // Retry once the user is done editing or the tab is visible again
+    setTimeout(() => {
+      if (newHash === latestBookingHash) refreshBookingTables(newHash);
+    }, 5000);
+    return;
+  }
+
+  // State has changed! Fetch updated HTML fragment
+  fetch(`/booking/${selectedMeetingId}/tables_html`)
+    .then((res) => res.text())
+    .then((html) => {
+      // Double check protection before swapping
+      if (shouldSkipRefresh()) return;
+
+      const container = document.getElementById("booking-tables-container");
+      if (container) {
+        // Map of new owner/waitlist state per session_id
+        const newStates = {};
+        const tempDiv = document.createElement("div");
+        tempDiv.innerHTML = html;
+
+        tempDiv.querySelectorAll("tr[data-session-id]").forEach((row) => {
+          const sid = row.dataset.sessionId;
+          if (!sid) return;
+
+          let stateStr = "";
+          const adminInput = row.querySelector(".admin-assign-input");
+          if (adminInput) {
+            stateStr += adminInput.value + "|" + adminInput.dataset.currentId;
+          } else {
+            const ownerDisplay = row.querySelector(".owner-display");
+            if (ownerDisplay) {
+              stateStr += ownerDisplay.textContent.trim();
+            }
+          }
+
+          row.querySelectorAll(".waitlist-avatar").forEach((w) => {
+            stateStr += "|" + (w.dataset.name || "") + "|" + (w.dataset.userId || "");
+          });
+
+          newStates[sid] = stateStr;
+        });
+
+        // Collect session_ids whose state changed
+        const changedSessionIds = [];
+        container.querySelectorAll("tr[data-session-id]").forEach((row) => {
+          const sid = row.dataset.sessionId;
+          if (!sid) return;
+
+          let oldStateStr = "";
+          const adminInput = row.querySelector(".admin-assign-input");
+          if (adminInput) {
+            oldStateStr += adminInput.value + "|" + adminInput.dataset.currentId;
+          } else {
+            const ownerDisplay = row.querySelector(".owner-display");
+            if (ownerDisplay) {
+              oldStateStr += ownerDisplay.textContent.trim();
+            }
+          }
+
+          row.querySelectorAll(".waitlist-avatar").forEach((w) => {
+            oldStateStr += "|" + (w.dataset.name || "") + "|" + (w.dataset.userId || "");
+          });
+
+          if (newStates[sid] && newStates[sid] !== oldStateStr) {
+            changedSessionIds.push(sid);
+          }
+        });
+
+        // Perform DOM Swap
+        container.innerHTML = html;
+        currentBookingHash = newHash;
+
+        // Rebind listeners
+        if (isAdminView) {
+          initializeAdminAutocomplete();
+        }
+        initializeAccordions();
+
+        // Trigger pulse glow animation on changed rows
+        changedSessionIds.forEach((sid) => {
+          const row = container.querySelector(`tr[data-session-id="${sid}"]:not(.recommendation-row)`);
+          if (row) {
+            row.classList.add("row-pulse-glow");
+            row.addEventListener("animationend", () => {
+              row.classList.remove("row-pulse-glow");
+            }, { once: true });
+          }
+        });
+      }
+    })
+    .catch((err) => console.error("Error fetching tables HTML:", err));
+}
+
 
 function resetRole(btn, sessionId) {
   const row = btn.closest('tr');
@@ -385,6 +385,147 @@ document.addEventListener('DOMContentLoaded', function() {
         }
     }
 
+    const STREAM_POLL_INTERVAL = 2000;
+    const modifyingTools = [
+        'assign_role',
+        'cancel_role',
+        'manage_meeting_roles',
+        'update_meeting_status',
+        'manage_meeting_sessions',
+        'update_project_details',
+        'manage_waitlist',
+        'create_meeting'
+    ];
+
+    function finishSending() {
+        showTyping(false);
+        isSending = false;
+        sendBtn.disabled = false;
+    }
+
+    // Show notification dot and refresh the agenda after a reply arrived
+    function afterReply(text, executedTools) {
+        // If user closed panel while loading, show notification dot
+        if (!panel.classList.contains('open')) {
+            unreadDot.style.display = 'block';
+        }
+
+        // Auto-refresh agenda table if on agenda page and update occurred
+        let shouldRefreshAgenda = false;
+        if (executedTools && executedTools.length > 0) {
+            shouldRefreshAgenda = executedTools.some(tool => modifyingTools.includes(tool.name));
+        } else {
+            const trimmed = text.trim();
+            if (trimmed.startsWith('/')) {
+                const cmd = trimmed.split(/\s+/)[0].toLowerCase();
+                const modifyingCommands = [
+                    '/create-meeting',
+                    '/assign',
+                    '/cancel-role',
+                    '/status',
+                    '/waitlist'
+                ];
+                shouldRefreshAgenda = modifyingCommands.includes(cmd);
+            }
+        }
+
+        if (shouldRefreshAgenda && typeof window.refreshAgendaTable === 'function') {
+            window.refreshAgendaTable();
+        }
+    }
+
+    function showError(message) {
+        const isZh = (typeof CURRENT_LOCALE !== 'undefined' && CURRENT_LOCALE === 'zh_CN');
+        appendMessage('system', message || (isZh ? '发生错误。' : 'Error occurred.'));
+    }
+
+    // Follow a reply generated in the background: tokens and tool progress
+    // arrive over AppEvents, with polling in case events were missed.
+    function followReply(data, text) {
+        let bubble = null;
+        let settled = false;
+        let timer = null;
+        const shownTools = new Set();
+
+        function showTool(id, name, args) {
+            if (shownTools.has(id)) return;
+            shownTools.add(id);
+            appendToolCard(name, args);
+            // Keep the streaming bubble below the tool cards
+            if (bubble) {
+                messagesPane.appendChild(bubble);
+            }
+        }
+
+        function render(content) {
+            if (!bubble) {
+                showTyping(false);
+                bubble = document.createElement('div');
+                bubble.className = 'chat-msg-bubble assistant';
+                messagesPane.appendChild(bubble);
+            }
+            bubble.innerHTML = renderMarkdown(content);
+            scrollToBottom();
+        }
+
+        function settle(result) {
+            if (settled) return;
+            settled = true;
+            clearTimeout(timer);
+            if (typeof AppEvents !== 'undefined') {
+                AppEvents.unsubscribe(data.topic, onEvent);
+            }
+            finishSending();
+            if (result.status === 'error') {
+                if (bubble) bubble.remove();
+                showError(result.message);
+                return;
+            }
+            (result.executed_tools || []).forEach(tool => showTool(tool.id, tool.name, tool.arguments));
+            render(result.content || '');
+            afterReply(text, result.executed_tools);
+        }
+
+        function onEvent(raw) {
+            let event;
+            try {
+                event = JSON.parse(raw);
+            } catch (e) {
+                return;
+            }
+            if (settled) return;
+            if (event.type === 'token') {
+                render(event.text);
+            } else if (event.type === 'tool' && event.status === 'running') {
+                showTool(event.id, event.name, event.arguments);
+            } else if (event.type === 'done') {
+                settle({ status: 'done', content: event.content, executed_tools: event.executed_tools });
+            } else if (event.type === 'error') {
+                settle({ status: 'error', message: event.message });
+            }
+        }
+
+        function poll() {
+            fetch(data.status_url)
+                .then(res => res.json())
+                .then(result => {
+                    if (result.status === 'done' || result.status === 'error') {
+                        settle(result);
+                    } else if (!settled) {
+                        timer = setTimeout(poll, STREAM_POLL_INTERVAL);
+                    }
+                })
+                .catch(() => {
+                    if (!settled) timer = setTimeout(poll, STREAM_POLL_INTERVAL);
+                });
+        }
+
+        if (typeof AppEvents !== 'undefined') {
+            AppEvents.subscribe(data.topic, onEvent);
+        }
+        timer = setTimeout(poll, STREAM_POLL_INTERVAL);
+    }
+
     // Send Message
     function sendMessage() {
         const text = inputText.value.trim();
@@ -403,14 +544,16 @@ document.addEventListener('DOMContentLoaded', function() {
             headers: {
                 'Content-Type': 'application/json'
             },
-            body: JSON.stringify({ message: text })
+            body: JSON.stringify({ message: text, stream: true })
         })
         .then(res => res.json())
         .then(data => {
-            showTyping(false);
-            isSending = false;
-            sendBtn.disabled = false;
-            
+            if (data.success && data.pending) {
+                followReply(data, text);
+                return;
+            }
+
+            finishSending();
             if (data.success) {
                 // If tools were run, show compact tool execution summaries
                 if (data.executed_tools && data.executed_tools.length > 0) {
@@ -419,54 +562,13 @@ document.addEventListener('DOMContentLoaded', function() {
                     });
                 }
                 appendMessage('assistant', data.content);
-                
-                // If user closed panel while loading, show notification dot
-                if (!panel.classList.contains('open')) {
-                    unreadDot.style.display = 'block';
-                }
-
-                // Auto-refresh agenda table if on agenda page and update occurred
-                let shouldRefreshAgenda = false;
-                if (data.executed_tools && data.executed_tools.length > 0) {
-                    const modifyingTools = [
-                        'assign_role',
-                        'cancel_role',
-                        'manage_meeting_roles',
-                        'update_meeting_status',
-                        'manage_meeting_sessions',
-                        'update_project_details',
-                        'manage_waitlist',
-                        'create_meeting'
-                    ];
-                    shouldRefreshAgenda = data.executed_tools.some(tool => modifyingTools.includes(tool.name));
-                } else {
-                    const trimmed = text.trim();
-                    if (trimmed.startsWith('/')) {
-                        const cmd = trimmed.split(/\s+/)[0].toLowerCase();
-                        const modifyingCommands = [
-                            '/create-meeting',
-                            '/assign',
-                            '/cancel-role',
-                            '/status',
-                            '/waitlist'
-                        ];
-                        shouldRefreshAgenda = modifyingCommands.includes(cmd);
-                    }
-                }
-
-                if (shouldRefreshAgenda && typeof window.refreshAgendaTable === 'function') {
-                    window.refreshAgendaTable();
-                }
+                afterReply(text, data.executed_tools);
             } else {
-                const isZh = (typeof CURRENT_LOCALE !== 'undefined' && CURRENT_LOCALE === 'zh_CN');
-                const errMsg = isZh ? '发生错误。' : 'Error occurred.';
-                appendMessage('system', data.message || errMsg);
+                showError(data.message);
             }
         })
         .catch(err => {
-            showTyping(false);
-            isSending = false;
-            sendBtn.disabled = false;
+            finishSending();
             const isZh = (typeof CURRENT_LOCALE !== 'undefined' && CURRENT_LOCALE === 'zh_CN');
             const errMsg = isZh ? '网络错误。无法发送消息。' : 'Network error. Could not send message.';
             appendMessage('system', errMsg);
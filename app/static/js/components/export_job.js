@@ -0,0 +1,78 @@
+/**
+ * Shared Export Job Component
+ *
+ * Agenda exports, slide decks and upload archives are built by background
+ * jobs (app/services/export_jobs.py). ExportJob.run(url, onProgress) asks
+ * the export endpoint for a job, follows it over the page's AppEvents
+ * connection (job:<id>:progress) with a polling fallback, and resolves with
+ * the finished job, whose download_url serves the file.
+ */
+
+(function () {
+    const POLL_INTERVAL = 2000;
+
+    function fetchJson(url) {
+        return fetch(url, { headers: { "X-Requested-With": "XMLHttpRequest" } })
+            .then((response) => response.json().catch(() => ({})).then((data) => {
+                if (!data.job) {
+                    throw new Error(data.message || `Server returned status ${response.status}`);
+                }
+                return data.job;
+            }));
+    }
+
+    function follow(job, onProgress) {
+        return new Promise((resolve, reject) => {
+            let settled = false;
+            let timer = null;
+
+            function onEvent(data) {
+                try {
+                    handle(JSON.parse(data));
+                } catch (e) {
+                    refresh();
+                }
+            }
+
+            function settle() {
+                settled = true;
+                clearInterval(timer);
+                if (typeof AppEvents !== "undefined") {
+                    AppEvents.unsubscribe(job.topic, onEvent);
+                }
+            }
+
+            function handle(update) {
+                if (settled) return;
+                Object.assign(job, update);
+                if (onProgress) onProgress(job);
+                if (job.status === "finished" && job.download_url) {
+                    settle();
+                    resolve(job);
+                } else if (job.status === "failed") {
+                    settle();
+                    reject(new Error(job.message || "Export failed"));
+                } else if (job.status === "finished") {
+                    // Progress events carry no URL; fetch the finished job
+                    refresh();
+                }
+            }
+
+            function refresh() {
+                fetchJson(job.status_url).then(handle).catch(() => {});
+            }
+
+            if (typeof AppEvents !== "undefined") {
+                AppEvents.subscribe(job.topic, onEvent);
+            }
+            timer = setInterval(refresh, POLL_INTERVAL);
+            handle({});
+        });
+    }
+
+    window.ExportJob = {
+        run: function (url, onProgress) {
+            return fetchJson(url).then((job) => follow(job, onProgress));
+        },
+    };
+})();
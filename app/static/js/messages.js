@@ -20,9 +20,9 @@ document.addEventListener('DOMContentLoaded', () => {
     setInterval(() => loadMessages(currentTab, true, currentPage), 60000);
 
     // Server-Sent Events to refresh message list in real-time
-    if (typeof messageEventSource !== 'undefined') {
-        messageEventSource.addEventListener('message', (event) => {
-            if (event.data === 'new_message') {
+    if (typeof AppEvents !== 'undefined') {
+        AppEvents.subscribe(mailEventTopic, (data) => {
+            if (data === 'new_message') {
                 loadMessages(currentTab, true, currentPage);
             }
         });
@@ -463,8 +463,23 @@ function startLiveVoteRefresh() {
 		return;
 	}
 
-	// Poll every 5 seconds
-	setInterval(fetchLiveResults, 5000);
+	if (typeof AppEvents !== 'undefined') {
+		// Refresh when a ballot lands; coalesce bursts into one fetch
+		let pending = null;
+		AppEvents.subscribe(`meeting:${selectedMeetingId}:votes`, () => {
+			if (!pending) {
+				pending = setTimeout(() => {
+					pending = null;
+					fetchLiveResults();
+				}, 1000);
+			}
+		});
+		// Slow safety net in case an event was missed while reconnecting
+		setInterval(fetchLiveResults, 60000);
+	} else {
+		// Poll every 5 seconds
+		setInterval(fetchLiveResults, 5000);
+	}
 }
 
 function fetchLiveResults() {
@@ -1,10 +1,21 @@
 import json
 import os
-from flask import session, request, has_request_context
+from types import MappingProxyType
 
-# Cache dictionary to store loaded translations in memory
-# Structure: { locale: { english_key: translated_value } }
+from flask import session, request, has_request_context, has_app_context, current_app
+from jinja2.ext import Extension
+from jinja2.lexer import Token
+
+TRANSLATIONS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Compiled catalogs: { locale: read-only { english_key: translated_value } }
+# Loaded once; only re-read when auto-reload is on (debug) or on
+# reload_translations().
 _translation_cache = {}
+_translation_mtimes = {}
+
+# Set by init_app from TRANSLATIONS_AUTO_RELOAD (defaults to app.debug)
+_auto_reload = False
 
 def get_locale():
     """
@@ -19,51 +30,69 @@ def get_locale():
         locale = session.get('locale')
         if locale:
             return locale
-        
-        # 2. Check Accept Languages header
-        best = request.accept_languages.best_match(['en', 'zh_CN'])
-        if best:
-            return best
-            
+
+        # 2. Check Accept Languages header (parsed once per request)
+        best = getattr(request, '_accept_locale', None)
+        if best is None:
+            best = request._accept_locale = request.accept_languages.best_match(['en', 'zh_CN']) or 'en'
+        return best
+
     return 'en'
 
-_translation_mtimes = {}
 
-def load_translations(locale):
-    """
-    Load the translations JSON file for the given locale.
-    Caches the results in memory and reloads if the file has been modified.
-    """
-    global _translation_cache, _translation_mtimes
-    
-    # Define path to translation file: app/translations/{locale}.json
-    base_dir = os.path.dirname(os.path.abspath(__file__))
-    translation_file = os.path.join(base_dir, f'{locale}.json')
-    
-    mtime = 0
-    if os.path.exists(translation_file):
-        try:
-            mtime = os.path.getmtime(translation_file)
-        except Exception:
-            pass
-            
-    if locale in _translation_cache and _translation_mtimes.get(locale) == mtime:
-        return _translation_cache[locale]
+def _translation_file(locale):
+    return os.path.join(TRANSLATIONS_DIR, f'{locale}.json')
+
+
+def _file_mtime(path):
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return 0
 
-    _translation_cache[locale] = {}
-    _translation_mtimes[locale] = mtime
 
+def _compile(locale):
+    """Read {locale}.json into a read-only dict, dropping untranslated keys."""
+    translation_file = _translation_file(locale)
+    catalog = {}
     if os.path.exists(translation_file):
         try:
             with open(translation_file, 'r', encoding='utf-8') as f:
-                _translation_cache[locale] = json.load(f)
+                catalog = {k: v for k, v in json.load(f).items() if v}
         except Exception as e:
             # Squelch error and fall back to empty translations (English fallback)
             print(f"Error loading translation file for {locale}: {e}")
-            
+    _translation_cache[locale] = MappingProxyType(catalog)
+    _translation_mtimes[locale] = _file_mtime(translation_file)
     return _translation_cache[locale]
 
 
+def load_translations(locale):
+    """
+    Return the compiled catalog for the given locale.
+    The JSON file is only stat'ed again when auto-reload is enabled.
+    """
+    catalog = _translation_cache.get(locale)
+    if catalog is None:
+        return _compile(locale)
+    if _auto_reload and _translation_mtimes.get(locale) != _file_mtime(_translation_file(locale)):
+        return _compile(locale)
+    return catalog
+
+
+def available_locales():
+    return sorted(f[:-5] for f in os.listdir(TRANSLATIONS_DIR) if f.endswith('.json'))
+
+
+def reload_translations():
+    """Re-read every catalog (explicit reload signal, e.g. after translate-scan)."""
+    for locale in available_locales():
+        _compile(locale)
+    if has_app_context():
+        # Templates may have constant translations baked in
+        current_app.jinja_env.cache.clear()
+
+
 def translate(text, **kwargs):
     """
     Translate the given text to the current active locale.
@@ -72,14 +101,14 @@ def translate(text, **kwargs):
     """
     if not text:
         return ""
-        
+
     locale = get_locale()
     if locale == 'en':
         translated = text
     else:
         translations = load_translations(locale)
         translated = translations.get(text) or text
-        
+
     if kwargs:
         try:
             return translated % kwargs
@@ -88,8 +117,85 @@ def translate(text, **kwargs):
                 return translated.format(**kwargs)
             except Exception:
                 return translated
-                
+
     return translated
 
 # Alias for standard internationalization syntax
 _ = translate
+
+
+class CompiledTranslationExtension(Extension):
+    """
+    Resolve constant ``_('...')`` calls when a template is compiled.
+
+    ``{{ _('Calendar') }}`` is rewritten to a literal
+    ``{'zh_CN': '日历'}.get(get_locale(), 'Calendar')``, or to the bare
+    string when no locale translates it, so rendering skips the catalog
+    lookup entirely. Calls with arguments or non-constant text are left
+    alone. Only enabled when translations do not auto-reload, since baked
+    strings would not see JSON edits.
+    """
+
+    def filter_stream(self, stream):
+        tokens = list(stream)
+        i = 0
+        while i < len(tokens):
+            tok = tokens[i]
+            if (tok.type == 'name' and tok.value == '_'
+                    and i + 3 < len(tokens)
+                    and tokens[i + 1].type == 'lparen'
+                    and tokens[i + 2].type == 'string'
+                    and tokens[i + 3].type == 'rparen'
+                    and (i == 0 or tokens[i - 1].type != 'dot')):
+                yield from self._resolve(tok.lineno, tokens[i + 2].value)
+                i += 4
+                continue
+            yield tok
+            i += 1
+
+    def _resolve(self, lineno, text):
+        if not text:
+            yield Token(lineno, 'string', '')
+            return
+        translated = {}
+        for locale in available_locales():
+            if locale != 'en':
+                value = load_translations(locale).get(text)
+                if value:
+                    translated[locale] = value
+        if not translated:
+            yield Token(lineno, 'string', text)
+            return
+
+        yield Token(lineno, 'lparen', '(')
+        yield Token(lineno, 'lbrace', '{')
+        for n, (locale, value) in enumerate(sorted(translated.items())):
+            if n:
+                yield Token(lineno, 'comma', ',')
+            yield Token(lineno, 'string', locale)
+            yield Token(lineno, 'colon', ':')
+            yield Token(lineno, 'string', value)
+        yield Token(lineno, 'rbrace', '}')
+        yield Token(lineno, 'rparen', ')')
+        yield Token(lineno, 'dot', '.')
+        yield Token(lineno, 'name', 'get')
+        yield Token(lineno, 'lparen', '(')
+        yield Token(lineno, 'name', 'get_locale')
+        yield Token(lineno, 'lparen', '(')
+        yield Token(lineno, 'rparen', ')')
+        yield Token(lineno, 'comma', ',')
+        yield Token(lineno, 'string', text)
+        yield Token(lineno, 'rparen', ')')
+
+
+def init_app(app):
+    """Load catalogs once at startup and register the template helpers."""
+    global _auto_reload
+    _auto_reload = app.config.get('TRANSLATIONS_AUTO_RELOAD', app.debug)
+    for locale in available_locales():
+        _compile(locale)
+
+    app.jinja_env.globals['_'] = translate
+    app.jinja_env.globals['get_locale'] = get_locale
+    if not _auto_reload:
+        app.jinja_env.add_extension(CompiledTranslationExtension)
@@ -1,6 +1,4 @@
 import os
-import io
-import zipfile
 import secrets
 from datetime import datetime
 from flask import Blueprint, render_template, redirect, url_for, request, jsonify, send_from_directory, current_app, flash, abort, Response
@@ -12,6 +10,9 @@ from .auth.utils import is_authorized, club_permission_required
 from .auth.permissions import Permissions
 from .models import UploadLink, Meeting
 from .club_context import get_current_club_id
+from .jobs_routes import cached_artifact_response, job_response
+from .services import artifact_cache, export_jobs, zip_stream
+from .services.export_jobs import upload_archive_entries, upload_link_folder
 
 uploads_bp = Blueprint('uploads_bp', __name__)
 
@@ -56,7 +57,7 @@ def get_club_storage_used(club_id):
     links = UploadLink.query.filter_by(club_id=club_id).all()
     total_size = 0
     for link in links:
-        folder_path = os.path.join(current_app.root_path, 'static', 'uploads', link.code)
+        folder_path = upload_link_folder(link.code)
         if os.path.exists(folder_path) and os.path.isdir(folder_path):
             for entry in os.scandir(folder_path):
                 if entry.is_file() and not entry.name.startswith('.'):
@@ -96,7 +97,7 @@ def manage_uploads():
     # Calculate file counts and disk usage for each link
     stats = {}
     for link in upload_links:
-        folder_path = os.path.join(current_app.root_path, 'static', 'uploads', link.code)
+        folder_path = upload_link_folder(link.code)
         file_count = 0
         total_size = 0
         if os.path.exists(folder_path) and os.path.isdir(folder_path):
@@ -201,7 +202,7 @@ def create_upload_link():
     db.session.commit()
     
     # Ensure uploads subfolder exists
-    folder_path = os.path.join(current_app.root_path, 'static', 'uploads', code)
+    folder_path = upload_link_folder(code)
     os.makedirs(folder_path, exist_ok=True)
     
     return redirect(url_for('uploads_bp.manage_uploads'))
@@ -289,7 +290,7 @@ def delete_upload_link(link_id):
     link = UploadLink.query.filter_by(id=link_id, club_id=club_id).first_or_404()
     
     # Remove files from disk
-    folder_path = os.path.join(current_app.root_path, 'static', 'uploads', link.code)
+    folder_path = upload_link_folder(link.code)
     if os.path.exists(folder_path) and os.path.isdir(folder_path):
         try:
             import shutil
@@ -309,7 +310,7 @@ def view_upload_files(code):
     club_id = get_current_club_id()
     link = UploadLink.query.filter_by(code=code, club_id=club_id).first_or_404()
     
-    folder_path = os.path.join(current_app.root_path, 'static', 'uploads', code)
+    folder_path = upload_link_folder(code)
     files = []
     total_size = 0
     
@@ -367,7 +368,7 @@ def download_file(code, filename):
     # Verify ownership
     UploadLink.query.filter_by(code=code, club_id=club_id).first_or_404()
     
-    directory = os.path.join(current_app.root_path, 'static', 'uploads', code)
+    directory = upload_link_folder(code)
     # Secure transmission using send_from_directory
     return send_from_directory(directory, filename, as_attachment=True)
 
@@ -383,7 +384,7 @@ def delete_files(code):
         return jsonify(success=False, error="Invalid request payload."), 400
         
     filenames = data['filenames']
-    folder_path = os.path.join(current_app.root_path, 'static', 'uploads', code)
+    folder_path = upload_link_folder(code)
     
     deleted_count = 0
     errors = []
@@ -419,41 +420,39 @@ def download_zip(code):
     club_id = get_current_club_id()
     link = UploadLink.query.filter_by(code=code, club_id=club_id).first_or_404()
     
-    folder_path = os.path.join(current_app.root_path, 'static', 'uploads', code)
-    
-    if not os.path.exists(folder_path) or not os.path.isdir(folder_path):
+    entries = upload_archive_entries(code)
+    if entries is None:
         abort(404)
-        
-    zip_data = io.BytesIO()
-    file_count = 0
-    with zipfile.ZipFile(zip_data, 'w', zipfile.ZIP_DEFLATED) as zipf:
-        for entry in os.scandir(folder_path):
-            if entry.is_file() and not entry.name.startswith('.'):
-                file_path = os.path.join(folder_path, entry.name)
-                # Keep direct name as archive name (do not nest folders)
-                zipf.write(file_path, entry.name)
-                file_count += 1
-                
-    if file_count == 0:
+
+    if not entries:
+        if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+            return jsonify(success=False, message="No files to package for download."), 400
         flash("No files to package for download.", "info")
         return redirect(url_for('uploads_bp.view_upload_files', code=code))
         
-    # Get buffer size and reset cursor
-    size = zip_data.tell()
-    zip_data.seek(0)
-    
     # Format filename safely
     safe_title = secure_filename(link.title).replace('_', ' ')
     if not safe_title:
         safe_title = f"uploads_{code}"
         
     filename = f"{safe_title}.zip"
-    
+
+    # A built archive is served from the cache, with Range/If-Range support
+    digest = artifact_cache.upload_archive_digest(code, entries)
+    cached = cached_artifact_response('uploads_zip', digest, filename)
+    if cached:
+        return cached
+
+    if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+        job = export_jobs.enqueue('uploads_zip', code, filename, club_id=club_id,
+                                  user_id=current_user.id, digest=digest)
+        return job_response(job)
+
+    # Plain links get the archive streamed as it is written
     return Response(
-        zip_data.read(),
+        zip_stream.iter_zip(entries),
         headers={
             'Content-Disposition': f'attachment; filename="{filename}"',
-            'Content-Length': str(size),
             'Content-Type': 'application/zip',
             'Cache-Control': 'no-cache'
         }
@@ -506,7 +505,7 @@ def upload_file(code):
     if used_bytes + incoming_size > max_bytes:
         return jsonify(success=False, error=f"Upload refused. Your club has exceeded its maximum storage limit of {format_size(max_bytes)} (Currently using: {format_size(used_bytes)}, trying to upload: {format_size(incoming_size)})."), 400
         
-    folder_path = os.path.join(current_app.root_path, 'static', 'uploads', code)
+    folder_path = upload_link_folder(code)
     os.makedirs(folder_path, exist_ok=True)
     
     # 1. Enforce max_files validation if specified
@@ -867,46 +867,26 @@ def get_default_meeting_id():
     from .auth.utils import is_authorized
     from .auth.permissions import Permissions
 
-    # 1. Check for running meeting
-    club_id = get_current_club_id()
-    
-    running_query = Meeting.query.filter_by(status='running')
-    if club_id:
-        running_query = running_query.filter(Meeting.club_id == club_id)
-    
-    running_meeting = running_query.first()
-    if running_meeting:
-        return running_meeting.id
-
-    # 2. Check for nearest unfinished meeting (not started, unpublished, or cancelled)
-    # Only include 'unpublished' if user has MEETING_VIEW_ALL permission
-    from .models import SessionLog
-    upcoming_statuses = ['not started', 'cancelled']
-    if is_authorized(Permissions.MEETING_VIEW_ALL):
-        upcoming_statuses.append('unpublished')
-    
-    upcoming_query = Meeting.query \
-        .join(SessionLog, Meeting.id == SessionLog.meeting_id) \
-        .filter(Meeting.status.in_(upcoming_statuses))
-    
-    if club_id:
-        upcoming_query = upcoming_query.filter(Meeting.club_id == club_id)
-        
-    upcoming_meeting = upcoming_query.order_by(Meeting.Meeting_Date.asc(), Meeting.id.asc()).first()
+    return find_default_meeting_id(get_current_club_id(),
+                                   is_authorized(Permissions.MEETING_VIEW_ALL))
 
-    if upcoming_meeting:
-        return upcoming_meeting.id
-    
-    # 3. Fallback: Latest finished meeting
-    latest_query = Meeting.query.filter_by(status='finished')
-    if club_id:
-        latest_query = latest_query.filter(Meeting.club_id == club_id)
-    
-    latest_meeting = latest_query.order_by(Meeting.Meeting_Date.desc(), Meeting.id.desc()).first()
-    if latest_meeting:
-        return latest_meeting.id
-    
-    return None
+
+def find_default_meeting_id(club_id, include_unpublished):
+    """
+    Resolve the default meeting for a club without consulting the current
+    user; see get_default_meeting_id for the priority order.
+
+    Reads the club's precomputed MeetingPointer row (one keyed lookup) and
+    only computes the pointer on the fly when there is no club context or
+    the row has not been built yet.
+    """
+    from .services.meeting_pointer import (
+        compute_meeting_pointer, get_meeting_pointer, pick_default_meeting_id)
+
+    pointer = get_meeting_pointer(club_id) if club_id else None
+    if pointer is None:
+        pointer = compute_meeting_pointer(db.session, club_id)
+    return pick_default_meeting_id(pointer, include_unpublished)
 
 def get_session_voter_identifier():
     """
@@ -7,12 +7,14 @@ from .models import SessionLog, SessionType, Contact, Meeting, User, MeetingRole
 from . import db
 from datetime import datetime
 import secrets
-from sqlalchemy import func, distinct
 from sqlalchemy.orm import joinedload, selectinload
 from flask_login import current_user
 from .club_context import get_current_club_id, authorized_club_required
 
 from .services.role_service import RoleService
+from .services.event_bus import publish, votes_topic
+from .services.vote_tally import ballot_update, get_tally, get_vote_counts
+from .services.voting_ballots import build_ballot_rows, write_ballot
 from .utils import (
     get_session_voter_identifier,
     get_current_user_info,
@@ -105,41 +107,7 @@ def get_meeting_omr_records(meeting_id):
 
 def populate_session_log_owners(session_logs, meeting_id):
     """Batch populates the cached owners relationship on session logs to avoid N+1 queries."""
-    if not session_logs:
-        return
-        
-    omr_records = get_meeting_omr_records(meeting_id)
-        
-    # Group contacts by their role_id and session_log_id
-    single_owner_map = {} # (role_id, session_log_id) -> list of Contacts
-    shared_owner_map = {} # role_id -> list of Contacts
-    
-    for omr, contact, role in omr_records:
-        if not role:
-            continue
-        role_id = role.id
-        has_single_owner = role.has_single_owner
-        
-        if has_single_owner:
-            key = (role_id, omr.session_log_id)
-            single_owner_map.setdefault(key, []).append(contact)
-        else:
-            shared_owner_map.setdefault(role_id, []).append(contact)
-            
-    # Assign cached owners to each session log
-    for log in session_logs:
-        if not log.session_type or not log.session_type.role:
-            log._cached_owners = []
-            continue
-            
-        role = log.session_type.role
-        role_id = role.id
-        has_single_owner = role.has_single_owner
-        
-        if has_single_owner:
-            log._cached_owners = single_owner_map.get((role_id, log.id), [])
-        else:
-            log._cached_owners = shared_owner_map.get(role_id, [])
+    SessionLog.load_owners(session_logs)
 
 
 def _enrich_role_data_for_voting(roles_dict, selected_meeting, vote_counts=None, logs_by_id=None, user_votes=None, winners_list=None):
@@ -309,7 +277,7 @@ def _get_roles_for_voting(meeting_id, meeting, award_configs_list=None, user_vot
     consolidated = consolidate_session_logs(all_logs, include_waitlist=False)
     logs_by_id = {log.id: log for log in all_logs}
 
-    # Single aggregated vote-count query, gated by admin/track-progress perms.
+    # Vote counts from the live tally, gated by admin/track-progress perms.
     # This replaces three separate GROUP BYs that used to live in the
     # officer / role-taker / custom-config blocks below.
     can_see_vote_counts = (
@@ -319,9 +287,8 @@ def _get_roles_for_voting(meeting_id, meeting, award_configs_list=None, user_vot
             or is_authorized(Permissions.VOTING_TRACK_PROGRESS, meeting=meeting)
         )
     )
-    from .services.voting_aggregation import aggregate_votes_for_meeting
     vote_counts = (
-        aggregate_votes_for_meeting(meeting_id) if can_see_vote_counts else {}
+        get_vote_counts(meeting_id) if can_see_vote_counts else {}
     )
 
     enriched_roles = _enrich_role_data_for_voting(consolidated, meeting, vote_counts, logs_by_id, user_votes, winners_list)
@@ -691,11 +658,8 @@ def _get_voting_page_context(meeting_id):
     award_configs_list = selected_meeting.award_configs if selected_meeting else []
     context['award_configs_list'] = award_configs_list
 
-    # Calculate total received votes (unique voters)
-    total_voters = db.session.query(func.count(distinct(Vote.voter_identifier)))\
-        .filter(Vote.meeting_id == meeting_id)\
-        .scalar() or 0
-    context['total_voters'] = total_voters
+    # Total received votes (unique voters) from the live tally
+    context['total_voters'] = get_tally(meeting_id)['voters']
 
     # --- Access Control Logic ---
     status = selected_meeting.status
@@ -826,61 +790,15 @@ def batch_vote():
         voter_identifier = session['voter_token']
 
     try:
-        # Clear previous votes for this voter in this meeting
-        Vote.query.filter_by(
-            meeting_id=meeting_id,
-            voter_identifier=voter_identifier
-        ).delete()
-        
-        # Load configs to get disabled categories and max votes
-        from .models.voting import MeetingAwardConfig
-        configs = MeetingAwardConfig.query.filter_by(meeting_id=meeting_id).all()
-        disabled_cats = {c.award_category for c in configs if c.max_votes_per_user == 0 or c.max_winners == 0}
-        
-        category_votes_count = {}
-        
-        # Add new votes
-        for v in votes:
-            contact_id = v.get('contact_id')
-            award_category = v.get('award_category')
-            if contact_id and award_category:
-                if award_category in disabled_cats:
-                    continue
-                
-                # Enforce max votes per user limit (capping at max_votes or max_winners)
-                config_item = next((c for c in configs if c.award_category == award_category), None)
-                max_votes_allowed = 1
-                if config_item:
-                    max_votes_allowed = min(config_item.max_votes_per_user, config_item.max_winners)
-                
-                category_votes_count[award_category] = category_votes_count.get(award_category, 0) + 1
-                if category_votes_count[award_category] > max_votes_allowed:
-                    continue
+        with ballot_update(meeting.id, voter_identifier):
+            # Load configs once to get disabled categories and max votes
+            from .models.voting import MeetingAwardConfig
+            configs = MeetingAwardConfig.query.filter_by(meeting_id=meeting_id).all()
 
-                new_vote = Vote(
-                    meeting_id=meeting_id,
-                    voter_identifier=voter_identifier,
-                    award_category=award_category,
-                    contact_id=contact_id
-                )
-                db.session.add(new_vote)
-            
-            # Handle question votes
-            question = v.get('question')
-            score = v.get('score')
-            comments = v.get('comments')
-            
-            if question is not None and (score is not None or comments is not None):
-                new_vote = Vote(
-                    meeting_id=meeting_id,
-                    voter_identifier=voter_identifier,
-                    question=question,
-                    score=score,
-                    comments=comments
-                )
-                db.session.add(new_vote)
-        
-        db.session.commit()
+            rows = build_ballot_rows(meeting.id, voter_identifier, votes, configs)
+            write_ballot(meeting.id, voter_identifier, rows)
+            db.session.commit()
+        publish(votes_topic(meeting.id))
         return jsonify(success=True)
     except Exception as e:
         db.session.rollback()
@@ -940,22 +858,24 @@ def vote_for_award():
     your_vote_id = None
 
     try:
-        if existing_vote:
-            # User clicked the same person again, so cancel the vote
-            db.session.delete(existing_vote)
-            your_vote_id = None
-        else:
-            # New vote
-            new_vote = Vote(
-                meeting_id=meeting.id,
-                voter_identifier=voter_identifier,
-                award_category=award_category,
-                contact_id=contact_id
-            )
-            db.session.add(new_vote)
-            your_vote_id = contact_id
-
-        db.session.commit()
+        with ballot_update(meeting.id, voter_identifier):
+            if existing_vote:
+                # User clicked the same person again, so cancel the vote
+                db.session.delete(existing_vote)
+                your_vote_id = None
+            else:
+                # New vote
+                new_vote = Vote(
+                    meeting_id=meeting.id,
+                    voter_identifier=voter_identifier,
+                    award_category=award_category,
+                    contact_id=contact_id
+                )
+                db.session.add(new_vote)
+                your_vote_id = contact_id
+
+            db.session.commit()
+        publish(votes_topic(meeting.id))
 
         if meeting.status == 'finished' and is_admin:
             from .models.voting import MeetingAwardWinner
@@ -1110,29 +1030,16 @@ def voting_live_results(meeting_id):
     if not is_authorized(Permissions.VOTING_TRACK_PROGRESS, meeting=meeting):
         return jsonify(success=False, message="Permission denied."), 403
 
-    # Get total votes received (unique voters)
-    total_voters = db.session.query(func.count(distinct(Vote.voter_identifier)))\
-        .filter(Vote.meeting_id == meeting_id)\
-        .scalar() or 0
+    # Unique voters and per-candidate counts come from the live tally
+    tally = get_tally(meeting_id)
+    vote_data = [
+        {'contact_id': cid, 'award_category': cat, 'count': count}
+        for (cid, cat), count in tally['counts'].items()
+    ]
 
-    # Get vote counts for award categories
-    counts = db.session.query(Vote.contact_id, Vote.award_category, func.count(Vote.id)).filter(
-        Vote.meeting_id == meeting_id,
-        Vote.award_category.isnot(None)
-    ).group_by(Vote.contact_id, Vote.award_category).all()
-    
-    vote_data = []
-    for cid, cat, count in counts:
-        if cid:
-            vote_data.append({
-                'contact_id': cid,
-                'award_category': cat,
-                'count': count
-            })
-            
     return jsonify(
         success=True,
-        total_voters=total_voters,
+        total_voters=tally['voters'],
         votes=vote_data
     )
 
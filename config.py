@@ -42,6 +42,41 @@ class Config:
     CACHE_REDIS_URL = os.getenv('CACHE_REDIS_URL', 'redis://localhost:6379/0')
     CACHE_DEFAULT_TIMEOUT = 300
 
+    # SSE announcer backend. 'redis' fans events out across gunicorn workers
+    # over pub/sub; 'memory' only reaches streams served by the same process.
+    ANNOUNCER_BACKEND = os.getenv(
+        'ANNOUNCER_BACKEND',
+        'redis' if _is_prod else 'memory',
+    )
+    ANNOUNCER_REDIS_URL = os.getenv('ANNOUNCER_REDIS_URL', CACHE_REDIS_URL)
+
+    # Background export jobs (agenda XLSX/PPTX, upload archives). Each
+    # gunicorn worker runs a pool of EXPORT_JOB_WORKERS threads; artifacts go
+    # to EXPORT_JOB_DIR (default: instance/export_jobs) and are deleted
+    # EXPORT_JOB_RETENTION seconds after they finish. Set EXPORT_JOB_INLINE to
+    # build in the request instead (the default under TESTING).
+    EXPORT_JOB_WORKERS = int(os.getenv('EXPORT_JOB_WORKERS', 2))
+    EXPORT_JOB_DIR = os.getenv('EXPORT_JOB_DIR')
+    EXPORT_JOB_TIMEOUT = int(os.getenv('EXPORT_JOB_TIMEOUT', 600))
+    EXPORT_JOB_RETENTION = int(os.getenv('EXPORT_JOB_RETENTION', 3600))
+    _export_job_inline = os.getenv('EXPORT_JOB_INLINE')
+    EXPORT_JOB_INLINE = (_export_job_inline.lower() in ['true', 'on', '1']
+                         if _export_job_inline else None)
+
+    # Files received through upload links, one folder per link code
+    # (default: app/static/uploads).
+    UPLOAD_LINK_DIR = os.getenv('UPLOAD_LINK_DIR')
+
+    # Cache of built agenda workbooks/slide decks, keyed by a digest of the
+    # meeting's data (default: instance/artifact_cache). Least recently used
+    # files are deleted past ARTIFACT_CACHE_MAX_BYTES.
+    ARTIFACT_CACHE_DIR = os.getenv('ARTIFACT_CACHE_DIR')
+    ARTIFACT_CACHE_MAX_BYTES = int(os.getenv('ARTIFACT_CACHE_MAX_BYTES', 200 * 1024 * 1024))
+
+    # Flattened/cropped avatar PNGs reused by slide generation
+    # (default: instance/avatar_renditions).
+    AVATAR_RENDITION_DIR = os.getenv('AVATAR_RENDITION_DIR')
+
 
     # Session settings
     PERMANENT_SESSION_LIFETIME = timedelta(days=30)
@@ -68,6 +103,27 @@ class Config:
     MAIL_PASSWORD = os.getenv('MAIL_PASSWORD')
     MAIL_DEFAULT_SENDER = os.getenv('MAIL_DEFAULT_SENDER', 'support.memmaker@gmail.com')
 
+    # Outgoing mail is queued in the email_outbox table and sent by a
+    # background thread per gunicorn worker, up to EMAIL_OUTBOX_BATCH_SIZE
+    # messages per SMTP connection. Failed attempts are retried after
+    # EMAIL_OUTBOX_RETRY_DELAY seconds, doubling each time, up to
+    # EMAIL_OUTBOX_MAX_ATTEMPTS. Set EMAIL_OUTBOX_INLINE to send right after
+    # the queuing request commits instead (the default under TESTING).
+    EMAIL_OUTBOX_BATCH_SIZE = int(os.getenv('EMAIL_OUTBOX_BATCH_SIZE', 20))
+    EMAIL_OUTBOX_MAX_ATTEMPTS = int(os.getenv('EMAIL_OUTBOX_MAX_ATTEMPTS', 5))
+    EMAIL_OUTBOX_RETRY_DELAY = int(os.getenv('EMAIL_OUTBOX_RETRY_DELAY', 30))
+    EMAIL_OUTBOX_RETENTION_DAYS = int(os.getenv('EMAIL_OUTBOX_RETENTION_DAYS', 30))
+    _email_outbox_inline = os.getenv('EMAIL_OUTBOX_INLINE')
+    EMAIL_OUTBOX_INLINE = (_email_outbox_inline.lower() in ['true', 'on', '1']
+                           if _email_outbox_inline else None)
+
+    # Stored pathway progress dropped by a commit is recomputed on a
+    # background thread per gunicorn worker. Set PATHWAY_PROGRESS_INLINE to
+    # recompute right after the commit instead (the default under TESTING).
+    _pathway_progress_inline = os.getenv('PATHWAY_PROGRESS_INLINE')
+    PATHWAY_PROGRESS_INLINE = (_pathway_progress_inline.lower() in ['true', 'on', '1']
+                               if _pathway_progress_inline else None)
+
     # Sync settings
     SYNC_REMOTE_USER = os.getenv('SYNC_REMOTE_USER', 'ubuntu')
     SYNC_REMOTE_HOST = os.getenv('SYNC_REMOTE_HOST', 'moleqode.com')
@@ -77,6 +133,15 @@ class Config:
     ANTHROPIC_API_KEY = os.getenv('ANTHROPIC_API_KEY')
     ANTHROPIC_MODEL = os.getenv('ANTHROPIC_MODEL', 'MiniMax-M3')
     ANTHROPIC_BASE_URL = os.getenv('ANTHROPIC_BASE_URL', 'https://api.minimaxi.com/anthropic')
+
+    # Streamed AI chat replies ("stream": true on /chat/send) run on a pool
+    # of CHAT_RUN_WORKERS threads per gunicorn worker. Set CHAT_RUN_INLINE
+    # to generate them in the request instead (the default under TESTING).
+    CHAT_RUN_WORKERS = int(os.getenv('CHAT_RUN_WORKERS', 4))
+    _chat_run_inline = os.getenv('CHAT_RUN_INLINE')
+    CHAT_RUN_INLINE = (_chat_run_inline.lower() in ['true', 'on', '1']
+                       if _chat_run_inline else None)
+
     CHAT_HISTORY_ACTIVE_LIMIT = int(os.getenv('CHAT_HISTORY_ACTIVE_LIMIT', 20))
 
 
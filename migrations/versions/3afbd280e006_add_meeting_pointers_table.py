@@ -0,0 +1,75 @@
+"""add meeting pointers table
+
+Revision ID: 3afbd280e006
+Revises: 3317b442785c
+Create Date: 2026-10-17 10:12:08.511204
+
+"""
+from datetime import datetime, timezone
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3afbd280e006'
+down_revision = '3317b442785c'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('meeting_pointers',
+    sa.Column('club_id', sa.Integer(), nullable=False),
+    sa.Column('running_meeting_id', sa.Integer(), nullable=True),
+    sa.Column('upcoming_meeting_id', sa.Integer(), nullable=True),
+    sa.Column('upcoming_unpublished_meeting_id', sa.Integer(), nullable=True),
+    sa.Column('finished_meeting_id', sa.Integer(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['club_id'], ['clubs.id'], name=op.f('fk_meeting_pointers_club_id_clubs'), ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['running_meeting_id'], ['Meetings.id'], name=op.f('fk_meeting_pointers_running_meeting_id_Meetings'), ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['upcoming_meeting_id'], ['Meetings.id'], name=op.f('fk_meeting_pointers_upcoming_meeting_id_Meetings'), ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['upcoming_unpublished_meeting_id'], ['Meetings.id'], name=op.f('fk_meeting_pointers_upcoming_unpublished_meeting_id_Meetings'), ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['finished_meeting_id'], ['Meetings.id'], name=op.f('fk_meeting_pointers_finished_meeting_id_Meetings'), ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('club_id', name=op.f('pk_meeting_pointers'))
+    )
+
+    # Backfill one row per club (same rules as app/services/meeting_pointer.py)
+    connection = op.get_bind()
+    upcoming_sql = (
+        "SELECT m.id FROM Meetings m JOIN Session_Logs l ON l.meeting_id = m.id "
+        "WHERE m.club_id = :club_id AND m.status IN {statuses} "
+        "ORDER BY m.Meeting_Date ASC, m.id ASC LIMIT 1"
+    )
+    queries = {
+        'running_meeting_id':
+            "SELECT id FROM Meetings WHERE club_id = :club_id AND status = 'running' "
+            "ORDER BY id ASC LIMIT 1",
+        'upcoming_meeting_id':
+            upcoming_sql.format(statuses="('not started', 'cancelled')"),
+        'upcoming_unpublished_meeting_id':
+            upcoming_sql.format(statuses="('not started', 'cancelled', 'unpublished')"),
+        'finished_meeting_id':
+            "SELECT id FROM Meetings WHERE club_id = :club_id AND status = 'finished' "
+            "ORDER BY Meeting_Date DESC, id DESC LIMIT 1",
+    }
+    now = datetime.now(timezone.utc)
+    club_ids = [row[0] for row in connection.execute(sa.text("SELECT id FROM clubs"))]
+    for club_id in club_ids:
+        values = {
+            column: connection.execute(sa.text(sql), {'club_id': club_id}).scalar()
+            for column, sql in queries.items()
+        }
+        connection.execute(
+            sa.text(
+                "INSERT INTO meeting_pointers (club_id, running_meeting_id, upcoming_meeting_id, "
+                "upcoming_unpublished_meeting_id, finished_meeting_id, updated_at) "
+                "VALUES (:club_id, :running_meeting_id, :upcoming_meeting_id, "
+                ":upcoming_unpublished_meeting_id, :finished_meeting_id, :updated_at)"
+            ),
+            dict(values, club_id=club_id, updated_at=now),
+        )
+
+
+def downgrade():
+    op.drop_table('meeting_pointers')
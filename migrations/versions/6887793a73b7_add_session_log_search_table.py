@@ -0,0 +1,51 @@
+"""add session log search table
+
+Revision ID: 6887793a73b7
+Revises: 3afbd280e006
+Create Date: 2026-10-17 14:31:52.207716
+
+Populate it afterwards with: flask speech-logs:reindex-search
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '6887793a73b7'
+down_revision = '3afbd280e006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('session_log_search',
+    sa.Column('session_log_id', sa.Integer(), nullable=False),
+    sa.Column('club_id', sa.Integer(), nullable=False),
+    sa.Column('meeting_id', sa.Integer(), nullable=False),
+    sa.Column('document', sa.Text(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['club_id'], ['clubs.id'], name=op.f('fk_session_log_search_club_id_clubs'), ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['meeting_id'], ['Meetings.id'], name=op.f('fk_session_log_search_meeting_id_Meetings'), ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['session_log_id'], ['Session_Logs.id'], name=op.f('fk_session_log_search_session_log_id_Session_Logs'), ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('session_log_id', name=op.f('pk_session_log_search'))
+    )
+    with op.batch_alter_table('session_log_search', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_session_log_search_club_id'), ['club_id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_session_log_search_meeting_id'), ['meeting_id'], unique=False)
+
+    bind = op.get_bind()
+    if bind.dialect.name == 'mysql':
+        op.create_index('ft_session_log_search_document', 'session_log_search', ['document'],
+                        unique=False, mysql_prefix='FULLTEXT')
+
+
+def downgrade():
+    bind = op.get_bind()
+    if bind.dialect.name == 'mysql':
+        op.drop_index('ft_session_log_search_document', table_name='session_log_search')
+
+    with op.batch_alter_table('session_log_search', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_session_log_search_meeting_id'))
+        batch_op.drop_index(batch_op.f('ix_session_log_search_club_id'))
+
+    op.drop_table('session_log_search')
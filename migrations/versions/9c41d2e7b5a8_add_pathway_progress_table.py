@@ -0,0 +1,40 @@
+"""add pathway progress table
+
+Revision ID: 9c41d2e7b5a8
+Revises: 6887793a73b7
+Create Date: 2026-10-17 16:05:12.418930
+
+Rows are built on first read; to warm them: flask speech-logs:rebuild-progress
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9c41d2e7b5a8'
+down_revision = '6887793a73b7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('pathway_progress',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('contact_id', sa.Integer(), nullable=False),
+    sa.Column('pathway', sa.String(length=100), nullable=False),
+    sa.Column('level', sa.Integer(), nullable=False),
+    sa.Column('summary', sa.Text(), nullable=False),
+    sa.Column('computed_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['contact_id'], ['Contacts.id'], name=op.f('fk_pathway_progress_contact_id_Contacts'), ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id', name=op.f('pk_pathway_progress')),
+    sa.UniqueConstraint('contact_id', 'pathway', 'level', name='uq_pathway_progress')
+    )
+    with op.batch_alter_table('pathway_progress', schema=None) as batch_op:
+        batch_op.create_index('ix_pathway_progress_contact', ['contact_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('pathway_progress', schema=None) as batch_op:
+        batch_op.drop_index('ix_pathway_progress_contact')
+
+    op.drop_table('pathway_progress')
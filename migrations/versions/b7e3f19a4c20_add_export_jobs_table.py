@@ -0,0 +1,48 @@
+"""add export jobs table
+
+Revision ID: b7e3f19a4c20
+Revises: 9c41d2e7b5a8
+Create Date: 2026-10-17 18:20:41.502113
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7e3f19a4c20'
+down_revision = '9c41d2e7b5a8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('export_jobs',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('club_id', sa.Integer(), nullable=True),
+    sa.Column('kind', sa.String(length=20), nullable=False),
+    sa.Column('target', sa.String(length=50), nullable=False),
+    sa.Column('active_key', sa.String(length=100), nullable=True),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('progress', sa.Integer(), nullable=False),
+    sa.Column('message', sa.String(length=255), nullable=True),
+    sa.Column('download_name', sa.String(length=255), nullable=False),
+    sa.Column('file_path', sa.String(length=500), nullable=True),
+    sa.Column('requested_by_id', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('started_at', sa.DateTime(), nullable=True),
+    sa.Column('finished_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['club_id'], ['clubs.id'], name=op.f('fk_export_jobs_club_id_clubs'), ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['requested_by_id'], ['users.id'], name=op.f('fk_export_jobs_requested_by_id_users'), ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('id', name=op.f('pk_export_jobs')),
+    sa.UniqueConstraint('active_key', name=op.f('uq_export_jobs_active_key'))
+    )
+    with op.batch_alter_table('export_jobs', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_export_jobs_club_id'), ['club_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('export_jobs', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_export_jobs_club_id'))
+
+    op.drop_table('export_jobs')
@@ -0,0 +1,26 @@
+"""add digest to export jobs
+
+Revision ID: c4d8e2a19f63
+Revises: b7e3f19a4c20
+Create Date: 2026-10-17 19:02:13.774520
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4d8e2a19f63'
+down_revision = 'b7e3f19a4c20'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('export_jobs', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('digest', sa.String(length=64), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('export_jobs', schema=None) as batch_op:
+        batch_op.drop_column('digest')
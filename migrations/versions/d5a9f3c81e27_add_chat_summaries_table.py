@@ -0,0 +1,35 @@
+"""add chat summaries table
+
+Revision ID: d5a9f3c81e27
+Revises: c4d8e2a19f63
+Create Date: 2026-10-17 21:14:05.318842
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd5a9f3c81e27'
+down_revision = 'c4d8e2a19f63'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('chat_summaries',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('club_id', sa.Integer(), nullable=False),
+    sa.Column('summary', sa.Text(), nullable=False),
+    sa.Column('last_message_id', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['club_id'], ['clubs.id'], name=op.f('fk_chat_summaries_club_id_clubs'), ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], name=op.f('fk_chat_summaries_user_id_users'), ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id', name=op.f('pk_chat_summaries')),
+    sa.UniqueConstraint('user_id', 'club_id', name='uq_chat_summary_user_club')
+    )
+
+
+def downgrade():
+    op.drop_table('chat_summaries')
@@ -0,0 +1,26 @@
+"""add chat summary generation
+
+Revision ID: f3a7d1c95b42
+Revises: e8b2c6d4f190
+Create Date: 2026-10-18 10:12:37.904215
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3a7d1c95b42'
+down_revision = 'e8b2c6d4f190'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('chat_summaries', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('generation', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade():
+    with op.batch_alter_table('chat_summaries', schema=None) as batch_op:
+        batch_op.drop_column('generation')
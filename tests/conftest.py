@@ -249,6 +249,71 @@ class AuthActions:
 def auth(client):
     return AuthActions(client)
 
+@pytest.fixture
+def session_login(app, client, default_club):
+    """Sign the test client in as a new member of ``default_club``, skipping the login form.
+
+    ``session_login(*permission_names)`` gives the member a role granting
+    those permissions and returns ``(user_id, contact_id)``.
+    """
+    from app import db
+    from app.models import AuthRole, Contact, Permission, User, UserClub
+
+    def login(*permission_names):
+        with app.app_context():
+            role = AuthRole(name='ClubAdmin' if permission_names else 'Member',
+                            level=4 if permission_names else 1)
+            for name in permission_names:
+                role.permissions.append(Permission(name=name, category='test'))
+            contact = Contact(Name='Alice', Email='alice@example.com', Type='Member')
+            user = User(username='alice', email='alice@example.com', status='active')
+            user.set_password('password')
+            db.session.add_all([role, contact, user])
+            db.session.flush()
+            db.session.add(UserClub(user_id=user.id, club_id=default_club.id, contact_id=contact.id,
+                                    is_home=True, auth_role_id=role.id))
+            db.session.commit()
+            ids = user.id, contact.id
+
+        with client.session_transaction() as sess:
+            sess['_user_id'] = str(ids[0])
+            sess['_fresh'] = True
+            sess['current_club_id'] = default_club.id
+        return ids
+
+    return login
+
+
+@pytest.fixture
+def record_queries(app):
+    """Collect the SQL sent to the database inside a ``with`` block.
+
+    ``with record_queries() as statements:`` gives the statement strings;
+    ``record_queries(with_parameters=True)`` gives (statement, parameters) pairs.
+    """
+    from contextlib import contextmanager
+    from sqlalchemy import event
+    from app import db
+
+    with app.app_context():
+        engine = db.engine
+
+    @contextmanager
+    def recording(with_parameters=False):
+        statements = []
+
+        def listener(conn, cursor, statement, parameters, context, executemany):
+            statements.append((statement, parameters) if with_parameters else statement)
+
+        event.listen(engine, 'before_cursor_execute', listener)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, 'before_cursor_execute', listener)
+
+    return recording
+
+
 @pytest.fixture
 def captured_templates(app):
     recorded = []
@@ -262,3 +327,23 @@ def captured_templates(app):
         yield recorded
     finally:
         template_rendered.disconnect(record, app)
+
+
+@pytest.fixture
+def smtp_stub(app, monkeypatch):
+    """Route Flask-Mail to an in-process SMTP server instead of suppressing mail."""
+    from smtp_stub import SMTPStub
+
+    stub = SMTPStub().start()
+    state = app.extensions['mail']
+    monkeypatch.setattr(state, 'server', stub.host)
+    monkeypatch.setattr(state, 'port', stub.port)
+    monkeypatch.setattr(state, 'use_ssl', False)
+    monkeypatch.setattr(state, 'use_tls', False)
+    monkeypatch.setattr(state, 'username', None)
+    monkeypatch.setattr(state, 'password', None)
+    monkeypatch.setattr(state, 'suppress', False)
+    try:
+        yield stub
+    finally:
+        stub.stop()
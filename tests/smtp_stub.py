@@ -0,0 +1,85 @@
+"""Minimal in-process SMTP server for tests that exercise real SMTP sessions."""
+import socketserver
+import threading
+
+
+class _Handler(socketserver.StreamRequestHandler):
+
+    def _reply(self, line):
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self):
+        server = self.server.stub
+        server.connections += 1
+        self._reply('220 stub ESMTP')
+        envelope = None
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode(errors='replace').strip()
+            verb = command.split(' ', 1)[0].upper()
+            if verb == 'EHLO':
+                self._reply('250-stub')
+                self._reply('250 8BITMIME')
+            elif verb == 'HELO':
+                self._reply('250 stub')
+            elif verb == 'MAIL':
+                if server.reject:
+                    self._reply(server.reject.pop(0))
+                    continue
+                envelope = {'from': command[10:].strip('<> '), 'to': [], 'data': ''}
+                self._reply('250 OK')
+            elif verb == 'RCPT':
+                envelope['to'].append(command[8:].strip('<> '))
+                self._reply('250 OK')
+            elif verb == 'DATA':
+                self._reply('354 End data with <CR><LF>.<CR><LF>')
+                lines = []
+                while True:
+                    data = self.rfile.readline().decode(errors='replace')
+                    if data in ('.\r\n', '.\n', ''):
+                        break
+                    lines.append(data[1:] if data.startswith('..') else data)
+                envelope['data'] = ''.join(lines)
+                server.messages.append(envelope)
+                envelope = None
+                self._reply('250 OK')
+            elif verb in ('RSET', 'NOOP'):
+                envelope = None
+                self._reply('250 OK')
+            elif verb == 'QUIT':
+                self._reply('221 Bye')
+                return
+            else:
+                self._reply('502 Command not implemented')
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class SMTPStub:
+    """Accepts mail on localhost; records ``messages`` and ``connections``.
+
+    Reply lines pushed onto ``reject`` answer the next ``MAIL FROM``
+    commands instead of ``250``, e.g. ``'451 Try again later'``.
+    """
+
+    def __init__(self):
+        self.messages = []
+        self.connections = 0
+        self.reject = []
+        self._server = _Server(('127.0.0.1', 0), _Handler)
+        self._server.stub = self
+        self.host, self.port = self._server.server_address
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,81 @@
+"""Tests for single-pass agenda start-time and section recomputation."""
+from datetime import date, time
+
+from app import db
+from app.models import Meeting, SessionLog, SessionType
+from app.services.agenda_schedule import recalculate_agenda
+
+
+def _types(club):
+    section = SessionType(Title='Section', Is_Section=True, club_id=club.id)
+    speech = SessionType(Title='Prepared Speech', club_id=club.id)
+    evaluation = SessionType(Title='Evaluation', club_id=club.id)
+    hidden = SessionType(Title='Hidden', Is_Hidden=True, club_id=club.id)
+    db.session.add_all([section, speech, evaluation, hidden])
+    db.session.commit()
+    return section, speech, evaluation, hidden
+
+
+def _meeting(club, number, items, ge_mode=0):
+    meeting = Meeting(Meeting_Number=number, Meeting_Date=date(2026, 1, number),
+                      Start_Time=time(19, 0), ge_mode=ge_mode, club_id=club.id)
+    db.session.add(meeting)
+    db.session.flush()
+    logs = []
+    for seq, (session_type, duration) in enumerate(items, 1):
+        log = SessionLog(meeting_id=meeting.id, Meeting_Seq=seq, Type_ID=session_type.id,
+                         Duration_Max=duration)
+        db.session.add(log)
+        logs.append(log)
+    db.session.commit()
+    return meeting, logs
+
+
+def test_start_times_and_sections_in_one_pass(app, default_club):
+    with app.app_context():
+        section, speech, evaluation, hidden = _types(default_club)
+        meeting, logs = _meeting(default_club, 1, [
+            (section, 0), (speech, 7), (evaluation, 3), (hidden, 5),
+            (section, 0), (speech, 0), (evaluation, 3),
+        ], ge_mode=1)
+        logs[3].hidden = True
+
+        assert recalculate_agenda([meeting]) == len(logs)
+        db.session.commit()
+        db.session.expire_all()
+
+        stored = SessionLog.query.filter_by(meeting_id=meeting.id).order_by(SessionLog.Meeting_Seq).all()
+        assert [log.Start_Time for log in stored] == [
+            None, time(19, 0), time(19, 8), None, None, None, time(19, 13)]
+        assert [log.section_id for log in stored] == [
+            logs[0].id, logs[0].id, logs[0].id, logs[0].id, logs[4].id, logs[4].id, logs[4].id]
+
+        # A second run finds nothing to change
+        assert recalculate_agenda([meeting.id]) == 0
+
+
+def test_query_count_is_constant(app, default_club, record_queries):
+    with app.app_context():
+        section, speech, evaluation, _ = _types(default_club)
+        items = [(section, 0)] + [(speech, 6), (evaluation, 3)] * 20
+        meetings = [_meeting(default_club, n, items, ge_mode=1)[0] for n in (1, 2, 3)]
+
+        recalculate_agenda(meetings[:1])
+        with record_queries() as statements:
+            updated = recalculate_agenda(meetings[1:])
+        assert updated == 2 * len(items)
+        # One SELECT for every meeting's logs plus the executemany UPDATEs
+        assert len([s for s in statements if s.startswith('SELECT')]) == 1
+        assert len([s for s in statements if s.startswith('UPDATE')]) <= 2
+
+
+def test_loaded_logs_see_new_values_without_being_dirty(app, default_club):
+    with app.app_context():
+        section, speech, _, _ = _types(default_club)
+        meeting, logs = _meeting(default_club, 1, [(section, 0), (speech, 5)])
+        logs[1].Duration_Max = 10
+        recalculate_agenda([meeting])
+
+        assert logs[1].Start_Time == time(19, 0)
+        assert logs[1].section_id == logs[0].id
+        assert logs[1] not in db.session.dirty
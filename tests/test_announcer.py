@@ -0,0 +1,73 @@
+"""Tests for the pluggable SSE announcer backends."""
+import queue
+
+from app.services.announcer import MemoryBackend, MessageAnnouncer, RedisBackend
+
+
+class SharedBus:
+    """Stands in for Redis pub/sub: every subscribed worker gets each event."""
+
+    def __init__(self):
+        self.dispatchers = []
+
+    def backend(self):
+        bus = self
+
+        class _Backend(MemoryBackend):
+            def start(self, dispatch):
+                if dispatch not in bus.dispatchers:
+                    bus.dispatchers.append(dispatch)
+
+            def publish(self, channel, message):
+                for dispatch in list(bus.dispatchers):
+                    dispatch(channel, message)
+
+        return _Backend()
+
+
+def test_memory_backend_delivers_locally():
+    announcer = MessageAnnouncer()
+    q = announcer.listen(5)
+    announcer.announce(5, 'new_message')
+    assert q.get_nowait() == 'new_message'
+
+    announcer.remove_listener(5, q)
+    assert announcer.listeners == {}
+
+
+def test_announce_reaches_listeners_on_other_workers():
+    bus = SharedBus()
+    worker_a = MessageAnnouncer(bus.backend())
+    worker_b = MessageAnnouncer(bus.backend())
+    q_b = worker_b.listen(7)
+    q_other = worker_b.listen(8)
+
+    worker_a.announce(7, 'new_message')
+
+    assert q_b.get_nowait() == 'new_message'
+    assert q_other.empty()
+
+
+def test_full_queue_drops_events_instead_of_blocking():
+    announcer = MessageAnnouncer()
+    q = announcer.listen(1)
+    for _ in range(10):
+        announcer.announce(1, 'new_message')
+    assert q.qsize() == q.maxsize
+    try:
+        while True:
+            q.get_nowait()
+    except queue.Empty:
+        pass
+
+
+def test_init_app_selects_backend(app):
+    announcer = MessageAnnouncer()
+    app.config['ANNOUNCER_BACKEND'] = 'redis'
+    try:
+        announcer.init_app(app)
+        assert isinstance(announcer.backend, RedisBackend)
+    finally:
+        app.config['ANNOUNCER_BACKEND'] = 'memory'
+        announcer.init_app(app)
+    assert isinstance(announcer.backend, MemoryBackend)
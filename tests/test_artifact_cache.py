@@ -0,0 +1,122 @@
+"""Tests for the content-addressed cache of meeting exports."""
+import os
+from datetime import date
+
+import pytest
+
+from app import db
+from app.models import Contact, ExportJob, Meeting, Vote
+from app.services import artifact_cache
+from app.services.export import MeetingExportService
+
+XHR = {'X-Requested-With': 'XMLHttpRequest'}
+
+
+@pytest.fixture
+def cache_dirs(app, tmp_path, monkeypatch):
+    monkeypatch.setitem(app.config, 'EXPORT_JOB_DIR', str(tmp_path / 'jobs'))
+    monkeypatch.setitem(app.config, 'ARTIFACT_CACHE_DIR', str(tmp_path / 'cache'))
+    return tmp_path / 'cache'
+
+
+def _meeting(app, club):
+    with app.app_context():
+        meeting = Meeting(Meeting_Number=7, Meeting_Date=date(2026, 4, 2),
+                          status='not started', club_id=club.id)
+        db.session.add(meeting)
+        db.session.commit()
+        return meeting.id
+
+
+def test_unchanged_meeting_is_served_from_the_cache(app, client, default_club, cache_dirs, monkeypatch,
+                                                    session_login):
+    _, contact_id = session_login()
+    meeting_id = _meeting(app, default_club)
+    builds = []
+    generate = MeetingExportService.generate_meeting_xlsx
+
+    def counting_generate(*args, **kwargs):
+        builds.append(args)
+        return generate(*args, **kwargs)
+
+    monkeypatch.setattr(MeetingExportService, 'generate_meeting_xlsx', staticmethod(counting_generate))
+
+    first = client.get(f'/agenda/export/{meeting_id}')
+    assert first.status_code == 200
+    etag = first.headers['ETag'].strip('"')
+    assert os.listdir(cache_dirs) == [f'{etag}.xlsx']
+
+    second = client.get(f'/agenda/export/{meeting_id}')
+    assert second.data == first.data
+    assert second.headers['ETag'] == first.headers['ETag']
+    assert len(builds) == 1
+    with app.app_context():
+        assert ExportJob.query.count() == 1
+
+    # Scripts are sent back to the export URL instead of to a job
+    payload = client.get(f'/agenda/export/{meeting_id}', headers=XHR).get_json()['job']
+    assert payload['download_url'] == f'/agenda/export/{meeting_id}'
+
+    not_modified = client.get(f'/agenda/export/{meeting_id}', headers={'If-None-Match': f'"{etag}"'})
+    assert not_modified.status_code == 304
+    assert not_modified.headers['ETag'] == f'"{etag}"'
+
+    # A new vote changes the digest, so the workbook is built again
+    with app.app_context():
+        db.session.add(Vote(meeting_id=meeting_id, voter_identifier='v1', award_category='speaker',
+                            contact_id=contact_id))
+        db.session.commit()
+    third = client.get(f'/agenda/export/{meeting_id}', headers={'If-None-Match': f'"{etag}"'})
+    assert third.status_code == 200
+    assert third.headers['ETag'] != first.headers['ETag']
+    assert len(builds) == 2
+
+
+def test_slide_digest_tracks_template_and_avatar_files(app, default_club, tmp_path, monkeypatch):
+    monkeypatch.setattr(app, 'static_folder', str(tmp_path))
+    (tmp_path / 'avatars').mkdir()
+    avatar = tmp_path / 'avatars' / 'alice.png'
+    avatar.write_bytes(b'png')
+    layouts = tmp_path / 'club_resources' / str(default_club.id) / 'slides_layouts.pptx'
+    layouts.parent.mkdir(parents=True)
+    layouts.write_bytes(b'pptx')
+
+    with app.app_context():
+        contact = Contact(Name='Alice', Type='Member', Avatar_URL='alice.png')
+        meeting = Meeting(Meeting_Number=8, Meeting_Date=date(2026, 4, 9), club_id=default_club.id)
+        db.session.add_all([contact, meeting])
+        db.session.commit()
+        db.session.add(Vote(meeting_id=meeting.id, voter_identifier='v1', award_category='speaker',
+                            contact_id=contact.id))
+        db.session.commit()
+
+        digest = artifact_cache.meeting_export_digest('agenda_pptx', meeting)
+        assert artifact_cache.meeting_export_digest('agenda_pptx', meeting) == digest
+        assert artifact_cache.meeting_export_digest('agenda_xlsx', meeting) != digest
+
+        os.utime(avatar, ns=(1, 1))
+        avatar_digest = artifact_cache.meeting_export_digest('agenda_pptx', meeting)
+        assert avatar_digest != digest
+
+        os.utime(layouts, ns=(1, 1))
+        assert artifact_cache.meeting_export_digest('agenda_pptx', meeting) != avatar_digest
+
+
+def test_store_evicts_least_recently_used_files(app, cache_dirs, tmp_path, monkeypatch):
+    monkeypatch.setitem(app.config, 'ARTIFACT_CACHE_MAX_BYTES', 25)
+
+    with app.app_context():
+        for i, name in enumerate(('a', 'b')):
+            source = tmp_path / f'{name}.part'
+            source.write_bytes(b'x' * 10)
+            path = artifact_cache.store(name, '.xlsx', str(source))
+            os.utime(path, ns=(i, i))
+
+        # Reading "a" makes "b" the least recently used file
+        assert artifact_cache.lookup('a', '.xlsx')
+        source = tmp_path / 'c.part'
+        source.write_bytes(b'x' * 10)
+        artifact_cache.store('c', '.xlsx', str(source))
+
+        assert sorted(os.listdir(cache_dirs)) == ['a.xlsx', 'c.xlsx']
+        assert artifact_cache.lookup('b', '.xlsx') is None
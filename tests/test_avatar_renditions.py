@@ -0,0 +1,64 @@
+"""Tests for the cached avatar renditions used by slide generation."""
+import os
+
+import pytest
+from PIL import Image
+
+from app.services import avatar_renditions
+from app.services.meeting_slide_service import MeetingSlideService
+
+
+@pytest.fixture
+def avatar(app, tmp_path, monkeypatch):
+    monkeypatch.setattr(app, 'static_folder', str(tmp_path / 'static'))
+    monkeypatch.setitem(app.config, 'AVATAR_RENDITION_DIR', str(tmp_path / 'renditions'))
+    (tmp_path / 'static' / 'avatars').mkdir(parents=True)
+    path = tmp_path / 'static' / 'avatars' / 'alice.png'
+    Image.new('RGBA', (400, 200), (255, 0, 0, 0)).save(path)
+    return path
+
+
+def test_rendition_is_flattened_cropped_and_reused(app, avatar, monkeypatch):
+    with app.app_context():
+        source = avatar_renditions.avatar_source_path('/static/avatars/alice.png')
+        assert source == str(avatar)
+        assert avatar_renditions.avatar_source_path('alice.png') == str(avatar)
+        assert avatar_renditions.avatar_source_path('missing.png') is None
+
+        path = avatar_renditions.rendition_path(source, (100, 100))
+        with Image.open(path) as img:
+            assert img.mode == 'RGB'
+            assert img.size == (100, 100)
+            # Transparent pixels are filled with white
+            assert img.getpixel((50, 50)) == (255, 255, 255)
+
+        renders = []
+        monkeypatch.setattr(avatar_renditions, '_render', lambda *args: renders.append(args))
+        assert avatar_renditions.rendition_path(source, (100, 100)) == path
+        assert MeetingSlideService._crop_image_to_aspect_ratio(
+            source, 100 * avatar_renditions.EMU_PER_INCH // avatar_renditions.RENDITION_DPI,
+            100 * avatar_renditions.EMU_PER_INCH // avatar_renditions.RENDITION_DPI) == path
+        assert renders == []
+
+
+def test_replaced_avatar_gets_a_new_rendition(app, avatar):
+    with app.app_context():
+        old = avatar_renditions.rendition_path(str(avatar), (100, 50))
+        Image.new('RGB', (50, 50), (0, 0, 255)).save(avatar)
+        os.utime(avatar, ns=(1, 1))
+
+        new = avatar_renditions.rendition_path(str(avatar), (100, 50))
+        assert new != old
+        assert os.listdir(app.config['AVATAR_RENDITION_DIR']) == [os.path.basename(new)]
+        with Image.open(new) as img:
+            # Small sources are cropped but not scaled up
+            assert img.size == (50, 25)
+            assert img.getpixel((0, 0)) == (0, 0, 255)
+
+
+def test_unreadable_avatar_has_no_rendition(app, avatar):
+    avatar.write_bytes(b'not an image')
+    with app.app_context():
+        assert avatar_renditions.rendition_path(str(avatar), (10, 10)) is None
+        assert avatar_renditions.rendition_bytes(str(avatar)) is None
+        assert not os.path.exists(app.config['AVATAR_RENDITION_DIR'])
@@ -0,0 +1,92 @@
+"""Tests for the single-pass streaming SQL dump parser."""
+import types
+
+import pytest
+
+from app.services.backup_parser import SQLBackupParser
+from app.services.legacy_migration_service import LegacyMigrationService
+
+DUMP = """-- MySQL dump 10.13
+/*!40101 SET @OLD_CHARACTER_SET_CLIENT=@@CHARACTER_SET_CLIENT */;
+DROP TABLE IF EXISTS `Contacts`;
+CREATE TABLE `Contacts` (
+  `id` int(11) NOT NULL AUTO_INCREMENT,
+  `Name` varchar(100) DEFAULT NULL COMMENT 'full; name',
+  `Notes` varchar(100) DEFAULT NULL,
+  PRIMARY KEY (`id`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+LOCK TABLES `Contacts` WRITE;
+/*!40000 ALTER TABLE `Contacts` DISABLE KEYS */;
+INSERT INTO `Contacts` VALUES (1,'O\\'Brien; Pat',NULL),(2,"Dash -- not a comment",'x(y)');
+INSERT INTO `Unknown` VALUES (9,'skipped');
+UNLOCK TABLES;
+INSERT INTO `contacts` VALUES (3,'Lee',';');
+"""
+
+EXPECTED_ROWS = [
+    ('contacts', [1, "O'Brien; Pat", None]),
+    ('contacts', [2, 'Dash -- not a comment', 'x(y)']),
+    ('contacts', [3, 'Lee', ';']),
+]
+
+
+@pytest.fixture
+def dump_path(tmp_path):
+    path = tmp_path / 'backup.sql'
+    path.write_text(DUMP, encoding='utf-8')
+    return str(path)
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 7, 64, 1 << 20])
+def test_rows_are_identical_for_any_chunk_boundary(dump_path, chunk_size):
+    items = list(SQLBackupParser().iter_rows(dump_path, chunk_size=chunk_size))
+
+    assert [item for item in items if item[0] != 'ddl'] == EXPECTED_ROWS
+    [(key, (table, ddl))] = [item for item in items if item[0] == 'ddl']
+    assert table == 'Contacts'
+    assert ddl.startswith('CREATE TABLE `Contacts`') and "'full; name'" in ddl
+
+
+def test_iter_rows_is_lazy(dump_path):
+    rows = SQLBackupParser().iter_rows(dump_path)
+    assert isinstance(rows, types.GeneratorType)
+    assert next(rows)[0] == 'ddl'
+
+
+def test_parse_keeps_its_dict_shape(dump_path):
+    data = SQLBackupParser().parse(dump_path)
+
+    assert set(data) == {'ddl', 'contacts'}
+    assert data['contacts'] == [row for _, row in EXPECTED_ROWS]
+    assert list(data['ddl']) == ['Contacts']
+
+
+def test_tables_are_read_one_at_a_time(dump_path, monkeypatch):
+    parser = SQLBackupParser()
+    assert parser.table_keys(dump_path) == {'ddl', 'contacts'}
+    assert list(parser.read_ddl(dump_path)) == ['Contacts']
+
+    parsed = []
+    original = parser.parse_simple
+    monkeypatch.setattr(parser, 'parse_simple', lambda text: parsed.append(text) or original(text))
+    assert parser.read_table(dump_path, 'users') == []
+    assert parsed == []  # other tables' values are skipped, not parsed
+    assert parser.read_table(dump_path, 'contacts') == [row for _, row in EXPECTED_ROWS]
+
+
+def test_legacy_migration_loads_streamed_statements(tmp_path):
+    path = tmp_path / 'v1.sql'
+    path.write_text(
+        "CREATE TABLE `Contacts` (`id` int(11) NOT NULL, `Name` varchar(100), `Notes` text) "
+        "ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;\n"
+        "LOCK TABLES `Contacts` WRITE;\n"
+        "INSERT INTO `Contacts` VALUES (1,'O\\'Brien; Pat',NULL),(2,'Lee',';');\n"
+        "UNLOCK TABLES;\n", encoding='utf-8')
+    service = LegacyMigrationService(str(path), target_club_id=1)
+    service.SCRIPT_BATCH_SIZE = 1  # one executescript per statement
+    service.load_v1_data()
+    try:
+        rows = service.cursor.execute("SELECT id, Name, Notes FROM `Contacts` ORDER BY id").fetchall()
+        assert [tuple(row) for row in rows] == [(1, "O'Brien; Pat", None), (2, 'Lee', ';')]
+    finally:
+        service.conn.close()
@@ -0,0 +1,72 @@
+"""Tests for the per-meeting booking version counter."""
+from datetime import date
+
+from app import db
+from app.models import Contact, Meeting, SessionLog, SessionType
+from app.models.roster import MeetingRole
+from app.services.booking_state import (
+    bump_booking_version,
+    get_booking_version,
+)
+from app.services.event_bus import booking_topic, event_bus
+from app.services.role_service import RoleService
+
+
+def _seed_meeting(club):
+    meeting = Meeting(Meeting_Number=1, Meeting_Date=date.today(),
+                      status='not started', club_id=club.id)
+    contact = Contact(Name='Alice', Email='alice@example.com')
+    role = MeetingRole(name='Timer', type='meeting', needs_approval=False,
+                       has_single_owner=True, is_member_only=False)
+    db.session.add_all([meeting, contact, role])
+    db.session.commit()
+    session_type = SessionType(role_id=role.id, Title='Timer')
+    db.session.add(session_type)
+    db.session.commit()
+    log = SessionLog(meeting_id=meeting.id, Type_ID=session_type.id,
+                     Meeting_Number=meeting.Meeting_Number)
+    db.session.add(log)
+    db.session.commit()
+    return meeting, contact, log
+
+
+def test_version_is_stable_until_bumped(app):
+    with app.app_context():
+        first = get_booking_version(42)
+        assert get_booking_version(42) == first
+        assert bump_booking_version(42) > first
+        assert get_booking_version(42) > first
+
+
+def test_version_reads_run_no_queries(app, record_queries):
+    with app.app_context():
+        get_booking_version(7)
+
+        with record_queries() as statements:
+            for _ in range(10):
+                get_booking_version(7)
+
+        assert statements == []
+
+
+def test_role_changes_bump_version(app, default_club):
+    with app.app_context():
+        meeting, contact, log = _seed_meeting(default_club)
+        before = get_booking_version(meeting.id)
+
+        RoleService.book_meeting_role(log, contact.id)
+        after_book = get_booking_version(meeting.id)
+        assert after_book > before
+
+        RoleService.cancel_meeting_role(log, contact.id)
+        assert get_booking_version(meeting.id) > after_book
+
+
+def test_bump_publishes_booking_topic(app):
+    with app.app_context():
+        q = event_bus.listen(booking_topic(3))
+        try:
+            version = bump_booking_version(3)
+            assert q.get_nowait() == str(version)
+        finally:
+            event_bus.remove_listener(booking_topic(3), q)
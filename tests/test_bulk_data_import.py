@@ -0,0 +1,258 @@
+"""Tests for the bulk mode of the SQL backup importer."""
+from app import cache, db
+from app.commands.import_data import import_data
+from app.constants import GLOBAL_CLUB_ID
+from app.models import (
+    Club, Contact, ContactClub, ExComm, Meeting, MeetingRole, OwnerMeetingRoles, Roster, SessionLog,
+    SessionType, Vote,
+)
+from app.models.voting import MeetingAwardWinner
+from app.services.bulk_data_import_service import BulkDataImportService
+
+CLUB_NO = '777001'
+
+# Source schemas as read by DataImportService (see the import_* docstrings)
+MEDIA = [(1, None, 'https://example.com/m1.mp4', 'video')]
+CONTACTS = [
+    (1, 'Alice Wong', None, '2023-01-01', 'Member', 0, None, '111', None, 'alice@x.com', 'PN-1',
+     None, None, None, None, None),
+    (2, 'Bob Lee', None, '2023-01-01', 'Member', 0, None, '222', None, 'bob@x.com', 'PN-2', 1, None, None, None, None),
+    (3, 'Cara Diaz', None, '2023-01-01', 'Guest', 0, None, None, None, None, None, 'PN-1', None, None, None, None),
+    # Same person exported twice: matched by email, not created again
+    (4, 'Alice W.', None, '2023-01-01', 'Member', 0, None, None, None, 'alice@x.com', None,
+     None, None, None, 'DTM', None),
+]
+MEETING_ROLES = [
+    (10, 'Prepared Speaker', 'icon', 'standard'),
+    (11, 'Timer', 'icon', 'standard'),
+]
+SESSION_TYPES = [
+    (20, 'Prepared Speech', 0, 5, 7, 0, 1, 1, 0, 10),
+    (21, 'Timer Report', 0, 1, 2, 0, 1, 0, 0, 11),
+    # Standard type missing from the target: falls back to Generic
+    (22, 'Retired Segment', 0, 1, 2, 0, 1, 0, 0, None),
+]
+
+
+def _meeting(number, day, tt=None, speaker=None):
+    return (number, number, f'2024-01-{day:02d}', 'default.csv', 'WOD', tt, None, speaker, None,
+            '19:00:00', 1, f'Meeting {number}', 'Keynote Speech', None, 'finished', 1, None, None, None)
+
+
+def _log(source_id, meet_no, type_id, owner, seq, title, credential=None, project=None, code=None):
+    return (source_id, meet_no, type_id, owner, '19:10:00', 5, 7, seq, None, title, project,
+            'Completed', credential, code, 'active', 'Presentation Mastery')
+
+
+MEETINGS = [_meeting(n, n - 300, tt=1, speaker=2) for n in range(301, 304)]
+SESSION_LOGS = []
+for n in range(301, 304):
+    SESSION_LOGS += [
+        _log(len(SESSION_LOGS) + 1, n, 20, 1, 1, f'Speech {n}', code='PM1'),
+        _log(len(SESSION_LOGS) + 2, n, 21, 2, 2, 'Timer'),
+        # Shared role: a second owner joins the same log
+        _log(len(SESSION_LOGS) + 3, n, 21, 3, 2, 'Timer'),
+        _log(len(SESSION_LOGS) + 4, n, 22, 3, 3, 'Networking'),
+    ]
+# Duplicate of the first speech carrying a credential
+SESSION_LOGS.append(_log(99, 301, 20, 1, 1, 'Speech 301', credential='DTM', code='PM1'))
+ROSTER = [(1, 301, 1, 'Early Bird', 1, 'Member'), (2, 301, 2, 'Early Bird', 3, 'Guest'),
+          (3, 301, 2, 'Early Bird', 3, 'Guest')]
+VOTES = [(1, 301, 'v1', 'speaker', 1, None, None, None), (2, 301, 'v1', 'speaker', 1, None, None, None),
+         (3, 302, 'v2', 'table-topic', 2, None, None, None)]
+EXCOMM = [(1, 1, '24H1', '2024-01-01', '2024-06-30', 'Builders', 1, 2, None, None, None, None, None, None)]
+
+
+def _sql(value):
+    if value is None:
+        return 'NULL'
+    if isinstance(value, str):
+        return "'" + value.replace("'", "\\'") + "'"
+    return str(value)
+
+
+def _write_dump(path, tables):
+    lines = []
+    for table, rows in tables.items():
+        values = ','.join('(' + ','.join(_sql(v) for v in row) + ')' for row in rows)
+        lines.append(f"INSERT INTO `{table}` VALUES {values};")
+    path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+    return str(path)
+
+
+def _seed_target():
+    """Global roles/types plus the club the backup is imported into."""
+    speaker = MeetingRole(name='Prepared Speaker', type='standard', needs_approval=False,
+                          has_single_owner=True, club_id=GLOBAL_CLUB_ID)
+    timer = MeetingRole(name='Timer', type='standard', needs_approval=False,
+                        has_single_owner=False, club_id=GLOBAL_CLUB_ID)
+    db.session.add_all([speaker, timer, Club(club_no=CLUB_NO, club_name='Import Club')])
+    db.session.flush()
+    db.session.add_all([
+        SessionType(Title='Prepared Speech', role_id=speaker.id, club_id=GLOBAL_CLUB_ID),
+        SessionType(Title='Timer Report', role_id=timer.id, club_id=GLOBAL_CLUB_ID),
+        SessionType(Title='Generic', club_id=GLOBAL_CLUB_ID),
+    ])
+    db.session.commit()
+
+
+def _reset():
+    db.session.remove()
+    db.drop_all()
+    db.create_all()
+    cache.clear()
+
+
+def _snapshot():
+    names = dict(db.session.query(Contact.id, Contact.Name))
+    numbers = dict(db.session.query(Meeting.id, Meeting.Meeting_Number))
+    titles = {log.id: log.Session_Title for log in SessionLog.query}
+    return {
+        'contacts': sorted((c.Name, c.Email, c.Phone_Number, c.Member_ID, c.first_name, c.last_name,
+                            names.get(c.Mentor_ID), c.credentials) for c in Contact.query),
+        'contact_clubs': sorted(names[cc.contact_id] for cc in ContactClub.query),
+        'meetings': sorted((m.Meeting_Number, m.Meeting_Date, m.status, m.Start_Time, m.media_id is not None)
+                           for m in Meeting.query),
+        'awards': sorted((numbers[w.meeting_id], w.award_category, names[w.contact_id])
+                         for w in MeetingAwardWinner.query),
+        'logs': sorted((numbers[log.meeting_id], log.Meeting_Seq, log.Session_Title or '', log.session_type.Title,
+                        log.Status, log.project_code or '', log.pathway or '', log.section_id is not None)
+                       for log in SessionLog.query),
+        'owners': sorted((numbers[o.meeting_id], titles.get(o.session_log_id) or '', names[o.contact_id],
+                          o.credential or '') for o in OwnerMeetingRoles.query),
+    }
+
+
+def _import(app, path, *args):
+    result = app.test_cli_runner().invoke(import_data, ['--file', path, '--club-no', CLUB_NO, *args])
+    assert result.exit_code == 0, result.output
+    assert 'Import completed successfully.' in result.output, result.output
+    return result.output
+
+
+def test_bulk_import_matches_row_by_row_import(app, default_club, tmp_path):
+    path = _write_dump(tmp_path / 'backup.sql', {
+        'Media': MEDIA, 'Contacts': CONTACTS, 'Meetings': MEETINGS, 'meeting_roles': MEETING_ROLES,
+        'session_types': SESSION_TYPES, 'Session_Logs': SESSION_LOGS,
+    })
+    with app.app_context():
+        _seed_target()
+    _import(app, path)
+    with app.app_context():
+        expected = _snapshot()
+        _reset()
+        _seed_target()
+
+    output = _import(app, path, '--bulk', '--chunk-size', '4')
+    assert 'session_logs: 9 row(s) written' in output
+    assert output.count('[session_logs] done in') == 1
+    assert 'written in' not in output  # each table's time is reported once
+    with app.app_context():
+        assert _snapshot() == expected
+        assert len(expected['owners']) == 12  # 3 x (speaker, 2 timers, generic)
+
+    # Importing the same backup again adds nothing
+    _import(app, path, '--bulk')
+    with app.app_context():
+        assert _snapshot() == expected
+
+
+def test_import_reads_the_backup_table_by_table(app, default_club, tmp_path, monkeypatch):
+    from app.services.backup_parser import SQLBackupParser
+
+    path = _write_dump(tmp_path / 'backup.sql', {'Contacts': CONTACTS, 'Meetings': MEETINGS})
+    with app.app_context():
+        _seed_target()
+
+    read = []
+    original = SQLBackupParser.read_table
+    monkeypatch.setattr(SQLBackupParser, 'parse', None)  # never loads every table at once
+    monkeypatch.setattr(SQLBackupParser, 'read_table',
+                        lambda self, file_path, key: read.append(key) or original(self, file_path, key))
+    _import(app, path, '--bulk')
+    assert read == ['contacts', 'meetings']
+    with app.app_context():
+        assert Meeting.query.count() == 3
+
+
+def test_bulk_import_writes_roster_votes_and_excomm(app, default_club, tmp_path):
+    path = _write_dump(tmp_path / 'backup.sql', {
+        'Contacts': CONTACTS[:3], 'excomm': EXCOMM, 'Meetings': MEETINGS, 'roster': ROSTER, 'votes': VOTES,
+    })
+    with app.app_context():
+        _seed_target()
+        db.session.add(MeetingRole(name='President', type='officer', needs_approval=False,
+                                   has_single_owner=True, club_id=GLOBAL_CLUB_ID))
+        db.session.commit()
+
+    _import(app, path, '--bulk')
+    with app.app_context():
+        club_id = Club.query.filter_by(club_no=CLUB_NO).one().id
+        excomm = ExComm.query.filter_by(club_id=club_id).one()
+        assert [o.meeting_role.name for o in excomm.officers] == ['President']
+        assert {m.excomm_id for m in Meeting.query} == {excomm.id}
+
+        roster = Roster.query.order_by(Roster.order_number).all()
+        assert [(r.order_number, r.ticket.name, r.contact.Name) for r in roster] == [
+            (1, 'Early Bird', 'Alice Wong'), (2, 'Early Bird', 'Cara Diaz')]
+        assert sorted((v.meeting.Meeting_Number, v.award_category) for v in Vote.query) == [
+            (301, 'speaker'), (302, 'table-topic')]
+
+
+def test_bulk_meeting_import_ignores_other_clubs_meeting_numbers(app, default_club):
+    with app.app_context():
+        _seed_target()
+        db.session.add(Meeting(Meeting_Number=301, club_id=default_club.id))
+        db.session.commit()
+
+        service = BulkDataImportService(CLUB_NO)
+        service.resolve_club()
+        service.import_meetings(MEETINGS)
+
+        club_id = Club.query.filter_by(club_no=CLUB_NO).one().id
+        assert sorted(m.Meeting_Number for m in Meeting.query.filter_by(club_id=club_id)) == [301, 302, 303]
+        assert db.session.get(Meeting, service.meeting_map[301]).club_id == club_id
+
+
+def test_bulk_session_log_import_does_no_per_row_lookups(app, default_club, record_queries):
+    meetings = [_meeting(n, 1 + n % 28) for n in range(400, 440)]
+    logs = [_log(i, 400 + i % 40, 20, 1 + i % 3, i // 40, f'Speech {i}') for i in range(400)]
+
+    with app.app_context():
+        _seed_target()
+        service = BulkDataImportService(CLUB_NO, chunk_size=100)
+        service.resolve_club()
+        service.import_contacts(CONTACTS[:3])
+        service.import_meetings(meetings)
+        service.import_meeting_roles(MEETING_ROLES)
+        service.import_session_types(SESSION_TYPES)
+
+        with record_queries() as statements:
+            service.import_session_logs(logs)
+
+        assert SessionLog.query.count() == 400
+        assert OwnerMeetingRoles.query.count() == 400
+        assert service.timings['session_logs'][0] == 400
+        # SQLite cannot return ids of a multi-row insert in order, so new
+        # logs are inserted one by one; everything else is per table or chunk.
+        others = [s for s in statements if not s.startswith('INSERT INTO "Session_Logs"')]
+        assert len(statements) - len(others) == 400
+        assert len(others) < 60, others
+
+
+def test_bulk_import_refreshes_the_chat_name_index(app, default_club):
+    from app.services.name_resolver import get_name_index
+
+    with app.app_context():
+        _seed_target()
+        service = BulkDataImportService(CLUB_NO)
+        service.resolve_club()
+        index = get_name_index(service.club_id)
+        assert index.search('Alice') == [] and index.meetings_by_number == {}
+
+        service.import_contacts(CONTACTS[:3])
+        service.import_meetings(MEETINGS)
+
+        index = get_name_index(service.club_id)
+        assert [c.name for c in index.search('Alice')] == ['Alice Wong']
+        assert sorted(index.meetings_by_number) == [301, 302, 303]
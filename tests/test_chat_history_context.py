@@ -1,8 +1,10 @@
 import pytest
 from unittest.mock import MagicMock, patch
 from flask import current_app
-from app import db, cache
-from app.models import ChatMessage, User, Club
+from app import db
+from app.auth.permissions import Permissions
+from app.models import AuthRole, ChatMessage, ChatSummary, Permission
+from app.services import chat_summaries
 from app.services.chat_history_context import ChatHistoryContext
 from app.services.chat_service import ChatService
 
@@ -21,7 +23,6 @@ def test_chat_history_partitioning(app, staff_user, default_club):
             ChatMessage(id=5, user_id=staff_user.id, club_id=default_club.id, role='user', content='Msg E'),
         ]
 
-        # We mock ChatService.generate_summary to avoid real LLM call
         with patch.object(ChatService, 'generate_summary', return_value="Mock summary of Msg A, B") as mock_summarize:
             with ChatHistoryContext(staff_user, default_club.id, chat_history_list=messages, locale='en') as ctx:
                 # Active limit is 3, so last 3 messages are active
@@ -30,66 +31,111 @@ def test_chat_history_partitioning(app, staff_user, default_club):
                 assert ctx.messages[1]['content'] == 'Msg D'
                 assert ctx.messages[2]['content'] == 'Msg E'
 
-                # Older limit messages are first 2
-                # ChatHistoryContext should call generate_summary
-                mock_summarize.assert_called_once()
-                assert ctx.summary == "Mock summary of Msg A, B"
+                # Older messages are summarized in the background, never during the turn
+                mock_summarize.assert_not_called()
+                assert ctx.summary == ""
 
-def test_chat_summary_caching_and_incremental_update(app, staff_user, default_club):
-    """Test that summary is cached and incrementally updated with new older messages."""
-    cache_key = f"chat_summary_{staff_user.id}_{default_club.id}"
-    
+
+def _add_messages(user_id, club_id, *contents):
+    roles = ['user', 'assistant']
+    messages = [
+        ChatMessage(user_id=user_id, club_id=club_id, role=roles[i % 2], content=content, mode='ai')
+        for i, content in enumerate(contents)
+    ]
+    db.session.add_all(messages)
+    db.session.commit()
+    return [msg.id for msg in messages]
+
+
+def test_chat_summary_is_persisted_and_incrementally_updated(app, staff_user, default_club):
+    """Test that refresh() folds messages leaving the active window into the stored summary."""
     with app.app_context():
-        cache.clear()
         app.config['CHAT_HISTORY_ACTIVE_LIMIT'] = 2
 
-        # 1. Initially, create 4 messages (with limit 2, 2 older)
-        messages_first = [
-            ChatMessage(id=1, user_id=staff_user.id, club_id=default_club.id, role='user', content='Msg A'),
-            ChatMessage(id=2, user_id=staff_user.id, club_id=default_club.id, role='assistant', content='Msg B'),
-            ChatMessage(id=3, user_id=staff_user.id, club_id=default_club.id, role='user', content='Msg C'),
-            ChatMessage(id=4, user_id=staff_user.id, club_id=default_club.id, role='assistant', content='Msg D'),
-        ]
+        # 1. Initially, 4 messages (with limit 2, 2 older)
+        ids = _add_messages(staff_user.id, default_club.id, 'Msg A', 'Msg B', 'Msg C', 'Msg D')
 
         with patch.object(ChatService, 'generate_summary', return_value="Summary A-B") as mock_summarize:
-            with ChatHistoryContext(staff_user, default_club.id, chat_history_list=messages_first, locale='en') as ctx:
-                assert ctx.summary == "Summary A-B"
-                mock_summarize.assert_called_once()
-                
-            # Verify it's cached
-            cached = cache.get(cache_key)
-            assert cached is not None
-            assert cached['summary'] == "Summary A-B"
-            assert cached['last_msg_id'] == 2
+            assert chat_summaries.refresh(staff_user.id, default_club.id) is True
+            mock_summarize.assert_called_once_with('', "user: Msg A\nassistant: Msg B\n", raise_errors=True)
 
-        # 2. Subsequent call with same messages shouldn't call generate_summary again
+        stored = ChatSummary.query.filter_by(user_id=staff_user.id, club_id=default_club.id).one()
+        assert (stored.summary, stored.last_message_id) == ("Summary A-B", ids[1])
+
+        # 2. Nothing new has left the window, so no further LLM call
         with patch.object(ChatService, 'generate_summary') as mock_summarize:
-            with ChatHistoryContext(staff_user, default_club.id, chat_history_list=messages_first, locale='en') as ctx:
-                assert ctx.summary == "Summary A-B"
-                mock_summarize.assert_not_called()
+            assert chat_summaries.refresh(staff_user.id, default_club.id) is False
+            mock_summarize.assert_not_called()
 
-        # 3. Add 2 more messages (now total 6, with limit 2, 4 older)
-        # The new older messages are 3 and 4 (since 5 and 6 are active)
-        messages_second = messages_first + [
-            ChatMessage(id=5, user_id=staff_user.id, club_id=default_club.id, role='user', content='Msg E'),
-            ChatMessage(id=6, user_id=staff_user.id, club_id=default_club.id, role='assistant', content='Msg F'),
-        ]
+        # A turn only loads messages above the watermark, plus the stored summary
+        with ChatHistoryContext(staff_user, default_club.id, locale='en') as ctx:
+            assert [m['content'] for m in ctx.messages] == ['Msg C', 'Msg D']
+            assert ctx.summary == "Summary A-B"
+            assert "Summary A-B" in ctx.system_prompt
+
+        # 3. Two more messages push Msg C and D out of the window
+        ids += _add_messages(staff_user.id, default_club.id, 'Msg E', 'Msg F')
+        assert [m.content for m in chat_summaries.recent_messages(staff_user.id, default_club.id)] == \
+            ['Msg C', 'Msg D', 'Msg E', 'Msg F']
 
         with patch.object(ChatService, 'generate_summary', return_value="Summary A-D") as mock_summarize:
-            with ChatHistoryContext(staff_user, default_club.id, chat_history_list=messages_second, locale='en') as ctx:
-                assert ctx.summary == "Summary A-D"
-                # Check that it passed "Summary A-B" as previous summary and only Msg C, D as new text
-                mock_summarize.assert_called_once()
-                args, kwargs = mock_summarize.call_args
-                assert args[0] == "Summary A-B"
-                assert "Msg C" in args[1]
-                assert "Msg D" in args[1]
-                assert "Msg A" not in args[1]
-                
-            # Check cached update
-            cached = cache.get(cache_key)
-            assert cached['summary'] == "Summary A-D"
-            assert cached['last_msg_id'] == 4
+            assert chat_summaries.refresh(staff_user.id, default_club.id) is True
+            args, kwargs = mock_summarize.call_args
+            assert args[0] == "Summary A-B"
+            assert "Msg C" in args[1]
+            assert "Msg D" in args[1]
+            assert "Msg A" not in args[1]
+
+        db.session.expire_all()
+        stored = ChatSummary.query.filter_by(user_id=staff_user.id, club_id=default_club.id).one()
+        assert (stored.summary, stored.last_message_id) == ("Summary A-D", ids[3])
+
+
+def test_failed_summary_keeps_the_previous_one(app, staff_user, default_club):
+    """Test that an LLM failure leaves the stored summary and watermark alone."""
+    with app.app_context():
+        app.config['CHAT_HISTORY_ACTIVE_LIMIT'] = 1
+        _add_messages(staff_user.id, default_club.id, 'Msg A', 'Msg B')
+
+        with patch.object(ChatService, 'get_client', side_effect=ValueError('no key')):
+            with pytest.raises(ValueError):
+                chat_summaries.refresh(staff_user.id, default_club.id)
+            db.session.rollback()
+
+            # Scheduled refreshes log the failure instead of raising
+            chat_summaries.schedule(staff_user.id, default_club.id)
+
+        assert ChatSummary.query.count() == 0
+
+
+def test_reply_schedules_a_summary_refresh(app, client, staff_user, default_club):
+    """Test that sending a message refreshes the summary after the reply is saved."""
+    with app.app_context():
+        perm = Permission.query.filter_by(name=Permissions.CHAT_COMMANDS).first()
+        if not perm:
+            perm = Permission(name=Permissions.CHAT_COMMANDS, description="Chat commands", category="Chat")
+            db.session.add(perm)
+        role = AuthRole.query.filter_by(name='Staff').first()
+        if perm not in role.permissions:
+            role.permissions.append(perm)
+        db.session.commit()
+        app.config['CHAT_HISTORY_ACTIVE_LIMIT'] = 2
+
+    with client.session_transaction() as sess:
+        sess['_user_id'] = str(staff_user.id)
+        sess['_fresh'] = True
+        sess['current_club_id'] = default_club.id
+
+    with patch.object(ChatService, 'generate_summary', return_value="Summary") as mock_summarize:
+        assert client.post('/chat/send', json={'message': '/help'}).status_code == 200
+        mock_summarize.assert_not_called()
+        assert client.post('/chat/send', json={'message': '/help'}).status_code == 200
+        mock_summarize.assert_called_once()
+
+    with app.app_context():
+        stored = ChatSummary.query.one()
+        assert stored.summary == "Summary"
+        assert stored.last_message_id == ChatMessage.query.order_by(ChatMessage.id).all()[1].id
 
 def test_character_ceilings(app, staff_user, default_club):
     """Test that database context and summary ceilings are applied correctly."""
@@ -104,8 +150,11 @@ def test_character_ceilings(app, staff_user, default_club):
         long_summary = "A" * 5000
         long_db_context = "[Database Context for Current Query]\n" + "B" * 4000
 
-        with patch.object(ChatService, 'generate_summary', return_value=long_summary), \
-             patch.object(ChatService, 'get_query_context', return_value=long_db_context):
+        db.session.add(ChatSummary(user_id=staff_user.id, club_id=default_club.id,
+                                   summary=long_summary, last_message_id=1))
+        db.session.commit()
+
+        with patch.object(ChatService, 'get_query_context', return_value=long_db_context):
             with ChatHistoryContext(staff_user, default_club.id, chat_history_list=messages, locale='en') as ctx:
                 # Summary ceiling is 4000 chars
                 assert "[Summary of older conversation in this session]" in ctx.system_prompt
@@ -119,25 +168,56 @@ def test_character_ceilings(app, staff_user, default_club):
                 assert "B" * 2500 in ctx.system_prompt
                 assert "[Context truncated due to size limit...]" in ctx.system_prompt
 
-def test_clear_chat_evicts_cache(app, client, auth, staff_user, default_club):
-    """Test that clearing chat history also evicts the cached summary context."""
-    cache_key = f"chat_summary_{staff_user.id}_{default_club.id}"
-    
-    with app.app_context():
-        # Set cache
-        cache.set(cache_key, {'summary': 'Cached Summary', 'last_msg_id': 1})
-        assert cache.get(cache_key) is not None
 
-    # Log in
-    auth.login(username=staff_user.username, password='password', club_id=default_club.id)
+def test_clear_chat_resets_summary(app, client, staff_user, default_club):
+    """Test that clearing chat history also resets the stored summary."""
+    with app.app_context():
+        perm = Permission.query.filter_by(name=Permissions.CHAT_COMMANDS).first()
+        if not perm:
+            perm = Permission(name=Permissions.CHAT_COMMANDS, description="Chat commands", category="Chat")
+            db.session.add(perm)
+        db.session.add(ChatSummary(user_id=staff_user.id, club_id=default_club.id,
+                                   summary='Stored Summary', last_message_id=1))
+        db.session.commit()
+
+    with client.session_transaction() as sess:
+        sess['_user_id'] = str(staff_user.id)
+        sess['_fresh'] = True
+        sess['current_club_id'] = default_club.id
 
     # Call clear chat route
     response = client.post('/chat/clear')
     assert response.status_code == 200
     
-    # Check cache is evicted
+    # Check the summary is empty
     with app.app_context():
-        assert cache.get(cache_key) is None
+        stored = chat_summaries.get_summary(staff_user.id, default_club.id)
+        assert (stored.summary, stored.last_message_id, stored.generation) == ('', 0, 1)
+
+
+@pytest.mark.parametrize('existing', [True, False])
+def test_refresh_does_not_restore_a_cleared_summary(app, staff_user, default_club, existing):
+    """Test that a refresh running across a clear drops its result."""
+    with app.app_context():
+        app.config['CHAT_HISTORY_ACTIVE_LIMIT'] = 2
+        if existing:
+            db.session.add(ChatSummary(user_id=staff_user.id, club_id=default_club.id,
+                                       summary='Old Summary', last_message_id=0))
+        _add_messages(staff_user.id, default_club.id, 'Msg A', 'Msg B', 'Msg C', 'Msg D')
+
+        def clear_meanwhile(*args, **kwargs):
+            # The user clears the chat while the model is summarizing
+            ChatMessage.query.filter_by(user_id=staff_user.id, club_id=default_club.id).delete()
+            chat_summaries.clear(staff_user.id, default_club.id)
+            db.session.commit()
+            return "Summary A-B"
+
+        with patch.object(ChatService, 'generate_summary', side_effect=clear_meanwhile):
+            assert chat_summaries.refresh(staff_user.id, default_club.id) is False
+
+        db.session.expire_all()
+        stored = chat_summaries.get_summary(staff_user.id, default_club.id)
+        assert (stored.summary, stored.last_message_id) == ('', 0)
 
 def test_failed_db_turn_filtering(app, staff_user, default_club):
     """Test that turns where tools were enforced but not called (failed/hallucinated) are excluded."""
@@ -0,0 +1,136 @@
+"""Tests for AI chat replies streamed from a background run."""
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app import db
+from app.auth.permissions import Permissions
+from app.models import AuthRole as Role, ChatMessage, Permission, User
+from app.services import chat_runs
+from app.services.chat_service import ChatService
+from app.services.chat_tool_executor import ChatToolExecutor
+
+
+@pytest.fixture
+def ai_chat(app, client, staff_user, default_club):
+    with app.app_context():
+        perm = Permission.query.filter_by(name=Permissions.CHAT_AI).first()
+        if not perm:
+            perm = Permission(name=Permissions.CHAT_AI, description="Chat AI", category="Chat")
+            db.session.add(perm)
+        role = Role.query.filter_by(name='Staff').first()
+        if perm not in role.permissions:
+            role.permissions.append(perm)
+        db.session.commit()
+        user_id = User.query.filter_by(username='staff').one().id
+    with client.session_transaction() as sess:
+        sess['_user_id'] = str(user_id)
+        sess['_fresh'] = True
+        sess['current_club_id'] = default_club.id
+    return client
+
+
+def _stream(chunks, final):
+    stream = MagicMock()
+    stream.__enter__.return_value = stream
+    stream.text_stream = iter(chunks)
+    stream.get_final_message.return_value = final
+    return stream
+
+
+def _response(stop_reason, *blocks):
+    response = MagicMock()
+    response.stop_reason = stop_reason
+    response.content = list(blocks)
+    return response
+
+
+def _events(published):
+    return [json.loads(data) for _, data in published]
+
+
+def test_reply_is_streamed_and_saved(app, ai_chat):
+    tool_use = MagicMock(type='tool_use', id='tu1', input={'meeting_identifier': '12'})
+    tool_use.name = 'get_meeting_info'
+    client = MagicMock()
+    client.messages.stream.side_effect = [
+        _stream(['Checking'], _response('tool_use', MagicMock(type='text', text='Checking'), tool_use)),
+        _stream(['Meeting ', '12 is set'], _response('end_turn', MagicMock(type='text', text='Meeting 12 is set'))),
+    ]
+    published = []
+
+    with patch.object(ChatService, 'get_client', return_value=client), \
+         patch.object(ChatToolExecutor, 'execute', return_value={'success': True, 'message': 'ok'}), \
+         patch.object(chat_runs, 'publish', side_effect=lambda topic, data: published.append((topic, data))):
+        res = ai_chat.post('/chat/send', json={'message': 'hello', 'stream': True})
+
+    assert res.status_code == 202
+    data = res.get_json()
+    assert data['pending'] is True
+    assert data['topic'] == f"chat:{data['message_id']}:reply"
+    assert {topic for topic, _ in published} == {data['topic']}
+
+    events = _events(published)
+    assert [e['type'] for e in events] == ['token', 'tool', 'tool', 'token', 'token', 'done']
+    assert [e.get('status') for e in events if e['type'] == 'tool'] == ['running', 'finished']
+    assert events[4]['text'] == 'Meeting 12 is set'
+    assert events[-1]['content'] == 'Meeting 12 is set'
+    assert events[-1]['executed_tools'][0]['name'] == 'get_meeting_info'
+
+    with app.app_context():
+        reply = db.session.get(ChatMessage, events[-1]['message_id'])
+        assert (reply.role, reply.content, reply.mode) == ('assistant', 'Meeting 12 is set', 'ai')
+        assert json.loads(reply.tool_calls)[0]['arguments'] == {'meeting_identifier': '12'}
+
+    status = ai_chat.get(data['status_url']).get_json()
+    assert (status['status'], status['content']) == ('done', 'Meeting 12 is set')
+    assert status['executed_tools'][0]['id'] == 'tu1'
+
+
+def test_failed_run_reports_an_error(app, ai_chat):
+    published = []
+    with patch.object(ChatService, 'get_client', side_effect=ValueError('no key')), \
+         patch.object(chat_runs, 'publish', side_effect=lambda topic, data: published.append((topic, data))):
+        res = ai_chat.post('/chat/send', json={'message': 'hello', 'stream': True})
+
+    assert res.status_code == 202
+    assert _events(published) == [{'type': 'error', 'message': 'Error: no key'}]
+    status = ai_chat.get(res.get_json()['status_url']).get_json()
+    assert status == {'success': True, 'status': 'error', 'message': 'Error: no key'}
+    with app.app_context():
+        assert ChatMessage.query.filter_by(role='assistant').count() == 0
+
+
+def test_reply_topic_is_private(app, ai_chat, default_club):
+    with app.app_context():
+        staff = User.query.filter_by(username='staff').first()
+        other = User(username='other', email='other@example.com', status='active')
+        other.set_password('password')
+        db.session.add(other)
+        db.session.flush()
+        mine = ChatMessage(user_id=staff.id, club_id=default_club.id, role='user', content='hi', mode='ai')
+        theirs = ChatMessage(user_id=other.id, club_id=default_club.id, role='user', content='hi', mode='ai')
+        db.session.add_all([mine, theirs])
+        db.session.commit()
+        mine_id, theirs_id = mine.id, theirs.id
+
+    assert ai_chat.get(f'/chat/replies/{mine_id}').get_json()['status'] == 'pending'
+    assert ai_chat.get(f'/chat/replies/{theirs_id}').status_code == 404
+    assert ai_chat.get(f'/api/events?topic=chat:{theirs_id}:reply').status_code == 403
+    res = ai_chat.get(f'/api/events?topic=chat:{mine_id}:reply')
+    assert res.status_code == 200
+    res.close()
+
+
+def test_later_messages_are_not_taken_for_the_reply(app, ai_chat, staff_user, default_club):
+    # The run is still queued when a command reply lands in the same chat
+    with patch.object(chat_runs, 'submit'):
+        res = ai_chat.post('/chat/send', json={'message': 'hello', 'stream': True})
+    message_id = res.get_json()['message_id']
+    with app.app_context():
+        db.session.add(ChatMessage(user_id=staff_user.id, club_id=default_club.id, role='assistant',
+                                   content='Vote recorded', mode='command'))
+        db.session.commit()
+
+    assert ai_chat.get(f'/chat/replies/{message_id}').get_json()['status'] == 'pending'
@@ -0,0 +1,103 @@
+"""Tests for the per-club role/session-type metadata cache."""
+
+from app import db
+from app.constants import GLOBAL_CLUB_ID
+from app.models import Club, Pathway, PathwayProject, Project, SessionType
+from app.models.roster import MeetingRole
+from app.services.club_metadata import (
+    get_club_metadata,
+    get_pathway_project_codes,
+    invalidate_club_metadata,
+)
+
+
+def _role(name, club_id, award=None):
+    return MeetingRole(name=name, type='standard', award_category=award, club_id=club_id,
+                       needs_approval=False, has_single_owner=True, is_member_only=False)
+
+
+def _seed(default_club):
+    local = Club(club_no='000002', club_name='Local Club')
+    db.session.add(local)
+    db.session.commit()
+    global_id = default_club.id
+    assert global_id == GLOBAL_CLUB_ID
+
+    timer = _role('Timer', global_id)
+    speaker = _role('Speaker', global_id, award='speaker')
+    local_speaker = _role('Speaker', local.id, award='speaker')
+    db.session.add_all([timer, speaker, local_speaker])
+    db.session.commit()
+    db.session.add_all([
+        SessionType(Title='Evaluation', club_id=global_id, role_id=timer.id),
+        SessionType(Title='Generic', club_id=global_id),
+        SessionType(Title='Evaluation', club_id=local.id, role_id=local_speaker.id),
+    ])
+    db.session.commit()
+    return local, local_speaker
+
+
+def test_local_rows_override_global(app, default_club):
+    with app.app_context():
+        local, local_speaker = _seed(default_club)
+        meta = get_club_metadata(local.id)
+
+        local_eval = SessionType.query.filter_by(Title='Evaluation', club_id=local.id).one()
+        assert meta['session_type_ids']['Evaluation'] == local_eval.id
+        assert meta['session_types_by_id'][local_eval.id]['role_name'] == 'Speaker'
+        assert [r['name'] for r in meta['roles']] == ['Speaker', 'Timer']
+        assert meta['roles_by_id'][local_speaker.id]['club_id'] == local.id
+        assert [r['id'] for r in meta['local_roles']] == [local_speaker.id]
+        assert meta['award_categories'] == {'speaker': [local_speaker.id]}
+
+        assert SessionType.get_id_by_title('Generic', local.id) == \
+            SessionType.get_id_by_title('Generic', GLOBAL_CLUB_ID)
+        assert SessionType.get_id_by_title('Missing', local.id) is None
+
+
+def test_reads_are_served_without_queries(app, default_club, record_queries):
+    with app.app_context():
+        local, _ = _seed(default_club)
+        get_club_metadata(local.id)
+        get_pathway_project_codes()
+
+        with record_queries() as statements:
+            SessionType.get_id_by_title('Evaluation', local.id)
+            get_club_metadata(local.id)
+            get_pathway_project_codes()
+        assert statements == []
+
+
+def test_orm_changes_invalidate(app, default_club):
+    with app.app_context():
+        local, _ = _seed(default_club)
+        assert 'Table Topics' not in get_club_metadata(local.id)['session_type_ids']
+
+        # A Global change reaches every club
+        db.session.add(SessionType(Title='Table Topics', club_id=GLOBAL_CLUB_ID))
+        db.session.commit()
+        assert 'Table Topics' in get_club_metadata(local.id)['session_type_ids']
+
+        role = MeetingRole.query.filter_by(name='Timer').one()
+        role.award_category = 'role-taker'
+        db.session.commit()
+        assert get_club_metadata(local.id)['award_categories']['role-taker'] == [role.id]
+
+        path = Pathway(name='Dynamic Leadership', abbr='DL')
+        project = Project(Project_Name='Ice Breaker')
+        db.session.add_all([path, project])
+        db.session.commit()
+        assert get_pathway_project_codes() == {}
+        db.session.add(PathwayProject(path_id=path.id, project_id=project.id, code='1.1', level=1, type='required'))
+        db.session.commit()
+        assert get_pathway_project_codes() == {project.id: {'DL': {'code': '1.1', 'level': 1}}}
+
+
+def test_explicit_invalidation_recompiles(app, default_club, record_queries):
+    with app.app_context():
+        local, _ = _seed(default_club)
+        get_club_metadata(local.id)
+        invalidate_club_metadata(local.id)
+        with record_queries() as statements:
+            get_club_metadata(local.id)
+        assert statements
@@ -0,0 +1,130 @@
+"""Tests for the outgoing email queue and its background sender."""
+from datetime import datetime, timedelta
+
+from flask_mail import Message
+
+from app import db
+from app.models import OutboundEmail
+from app.services import email_outbox
+
+
+def test_queued_mail_shares_one_connection(app, smtp_stub, monkeypatch):
+    # Let the rows pile up instead of draining after each commit
+    monkeypatch.setattr(email_outbox, 'wake', lambda: None)
+    with app.app_context():
+        for i in range(5):
+            email_outbox.enqueue(Message(f'Subject {i}', recipients=[f'user{i}@example.com'], body=f'Body {i}'))
+        db.session.commit()
+    app.config['EMAIL_OUTBOX_BATCH_SIZE'] = 2
+    try:
+        stats = email_outbox.drain(app)
+    finally:
+        app.config['EMAIL_OUTBOX_BATCH_SIZE'] = 20
+
+    assert stats == {'sent': 5, 'retrying': 0, 'failed': 0}
+    assert smtp_stub.connections == 1
+    assert [m['to'] for m in smtp_stub.messages] == [[f'user{i}@example.com'] for i in range(5)]
+    with app.app_context():
+        emails = OutboundEmail.query.all()
+        assert {e.status for e in emails} == {'sent'}
+        assert all(e.body == '' and e.sent_at for e in emails)
+
+
+def test_transient_failure_is_retried_with_backoff(app, smtp_stub):
+    smtp_stub.reject.append('451 Try again later')
+    with app.app_context():
+        email_outbox.enqueue(Message('Hello', recipients=['a@example.com'], body='Hi'))
+        db.session.commit()  # drains inline under TESTING
+
+        email = OutboundEmail.query.one()
+        assert email.status == 'queued'
+        assert email.attempts == 1
+        assert 'Try again later' in email.last_error
+        assert email.next_attempt_at > datetime.now() + timedelta(seconds=20)
+        assert smtp_stub.messages == []
+
+        # Not due yet: a plain drain leaves it alone
+        assert email_outbox.drain(app) == {'sent': 0, 'retrying': 0, 'failed': 0}
+
+    assert email_outbox.drain(app, include_deferred=True)['sent'] == 1
+    assert len(smtp_stub.messages) == 1
+    with app.app_context():
+        email = OutboundEmail.query.one()
+        assert (email.status, email.attempts, email.last_error) == ('sent', 2, None)
+
+
+def test_permanent_rejection_fails_without_retry(app, smtp_stub):
+    smtp_stub.reject.append('550 Mailbox unavailable')
+    with app.app_context():
+        email_outbox.enqueue(Message('Hello', recipients=['gone@example.com'], body='Hi'))
+        db.session.commit()
+
+        email = OutboundEmail.query.one()
+        assert (email.status, email.attempts) == ('failed', 1)
+        assert 'Mailbox unavailable' in email.last_error
+
+
+def test_reset_email_is_queued_and_sent_after_commit(app, client, smtp_stub):
+    from app.models import User
+
+    with app.app_context():
+        user = User(username='resetme', email='resetme@example.com', status='active')
+        user.set_password('password')
+        db.session.add(user)
+        db.session.commit()
+
+    client.post('/reset_password', data={'email': 'resetme@example.com'})
+
+    assert [m['to'] for m in smtp_stub.messages] == [['resetme@example.com']]
+    assert '/reset_password/' in smtp_stub.messages[0]['data']
+    with app.app_context():
+        email = OutboundEmail.query.one()
+        assert (email.kind, email.status) == ('password_reset', 'sent')
+
+
+def test_outbox_commands(app, smtp_stub):
+    smtp_stub.reject.append('550 Mailbox unavailable')
+    with app.app_context():
+        email_outbox.enqueue(Message('Hello', recipients=['a@example.com'], body='Hi'), kind='test')
+        db.session.commit()
+
+    runner = app.test_cli_runner()
+    result = runner.invoke(args=['email:outbox'])
+    assert result.exit_code == 0
+    assert 'queued: 0, sending: 0, sent: 0, failed: 1' in result.output
+    assert 'failed test to a@example.com (1 attempt(s)' in result.output
+    assert 'Mailbox unavailable' in result.output
+
+    result = runner.invoke(args=['email:drain', '--retry-failed'])
+    assert result.exit_code == 0
+    assert 'Queued 1 failed message(s) again.' in result.output
+    assert 'Sent 1, retrying 0, failed 0.' in result.output
+
+
+def test_first_request_drains_mail_left_by_a_dead_worker(app, client, smtp_stub, monkeypatch):
+    with app.app_context():
+        db.session.add_all([
+            # Claimed by a worker that died mid-batch
+            OutboundEmail(sender='club@example.com', recipients='a@example.com', subject='Claimed',
+                          status='sending', claimed_at=datetime.now() - timedelta(hours=1),
+                          next_attempt_at=datetime.now() - timedelta(hours=1)),
+            # Deferred by a worker that restarted before its retry timer fired
+            OutboundEmail(sender='club@example.com', recipients='b@example.com', subject='Deferred',
+                          status='queued', attempts=1, next_attempt_at=datetime.now() - timedelta(minutes=1)),
+        ])
+        db.session.commit()
+
+    class Inline:
+        def submit(self, fn, *args):
+            fn(*args)
+
+    monkeypatch.setitem(app.config, 'EMAIL_OUTBOX_INLINE', False)
+    monkeypatch.setattr(email_outbox, '_get_executor', Inline)
+    monkeypatch.setattr(email_outbox, '_schedule_retry', lambda app: None)
+    monkeypatch.setattr(email_outbox, '_started_pid', None)
+    client.get('/login')
+    client.get('/login')
+
+    assert sorted(m['to'][0] for m in smtp_stub.messages) == ['a@example.com', 'b@example.com']
+    with app.app_context():
+        assert {e.status for e in OutboundEmail.query} == {'sent'}
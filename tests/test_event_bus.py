@@ -0,0 +1,84 @@
+"""Tests for the topic-based event bus and the /api/events stream."""
+from datetime import date
+
+from app import db
+from app.models import Meeting
+from app.services.event_bus import (
+    booking_topic,
+    event_bus,
+    mail_topic,
+    parse_topic,
+    publish,
+    votes_topic,
+)
+
+
+def _meeting(app, club):
+    with app.app_context():
+        meeting = Meeting(Meeting_Number=1, Meeting_Date=date.today(),
+                          status='not started', club_id=club.id)
+        db.session.add(meeting)
+        db.session.commit()
+        return meeting.id
+
+
+def test_parse_topic():
+    assert parse_topic('meeting:5:booking') == ('meeting', 5, 'booking')
+    assert parse_topic('user:2:mail') == ('user', 2, 'mail')
+    assert parse_topic('meeting:5:mail') is None
+    assert parse_topic('meeting:x:votes') is None
+    assert parse_topic('') is None
+
+
+def test_listen_many_tags_events_with_topic():
+    topics = [booking_topic(1), votes_topic(1)]
+    q = event_bus.listen_many(topics)
+    try:
+        publish(votes_topic(1))
+        publish(booking_topic(1), 7)
+        publish(booking_topic(2), 8)
+        assert q.get_nowait() == (votes_topic(1), 'changed')
+        assert q.get_nowait() == (booking_topic(1), '7')
+        assert q.empty()
+    finally:
+        event_bus.remove_listener_many(topics, q)
+    assert booking_topic(1) not in event_bus.listeners
+
+
+def test_event_stream_multiplexes_topics(app, client, default_club, session_login):
+    user_id, _ = session_login()
+    meeting_id = _meeting(app, default_club)
+
+    res = client.get(f'/api/events?topic={mail_topic(user_id)},{booking_topic(meeting_id)}')
+    assert res.status_code == 200
+    assert res.mimetype == 'text/event-stream'
+    chunks = res.response
+    assert next(chunks).decode('utf-8') == "data: connected\n\n"
+
+    publish(booking_topic(meeting_id), 3)
+    assert next(chunks).decode('utf-8') == (
+        f'data: {{"topic": "{booking_topic(meeting_id)}", "data": "3"}}\n\n')
+    res.close()
+
+
+def test_event_stream_rejects_foreign_topics(app, client, default_club, session_login):
+    user_id, _ = session_login()
+    meeting_id = _meeting(app, default_club)
+
+    assert client.get('/api/events').status_code == 400
+    assert client.get(f'/api/events?topic={mail_topic(user_id + 1)}').status_code == 403
+    assert client.get(f'/api/events?topic={booking_topic(meeting_id + 100)}').status_code == 403
+
+
+def test_open_streams_do_not_hold_db_connections(app, client, default_club, session_login):
+    user_id, _ = session_login()
+    meeting_id = _meeting(app, default_club)
+
+    streams = [client.get(f'/api/events?topic={booking_topic(meeting_id)}'),
+               client.get('/api/messages/events')]
+    for res in streams:
+        assert next(res.response).decode('utf-8') == "data: connected\n\n"
+    with app.app_context():
+        assert db.engine.pool.checkedout() == 0
+    for res in streams:
+        res.close()
@@ -0,0 +1,192 @@
+"""Tests for the background export job queue."""
+import io
+import os
+import threading
+import time
+import zipfile
+from datetime import date
+
+import pytest
+
+from app import db
+from app.auth.permissions import Permissions
+from app.models import Club, ExportJob, Meeting, UploadLink
+from app.services import export_jobs
+from app.services.event_bus import event_bus, job_topic
+
+XHR = {'X-Requested-With': 'XMLHttpRequest'}
+
+
+@pytest.fixture
+def job_dir(app, tmp_path, monkeypatch):
+    monkeypatch.setitem(app.config, 'EXPORT_JOB_DIR', str(tmp_path / 'jobs'))
+    monkeypatch.setitem(app.config, 'ARTIFACT_CACHE_DIR', str(tmp_path / 'cache'))
+    return tmp_path / 'jobs'
+
+
+def _meeting(app, club):
+    with app.app_context():
+        meeting = Meeting(Meeting_Number=42, Meeting_Date=date(2026, 3, 5),
+                          status='not started', club_id=club.id)
+        db.session.add(meeting)
+        db.session.commit()
+        return meeting.id
+
+
+def _wait_for(app, job_id, timeout=10):
+    deadline = time.monotonic() + timeout
+    with app.app_context():
+        while time.monotonic() < deadline:
+            job = export_jobs.get_job(job_id)
+            if job.is_done:
+                return job
+            time.sleep(0.02)
+    raise AssertionError(f"job {job_id} did not finish")
+
+
+def test_agenda_export_is_built_by_a_job_and_served_from_disk(app, client, default_club, job_dir, session_login):
+    session_login(Permissions.UPLOAD_MANAGE)
+    meeting_id = _meeting(app, default_club)
+
+    # Scripts get the job and fetch the artifact separately
+    res = client.get(f'/agenda/export/{meeting_id}', headers=XHR)
+    assert res.status_code == 200
+    payload = res.get_json()['job']
+    assert payload['status'] == 'finished'
+    assert client.get(payload['status_url']).get_json()['job']['id'] == payload['id']
+    download = client.get(payload['download_url'])
+    assert download.status_code == 200
+    assert download.mimetype == export_jobs.XLSX_MIMETYPE
+    assert 'Agenda_2026-03-05.xlsx' in download.headers['Content-Disposition']
+    assert download.headers['Cache-Control'] == 'no-cache'
+    assert download.data[:2] == b'PK'
+
+    with app.app_context():
+        job = ExportJob.query.one()
+        assert (job.kind, job.target, job.status, job.progress) == ('agenda_xlsx', str(meeting_id), 'finished', 100)
+        assert job.active_key is None
+        assert os.path.dirname(job.file_path) == app.config['ARTIFACT_CACHE_DIR']
+
+    # Plain requests still download the file directly
+    res = client.get(f'/agenda/export/{meeting_id}')
+    assert res.status_code == 200
+    assert res.data == download.data
+
+
+def test_identical_requests_share_one_running_job(app, client, default_club, job_dir, monkeypatch, session_login):
+    session_login(Permissions.UPLOAD_MANAGE)
+    meeting_id = _meeting(app, default_club)
+    monkeypatch.setitem(app.config, 'EXPORT_JOB_INLINE', False)
+
+    started, release = threading.Event(), threading.Event()
+
+    def slow_builder(job, path, report):
+        started.set()
+        release.wait(5)
+        report(50, 'Half way')
+        with open(path, 'wb') as f:
+            f.write(b'slides')
+        return True
+
+    kind = export_jobs.JOB_KINDS['agenda_pptx']
+    monkeypatch.setitem(export_jobs.JOB_KINDS, 'agenda_pptx', kind._replace(builder=slow_builder))
+
+    first = client.get(f'/agenda/ppt/{meeting_id}', headers=XHR)
+    assert first.status_code == 202
+    job_id = first.get_json()['job']['id']
+    assert started.wait(5)
+
+    events = event_bus.listen(job_topic(job_id))
+    try:
+        second = client.get(f'/agenda/ppt/{meeting_id}', headers=XHR)
+        assert second.status_code == 202
+        assert second.get_json()['job']['id'] == job_id
+        with app.app_context():
+            assert ExportJob.query.count() == 1
+
+        # A browser navigating to the export gets a page that follows the job
+        page = client.get(f'/agenda/ppt/{meeting_id}', headers={'Accept': 'text/html,*/*;q=0.8'})
+        assert page.status_code == 202
+        assert page.mimetype == 'text/html'
+        assert b'export_job.js' in page.data
+        as_json = client.get(f'/agenda/ppt/{meeting_id}', headers={'Accept': 'application/json'})
+        assert as_json.get_json()['job']['id'] == job_id
+
+        release.set()
+        job = _wait_for(app, job_id)
+        assert job.status == 'finished'
+        assert events.get(timeout=5) == '{"status": "running", "progress": 50, "message": "Half way"}'
+    finally:
+        event_bus.remove_listener(job_topic(job_id), events)
+
+    res = client.get(f'/jobs/{job_id}/download')
+    assert res.data == b'slides'
+    assert 'Meeting_42_2026-03-05.pptx' in res.headers['Content-Disposition']
+
+    # Once finished, identical requests are served from the artifact cache
+    third = client.get(f'/agenda/ppt/{meeting_id}')
+    assert third.data == b'slides'
+    with app.app_context():
+        assert ExportJob.query.count() == 1
+
+
+def test_upload_archive_job_packs_every_file(app, client, default_club, job_dir, tmp_path, monkeypatch, session_login):
+    monkeypatch.setitem(app.config, 'UPLOAD_LINK_DIR', str(tmp_path / 'uploads'))
+    session_login(Permissions.UPLOAD_MANAGE)
+    with app.app_context():
+        db.session.add(UploadLink(code='jobzip', title='Club Photos', club_id=default_club.id))
+        db.session.commit()
+
+    folder = tmp_path / 'uploads' / 'jobzip'
+    folder.mkdir(parents=True)
+    assert client.get('/uploads/jobzip/zip', headers=XHR).status_code == 400
+    for name in ('b.txt', 'a.jpg', '.hidden'):
+        (folder / name).write_bytes(name.encode())
+
+    res = client.get('/uploads/jobzip/zip')
+    assert res.status_code == 200
+    assert 'Club Photos.zip' in res.headers['Content-Disposition']
+    with zipfile.ZipFile(io.BytesIO(res.data)) as archive:
+        assert archive.namelist() == ['a.jpg', 'b.txt']
+
+
+def test_jobs_are_private_to_their_club(app, client, default_club, job_dir, session_login):
+    session_login(Permissions.UPLOAD_MANAGE)
+    meeting_id = _meeting(app, default_club)
+    with app.app_context():
+        other = Club(club_no='000777', club_name='Other Club')
+        db.session.add(other)
+        db.session.flush()
+        foreign = ExportJob(kind='agenda_xlsx', target=str(meeting_id), club_id=other.id,
+                            download_name='x.xlsx', status='finished', progress=100)
+        db.session.add(foreign)
+        db.session.commit()
+        foreign_id = foreign.id
+
+    own_id = client.get(f'/agenda/export/{meeting_id}', headers=XHR).get_json()['job']['id']
+
+    assert client.get(f'/jobs/{foreign_id}').status_code == 404
+    assert client.get(f'/jobs/{foreign_id}/download').status_code == 404
+    assert client.get(f'/api/events?topic={job_topic(foreign_id)}').status_code == 403
+    res = client.get(f'/api/events?topic={job_topic(own_id)}')
+    assert res.status_code == 200
+    res.close()
+
+
+def test_failed_build_releases_the_job(app, client, default_club, job_dir, monkeypatch, session_login):
+    session_login(Permissions.UPLOAD_MANAGE)
+    meeting_id = _meeting(app, default_club)
+
+    def broken_builder(job, path, report):
+        raise RuntimeError('template missing')
+
+    kind = export_jobs.JOB_KINDS['agenda_xlsx']
+    monkeypatch.setitem(export_jobs.JOB_KINDS, 'agenda_xlsx', kind._replace(builder=broken_builder))
+
+    res = client.get(f'/agenda/export/{meeting_id}')
+    assert res.status_code == 500
+    assert res.get_data(as_text=True) == 'Error generating XLSX'
+    with app.app_context():
+        job = ExportJob.query.one()
+        assert (job.status, job.active_key, job.file_path) == ('failed', None, None)
+    assert os.listdir(job_dir) == []
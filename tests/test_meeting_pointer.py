@@ -0,0 +1,161 @@
+"""Tests for the per-club meeting pointers behind get_default_meeting_id."""
+from datetime import date
+
+from app import db
+from app.commands.meeting_pointers import rebuild_pointers
+from app.models import Club, Meeting, MeetingPointer, SessionLog, SessionType
+from app.services.meeting_pointer import get_meeting_pointer
+from app.utils import find_default_meeting_id
+
+
+def _meeting(club_id, number, status, with_log=True):
+    meeting = Meeting(Meeting_Number=number, Meeting_Date=date(2026, 1, number),
+                      status=status, club_id=club_id)
+    db.session.add(meeting)
+    db.session.flush()
+    if with_log:
+        session_type = SessionType.query.filter_by(club_id=club_id).first()
+        if session_type is None:
+            session_type = SessionType(Title='Generic', club_id=club_id)
+            db.session.add(session_type)
+            db.session.flush()
+        db.session.add(SessionLog(meeting_id=meeting.id, Meeting_Seq=1, Type_ID=session_type.id))
+    return meeting
+
+
+def test_pointer_follows_meeting_lifecycle(app, default_club):
+    with app.app_context():
+        club_id = default_club.id
+        finished = _meeting(club_id, 1, 'finished')
+        unpublished = _meeting(club_id, 2, 'unpublished')
+        upcoming = _meeting(club_id, 3, 'not started')
+        db.session.commit()
+
+        assert get_meeting_pointer(club_id) == {
+            'running_meeting_id': None,
+            'upcoming_meeting_id': upcoming.id,
+            'upcoming_unpublished_meeting_id': unpublished.id,
+            'finished_meeting_id': finished.id,
+        }
+        assert find_default_meeting_id(club_id, False) == upcoming.id
+        assert find_default_meeting_id(club_id, True) == unpublished.id
+
+        upcoming.status = 'running'
+        db.session.commit()
+        assert find_default_meeting_id(club_id, False) == upcoming.id
+
+        upcoming.status = 'finished'
+        db.session.commit()
+        pointer = get_meeting_pointer(club_id)
+        assert pointer['running_meeting_id'] is None
+        assert pointer['upcoming_meeting_id'] is None
+        assert pointer['finished_meeting_id'] == upcoming.id
+
+        db.session.delete(upcoming)
+        db.session.commit()
+        assert get_meeting_pointer(club_id)['finished_meeting_id'] == finished.id
+
+
+def test_meeting_without_agenda_is_not_upcoming_until_logs_exist(app, default_club):
+    with app.app_context():
+        club_id = default_club.id
+        meeting = _meeting(club_id, 1, 'not started', with_log=False)
+        db.session.commit()
+        assert get_meeting_pointer(club_id)['upcoming_meeting_id'] is None
+
+        session_type = SessionType(Title='Generic', club_id=club_id)
+        db.session.add(session_type)
+        db.session.flush()
+        db.session.add(SessionLog(meeting_id=meeting.id, Meeting_Seq=1, Type_ID=session_type.id))
+        db.session.commit()
+        assert get_meeting_pointer(club_id)['upcoming_meeting_id'] == meeting.id
+
+
+def test_rollback_discards_pointer_change(app, default_club):
+    with app.app_context():
+        club_id = default_club.id
+        meeting = _meeting(club_id, 1, 'not started')
+        db.session.commit()
+
+        meeting.status = 'running'
+        db.session.flush()
+        db.session.rollback()
+        db.session.commit()
+
+        assert get_meeting_pointer(club_id)['running_meeting_id'] is None
+
+
+def _pointer_writes(statements):
+    return [s for s in statements if 'meeting_pointers' in s]
+
+
+def test_pointer_is_recomputed_once_per_commit_and_only_for_deciding_changes(app, default_club, record_queries):
+    with app.app_context():
+        club_id = default_club.id
+        meeting = _meeting(club_id, 1, 'not started')
+        db.session.commit()
+        log = SessionLog.query.filter_by(meeting_id=meeting.id).one()
+
+        with record_queries() as statements:
+            meeting.status = 'running'
+            db.session.flush()
+            meeting.Meeting_Date = date(2026, 2, 1)
+            db.session.flush()
+            assert _pointer_writes(statements) == []
+            db.session.commit()
+            assert len(_pointer_writes(statements)) == 1
+
+            statements.clear()
+            log.Meeting_Seq = 2
+            meeting.Meeting_Title = 'Renamed'
+            db.session.commit()
+            assert _pointer_writes(statements) == []
+
+        assert get_meeting_pointer(club_id)['running_meeting_id'] == meeting.id
+
+
+def test_resolver_is_a_single_keyed_lookup(app, default_club, record_queries):
+    with app.app_context():
+        club_id = default_club.id
+        _meeting(club_id, 1, 'finished')
+        db.session.commit()
+
+        with record_queries() as statements:
+            find_default_meeting_id(club_id, True)
+
+        assert len(statements) == 1
+        assert 'meeting_pointers' in statements[0]
+
+
+def test_new_club_gets_pointer_row(app, default_club):
+    with app.app_context():
+        club = Club(club_no='000002', club_name='Second Club')
+        db.session.add(club)
+        db.session.commit()
+        assert get_meeting_pointer(club.id) == {
+            'running_meeting_id': None,
+            'upcoming_meeting_id': None,
+            'upcoming_unpublished_meeting_id': None,
+            'finished_meeting_id': None,
+        }
+
+
+def test_rebuild_command_repairs_drift(app, default_club):
+    with app.app_context():
+        club_id = default_club.id
+        finished = _meeting(club_id, 1, 'finished')
+        db.session.commit()
+
+        # Simulate an edit that bypassed the ORM
+        db.session.execute(db.delete(MeetingPointer))
+        db.session.commit()
+        assert get_meeting_pointer(club_id) is None
+        # Still resolvable while the row is missing
+        assert find_default_meeting_id(club_id, False) == finished.id
+
+    result = app.test_cli_runner().invoke(rebuild_pointers)
+    assert result.exit_code == 0, result.output
+    assert 'Done. 1 club pointer(s) rebuilt.' in result.output
+
+    with app.app_context():
+        assert get_meeting_pointer(club_id)['finished_meeting_id'] == finished.id
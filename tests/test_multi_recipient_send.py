@@ -164,9 +164,9 @@ class MultiRecipientSendTestCase(unittest.TestCase):
         self.assertEqual(first_chunk.decode('utf-8'), "data: connected\n\n")
 
         # Now, we need to test that sending a message announces it to recv1
-        # Let's announce an event to recv1 directly via announcer
-        from app.messages_routes import announcer
-        announcer.announce(self.recv1.id, 'new_message')
+        # Let's announce an event to recv1 directly via the event bus
+        from app.services.event_bus import mail_topic, publish
+        publish(mail_topic(self.recv1.id), 'new_message')
         
         # Read next chunk
         second_chunk = next(iterator)
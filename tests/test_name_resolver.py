@@ -0,0 +1,104 @@
+"""Tests for the per-club contact/meeting name index used by chat."""
+from datetime import date
+
+from app import db
+from app.models import Contact, ContactClub, Meeting
+from app.services import name_resolver
+from app.services.chat_service import ChatService
+from app.services.chat_tool_executor import ChatToolExecutor
+
+
+def _add_contact(club, name, first_name=None, last_name=None):
+    contact = Contact(Name=name, first_name=first_name, last_name=last_name, Type='Member')
+    db.session.add(contact)
+    db.session.flush()
+    db.session.add(ContactClub(contact_id=contact.id, club_id=club.id))
+    return contact
+
+
+def test_search_ranks_and_finds_chinese_names(app, default_club):
+    with app.app_context():
+        _add_contact(default_club, 'Anna Bell')
+        _add_contact(default_club, 'Ann Lee')
+        _add_contact(default_club, 'Joanne Ann')
+        _add_contact(default_club, '张伟')
+        db.session.commit()
+
+        index = name_resolver.get_name_index(default_club.id)
+        assert [c.name for c in index.search('ann')] == ['Ann Lee', 'Anna Bell', 'Joanne Ann']
+        assert [c.name for c in index.search('伟')] == ['张伟']
+        assert [c.name for c in index.names_in('分配张伟为计时员')] == ['张伟']
+        assert index.search('Anabel') == []
+        assert [c.name for c in index.search('Anabel', fuzzy=True)][:1] == ['Anna Bell']
+
+
+def test_resolve_contact_keeps_lookup_order(app, default_club):
+    with app.app_context():
+        _add_contact(default_club, 'John Doe')
+        _add_contact(default_club, 'John Doe Jr')
+        _add_contact(default_club, 'Mary Smith', first_name='Mary', last_name='Smith')
+        _add_contact(default_club, 'Bob')
+        db.session.commit()
+
+        assert ChatToolExecutor.resolve_contact('John Doe', default_club.id).Name == 'John Doe'
+        # Ambiguous partial names resolve to nothing
+        assert ChatToolExecutor.resolve_contact('John', default_club.id) is None
+        assert ChatToolExecutor.resolve_contact('Jr', default_club.id).Name == 'John Doe Jr'
+        assert ChatToolExecutor.resolve_contact('mary q smith', default_club.id).Name == 'Mary Smith'
+        assert ChatToolExecutor.resolve_contact('Bob', None) is None
+
+
+def test_index_follows_contact_and_meeting_changes(app, default_club):
+    with app.app_context():
+        contact = _add_contact(default_club, 'Carol King')
+        db.session.add(Meeting(club_id=default_club.id, Meeting_Number=501,
+                               Meeting_Date=date(2026, 5, 1), status='not started'))
+        db.session.commit()
+
+        assert ChatToolExecutor.resolve_contact('Carol', default_club.id).id == contact.id
+        assert ChatToolExecutor.resolve_meeting('#501', default_club.id).Meeting_Number == 501
+        assert ChatToolExecutor.resolve_meeting('2026-05-01', default_club.id).Meeting_Number == 501
+
+        contact.Name = 'Caroline Queen'
+        db.session.add(Meeting(club_id=default_club.id, Meeting_Number=502,
+                               Meeting_Date=date(2026, 5, 8), status='not started'))
+        db.session.commit()
+
+        assert ChatToolExecutor.resolve_contact('Carol King', default_club.id) is None
+        assert ChatToolExecutor.resolve_contact('Queen', default_club.id).id == contact.id
+        assert ChatToolExecutor.resolve_meeting('502', default_club.id).Meeting_Date == date(2026, 5, 8)
+
+        ctx = ChatService.get_query_context('Who is Carolin?', default_club.id)
+        assert "Name='Caroline Queen'" in ctx
+
+        db.session.delete(contact)
+        db.session.commit()
+        assert ChatToolExecutor.resolve_contact('Queen', default_club.id) is None
+
+
+def test_new_contact_joins_memberships_written_without_the_orm(app, default_club):
+    with app.app_context():
+        # Membership first, as the bulk importer writes it with a Core insert
+        db.session.execute(db.insert(ContactClub).values(contact_id=4242, club_id=default_club.id))
+        db.session.commit()
+        assert name_resolver.get_name_index(default_club.id).search('Dana') == []
+
+        db.session.add(Contact(id=4242, Name='Dana Ross', Type='Member'))
+        db.session.commit()
+        assert [c.name for c in name_resolver.get_name_index(default_club.id).search('Dana')] == ['Dana Ross']
+
+
+def test_lookups_run_without_sql_once_built(app, default_club, record_queries):
+    with app.app_context():
+        _add_contact(default_club, 'Dana White')
+        db.session.add(Meeting(club_id=default_club.id, Meeting_Number=601,
+                               Meeting_Date=date(2026, 6, 1), status='not started'))
+        db.session.commit()
+        name_resolver.get_name_index(default_club.id)
+
+        with record_queries() as statements:
+            ctx = ChatService.get_query_context('assign Dana White to meeting 601 next week', default_club.id)
+
+        assert "Name='Dana White'" in ctx
+        assert 'Meeting #601 exists' in ctx
+        assert statements == []
@@ -0,0 +1,79 @@
+"""Tests for the cached per-club navigation snapshot."""
+from datetime import date
+
+from flask import render_template_string
+
+from app import db
+from app.models import Club, Meeting, SessionLog, SessionType
+from app.services.nav_state import get_nav_state
+
+
+def _seed(club):
+    finished = Meeting(Meeting_Number=1, Meeting_Date=date(2026, 1, 1),
+                       status='finished', club_id=club.id)
+    upcoming = Meeting(Meeting_Number=2, Meeting_Date=date(2026, 2, 1),
+                       status='unpublished', club_id=club.id)
+    session_type = SessionType(Title='Generic', club_id=club.id)
+    db.session.add_all([finished, upcoming, session_type])
+    db.session.commit()
+    db.session.add(SessionLog(meeting_id=upcoming.id, Meeting_Seq=1, Type_ID=session_type.id))
+    db.session.commit()
+    return finished, upcoming
+
+
+def test_snapshot_resolves_both_default_variants(app, default_club):
+    with app.app_context():
+        finished, upcoming = _seed(default_club)
+        state = get_nav_state(default_club.id)
+
+        assert state['club'].club_name == default_club.club_name
+        assert state['has_meetings'] is True
+        assert state['default_meeting'][False]['id'] == finished.id
+        assert state['default_meeting'][False]['status'] == 'finished'
+        assert state['default_meeting'][True]['id'] == upcoming.id
+
+
+def test_warm_render_issues_no_queries(app, default_club, record_queries):
+    with app.app_context():
+        _seed(default_club)
+        club_id = default_club.id
+        template = '{{ club.club_name }}|{{ has_meetings }}|{{ hide_voting_nav }}'
+
+        with app.test_request_context(f'/?club_id={club_id}'):
+            render_template_string(template)
+        db.session.expunge_all()
+
+        with app.test_request_context(f'/?club_id={club_id}'), record_queries() as statements:
+            html = render_template_string(template)
+
+        assert html.startswith(f'{default_club.club_name}|True|')
+        assert not [s for s in statements if 'Meetings' in s or 'clubs' in s]
+
+
+def test_status_change_invalidates_snapshot(app, default_club):
+    with app.app_context():
+        finished, upcoming = _seed(default_club)
+        assert get_nav_state(default_club.id)['default_meeting'][False]['id'] == finished.id
+
+        upcoming.status = 'not started'
+        db.session.commit()
+
+        assert get_nav_state(default_club.id)['default_meeting'][False]['id'] == upcoming.id
+
+        upcoming.status = 'running'
+        db.session.commit()
+        assert get_nav_state(default_club.id)['default_meeting'][False]['status'] == 'running'
+
+
+def test_new_meeting_and_club_edit_invalidate_snapshot(app, default_club):
+    with app.app_context():
+        club_id = default_club.id
+        assert get_nav_state(club_id)['has_meetings'] is False
+
+        _seed(default_club)
+        assert get_nav_state(club_id)['has_meetings'] is True
+
+        db.session.get(Club, club_id).club_name = 'Renamed Club'
+        db.session.commit()
+        db.session.expunge_all()
+        assert get_nav_state(club_id)['club'].club_name == 'Renamed Club'
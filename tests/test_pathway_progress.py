@@ -0,0 +1,186 @@
+"""Tests for the materialized pathway progress behind the completion summary."""
+from datetime import date
+
+from app import db
+from app.commands.pathway_progress import rebuild_progress
+from app.models import (
+    Contact, LevelRole, Meeting, MeetingRole, OwnerMeetingRoles, Pathway, PathwayProgress, SessionLog,
+    SessionType,
+)
+from app.services.pathway_progress import (
+    compute_pathway_progress, get_pathway_progress, load_pathway_progress, store_pathway_progress,
+)
+
+PATHWAY = 'Presentation Mastery'
+STORED_MARKER = {'1': {'marker': True}}
+
+
+def _seed(club_id, names=('Kyle Wei',)):
+    db.session.add(LevelRole(level=1, role='Topicsmaster', type='required', count_required=1, band=0))
+    role = MeetingRole(name='Topicsmaster', type='standard', needs_approval=False,
+                       has_single_owner=True, club_id=club_id)
+    db.session.add(role)
+    db.session.flush()
+    session_type = SessionType(Title='Topicsmaster', role_id=role.id, club_id=club_id)
+    db.session.add(session_type)
+    db.session.flush()
+
+    logs = []
+    for seq, name in enumerate(names, start=1):
+        contact = Contact(Name=name, Type='Member', Current_Path=PATHWAY)
+        meeting = Meeting(Meeting_Number=900 + seq, Meeting_Date=date(2026, 1, seq),
+                          club_id=club_id, status='not started')
+        db.session.add_all([contact, meeting])
+        db.session.flush()
+        log = SessionLog(meeting_id=meeting.id, Meeting_Seq=1, Type_ID=session_type.id, Status='Booked')
+        db.session.add(log)
+        db.session.flush()
+        db.session.add(OwnerMeetingRoles(meeting_id=meeting.id, role_id=role.id,
+                                         contact_id=contact.id, session_log_id=log.id,
+                                         target_pathway=PATHWAY, target_level='1'))
+        logs.append((log, contact))
+    db.session.commit()
+    return logs
+
+
+def _topicsmaster(summary):
+    return summary['1']['required'][0]['requirement_items'][0]['status']
+
+
+def _mark_stored(*contacts):
+    """Replace stored progress with a marker that only a rebuild overwrites."""
+    for contact in contacts:
+        store_pathway_progress(contact.id, PATHWAY, STORED_MARKER)
+    db.session.commit()
+
+
+def test_commit_stores_summary_and_reads_reuse_it(app, default_club, record_queries):
+    with app.app_context():
+        [(log, contact)] = _seed(default_club.id)
+
+        summary = load_pathway_progress(contact.id, PATHWAY)
+        assert summary is not None
+
+        with record_queries() as statements:
+            assert get_pathway_progress(contact.id, PATHWAY) == summary
+        assert len(statements) == 1
+        assert 'pathway_progress' in statements[0]
+        assert summary == compute_pathway_progress(contact.id, PATHWAY)
+
+
+def test_read_of_missing_progress_does_not_write(app, default_club):
+    with app.app_context():
+        [(log, contact)] = _seed(default_club.id)
+        db.session.execute(db.delete(PathwayProgress))
+        db.session.commit()
+
+        summary = get_pathway_progress(contact.id, PATHWAY)
+        assert summary == compute_pathway_progress(contact.id, PATHWAY)
+        assert load_pathway_progress(contact.id, PATHWAY) is None
+
+
+def test_log_change_rebuilds_only_its_owner(app, default_club):
+    with app.app_context():
+        (log, contact), (_, other) = _seed(default_club.id, names=('Kyle Wei', 'Ann Lee'))
+        assert _topicsmaster(get_pathway_progress(contact.id, PATHWAY)) == 'booked'
+        _mark_stored(contact, other)
+
+        log.Status = 'Completed'
+        db.session.commit()
+
+        assert load_pathway_progress(other.id, PATHWAY) == STORED_MARKER
+        assert _topicsmaster(load_pathway_progress(contact.id, PATHWAY)) == 'completed'
+
+
+def test_unassigning_rebuilds_previous_owner(app, default_club):
+    with app.app_context():
+        [(log, contact)] = _seed(default_club.id)
+        _mark_stored(contact)
+
+        # set_owners clears OwnerMeetingRoles with a bulk delete
+        SessionLog.set_owners(log, [])
+        db.session.commit()
+
+        assert load_pathway_progress(contact.id, PATHWAY) == compute_pathway_progress(contact.id, PATHWAY)
+
+
+def test_renaming_a_member_rebuilds_only_their_meetings(app, default_club):
+    with app.app_context():
+        (_, contact), (_, other) = _seed(default_club.id, names=('Kyle Wei', 'Ann Lee'))
+        _mark_stored(contact, other)
+
+        contact.Name = 'Kyle W.'
+        db.session.commit()
+
+        assert load_pathway_progress(contact.id, PATHWAY) == compute_pathway_progress(contact.id, PATHWAY)
+        assert load_pathway_progress(other.id, PATHWAY) == STORED_MARKER
+
+
+def test_pathway_change_drops_only_members_on_it(app, default_club):
+    with app.app_context():
+        (_, contact), (_, other) = _seed(default_club.id, names=('Kyle Wei', 'Ann Lee'))
+        pathway = Pathway(name='Dynamic Leadership', abbr='DL')
+        db.session.add(pathway)
+        db.session.commit()
+        _mark_stored(contact, other)
+        store_pathway_progress(other.id, pathway.name, STORED_MARKER)
+        db.session.commit()
+
+        pathway.abbr = 'DLX'
+        db.session.commit()
+
+        assert load_pathway_progress(contact.id, PATHWAY) == STORED_MARKER
+        assert load_pathway_progress(other.id, pathway.name) != STORED_MARKER
+
+
+def test_requirement_change_drops_everyone_and_rollback_keeps_rows(app, default_club):
+    with app.app_context():
+        _seed(default_club.id, names=('Kyle Wei', 'Ann Lee'))
+
+        requirement = LevelRole.query.first()
+        requirement.count_required = 2
+        db.session.flush()
+        db.session.rollback()
+        assert db.session.query(PathwayProgress).count() == 2
+
+        requirement = LevelRole.query.first()
+        requirement.count_required = 2
+        db.session.commit()
+        assert db.session.query(PathwayProgress).count() == 0
+
+
+def test_rebuild_racing_a_change_does_not_store_stale_summary(app, default_club, monkeypatch):
+    from app.services import pathway_progress
+
+    with app.app_context():
+        [(log, contact)] = _seed(default_club.id)
+        changed = []
+
+        def compute_then_change(contact_id, pathway):
+            summary = compute_pathway_progress(contact_id, pathway)
+            if not changed:
+                changed.append(summary)
+                with app.app_context():
+                    db.session.get(SessionLog, log.id).Status = 'Completed'
+                    db.session.commit()
+            return summary
+
+        monkeypatch.setattr(pathway_progress, 'compute_pathway_progress', compute_then_change)
+        pathway_progress.rebuild_after_commit({contact.id})
+
+        assert _topicsmaster(changed[0]) == 'booked'
+        assert _topicsmaster(load_pathway_progress(contact.id, PATHWAY)) == 'completed'
+
+
+def test_rebuild_command_computes_in_parallel_batches(app, default_club):
+    with app.app_context():
+        pairs = _seed(default_club.id, names=('Kyle Wei', 'Ann Lee', 'Bo Chen'))
+        contact_ids = [contact.id for _, contact in pairs]
+
+    result = app.test_cli_runner().invoke(rebuild_progress, ['--workers', '2', '--batch-size', '1'])
+    assert result.exit_code == 0, result.output
+    assert 'Done. 3 member pathway(s) rebuilt.' in result.output
+
+    with app.app_context():
+        for contact_id in contact_ids:
+            assert load_pathway_progress(contact_id, PATHWAY) == compute_pathway_progress(contact_id, PATHWAY)
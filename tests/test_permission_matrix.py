@@ -0,0 +1,75 @@
+"""Tests for the compiled per-club permission matrix."""
+from app import db
+from app.auth.permission_matrix import (
+    compile_permission_matrix,
+    get_permission_matrix,
+    invalidate_permission_matrix,
+)
+from app.models import AuthRole, Club, Permission, RolePermission
+
+
+def _seed(default_club):
+    view = Permission(name='AGENDA_VIEW', category='agenda')
+    edit = Permission(name='AGENDA_EDIT', category='agenda')
+    role = AuthRole(name='Staff', level=2)
+    db.session.add_all([view, edit, role])
+    db.session.flush()
+    db.session.add(RolePermission(role_id=role.id, permission_id=view.id, club_id=None))
+    db.session.add(RolePermission(role_id=role.id, permission_id=edit.id, club_id=default_club.id))
+    db.session.commit()
+    return role, view, edit
+
+
+def test_compile_groups_global_and_club_rows(app, default_club):
+    with app.app_context():
+        role, _, _ = _seed(default_club)
+        matrix = compile_permission_matrix()
+
+        assert matrix[(role.id, None)] == frozenset({'AGENDA_VIEW'})
+        assert matrix[(role.id, default_club.id)] == frozenset({'AGENDA_EDIT'})
+
+
+def test_has_permission_uses_club_row_then_global_fallback(app, default_club):
+    with app.app_context():
+        role, _, _ = _seed(default_club)
+        other_club = Club(club_no='111111', club_name='Other Club')
+        db.session.add(other_club)
+        db.session.commit()
+
+        assert role.has_permission('AGENDA_EDIT', club_id=default_club.id)
+        assert role.has_permission('AGENDA_VIEW', club_id=default_club.id)
+        assert role.has_permission('AGENDA_VIEW', club_id=other_club.id)
+        assert not role.has_permission('AGENDA_EDIT', club_id=other_club.id)
+
+
+def test_steady_state_checks_run_no_queries(app, default_club, record_queries):
+    with app.app_context():
+        role, _, _ = _seed(default_club)
+        get_permission_matrix()
+
+        with record_queries() as statements:
+            for _ in range(10):
+                role.has_permission('AGENDA_EDIT', club_id=default_club.id)
+                role.has_permission('MISSING', club_id=default_club.id)
+
+        assert statements == []
+
+
+def test_mapping_changes_invalidate_matrix(app, default_club):
+    with app.app_context():
+        role, _, _ = _seed(default_club)
+
+        other = Permission(name='ROSTER_VIEW', category='roster')
+        db.session.add(other)
+        db.session.flush()
+        assert not role.has_permission('ROSTER_VIEW', club_id=default_club.id)
+
+        db.session.add(RolePermission(role_id=role.id, permission_id=other.id, club_id=default_club.id))
+        db.session.commit()
+        assert role.has_permission('ROSTER_VIEW', club_id=default_club.id)
+
+        RolePermission.query.filter_by(club_id=default_club.id).delete()
+        db.session.commit()
+        invalidate_permission_matrix()
+        assert not role.has_permission('AGENDA_EDIT', club_id=default_club.id)
+        assert role.has_permission('AGENDA_VIEW', club_id=default_club.id)
@@ -0,0 +1,114 @@
+"""Tests for batched SessionLog owner loading."""
+import logging
+from datetime import date
+
+from app import db
+from app.models import Contact, Meeting, OwnerMeetingRoles, SessionLog, SessionType
+from app.models.roster import MeetingRole
+
+
+def _seed(club):
+    meeting = Meeting(Meeting_Number=1, Meeting_Date=date.today(), club_id=club.id)
+    speaker = MeetingRole(name='Prepared Speaker', type='standard', needs_approval=False,
+                          has_single_owner=True, club_id=club.id)
+    topics = MeetingRole(name='Topics Speaker', type='standard', needs_approval=False,
+                         has_single_owner=False, club_id=club.id)
+    contacts = [Contact(Name=f'Member {i}', Email=f'm{i}@example.com') for i in range(4)]
+    db.session.add_all([meeting, speaker, topics, *contacts])
+    db.session.flush()
+    speech = SessionType(Title='Prepared Speech', role_id=speaker.id, club_id=club.id)
+    table_topics = SessionType(Title='Table Topics', role_id=topics.id, club_id=club.id)
+    db.session.add_all([speech, table_topics])
+    db.session.flush()
+
+    logs = []
+    for seq in range(1, 4):
+        log = SessionLog(meeting_id=meeting.id, Meeting_Seq=seq, Type_ID=speech.id)
+        db.session.add(log)
+        logs.append(log)
+    tt_logs = [SessionLog(meeting_id=meeting.id, Meeting_Seq=seq, Type_ID=table_topics.id) for seq in (4, 5)]
+    db.session.add_all(tt_logs)
+    db.session.flush()
+
+    db.session.add_all([
+        OwnerMeetingRoles(meeting_id=meeting.id, role_id=speaker.id, contact_id=contacts[0].id,
+                          session_log_id=logs[0].id, target_pathway='Dynamic Leadership', target_level='2'),
+        OwnerMeetingRoles(meeting_id=meeting.id, role_id=speaker.id, contact_id=contacts[1].id,
+                          session_log_id=logs[1].id),
+        OwnerMeetingRoles(meeting_id=meeting.id, role_id=topics.id, contact_id=contacts[2].id),
+        OwnerMeetingRoles(meeting_id=meeting.id, role_id=topics.id, contact_id=contacts[3].id,
+                          session_log_id=tt_logs[0].id),
+    ])
+    db.session.commit()
+    return meeting, logs + tt_logs, contacts
+
+
+def _owner_ids(log):
+    return [c.id for c in log.owners]
+
+
+def test_load_owners_matches_property(app, default_club):
+    with app.app_context():
+        meeting, logs, contacts = _seed(default_club)
+        expected = {log.id: _owner_ids(log) for log in logs}
+
+        db.session.expire_all()
+        loaded = SessionLog.query.filter_by(meeting_id=meeting.id).all()
+        SessionLog.load_owners(loaded)
+        assert {log.id: _owner_ids(log) for log in loaded} == expected
+        assert expected[logs[2].id] == []
+        assert sorted(expected[logs[3].id]) == [contacts[2].id, contacts[3].id]
+
+        first = next(log for log in loaded if log.id == logs[0].id)
+        assert first._cached_owner_targets == {
+            contacts[0].id: {'pathway': 'Dynamic Leadership', 'level': '2'}}
+
+
+def test_load_owners_uses_one_query(app, default_club, record_queries):
+    with app.app_context():
+        meeting, _, _ = _seed(default_club)
+        loaded = SessionLog.query.filter_by(meeting_id=meeting.id).all()
+        for log in loaded:
+            log.session_type.role  # warm relationships the caller normally eager-loads
+
+        with record_queries() as statements:
+            SessionLog.load_owners(loaded)
+            for log in loaded:
+                log.owners
+        assert len(statements) == 1
+
+
+def test_load_owners_reads_only_the_rows_of_the_given_logs(app, default_club):
+    with app.app_context():
+        meeting, logs, contacts = _seed(default_club)
+        db.session.expire_all()
+        page = [db.session.get(SessionLog, logs[1].id), db.session.get(SessionLog, logs[4].id)]
+
+        SessionLog.load_owners(page)
+        assert _owner_ids(page[0]) == [contacts[1].id]
+        assert sorted(_owner_ids(page[1])) == [contacts[2].id, contacts[3].id]
+
+
+def test_set_owners_drops_primed_owners(app, default_club):
+    with app.app_context():
+        meeting, logs, contacts = _seed(default_club)
+        SessionLog.load_owners(logs)
+        SessionLog.set_owners(logs[2], [contacts[3].id])
+        db.session.commit()
+        assert _owner_ids(logs[2]) == [contacts[3].id]
+
+
+def test_debug_guard_warns_on_unprimed_loop(app, default_club, caplog):
+    with app.app_context():
+        meeting, logs, _ = _seed(default_club)
+        app.config['OWNER_LOAD_GUARD'] = True
+        try:
+            with app.test_request_context():
+                with caplog.at_level(logging.WARNING):
+                    for log in SessionLog.query.filter_by(meeting_id=meeting.id).all():
+                        log.owners
+        finally:
+            app.config.pop('OWNER_LOAD_GUARD')
+        warnings = [r for r in caplog.records if 'load_owners' in r.getMessage()]
+        assert len(warnings) == 1
+        assert 'test_session_log_owners.py' in warnings[0].getMessage()
@@ -0,0 +1,174 @@
+"""Tests for the speech log full-text search index."""
+from datetime import date, timedelta
+
+from sqlalchemy import insert
+
+from app import db
+from app.commands.search_index import reindex_search
+from app.models import (
+    Contact, Meeting, MeetingRole, OwnerMeetingRoles, SessionLog, SessionLogSearch, SessionType,
+)
+from app.speech_logs_routes import _search_logs
+
+
+def _seed(club_id):
+    role = MeetingRole(name='Prepared Speaker', type='standard', needs_approval=False,
+                       has_single_owner=True, club_id=club_id)
+    db.session.add(role)
+    db.session.flush()
+    session_type = SessionType(Title='Prepared Speech', role_id=role.id, club_id=club_id)
+    contact = Contact(Name='Samantha Adams', Type='Member', first_name='Samantha', last_name='Adams')
+    meeting = Meeting(Meeting_Number=975, Meeting_Date=date(2026, 1, 1), club_id=club_id)
+    db.session.add_all([session_type, contact, meeting])
+    db.session.flush()
+    log = SessionLog(meeting_id=meeting.id, Meeting_Seq=1, Type_ID=session_type.id,
+                     Session_Title='The Power of AI', project_code='PM1.1')
+    db.session.add(log)
+    db.session.flush()
+    db.session.add(OwnerMeetingRoles(meeting_id=meeting.id, role_id=role.id,
+                                     contact_id=contact.id, session_log_id=log.id))
+    db.session.commit()
+    return log, contact
+
+
+def _search(club_id, q):
+    return [log.id for log in _search_logs(q, can_view_all=True, current_club_id=club_id)]
+
+
+def test_document_tracks_log_and_owner_changes(app, default_club):
+    with app.app_context():
+        club_id = default_club.id
+        log, contact = _seed(club_id)
+
+        document = db.session.get(SessionLogSearch, log.id).document
+        for part in ('Samantha Adams', 'The Power of AI', 'Prepared Speaker', 'PM1.1', '975'):
+            assert part in document
+
+        contact.Name = 'Sam Lee'
+        contact.last_name = 'Lee'
+        db.session.commit()
+        assert _search(club_id, 'Lee') == [log.id]
+        assert _search(club_id, 'Adams') == []
+
+        log.Session_Title = 'Leadership Lessons'
+        db.session.commit()
+        assert _search(club_id, 'Power') == []
+        assert _search(club_id, 'leadership 975') == [log.id]
+
+        # Unassigning goes through a bulk delete of OwnerMeetingRoles
+        SessionLog.set_owners(log, [])
+        db.session.commit()
+        assert _search(club_id, 'Lee') == []
+
+        db.session.delete(log)
+        db.session.commit()
+        assert db.session.get(SessionLogSearch, log.id) is None
+
+
+def test_keywords_match_substrings_and_exact_punctuation(app, default_club):
+    with app.app_context():
+        club_id = default_club.id
+        log, _ = _seed(club_id)
+
+        assert _search(club_id, 'sam') == [log.id]
+        assert _search(club_id, 'PM1.1') == [log.id]
+        assert _search(club_id, 'PM1.2') == []
+        assert _search(club_id, 'Samantha Speaker 97') == [log.id]
+
+
+def test_rollback_leaves_index_untouched(app, default_club):
+    with app.app_context():
+        club_id = default_club.id
+        log, _ = _seed(club_id)
+
+        log.Session_Title = 'Something Else'
+        db.session.flush()
+        db.session.rollback()
+
+        assert _search(club_id, 'Power') == [log.id]
+
+
+def test_documents_are_rebuilt_after_commit_not_in_the_flush(app, default_club):
+    with app.app_context():
+        club_id = default_club.id
+        log, _ = _seed(club_id)
+
+        log.Session_Title = 'Leadership Lessons'
+        db.session.flush()
+        assert 'The Power of AI' in db.session.get(SessionLogSearch, log.id).document
+        db.session.commit()
+        assert _search(club_id, 'Leadership') == [log.id]
+
+
+def test_reindex_command_rebuilds_missing_documents(app, default_club):
+    with app.app_context():
+        club_id = default_club.id
+        log, _ = _seed(club_id)
+        db.session.execute(db.delete(SessionLogSearch))
+        db.session.commit()
+        assert _search(club_id, 'Samantha') == []
+
+    result = app.test_cli_runner().invoke(reindex_search)
+    assert result.exit_code == 0, result.output
+    assert 'Done. 1 session log(s) indexed.' in result.output
+
+    with app.app_context():
+        assert _search(club_id, 'Samantha') == [log.id]
+
+
+def test_multi_keyword_search_reads_the_index_on_large_history(app, default_club, record_queries):
+    with app.app_context():
+        club_id = default_club.id
+        log, contact = _seed(club_id)
+        session_type_id = log.Type_ID
+        role_id = db.session.get(SessionType, session_type_id).role_id
+
+        # 1200 meetings x 3 speeches, written in bulk and indexed once
+        meeting_rows = [{'Meeting_Number': 1000 + n, 'Meeting_Date': date(2000, 1, 1) + timedelta(days=7 * n),
+                         'club_id': club_id, 'status': 'finished'} for n in range(1200)]
+        db.session.execute(insert(Meeting), meeting_rows)
+        meeting_ids = [m.id for m in Meeting.query.filter(Meeting.Meeting_Number >= 1000)]
+        db.session.execute(insert(SessionLog), [
+            {'meeting_id': mid, 'Meeting_Seq': seq, 'Type_ID': session_type_id,
+             'Session_Title': f'Speech {mid}-{seq}', 'project_code': 'PM1.1'}
+            for mid in meeting_ids for seq in range(1, 4)])
+        db.session.commit()
+        first_log = SessionLog.query.filter(SessionLog.meeting_id == meeting_ids[0]).first()
+        db.session.add(OwnerMeetingRoles(meeting_id=first_log.meeting_id, role_id=role_id,
+                                         contact_id=contact.id, session_log_id=first_log.id))
+        db.session.commit()
+
+        from app.services.speech_log_search import rebuild_search_index
+        assert rebuild_search_index(club_id) == 3601
+        db.session.commit()
+
+        with record_queries(with_parameters=True) as statements:
+            results = _search(club_id, 'Samantha Speaker PM1.1')
+        assert sorted(results) == sorted([log.id, first_log.id])
+
+        # One statement, reaching the documents through the club index
+        # rather than scanning logs, owners and contacts per keyword
+        assert len(statements) == 1
+        statement, parameters = statements[0]
+        plan = [row[3] for row in db.session.connection().exec_driver_sql(
+            f'EXPLAIN QUERY PLAN {statement}', parameters)]
+        assert any(step.startswith('SEARCH session_log_search USING INDEX') for step in plan), plan
+        assert not any(step.startswith('SCAN') for step in plan), plan
+
+        # SQLite only runs the LIKE, which matches inside words
+        assert sorted(_search(club_id, 'dams')) == sorted([log.id, first_log.id])
+
+
+def test_fulltext_terms_match_plain_keywords_as_whole_words():
+    from app.services.speech_log_search import fulltext_terms
+
+    assert fulltext_terms('Samantha') == ['+samantha']
+    assert fulltext_terms('PM1.1') == ['+pm1']
+    assert fulltext_terms('975') == ['+975']
+    assert fulltext_terms('x-ray') == ['+ray']
+    assert fulltext_terms('what-the-heck') == ['+heck']
+    # Left to the LIKE: stopwords, short words, words InnoDB splits differently, non-ASCII
+    assert fulltext_terms('AI') == []
+    assert fulltext_terms("o'brien") == []
+    assert fulltext_terms('first_name') == []
+    assert fulltext_terms('张伟') == []
@@ -0,0 +1,116 @@
+"""Tests for the result cache of read-only chat tools."""
+from datetime import date
+
+from app import db
+from app.models import Club, Contact, ContactClub, Meeting, Pathway
+from app.services import tool_result_cache
+from app.services.chat_tool_executor import ChatToolExecutor
+
+
+def test_library_answers_are_reused_until_pathways_change(app, default_club):
+    with app.test_request_context():
+        db.session.add(Pathway(name='Dynamic Leadership', abbr='DL', status='active'))
+        db.session.commit()
+
+        first = ChatToolExecutor.execute('query_pathways_library', {}, None, default_club.id)
+        second = ChatToolExecutor.execute('query_pathways_library', {'pathway_name': '  '}, None, default_club.id)
+        assert second == first
+        assert 'Dynamic Leadership' in first['message']
+        assert tool_result_cache.stats()['query_pathways_library'] == {'hits': 1, 'misses': 1, 'hit_rate': 0.5}
+
+        db.session.add(Pathway(name='Presentation Mastery', abbr='PM', status='active'))
+        db.session.commit()
+
+        third = ChatToolExecutor.execute('query_pathways_library', {}, None, default_club.id)
+        assert 'Presentation Mastery' in third['message']
+        assert tool_result_cache.stats()['query_pathways_library']['misses'] == 2
+
+
+def test_meeting_changes_only_invalidate_their_club(app, default_club):
+    calls = []
+
+    def build():
+        calls.append(1)
+        return {'success': True, 'message': f"build {len(calls)}"}
+
+    with app.test_request_context():
+        other = Club(club_no='999999', club_name='Other Club')
+        db.session.add(other)
+        db.session.commit()
+
+        tool_result_cache.cached('list_meetings', {'limit': 5}, default_club.id, build)
+        tool_result_cache.cached('list_meetings', {'limit': 5}, other.id, build)
+        assert len(calls) == 2
+
+        db.session.add(Meeting(club_id=other.id, Meeting_Number=7, Meeting_Date=date(2026, 7, 1)))
+        db.session.commit()
+
+        assert tool_result_cache.cached('list_meetings', {'limit': 5}, default_club.id, build)['message'] == 'build 1'
+        assert tool_result_cache.cached('list_meetings', {'limit': 5}, other.id, build)['message'] == 'build 3'
+
+
+def test_stats_command(app, default_club):
+    runner = app.test_cli_runner()
+    with app.test_request_context():
+        tool_result_cache.cached('list_meetings', {}, default_club.id, lambda: {'success': True, 'message': ''})
+        tool_result_cache.cached('list_meetings', {}, default_club.id, lambda: {'success': True, 'message': ''})
+
+    result = runner.invoke(args=['chat:tool-cache-stats', '--reset'])
+    assert result.exit_code == 0
+    assert 'list_meetings: 1 hit(s), 1 miss(es), 50% hit rate' in result.output
+
+    with app.app_context():
+        assert tool_result_cache.stats()['list_meetings']['hits'] == 0
+
+
+def test_ballot_cast_through_voting_refreshes_cached_results(app, client, default_club):
+    with app.test_request_context():
+        meeting = Meeting(club_id=default_club.id, Meeting_Number=8, Meeting_Date=date.today(), status='running')
+        alice = Contact(Name='Alice Wong', Email='alice@example.com')
+        db.session.add_all([meeting, alice])
+        db.session.commit()
+        meeting_id, alice_id, club_id = meeting.id, alice.id, default_club.id
+
+        def results():
+            meeting = db.session.get(Meeting, meeting_id)
+            return tool_result_cache.cached('get_voting_results', {'meeting_id': meeting_id}, club_id,
+                                            lambda: ChatToolExecutor._voting_results(meeting))['message']
+
+        assert 'No votes have been cast yet.' in results()
+
+    # batch_vote writes the ballot with Core statements
+    response = client.post('/voting/batch_vote', json={
+        'meeting_id': meeting_id, 'votes': [{'contact_id': alice_id, 'award_category': 'speaker'}]})
+    assert response.get_json()['success']
+
+    with app.test_request_context():
+        assert '* Alice Wong: 1 vote(s)' in results()
+
+
+def test_contact_changes_only_invalidate_their_clubs(app, default_club):
+    calls = []
+
+    def build():
+        calls.append(1)
+        return {'success': True, 'message': f"build {len(calls)}"}
+
+    def agenda(club_id):
+        return tool_result_cache.cached('get_meeting_agenda', {'meeting_id': 1}, club_id, build)['message']
+
+    with app.test_request_context():
+        other = Club(club_no='999999', club_name='Other Club')
+        carol = Contact(Name='Carol King')
+        db.session.add_all([other, carol])
+        db.session.flush()
+        db.session.add(ContactClub(contact_id=carol.id, club_id=other.id))
+        db.session.commit()
+        assert [agenda(default_club.id), agenda(other.id)] == ['build 1', 'build 2']
+
+        carol.Name = 'Caroline King'
+        db.session.commit()
+        assert [agenda(default_club.id), agenda(other.id)] == ['build 1', 'build 3']
+
+        # Assigning the same value leaves nothing to invalidate
+        carol.Name = 'Caroline King'
+        db.session.commit()
+        assert agenda(other.id) == 'build 3'
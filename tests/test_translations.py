@@ -122,5 +122,36 @@ class TranslationsTestCase(unittest.TestCase):
             # Host URL matches localhost, so malicious redirect falls back to index
             self.assertEqual(resp.headers['Location'], '/')
 
+    def test_lookups_do_not_stat_catalog(self):
+        """Compiled catalogs are not re-checked on disk for every call."""
+        from unittest import mock
+        with self.app.test_request_context():
+            from flask import session
+            session['locale'] = 'zh_CN'
+            with mock.patch('app.translations.translations.os.path.getmtime') as getmtime, \
+                    mock.patch('app.translations.translations.os.path.exists') as exists:
+                for _i in range(50):
+                    self.assertEqual(translate('Calendar'), '日历')
+            getmtime.assert_not_called()
+            exists.assert_not_called()
+
+    def test_template_constants_resolved_at_compile_time(self):
+        """Constant _('...') calls in templates are baked in per locale."""
+        source = ("{{ _('Calendar') }}|{{ _('Nonexistent Key') }}|"
+                  "{{ _('Meeting #%(num)s is %(status)s', num=3, status='x') }}")
+        compiled = self.app.jinja_env.compile(source, raw=True)
+        self.assertIn("{'zh_CN': '日历'}", compiled)
+        # Untranslated constants become plain template text
+        self.assertIn("'|Nonexistent Key|'", compiled)
+
+        template = self.app.jinja_env.from_string(source)
+        with self.app.test_request_context():
+            from flask import session
+            session['locale'] = 'zh_CN'
+            self.assertEqual(template.render(), '日历|Nonexistent Key|会议 #3 状态为 x')
+        with self.app.test_request_context(headers={'Accept-Language': 'en-US'}):
+            self.assertEqual(template.render(), 'Calendar|Nonexistent Key|Meeting #3 is x')
+
+
 if __name__ == '__main__':
     unittest.main()
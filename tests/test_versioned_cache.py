@@ -0,0 +1,45 @@
+"""Tests for the version stamps and invalidation hooks shared by the caches."""
+from app import db
+from app.models import Club
+from app.services import versioned_cache
+from app.services.versioned_cache import VersionStamps
+
+
+def test_stamps_keep_a_local_copy_until_bumped(app):
+    stamps = VersionStamps('test_stamps')
+    built = []
+
+    def build():
+        built.append(1)
+        return len(built)
+
+    with app.app_context():
+        versions = stamps.get('a', 'b')
+        assert stamps.get('a', 'b') == versions
+        assert stamps.local_copy('a', versions, build) == 1
+        assert stamps.local_copy('a', stamps.get('a', 'b'), build) == 1
+
+        stamps.bump('b')
+        assert stamps.get('a', 'b')[0] == versions[0]
+        assert stamps.local_copy('a', stamps.get('a', 'b'), build) == 2
+
+
+def test_tracked_changes_invalidate_at_flush_and_when_the_transaction_ends(app, monkeypatch):
+    invalidated = []
+
+    def changes(session):
+        return {obj.club_no for obj in session.new if isinstance(obj, Club)}
+
+    monkeypatch.setitem(versioned_cache._trackers, 'test_clubs', (changes, invalidated.append))
+    with app.app_context():
+        db.session.add(Club(club_no='000321', club_name='Tracked'))
+        db.session.flush()
+        assert invalidated == ['000321']
+        db.session.commit()
+        assert invalidated == ['000321', '000321']
+
+        # Items reported by a Core write, then rolled back
+        db.session.execute(db.update(Club).where(Club.club_no == '000321').values(club_name='Renamed'))
+        versioned_cache.mark(db.session, 'test_clubs', ['000654'])
+        db.session.rollback()
+        assert invalidated[2:] == ['000654', '000654']
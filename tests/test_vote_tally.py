@@ -0,0 +1,118 @@
+"""Tests for the incremental live vote tally."""
+from datetime import date
+
+from app import cache, db
+from app.models import Contact, Meeting, Vote
+from app.services import vote_tally
+from app.services.vote_tally import (
+    ballot_update,
+    compute_tally,
+    get_tally,
+    reconcile_vote_tally,
+)
+
+
+def _seed(club):
+    meeting = Meeting(Meeting_Number=1, Meeting_Date=date.today(),
+                      status='running', club_id=club.id)
+    alice = Contact(Name='Alice', Email='alice@example.com')
+    bob = Contact(Name='Bob', Email='bob@example.com')
+    db.session.add_all([meeting, alice, bob])
+    db.session.commit()
+    db.session.add(Vote(meeting_id=meeting.id, voter_identifier='v1',
+                        award_category='speaker', contact_id=alice.id))
+    db.session.commit()
+    return meeting, alice, bob
+
+
+def _cast(meeting, voter, pairs):
+    with ballot_update(meeting.id, voter):
+        Vote.query.filter_by(meeting_id=meeting.id, voter_identifier=voter).delete()
+        for contact_id, category in pairs:
+            db.session.add(Vote(meeting_id=meeting.id, voter_identifier=voter,
+                                award_category=category, contact_id=contact_id))
+        db.session.commit()
+
+
+def test_tally_seeds_from_sql_and_reads_without_queries(app, default_club, record_queries):
+    with app.app_context():
+        meeting, alice, _ = _seed(default_club)
+        assert get_tally(meeting.id) == {'voters': 1, 'counts': {(alice.id, 'speaker'): 1}}
+
+        with record_queries() as statements:
+            get_tally(meeting.id)
+        assert statements == []
+
+
+def test_ballot_changes_apply_deltas(app, default_club):
+    with app.app_context():
+        meeting, alice, bob = _seed(default_club)
+        get_tally(meeting.id)
+
+        _cast(meeting, 'v2', [(bob.id, 'speaker'), (alice.id, 'evaluator')])
+        _cast(meeting, 'v1', [(bob.id, 'speaker')])
+
+        assert get_tally(meeting.id) == compute_tally(meeting.id)
+        assert get_tally(meeting.id)['counts'] == {
+            (bob.id, 'speaker'): 2,
+            (alice.id, 'evaluator'): 1,
+        }
+
+        _cast(meeting, 'v2', [])
+        tally = get_tally(meeting.id)
+        assert tally['voters'] == 1
+        assert tally == compute_tally(meeting.id)
+
+
+def test_contact_merge_drops_the_tally(app, default_club):
+    with app.app_context():
+        meeting, alice, bob = _seed(default_club)
+        get_tally(meeting.id)
+
+        Contact.merge_contacts(bob.id, [alice.id])
+        assert get_tally(meeting.id) == {'voters': 1, 'counts': {(bob.id, 'speaker'): 1}}
+
+
+def test_reconcile_detects_drift_and_drops_tally(app, default_club):
+    with app.app_context():
+        meeting, _, bob = _seed(default_club)
+        get_tally(meeting.id)
+        assert reconcile_vote_tally(meeting.id)
+
+        get_tally(meeting.id)
+        # A write that bypasses ballot_update leaves the tally stale
+        db.session.add(Vote(meeting_id=meeting.id, voter_identifier='v9',
+                            award_category='speaker', contact_id=bob.id))
+        db.session.commit()
+        assert not reconcile_vote_tally(meeting.id)
+        assert get_tally(meeting.id)['voters'] == 2
+
+
+def test_tally_reseeded_during_a_ballot_is_not_double_counted(app, default_club):
+    with app.app_context():
+        meeting, alice, bob = _seed(default_club)
+        get_tally(meeting.id)
+
+        with ballot_update(meeting.id, 'v2'):
+            db.session.add(Vote(meeting_id=meeting.id, voter_identifier='v2',
+                                award_category='speaker', contact_id=bob.id))
+            db.session.commit()
+            # Another worker drops and reseeds the tally after the commit
+            vote_tally.invalidate_tally(meeting.id)
+            assert get_tally(meeting.id)['voters'] == 2
+
+        assert get_tally(meeting.id) == compute_tally(meeting.id)
+        assert get_tally(meeting.id)['voters'] == 2
+
+
+def test_lock_is_only_released_by_its_holder(app, default_club):
+    with app.app_context():
+        token = vote_tally._acquire(1)
+        assert token
+        # The lock expired and another writer took it
+        cache.set(vote_tally._lock_key(1), 'other-writer')
+        vote_tally._release(1, token)
+        assert cache.get(vote_tally._lock_key(1)) == 'other-writer'
+
+        vote_tally._release(1, 'other-writer')
+        assert cache.get(vote_tally._lock_key(1)) is None
@@ -0,0 +1,69 @@
+"""Tests for bulk ballot ingestion used by batch_vote."""
+from datetime import date
+
+from app import db
+from app.models import Contact, Meeting, Vote
+from app.models.voting import MeetingAwardConfig
+from app.services.voting_ballots import build_ballot_rows, write_ballot
+
+
+def _meeting(club):
+    meeting = Meeting(Meeting_Number=1, Meeting_Date=date.today(),
+                      status='running', club_id=club.id)
+    alice = Contact(Name='Alice', Email='alice@example.com')
+    bob = Contact(Name='Bob', Email='bob@example.com')
+    db.session.add_all([meeting, alice, bob])
+    db.session.commit()
+    return meeting, alice, bob
+
+
+def test_build_rows_applies_limits_and_disabled_categories(app, default_club):
+    with app.app_context():
+        meeting, alice, bob = _meeting(default_club)
+        configs = [
+            MeetingAwardConfig(meeting_id=meeting.id, award_category='speaker',
+                               max_votes_per_user=2, max_winners=2),
+            MeetingAwardConfig(meeting_id=meeting.id, award_category='debater',
+                               max_votes_per_user=0, max_winners=1),
+        ]
+        votes = [
+            {'contact_id': alice.id, 'award_category': 'speaker'},
+            {'contact_id': str(bob.id), 'award_category': 'speaker'},
+            {'contact_id': alice.id, 'award_category': 'speaker'},
+            {'contact_id': alice.id, 'award_category': 'evaluator'},
+            {'contact_id': bob.id, 'award_category': 'evaluator'},
+            {'contact_id': bob.id, 'award_category': 'debater'},
+            {'question': 'Q1', 'score': 8},
+            {'question': 'Q2'},
+        ]
+        rows = build_ballot_rows(meeting.id, 'v1', votes, configs)
+
+        assert [(r['contact_id'], r['award_category']) for r in rows if r['award_category']] == [
+            (alice.id, 'speaker'), (bob.id, 'speaker'), (alice.id, 'evaluator')]
+        assert [(r['question'], r['score']) for r in rows if r['question']] == [('Q1', 8)]
+
+
+def test_write_ballot_only_touches_changed_rows(app, default_club, record_queries):
+    with app.app_context():
+        meeting, alice, bob = _meeting(default_club)
+        first = build_ballot_rows(meeting.id, 'v1', [
+            {'contact_id': alice.id, 'award_category': 'speaker'},
+            {'question': 'Q1', 'score': 9},
+        ], [])
+        assert write_ballot(meeting.id, 'v1', first) == (2, 0)
+        db.session.commit()
+
+        with record_queries() as statements:
+            assert write_ballot(meeting.id, 'v1', first) == (0, 0)
+        writes = [s for s in statements if s.startswith('INSERT') or s.startswith('DELETE')]
+        assert writes == []
+
+        second = build_ballot_rows(meeting.id, 'v1', [
+            {'contact_id': bob.id, 'award_category': 'speaker'},
+            {'question': 'Q1', 'score': 9},
+        ], [])
+        assert write_ballot(meeting.id, 'v1', second) == (1, 1)
+        db.session.commit()
+
+        stored = Vote.query.filter_by(meeting_id=meeting.id, voter_identifier='v1').all()
+        assert sorted((v.contact_id or 0, v.question or '') for v in stored) == [(0, 'Q1'), (bob.id, '')]
@@ -198,5 +198,56 @@ class VotingConcurrencyTestCase(unittest.TestCase):
         self.assertEqual(len(failures), 0, f"Expected 0 failures, but got {len(failures)} failures.")
         self.assertEqual(len(successes), self.concurrent_users, f"Expected {self.concurrent_users} successes, but got {len(successes)}.")
 
+    def test_concurrent_ballot_submissions(self):
+        """Simulate 100+ voters submitting ballots at the end of a meeting."""
+        if self.target_url:
+            self.skipTest("Ballot submission benchmark only runs against the local test client")
+
+        voters = max(100, self.concurrent_users)
+        candidates = [Contact(Name=f'Candidate {i}', Email=f'c{i}@example.com') for i in range(4)]
+        db.session.add_all(candidates)
+        db.session.commit()
+        candidate_ids = [c.id for c in candidates]
+
+        def submit(index):
+            client = self.app.test_client()
+            ballot = {
+                'meeting_id': int(self.meeting_id),
+                'votes': [
+                    {'contact_id': candidate_ids[index % 4], 'award_category': 'speaker'},
+                    {'contact_id': candidate_ids[(index + 1) % 4], 'award_category': 'evaluator'},
+                    {'question': 'How likely are you to recommend this meeting to a friend or colleague?',
+                     'score': 9},
+                ],
+            }
+            start_time = time.time()
+            resp = client.post('/voting/batch_vote', json=ballot)
+            success = resp.status_code == 200 and resp.get_json().get('success')
+            return success, time.time() - start_time
+
+        start_all = time.time()
+        with ThreadPoolExecutor(max_workers=min(voters, 50)) as executor:
+            results = list(executor.map(submit, range(voters)))
+        total_time = time.time() - start_all
+
+        elapsed_times = sorted(elapsed for _, elapsed in results)
+        successes = sum(1 for success, _ in results if success)
+
+        print("\n--- Ballot Submission Results Summary ---")
+        print(f"Total voters: {voters}")
+        print(f"Successful ballots: {successes}")
+        print(f"Failed ballots: {voters - successes}")
+        print(f"Total test execution time: {total_time:.4f} seconds")
+        print(f"Min response time: {elapsed_times[0]:.4f}s")
+        print(f"Mean response time: {sum(elapsed_times) / len(elapsed_times):.4f}s")
+        print(f"Median response time: {elapsed_times[len(elapsed_times) // 2]:.4f}s")
+        print(f"95th percentile response time: {elapsed_times[int(len(elapsed_times) * 0.95)]:.4f}s")
+        print(f"Max response time: {elapsed_times[-1]:.4f}s")
+
+        self.assertEqual(successes, voters, f"Expected {voters} successes, but got {successes}.")
+        db.session.expire_all()
+        self.assertEqual(Vote.query.filter_by(meeting_id=int(self.meeting_id)).count(), voters * 3)
+
+
 if __name__ == '__main__':
     unittest.main()
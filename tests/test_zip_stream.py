@@ -0,0 +1,90 @@
+"""Tests for streamed upload-link ZIP downloads."""
+import io
+import os
+import zipfile
+
+import pytest
+
+from app import db
+from app.auth.permissions import Permissions
+from app.models import ExportJob, UploadLink
+from app.services import zip_stream
+
+XHR = {'X-Requested-With': 'XMLHttpRequest'}
+
+
+@pytest.fixture
+def upload_folder(app, tmp_path, monkeypatch):
+    monkeypatch.setitem(app.config, 'EXPORT_JOB_DIR', str(tmp_path / 'jobs'))
+    monkeypatch.setitem(app.config, 'ARTIFACT_CACHE_DIR', str(tmp_path / 'cache'))
+    monkeypatch.setitem(app.config, 'UPLOAD_LINK_DIR', str(tmp_path / 'uploads'))
+    folder = tmp_path / 'uploads' / 'streamzip'
+    folder.mkdir(parents=True)
+    (folder / 'talk.mp4').write_bytes(os.urandom(200 * 1024))
+    (folder / 'notes.txt').write_bytes(b'minutes ' * 10000)
+    return str(folder)
+
+
+def _upload_link(app, club):
+    with app.app_context():
+        db.session.add(UploadLink(code='streamzip', title='Speech Videos', club_id=club.id))
+        db.session.commit()
+
+
+def test_iter_zip_keeps_a_bounded_buffer(upload_folder):
+    entries = [(os.path.join(upload_folder, name), name) for name in ('notes.txt', 'talk.mp4')]
+    chunks = list(zip_stream.iter_zip(entries, chunk_size=4096))
+
+    assert len(chunks) > 10
+    assert max(len(chunk) for chunk in chunks) < 3 * 4096
+    with zipfile.ZipFile(io.BytesIO(b''.join(chunks))) as archive:
+        assert archive.namelist() == ['notes.txt', 'talk.mp4']
+        assert archive.getinfo('notes.txt').compress_type == zipfile.ZIP_DEFLATED
+        assert archive.getinfo('talk.mp4').compress_type == zipfile.ZIP_STORED
+        with open(entries[1][0], 'rb') as f:
+            assert archive.read('talk.mp4') == f.read()
+
+
+def test_plain_download_is_streamed(app, client, default_club, upload_folder, session_login):
+    session_login(Permissions.UPLOAD_MANAGE)
+    _upload_link(app, default_club)
+
+    res = client.get('/uploads/streamzip/zip')
+    assert res.status_code == 200
+    assert res.is_streamed
+    assert 'Content-Length' not in res.headers
+    assert res.headers['Content-Disposition'] == 'attachment; filename="Speech Videos.zip"'
+    assert res.headers['Cache-Control'] == 'no-cache'
+    with zipfile.ZipFile(io.BytesIO(res.data)) as archive:
+        assert archive.namelist() == ['notes.txt', 'talk.mp4']
+    with app.app_context():
+        assert ExportJob.query.count() == 0
+
+
+def test_built_archive_is_cached_and_resumable(app, client, default_club, upload_folder, session_login):
+    session_login(Permissions.UPLOAD_MANAGE)
+    _upload_link(app, default_club)
+
+    payload = client.get('/uploads/streamzip/zip', headers=XHR).get_json()['job']
+    assert payload['status'] == 'finished'
+    full = client.get(payload['download_url'])
+    assert full.status_code == 200
+    assert 'Speech Videos.zip' in full.headers['Content-Disposition']
+
+    # Later downloads come from the cache and can be resumed
+    cached = client.get('/uploads/streamzip/zip')
+    assert cached.headers['Content-Length'] == str(len(full.data))
+    assert cached.data == full.data
+    etag = cached.headers['ETag']
+    partial = client.get('/uploads/streamzip/zip', headers={'Range': 'bytes=100-', 'If-Range': etag})
+    assert partial.status_code == 206
+    assert partial.headers['Accept-Ranges'] == 'bytes'
+    assert partial.data == full.data[100:]
+
+    # A new upload changes the digest, so the archive is streamed afresh
+    with open(os.path.join(upload_folder, 'agenda.pdf'), 'wb') as f:
+        f.write(b'%PDF')
+    fresh = client.get('/uploads/streamzip/zip', headers={'If-None-Match': etag})
+    assert fresh.status_code == 200
+    with zipfile.ZipFile(io.BytesIO(fresh.data)) as archive:
+        assert archive.namelist() == ['agenda.pdf', 'notes.txt', 'talk.mp4']